@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.errors import AnsibleActionFail
+from ansible.module_utils._text import to_native
+from ansible.plugins.action import ActionBase
+from ansible.utils.unsafe_proxy import wrap_var
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_runner import (
+    SharedModuleContext,
+    import_module,
+    module_short_name,
+    run_module,
+)
+
+ARGUMENT_SPEC = dict(
+    module=dict(type="str", required=True),
+    items=dict(type="list", elements="dict", required=True),
+    provider=dict(type="dict", required=False, no_log=True),
+    concurrency=dict(type="int", default=8),
+    cache_listings=dict(type="bool", default=True),
+)
+
+
+class ActionModule(ActionBase):
+    """Run a zscaler.zpacloud module over many parameter sets in this worker process."""
+
+    TRANSFERS_FILES = False
+    _VALID_ARGS = frozenset(ARGUMENT_SPEC)
+
+    def run(self, tmp=None, task_vars=None):
+        result = super(ActionModule, self).run(tmp, task_vars)
+        del tmp
+
+        _unused, args = self.validate_argument_spec(argument_spec=ARGUMENT_SPEC)
+
+        target = module_short_name(args["module"])
+        if target == "zpa_batch":
+            raise AnsibleActionFail("zpa_batch cannot run itself")
+        if args["concurrency"] < 1:
+            raise AnsibleActionFail("concurrency must be at least 1")
+        try:
+            mod = import_module(target)
+        except ImportError as e:
+            raise AnsibleActionFail(to_native(e))
+
+        items = args["items"]
+        provider = args.get("provider")
+        run_options = dict(
+            check_mode=bool(self._task.check_mode or self._play_context.check_mode),
+            diff=bool(self._task.diff or self._play_context.diff),
+            no_log=bool(self._task.no_log),
+            verbosity=self._display.verbosity,
+        )
+
+        with SharedModuleContext(mod, cache_listings=args["cache_listings"]) as ctx:
+
+            def run_item(item):
+                params = dict(item)
+                if provider and "provider" not in params:
+                    params["provider"] = provider
+                item_result = run_module(mod, params, **run_options)
+                ctx.item_done(item_result)
+                return item_result
+
+            with ThreadPoolExecutor(max_workers=args["concurrency"]) as pool:
+                item_results = list(pool.map(run_item, items))
+
+        results = []
+        for item, item_result in zip(items, item_results):
+            # Like normal execution, API data is never templated again.
+            item_result = wrap_var(dict(item_result))
+            item_result.setdefault("changed", False)
+            item_result.setdefault("failed", False)
+            item_result["item"] = item
+            item_result["ansible_loop_var"] = "item"
+            results.append(item_result)
+
+        failed = [r for r in results if r["failed"]]
+        result.update(
+            changed=any(r["changed"] for r in results),
+            results=results,
+        )
+        if failed:
+            result.update(
+                failed=True,
+                msg=f"One or more items failed ({len(failed)} of {len(results)})",
+            )
+        else:
+            result["msg"] = "All items completed"
+        return result
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible.plugins.action import ActionBase
+from ansible.plugins.action.normal import ActionModule as NormalActionModule
+from ansible.utils.unsafe_proxy import wrap_var
+from ansible.utils.vars import merge_hash
+from ansible_collections.zscaler.zpacloud.plugins.module_utils import zpa_client
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_runner import (
+    import_module,
+    run_module,
+)
+
+
+class ActionModule(NormalActionModule):
+    """
+    Runs the collection's modules in the worker process instead of shipping
+    them through AnsiballZ to a fresh interpreter on localhost.
+
+    Every ZPA module is routed here from meta/runtime.yml. The module is run
+    in-process only when that cannot change its behaviour: the task runs on
+    the local connection, is not async, sets no task environment, and the
+    controller's Python has the SDK. Anything else, or ZPA_IN_PROCESS=false
+    (or the zpa_in_process variable), falls back to normal execution.
+    """
+
+    def _in_process_module(self, task_vars):
+        enabled = (task_vars or {}).get("zpa_in_process", os.getenv("ZPA_IN_PROCESS"))
+        if enabled is not None and not boolean(enabled, strict=False):
+            return None
+        if self._task.async_val or self._task.environment:
+            return None
+        if getattr(self._connection, "transport", None) not in (
+            "local",
+            "ansible.builtin.local",
+        ):
+            return None
+        if not zpa_client.HAS_ZSCALER:
+            return None
+        try:
+            return import_module(self._task.action)
+        except ImportError:
+            return None
+
+    def run(self, tmp=None, task_vars=None):
+        mod = self._in_process_module(task_vars)
+        if mod is None:
+            return super(ActionModule, self).run(tmp, task_vars)
+
+        result = ActionBase.run(self, tmp, task_vars)
+        del tmp
+
+        module_result = run_module(
+            mod,
+            self._task.args,
+            check_mode=bool(self._task.check_mode or self._play_context.check_mode),
+            diff=bool(self._task.diff or self._play_context.diff),
+            no_log=bool(self._task.no_log),
+            verbosity=self._display.verbosity,
+        )
+        # Like normal execution, API data is never templated again.
+        return merge_hash(result, wrap_var(module_result))
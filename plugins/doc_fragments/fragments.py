@@ -265,3 +265,46 @@ options:
         choices:
             - present
 """
+
+    INFO_PROJECTION = r"""
+options:
+    fields:
+        description:
+            - Only return these keys of each object. Dotted paths such as C(config.name)
+              select nested keys, and are applied to every element of nested lists.
+            - Keys missing from an object are left out.
+        type: list
+        elements: str
+        required: false
+    count_only:
+        description:
+            - Only return the number of matching objects, in C(count).
+        type: bool
+        default: false
+"""
+
+    RAW_LISTING = r"""
+options:
+    raw:
+        description:
+            - Return the JSON objects sent by the API, with snake_case keys, instead of
+              building SDK models and converting them back to dicts.
+            - Faster and lighter on large listings. Keys the API leaves out are missing
+              from the result instead of being set to C(null).
+            - Applies to listings, not to lookups by O(id).
+        type: bool
+        default: false
+"""
+
+    IDP_DIRECTORY_CACHE = r"""
+options:
+    cache_ttl:
+        description:
+            - How long, in seconds, IdP IDs and the unfiltered listings of their
+              attributes or groups are reused by later tasks of the same tenant.
+            - Lookups by name are answered from that listing, so resolving many names
+              costs one IdP search and one listing.
+            - C(0) disables the cache, and lookups by name then search the API by name.
+        type: int
+        default: 300
+"""
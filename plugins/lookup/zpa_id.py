@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+name: zpa_id
+short_description: Resolve ZPA object names to IDs
+description:
+    - Resolves one or more ZPA object names of a given resource type to their IDs.
+    - Runs on the controller and lists each resource type once; the name index is
+      memoized for the lifetime of the playbook run, so any number of templated
+      lookups against the same resource type cost a single listing.
+    - The index is kept in memory and mirrored to a private cache directory
+      (C(ZPA_CACHE_DIR), defaults to a per-user folder under the system temp dir)
+      so other tasks of the same run can reuse it.
+author:
+  - William Guilherme (@willguibr)
+version_added: "2.3.0"
+requirements:
+    - Zscaler SDK Python can be obtained from PyPI U(https://pypi.org/project/zscaler-sdk-python/)
+extends_documentation_fragment:
+  - zscaler.zpacloud.fragments.provider
+options:
+  _terms:
+    description:
+      - The first term is the resource type, for example C(server_group),
+        C(segment_group), C(application_segment), C(app_connector_group),
+        C(scim_group) or C(policy_access_rule).
+      - The remaining terms are the object names to resolve. Lists are flattened.
+    required: true
+    type: list
+    elements: raw
+  microtenant_id:
+    description:
+      - The unique identifier of the Microtenant for the ZPA tenant.
+    type: str
+  parent_id:
+    description:
+      - ID of the parent object for resource types that are scoped to one,
+        the IdP for C(scim_group) and C(scim_attribute), the namespace for C(tag_key).
+    type: str
+  parent_name:
+    description:
+      - Name of the parent object, resolved through the same cache. Ignored when O(parent_id) is set.
+    type: str
+  errors:
+    description:
+      - What to do when a name cannot be resolved.
+      - C(strict) fails the lookup, C(warn) emits a warning and returns C(None)
+        for that name, C(ignore) silently returns C(None).
+    type: str
+    default: strict
+    choices: ["strict", "warn", "ignore"]
+  cache_ttl:
+    description:
+      - How long, in seconds, a cached name index stays valid. C(0) disables caching.
+    type: int
+    default: 300
+  incremental:
+    description:
+      - Keep the last full listing of each resource type across runs and, on a cache miss,
+        only fetch objects modified since then, newest first.
+      - Deletions are detected by comparing the object count with the total reported by
+        the API, and a full listing is done every O(reconcile_interval) seconds.
+    type: bool
+    default: false
+  reconcile_interval:
+    description:
+      - With O(incremental), seconds between full listings of a resource type.
+    type: int
+    default: 3600
+"""
+
+EXAMPLES = r"""
+- name: Create an application segment referencing groups by name
+  zscaler.zpacloud.zpa_application_segment:
+    provider: "{{ zpa_cloud }}"
+    name: "crm"
+    domain_names: ["crm.example.com"]
+    tcp_port_range:
+      - from: "443"
+        to: "443"
+    segment_group_id: "{{ lookup('zscaler.zpacloud.zpa_id', 'segment_group', 'crm', provider=zpa_cloud) }}"
+    server_group_ids: "{{ query('zscaler.zpacloud.zpa_id', 'server_group', ['web-servers', 'db-servers'], provider=zpa_cloud) }}"
+
+- name: Resolve SCIM group IDs for a given IdP
+  ansible.builtin.set_fact:
+    scim_group_ids: "{{ query('zscaler.zpacloud.zpa_id', 'scim_group', 'Engineering', 'Finance', parent_name='Okta', provider=zpa_cloud) }}"
+"""
+
+RETURN = r"""
+_raw:
+  description:
+    - The IDs of the requested objects, in the same order as the names.
+  type: list
+  elements: str
+"""
+
+from ansible.errors import AnsibleLookupError
+from ansible.module_utils._text import to_native
+from ansible.plugins.lookup import LookupBase
+from ansible.utils.display import Display
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_cache import (
+    incremental_cache,
+    run_cache,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    ZPAClientHelper,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_resources import (
+    PARENT_RESOURCE_TYPES,
+    build_name_index,
+    get_resource_type,
+    list_resource,
+    list_resource_incremental,
+)
+
+display = Display()
+
+
+class _LookupModuleShim:
+    """Just enough of AnsibleModule for ZPAClientHelper to authenticate a lookup."""
+
+    def __init__(self, params):
+        self.params = params
+        self.check_mode = False
+
+    def fail_json(self, msg, **kwargs):
+        raise AnsibleLookupError(msg)
+
+    def warn(self, msg):
+        display.warning(msg)
+
+
+class LookupModule(LookupBase):
+    def run(self, terms, variables=None, **kwargs):
+        self.set_options(var_options=variables, direct=kwargs)
+
+        if not terms:
+            raise AnsibleLookupError("zpa_id requires a resource type as first term")
+        resource_type = terms[0]
+        try:
+            rtype = get_resource_type(resource_type)
+        except KeyError as e:
+            raise AnsibleLookupError(to_native(e.args[0]))
+
+        names = []
+        for term in terms[1:]:
+            names.extend(term if isinstance(term, list) else [term])
+
+        params = {
+            "provider": self.get_option("provider") or {},
+            "microtenant_id": self.get_option("microtenant_id"),
+        }
+        self._params = params
+        self._client = None
+        self._cache = run_cache(
+            "zpa_id", params, self.get_option("cache_ttl"), controller=True
+        )
+
+        parent_id = None
+        if rtype.parent:
+            parent_id = self.get_option("parent_id")
+            if not parent_id and self.get_option("parent_name"):
+                parent_type = PARENT_RESOURCE_TYPES[rtype.parent]
+                parent_index = self._name_index(parent_type)
+                parent_id = parent_index.get(self.get_option("parent_name"))
+            if not parent_id:
+                raise AnsibleLookupError(
+                    f"Resource type '{resource_type}' requires parent_id or a resolvable parent_name"
+                )
+
+        index = self._name_index(resource_type, parent_id)
+
+        errors = self.get_option("errors")
+        ids = []
+        missing = []
+        for name in names:
+            obj_id = index.get(name)
+            if obj_id is None:
+                missing.append(name)
+            ids.append(obj_id)
+
+        if missing:
+            msg = f"{resource_type} not found: {', '.join(map(str, missing))}"
+            if errors == "strict":
+                raise AnsibleLookupError(msg)
+            if errors == "warn":
+                display.warning(msg)
+        return ids
+
+    def _get_client(self):
+        if self._client is None:
+            self._client = ZPAClientHelper(_LookupModuleShim(self._params))
+        return self._client
+
+    def _name_index(self, resource_type, parent_id=None):
+        """Return the cached ``{name: id}`` index for a resource type, listing it on a miss."""
+        microtenant_id = self._params.get("microtenant_id")
+        key = f"{resource_type}:{microtenant_id or ''}:{parent_id or ''}"
+        index = self._cache.get(key)
+        if index is not None:
+            return index
+
+        if self.get_option("incremental"):
+            items, err = list_resource_incremental(
+                self._get_client(),
+                resource_type,
+                incremental_cache(self._params),
+                microtenant_id=microtenant_id,
+                parent_id=parent_id,
+                reconcile_interval=self.get_option("reconcile_interval"),
+            )
+        else:
+            items, err = list_resource(
+                self._get_client(),
+                resource_type,
+                microtenant_id=microtenant_id,
+                parent_id=parent_id,
+            )
+        if err:
+            raise AnsibleLookupError(f"Error listing {resource_type}: {to_native(err)}")
+        index = build_name_index(get_resource_type(resource_type), items)
+        self._cache.set(key, index)
+        return index
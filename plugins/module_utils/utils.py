@@ -25,6 +25,7 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import heapq
 import re
 
 
@@ -48,9 +49,11 @@ def remove_cloud_suffix(s: str) -> str:
     return re.sub(r"\s*\([a-zA-Z0-9\-_\.]+\)\s*$", "", s or "").strip()
 
 
-def collect_all_items(list_fn, query_params=None):
+def iter_item_pages(list_fn, query_params=None):
     """
-    Collects all pages of results from a paginated ZPA SDK list_* method.
+    Yields ``(page, error)`` tuples for every page of a paginated ZPA SDK
+    list_* method, so large listings can be processed page by page without
+    holding the whole collection in memory. Iteration stops after an error.
     Handles both paginated and non-paginated SDK methods.
     """
     # Ensure query_params is a dict and set maximum page size for efficient pagination
@@ -64,32 +67,155 @@ def collect_all_items(list_fn, query_params=None):
     if isinstance(result, tuple) and len(result) == 2:
         items, err = result
         if err:
-            return None, err
-        return items or [], None
+            yield None, err
+            return
+        yield items or [], None
+        return
 
     # Case 2: (items, resp, error) – paginated SDK methods
     if isinstance(result, tuple) and len(result) == 3:
         items, resp, err = result
         if err:
-            return None, err
-
-        all_items = items or []
+            yield None, err
+            return
+        yield items or [], None
 
         # Continue calling next() until no more pages are available
         while resp and resp.has_next():
             try:
                 page, resp, err = resp.next()
-                if err:
-                    return None, err
-                if page:
-                    all_items.extend(page)
             except StopIteration:
                 # No more pages available
                 break
+            if err:
+                yield None, err
+                return
+            if page:
+                yield page, None
+        return
+
+    yield None, f"Unexpected return structure from {list_fn.__name__}"
+
+
+def collect_all_items(list_fn, query_params=None):
+    """
+    Collects all pages of results from a paginated ZPA SDK list_* method.
+    Handles both paginated and non-paginated SDK methods.
+    """
+    all_items = []
+    for page, err in iter_item_pages(list_fn, query_params):
+        if err:
+            return None, err
+        all_items.extend(page)
+    return all_items, None
+
+
+def _field_tree(fields):
+    tree = {}
+    for field in fields:
+        node = tree
+        for part in field.split("."):
+            node = node.setdefault(part, {})
+    return tree
+
+
+def _project(value, tree):
+    if isinstance(value, list):
+        return [_project(v, tree) for v in value]
+    if not isinstance(value, dict):
+        return value
+    return {
+        key: _project(value[key], sub) if sub else value[key]
+        for key, sub in tree.items()
+        if key in value
+    }
+
+
+def project_fields(items, fields):
+    """
+    Restrict each dict in ``items`` to ``fields``. Dotted paths such as
+    ``config.name`` select nested keys and are applied to every element of
+    nested lists (``server_groups.id``). Missing keys are left out.
+    """
+    if not fields:
+        return items
+    tree = _field_tree(fields)
+    return [_project(item, tree) for item in items]
+
+
+def info_exit(module, result_key, items):
+    """
+    exit_json for info modules, honouring the ``fields`` and ``count_only``
+    options so large listings are slimmed down before Ansible serializes them.
+    """
+    if module.params.get("count_only"):
+        module.exit_json(changed=False, count=len(items))
+    module.exit_json(
+        changed=False,
+        **{result_key: project_fields(items, module.params.get("fields"))},
+    )
+
+
+def _trigrams(text):
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
 
-        return all_items, None
 
-    return None, f"Unexpected return structure from {list_fn.__name__}"
+def _edit_distance(a, b):
+    """Levenshtein distance between two strings, one row at a time."""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(
+                min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb))
+            )
+        previous = current
+    return previous[-1]
+
+
+def closest_names(name, candidates, limit=5):
+    """
+    Return up to ``limit`` of ``candidates`` closest to ``name``, best first.
+
+    Candidates are shortlisted by shared trigrams, a single linear pass, and
+    only the shortlist is ranked by case-insensitive edit distance, so the
+    cost and the output size stay bounded however many names there are.
+    Candidates sharing no trigram with ``name``, or more than half its length
+    of edits away, are never suggested.
+    """
+    wanted = str(name or "").casefold()
+    wanted_grams = _trigrams(wanted)
+    scored = {}
+    for candidate in candidates:
+        if not candidate or candidate in scored:
+            continue
+        grams = _trigrams(str(candidate).casefold())
+        shared = len(wanted_grams & grams)
+        if shared:
+            scored[candidate] = shared / len(wanted_grams | grams)
+
+    # Edits beyond half the requested name make for a different name.
+    max_distance = max(2, len(wanted) // 2)
+    ranked = []
+    for candidate in heapq.nlargest(limit * 4, scored, key=scored.get):
+        distance = _edit_distance(wanted, str(candidate).casefold())
+        if distance <= max_distance:
+            ranked.append((distance, -scored[candidate], candidate))
+    return [candidate for _d, _s, candidate in sorted(ranked)[:limit]]
+
+
+def did_you_mean(name, candidates, limit=5):
+    """
+    Suffix for a "not found" message suggesting the names closest to ``name``,
+    instead of listing every name in the tenant. Empty when nothing is close.
+    """
+    suggestions = closest_names(name, candidates, limit)
+    if not suggestions:
+        return ""
+    return " Did you mean: " + ", ".join(f"'{s}'" for s in suggestions) + "?"
 
 
 def normalize_port_processing(app):
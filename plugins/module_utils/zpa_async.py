@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import asyncio
+import json
+import logging
+
+from ansible.module_utils.basic import missing_required_lib
+
+try:
+    import aiohttp
+
+    HAS_AIOHTTP = True
+    AIOHTTP_IMPORT_ERROR = None
+except ImportError:
+    HAS_AIOHTTP = False
+    AIOHTTP_IMPORT_ERROR = missing_required_lib("aiohttp")
+
+try:
+    from zscaler.helpers import to_snake_case
+except ImportError:
+    to_snake_case = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 16
+PAGE_SIZE = 500
+RETRYABLE_STATUS = (429, 503, 504)
+
+_SNAKE_CASE_KEYS = {}
+
+
+def snake_case_keys(data):
+    """
+    Map the keys of an API payload to snake_case, like the SDK does.
+
+    Each key is converted once per process. The SDK converter rebuilds its
+    table of special cases on every call, which dominates large listings.
+    """
+    if isinstance(data, dict):
+        result = {}
+        for key, value in data.items():
+            snake = _SNAKE_CASE_KEYS.get(key)
+            if snake is None:
+                snake = _SNAKE_CASE_KEYS[key] = to_snake_case(key)
+            result[snake] = snake_case_keys(value)
+        return result
+    if isinstance(data, list):
+        return [snake_case_keys(value) for value in data]
+    return data
+
+
+def sdk_request_executor(sdk_client):
+    """Return the SDK RequestExecutor of a OneAPI or legacy ZPA client."""
+    executor = sdk_client._request_executor
+    # The legacy client keeps its RequestExecutor one level down.
+    return getattr(executor, "request_executor", executor)
+
+
+def management_endpoint(executor, path, api_version="v1", base_path="mgmtconfig"):
+    """
+    Full ZPA API endpoint for a ``path`` relative to the customer, under the
+    ``base_path`` service (``mgmtconfig``, ``waap-pra-config``, ...).
+    """
+    customer_id = executor.customer_id
+    return f"/zpa/{base_path}/{api_version}/admin/customers/{customer_id}{path}"
+
+
+class AsyncZPATransport:
+    """
+    asyncio transport for the fan-out phases of a module, over one aiohttp
+    connection pool.
+
+    Requests are built by the request executor of an authenticated SDK
+    client, so URLs, query parameter and body casing, the OAuth token (or the
+    legacy bearer token) and the retry limits are the ones of regular SDK
+    calls. Responses are parsed JSON with snake_case keys.
+
+    Coroutines only run inside run(), which opens the session and awaits them
+    concurrently. Every coroutine resolves to a ``(result, error)`` tuple::
+
+        transport = client.async_transport(concurrency=8)
+        results = transport.run(
+            *[transport.delete(f"/segmentGroup/{group_id}") for group_id in ids]
+        )
+    """
+
+    def __init__(self, request_executor, concurrency=DEFAULT_CONCURRENCY):
+        self._executor = request_executor
+        self._legacy = getattr(self._executor, "zpa_legacy_client", None)
+        self._concurrency = max(1, concurrency)
+        self._max_retries = getattr(self._executor, "_max_retries", 2)
+        self._session = None
+        self._semaphore = None
+        self._auth_lock = None
+        self._auth_generation = 0
+        self._resume_at = 0
+
+    def endpoint(self, path, api_version="v1", base_path="mgmtconfig"):
+        return management_endpoint(self._executor, path, api_version, base_path)
+
+    def run(self, *coroutines):
+        """Await ``coroutines`` concurrently on one session and return their results in order."""
+        return asyncio.run(self._run(coroutines))
+
+    async def _run(self, coroutines):
+        timeout = aiohttp.ClientTimeout(
+            total=getattr(self._executor, "_request_timeout", None) or None
+        )
+        try:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._concurrency),
+                timeout=timeout,
+                trust_env=True,
+            )
+        except Exception:
+            for coroutine in coroutines:
+                coroutine.close()
+            raise
+        async with session:
+            self._session = session
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+            self._auth_lock = asyncio.Lock()
+            try:
+                return await asyncio.gather(*coroutines)
+            finally:
+                self._session = None
+
+    async def get(self, path, params=None, api_version="v1", base_path="mgmtconfig"):
+        return await self.request("GET", path, None, params, api_version, base_path)
+
+    async def add(self, path, body, params=None, api_version="v1"):
+        return await self.request("POST", path, body, params, api_version)
+
+    async def update(self, path, body, params=None, api_version="v1"):
+        return await self.request("PUT", path, body, params, api_version)
+
+    async def delete(self, path, params=None, api_version="v1", base_path="mgmtconfig"):
+        return await self.request("DELETE", path, None, params, api_version, base_path)
+
+    async def list_all(
+        self, path, params=None, api_version="v1", base_path="mgmtconfig"
+    ):
+        """
+        List every object under ``path``. The first page gives the page count,
+        the remaining pages are then fetched concurrently.
+        """
+        params = dict(params or {}, page_size=PAGE_SIZE, page=1)
+        first, err = await self.get(path, params, api_version, base_path)
+        if err:
+            return None, err
+        if isinstance(first, list):
+            # Non-paginated endpoint
+            return first, None
+
+        items = list(first.get("list") or [])
+        total_pages = int(first.get("total_pages") or 1)
+        pages = await asyncio.gather(
+            *[
+                self.get(path, dict(params, page=page), api_version, base_path)
+                for page in range(2, total_pages + 1)
+            ]
+        )
+        for page, err in pages:
+            if err:
+                return None, err
+            items.extend(page.get("list") or [])
+        return items, None
+
+    async def request(
+        self,
+        method,
+        path,
+        body=None,
+        params=None,
+        api_version="v1",
+        base_path="mgmtconfig",
+    ):
+        """Send one request, retrying on expired tokens and rate limiting."""
+        if self._session is None:
+            raise RuntimeError(
+                "AsyncZPATransport requests must be awaited inside run()"
+            )
+        endpoint = self.endpoint(path, api_version, base_path)
+        async with self._semaphore:
+            for attempt in range(self._max_retries + 1):
+                await self._throttle(method)
+                generation = self._auth_generation
+                try:
+                    status, headers, text = await self._send(
+                        method, endpoint, body, params
+                    )
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    return None, f"{method} {endpoint} failed: {e}"
+
+                if attempt < self._max_retries:
+                    if status == 401:
+                        await self._reauthenticate(generation)
+                        continue
+                    if status in RETRYABLE_STATUS:
+                        self._pause(self._retry_after(headers, attempt))
+                        continue
+                break
+
+        if status >= 300:
+            return (
+                None,
+                f"{method} {endpoint} returned {status}: {_error_message(text)}",
+            )
+        if not text:
+            return {}, None
+        return snake_case_keys(json.loads(text)), None
+
+    async def _send(self, method, endpoint, body, params):
+        request, err = self._executor.create_request(
+            method, endpoint, body=body, params=_query_params(params)
+        )
+        if err:
+            raise aiohttp.ClientError(err)
+        headers = request["headers"]
+        if self._legacy is not None:
+            if not self._legacy.headers.get("Authorization"):
+                self._legacy.refreshToken()
+            headers = dict(headers, **self._legacy.headers)
+
+        async with self._session.request(
+            method,
+            request["url"],
+            params=_query_params(request["params"]),
+            json=request.get("json") if body is not None else None,
+            headers=headers,
+        ) as response:
+            return response.status, response.headers, await response.text()
+
+    async def _throttle(self, method):
+        """Wait out a rate-limit pause and, for the legacy client, its request quota."""
+        loop = asyncio.get_running_loop()
+        while loop.time() < self._resume_at:
+            await asyncio.sleep(self._resume_at - loop.time())
+        limiter = getattr(self._legacy, "rate_limiter", None)
+        while limiter is not None:
+            should_wait, delay = limiter.wait(method)
+            if not should_wait:
+                break
+            await asyncio.sleep(delay)
+
+    def _pause(self, seconds):
+        """Hold back every request of the session, not only the one that was throttled."""
+        resume_at = asyncio.get_running_loop().time() + seconds
+        self._resume_at = max(self._resume_at, resume_at)
+
+    def _retry_after(self, headers, attempt):
+        backoff = self._executor.get_retry_after(headers, logger)
+        return backoff if backoff is not None else 2**attempt
+
+    async def _reauthenticate(self, generation):
+        """Refresh the token once, however many concurrent requests saw it expire."""
+        async with self._auth_lock:
+            if generation != self._auth_generation:
+                return
+            if self._legacy is not None:
+                self._legacy.access_token = None
+                self._legacy.headers = {}
+            elif getattr(self._executor, "_oauth", None) is not None:
+                self._executor._oauth.clear_access_token()
+            self._auth_generation += 1
+
+
+def _query_params(params):
+    """Drop unset values and render the rest the way the REST API expects them."""
+    rendered = {}
+    for key, value in (params or {}).items():
+        if value is None:
+            continue
+        rendered[key] = str(value).lower() if isinstance(value, bool) else str(value)
+    return rendered
+
+
+def _error_message(text):
+    try:
+        body = json.loads(text)
+    except ValueError:
+        return text
+    if isinstance(body, dict):
+        return body.get("reason") or body.get("message") or body.get("id") or text
+    return text
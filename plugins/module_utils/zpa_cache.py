@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+# Process-wide memo so repeated lookups inside one worker never touch the disk.
+_MEMORY = {}
+
+
+def default_cache_dir():
+    """Cache directory: ZPA_CACHE_DIR, or a per-user folder under the system temp dir."""
+    cache_dir = os.getenv("ZPA_CACHE_DIR")
+    if cache_dir:
+        return cache_dir
+    uid = os.getuid() if hasattr(os, "getuid") else "user"
+    return os.path.join(tempfile.gettempdir(), f"zpacloud-ansible-cache-{uid}")
+
+
+def cache_disabled():
+    return os.getenv("ZPA_CACHE_DISABLED", "").lower() in ("1", "true", "yes")
+
+
+def tenant_scope(params):
+    """
+    Build a stable, non-secret identifier for the tenant a set of module or
+    lookup parameters authenticates against, so cached data never leaks
+    between tenants, clouds or microtenants.
+    """
+    provider = params.get("provider") or {}
+    keys = (
+        "vanity_domain",
+        "client_id",
+        "customer_id",
+        "cloud",
+        "microtenant_id",
+        "zpa_client_id",
+        "zpa_customer_id",
+        "zpa_cloud",
+        "zpa_microtenant_id",
+    )
+    env = {
+        "vanity_domain": "ZSCALER_VANITY_DOMAIN",
+        "client_id": "ZSCALER_CLIENT_ID",
+        "customer_id": "ZPA_CUSTOMER_ID",
+        "cloud": "ZSCALER_CLOUD",
+        "microtenant_id": "ZPA_MICROTENANT_ID",
+        "zpa_client_id": "ZPA_CLIENT_ID",
+        "zpa_customer_id": "ZPA_CUSTOMER_ID",
+        "zpa_cloud": "ZPA_CLOUD",
+        "zpa_microtenant_id": "ZPA_MICROTENANT_ID",
+    }
+    parts = []
+    for key in keys:
+        value = provider.get(key) or params.get(key) or os.getenv(env[key]) or ""
+        parts.append(f"{key}={value}")
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()[:32]
+
+
+class ZPACache:
+    """
+    Small TTL key/value store shared between tasks.
+
+    Values are kept in process memory and mirrored to JSON files so that
+    separate module or worker processes of the same run can reuse them.
+    Every key is namespaced by the tenant scope, and a ``ttl`` of 0 (or
+    ``ZPA_CACHE_DISABLED=true``) turns the cache into a no-op. With
+    ``persist=False`` values only live in process memory.
+    """
+
+    def __init__(self, namespace, scope, ttl=300, cache_dir=None, persist=True):
+        self.namespace = namespace
+        self.scope = scope
+        self.ttl = int(os.getenv("ZPA_CACHE_TTL", ttl)) if ttl else 0
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.enabled = self.ttl > 0 and not cache_disabled()
+        self.persist = persist
+
+    def _path(self, key):
+        digest = hashlib.sha256(
+            f"{self.namespace}|{self.scope}|{key}".encode("utf-8")
+        ).hexdigest()
+        return os.path.join(self.cache_dir, self.namespace, digest + ".json")
+
+    def get(self, key):
+        """Return the cached value for ``key``, or None when missing or expired."""
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        now = time.time()
+
+        entry = _MEMORY.get(path)
+        if entry is None:
+            if not self.persist:
+                return None
+            try:
+                with open(path, "r", encoding="utf-8") as fh:
+                    entry = json.load(fh)
+            except (OSError, ValueError):
+                return None
+            _MEMORY[path] = entry
+
+        if now - entry.get("ts", 0) > self.ttl:
+            self.invalidate(key)
+            return None
+        return entry.get("value")
+
+    def set(self, key, value):
+        """Store ``value`` (must be JSON serializable) under ``key``."""
+        if not self.enabled:
+            return
+        path = self._path(key)
+        entry = {"ts": time.time(), "value": value}
+        _MEMORY[path] = entry
+        if not self.persist:
+            return
+
+        directory = os.path.dirname(path)
+        try:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(entry, fh)
+            os.replace(tmp_path, path)
+        except OSError:
+            # The disk mirror is best effort; the in-memory copy still applies.
+            pass
+
+    def invalidate(self, key):
+        path = self._path(key)
+        _MEMORY.pop(path, None)
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+# Incremental listings are reconciled on their own schedule, so the state
+# itself may live much longer than a regular cache entry.
+INCREMENTAL_TTL = 7 * 24 * 3600
+
+
+def incremental_cache(params):
+    """Return the tenant-scoped cache used by ``list_resource_incremental``."""
+    return ZPACache("incremental", scope=tenant_scope(params), ttl=INCREMENTAL_TTL)
+
+
+# Enrollment certificates are effectively static for the life of a tenant.
+ENROLLMENT_CERT_TTL = 24 * 3600
+
+
+def enrollment_cert_cache(params):
+    """Return the tenant-scoped cache used by ``resolve_enrollment_cert_id``."""
+    return ZPACache(
+        "enrollment_cert", scope=tenant_scope(params), ttl=ENROLLMENT_CERT_TTL
+    )
+
+
+# IdPs and their SCIM/SAML attributes and groups change far less often than
+# policies referencing them are applied, but SCIM sync does add groups.
+DIRECTORY_TTL = 300
+
+
+def idp_directory_cache(params):
+    """Return the tenant-scoped cache for IdP IDs and per-IdP group/attribute listings."""
+    return ZPACache(
+        "idp_directory",
+        scope=tenant_scope(params),
+        ttl=params.get("cache_ttl", DIRECTORY_TTL),
+    )
+
+
+def run_cache(namespace, params, ttl, controller=False):
+    """
+    Return a cache for data that must not outlive the current playbook run.
+
+    The run is given by ``ZPA_CACHE_RUN_ID``. Without it, plugins running in
+    a controller worker (``controller``) use the ansible-playbook process,
+    their parent, as the run. Anything else, such as a module shipped through
+    AnsiballZ whose parent is a per-task shell, keeps the data in process
+    memory only.
+    """
+    run_id = os.getenv("ZPA_CACHE_RUN_ID") or (os.getppid() if controller else None)
+    return ZPACache(
+        namespace,
+        scope=f"{tenant_scope(params)}:{run_id or os.getpid()}",
+        ttl=ttl,
+        persist=run_id is not None,
+    )
+
+
+def name_index_cache(params):
+    """
+    Return the run-scoped cache of ``{name: id}`` indexes used to resolve policy operands.
+
+    Objects deleted and recreated under the same name get a new ID, which a
+    cache shared across runs would keep resolving to the old one.
+    """
+    return run_cache("name_index", params, DIRECTORY_TTL)
+
+
+# Browser Access / inspection sub-apps are rewritten by the segment modules
+# themselves, so their listings are only reused briefly and dropped on write.
+SUB_APP_TTL = 60
+
+
+def sub_app_cache(params):
+    """Return the tenant-scoped cache used by ``index_sub_apps``."""
+    return ZPACache("sub_apps", scope=tenant_scope(params), ttl=SUB_APP_TTL)
+
+
+# Certificate indexes carry a fingerprint per certificate rather than the PEM.
+# Tasks keep them current for their own uploads and deletions.
+CERTIFICATE_TTL = 300
+
+
+def certificate_cache(params):
+    """Return the tenant-scoped cache used by ``certificate_index``."""
+    return ZPACache("certificates", scope=tenant_scope(params), ttl=CERTIFICATE_TTL)
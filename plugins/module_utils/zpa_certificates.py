@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import base64
+import binascii
+import hashlib
+import re
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_resources import (
+    list_resource,
+)
+
+_CERTIFICATE_PEM = re.compile(
+    r"-----BEGIN CERTIFICATE-----(.+?)-----END CERTIFICATE-----", re.DOTALL
+)
+
+# Key holding the PEM of each certificate type in its listing.
+CERTIFICATE_PEM_KEYS = {"ba_certificate": "certificate", "cbi_certificate": "pem"}
+
+# Keys dropped from cached entries once a fingerprint stands in for them.
+_BULKY_KEYS = ("certificate", "pem", "public_key")
+
+
+def certificate_fingerprint(pem):
+    """
+    SHA-256 fingerprint (hex) of the DER of the first certificate in ``pem``,
+    the leaf when a chain or a private key is bundled with it. None when
+    ``pem`` holds no decodable certificate.
+    """
+    match = _CERTIFICATE_PEM.search(pem or "")
+    if not match:
+        return None
+    try:
+        der = base64.b64decode("".join(match.group(1).split()), validate=True)
+    except (binascii.Error, ValueError):
+        return None
+    return hashlib.sha256(der).hexdigest() if der else None
+
+
+def _entry(resource_type, cert, fingerprint=None):
+    fingerprint = fingerprint or certificate_fingerprint(
+        cert.get(CERTIFICATE_PEM_KEYS[resource_type])
+    )
+    if not fingerprint:
+        return dict(cert, fingerprint=None)
+    entry = {k: v for k, v in cert.items() if k not in _BULKY_KEYS}
+    entry["fingerprint"] = fingerprint
+    return entry
+
+
+def _index_key(resource_type, microtenant_id):
+    return f"{resource_type}:{microtenant_id or ''}"
+
+
+def certificate_index(client, resource_type, cache, microtenant_id=None, refresh=False):
+    """
+    Return ``(entries, error)``: every certificate of ``resource_type`` with a
+    ``fingerprint`` key, from one listing shared between tasks through ``cache``.
+
+    Entries whose PEM has a fingerprint leave the PEM out, so the index stays
+    small however many certificates the tenant holds.
+    """
+    key = _index_key(resource_type, microtenant_id)
+    entries = None if refresh else cache.get(key)
+    if entries is not None:
+        return entries, None
+    items, err = list_resource(client, resource_type, microtenant_id=microtenant_id)
+    if err:
+        return None, err
+    entries = [_entry(resource_type, item) for item in items]
+    cache.set(key, entries)
+    return entries, None
+
+
+def _get_certificate(client, resource_type, cert_id, microtenant_id):
+    if resource_type == "cbi_certificate":
+        return client.cbi_certificate.get_cbi_certificate(cert_id)
+    return client.certificates.get_certificate(
+        certificate_id=cert_id,
+        query_params={"microtenant_id": microtenant_id} if microtenant_id else {},
+    )
+
+
+def _fetch(client, resource_type, entry, microtenant_id):
+    """
+    Return ``(cert, error)``: the full object of an index entry, fetched by
+    ID, or None when it no longer exists under the same name.
+    """
+    result, _unused, error = _get_certificate(
+        client, resource_type, entry.get("id"), microtenant_id
+    )
+    if error or not result:
+        return None, error
+    result = result.as_dict() if hasattr(result, "as_dict") else result
+    return (result if result.get("name") == entry.get("name") else None), None
+
+
+def _match(entries, name, fingerprint):
+    match = next((e for e in entries if name and e.get("name") == name), None)
+    if match is None and fingerprint:
+        match = next((e for e in entries if e.get("fingerprint") == fingerprint), None)
+    return match
+
+
+def find_certificate(
+    client, resource_type, cache, name=None, fingerprint=None, microtenant_id=None
+):
+    """
+    Return ``(cert, error)`` for the certificate named ``name`` or, when
+    ``fingerprint`` is given, the one whose content has that fingerprint.
+
+    The match is fetched by ID, so ``cert`` is the full object, PEM included.
+    A miss on a cached index, or a cached match that was deleted or renamed
+    outside this run, lists the certificates again before giving up.
+    """
+    cached = cache.get(_index_key(resource_type, microtenant_id)) is not None
+    entries, err = certificate_index(client, resource_type, cache, microtenant_id)
+    if err:
+        return None, err
+    match = _match(entries, name, fingerprint)
+    if match is not None:
+        cert, err = _fetch(client, resource_type, match, microtenant_id)
+        if cert is not None or not cached:
+            return cert, err
+    if not cached:
+        return None, None
+    entries, err = certificate_index(
+        client, resource_type, cache, microtenant_id, refresh=True
+    )
+    if err:
+        return None, err
+    match = _match(entries, name, fingerprint)
+    if match is None:
+        return None, None
+    return _fetch(client, resource_type, match, microtenant_id)
+
+
+def remember_certificate(
+    cache, resource_type, cert, microtenant_id=None, fingerprint=None
+):
+    """
+    Add a certificate uploaded by this task to the cached index. ``fingerprint``
+    is that of the uploaded PEM, for responses that do not echo it back.
+    """
+    key = _index_key(resource_type, microtenant_id)
+    entries = cache.get(key)
+    if entries is not None:
+        entries = [e for e in entries if str(e.get("id")) != str(cert.get("id"))]
+        cache.set(key, entries + [_entry(resource_type, cert, fingerprint)])
+
+
+def forget_certificate(cache, resource_type, cert_id, microtenant_id=None):
+    """Drop a certificate deleted by this task from the cached index."""
+    key = _index_key(resource_type, microtenant_id)
+    entries = cache.get(key)
+    if entries is not None:
+        cache.set(key, [e for e in entries if str(e.get("id")) != str(cert_id)])
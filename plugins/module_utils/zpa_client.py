@@ -33,6 +33,8 @@ VERSION_IMPORT_ERROR = None
 try:
     from zscaler.oneapi_client import LegacyZPAClient
     from zscaler import ZscalerClient as OneAPIClient
+    from zscaler.errors.response_checker import check_response_for_error
+    from zscaler.oneapi_response import ZscalerAPIResponse
 
     HAS_ZSCALER = True
 except ImportError as e:
@@ -41,6 +43,16 @@ except ImportError as e:
     HAS_ZSCALER = False
     ZSCALER_IMPORT_ERROR = missing_required_lib("zscaler")
 
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_async import (
+    AIOHTTP_IMPORT_ERROR,
+    DEFAULT_CONCURRENCY,
+    HAS_AIOHTTP,
+    AsyncZPATransport,
+    management_endpoint,
+    sdk_request_executor,
+    snake_case_keys,
+)
+
 try:
     from ansible_collections.zscaler.zpacloud.plugins.module_utils.version import (
         __version__ as ansible_collection_version,
@@ -113,6 +125,8 @@ class ZPAClientHelper:
                 exception=VERSION_IMPORT_ERROR,
             )
 
+        self._module = module
+
         provider = module.params.get("provider") or {}
         use_legacy_client = self._resolve_use_legacy_client(provider, module)
 
@@ -186,6 +200,61 @@ class ZPAClientHelper:
                 "(zpa_client_id, zpa_client_secret,zpa_customer_id, zpa_cloud) for Legacy mode."
             )
 
+    def async_transport(self, concurrency=DEFAULT_CONCURRENCY):
+        """
+        Return an AsyncZPATransport sharing this client's credentials, for
+        modules that fan out many independent requests (bulk deletes,
+        parallel pagination, multi-type listings).
+        """
+        if not HAS_AIOHTTP:
+            self._module.fail_json(
+                msg="The 'aiohttp' library is required for the async transport.",
+                exception=AIOHTTP_IMPORT_ERROR,
+            )
+        return AsyncZPATransport(
+            sdk_request_executor(self._client), concurrency=concurrency
+        )
+
+    def list_raw(
+        self, path, query_params=None, api_version="v1", base_path="mgmtconfig"
+    ):
+        """
+        List a collection like the SDK list_* methods do, without building SDK models.
+
+        ``path`` is relative to the customer, for example ``/segmentGroup``.
+        Returns ``(items, response, error)``. Items are the JSON objects sent by
+        the API with snake_case keys, and ``response.next()`` returns the
+        following pages the same way, so the result works with collect_all_items.
+        """
+        executor = sdk_request_executor(self._client)
+        request, error = executor.create_request(
+            "GET",
+            management_endpoint(executor, path, api_version, base_path),
+            params=query_params or {},
+        )
+        if error:
+            return None, None, error
+        # fire_request keeps the SDK retries and response cache, but unlike
+        # execute() it does not convert the whole body a second time.
+        request, response, body, error = executor.fire_request(request)
+        if error:
+            return None, None, error
+        if response is None:
+            return [], None, None
+        _unused, error = check_response_for_error(request["url"], response, body)
+        if error:
+            return None, None, error
+        # The data type is applied by response.next() to the following pages.
+        response = ZscalerAPIResponse(
+            request_executor=executor,
+            req=request,
+            service_type=request.get("service_type", "zpa"),
+            res_details=response,
+            response_body=body,
+            data_type=snake_case_keys,
+        )
+        return [snake_case_keys(i) for i in response.get_results()], response, None
+
     def __getattr__(self, name):
         """Delegate attribute access to the underlying client's zpa service"""
         try:
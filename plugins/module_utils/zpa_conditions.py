@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.module_utils._text import to_native
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_cache import (
+    name_index_cache,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_resources import (
+    build_name_index,
+    get_resource_type,
+    list_resource,
+)
+
+# Operand object types whose ``values`` can be given as ``names``.
+NAMED_VALUE_TYPES = {
+    "APP": "application_segment",
+    "APP_GROUP": "segment_group",
+    "MACHINE_GRP": "machine_group",
+    "CONSOLE": "pra_console",
+    "EDGE_CONNECTOR_GROUP": "cloud_connector_group",
+    "BRANCH_CONNECTOR_GROUP": "branch_connector_group",
+    "WORKLOAD_TAG_GROUP": "tag_group",
+}
+
+# Operand object types whose ``entry_values.lhs`` can be given as ``lhs_name``,
+# with the resource type and the field the API expects in ``lhs``.
+NAMED_LHS_TYPES = {
+    "SCIM_GROUP": ("idp", "id"),
+    "SAML": ("saml_attribute", "id"),
+    "POSTURE": ("posture_profile", "posture_udid"),
+    "TRUSTED_NETWORK": ("trusted_network", "network_id"),
+}
+
+
+def _name_indexes(client, wanted, cache, microtenant_id, concurrency):
+    """
+    Return ``{(resource_type, parent_id, value_key): {name: value}}`` for every key of ``wanted``.
+
+    Each index is listed once, concurrently across keys, and kept in ``cache``.
+    A cached index missing any of the wanted names is listed again, so objects
+    created since it was cached are found.
+    """
+
+    def index_for(key):
+        resource_type, parent_id, value_key = key
+        rtype = get_resource_type(resource_type)
+        scope = microtenant_id if rtype.microtenant else None
+        cache_key = f"{resource_type}:{scope or ''}:{parent_id or ''}:{value_key}"
+        index = cache.get(cache_key)
+        if index is not None and wanted[key].issubset(index):
+            return index
+
+        items, err = list_resource(
+            client, resource_type, microtenant_id=scope, parent_id=parent_id
+        )
+        if err:
+            raise RuntimeError(f"Error listing {resource_type}: {to_native(err)}")
+        index = build_name_index(rtype, items, value_key)
+        cache.set(cache_key, index)
+        return index
+
+    if not wanted:
+        return {}
+    keys = list(wanted)
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(keys))) as pool:
+        return dict(zip(keys, pool.map(index_for, keys)))
+
+
+def resolve_condition_names(
+    client, conditions, cache, microtenant_id=None, concurrency=8
+):
+    """
+    Replace object names in v2 policy condition operands with IDs, in place.
+
+    ``names`` of an operand are resolved and appended to its ``values``, and
+    ``lhs_name`` / ``rhs_name`` of its ``entry_values`` set ``lhs`` / ``rhs``.
+    Names are collected over all conditions first and resolved with one
+    name index per object type, so a rule, or every rule sharing ``cache``,
+    lists each type at most once. SCIM group names are resolved per IdP
+    after the IdPs themselves.
+
+    Raises ``ValueError`` for names given on object types that do not support
+    them. Returns the unresolved names, as ``"OBJECT_TYPE: name"`` strings.
+    """
+    operands = []
+    for condition in conditions or []:
+        for operand in condition.get("operands") or []:
+            obj = str(operand.get("object_type") or "").upper()
+            entry = operand.get("entry_values") or {}
+            if operand.get("names") and obj not in NAMED_VALUE_TYPES:
+                raise ValueError(
+                    f"'names' is not supported for {obj}. Supported types: "
+                    f"{', '.join(sorted(NAMED_VALUE_TYPES))}"
+                )
+            if entry.get("lhs_name") and obj not in NAMED_LHS_TYPES:
+                raise ValueError(
+                    f"'lhs_name' is not supported for {obj}. Supported types: "
+                    f"{', '.join(sorted(NAMED_LHS_TYPES))}"
+                )
+            if entry.get("rhs_name") and obj != "SCIM_GROUP":
+                raise ValueError("'rhs_name' is only supported for SCIM_GROUP")
+            operands.append((obj, operand, entry))
+
+    wanted = defaultdict(set)
+    for obj, operand, entry in operands:
+        if operand.get("names"):
+            wanted[(NAMED_VALUE_TYPES[obj], None, "id")].update(operand["names"])
+        if entry.get("lhs_name"):
+            resource_type, value_key = NAMED_LHS_TYPES[obj]
+            wanted[(resource_type, None, value_key)].add(entry["lhs_name"])
+    indexes = _name_indexes(client, wanted, cache, microtenant_id, concurrency)
+
+    missing = []
+
+    def lookup(key, name, obj):
+        value = indexes.get(key, {}).get(name)
+        if value is None:
+            missing.append(f"{obj}: {name}")
+        return value
+
+    for obj, operand, entry in operands:
+        names = operand.pop("names", None)
+        if names:
+            key = (NAMED_VALUE_TYPES[obj], None, "id")
+            resolved = [lookup(key, name, obj) for name in names]
+            operand["values"] = list(operand.get("values") or []) + [
+                v for v in resolved if v is not None
+            ]
+        lhs_name = entry.pop("lhs_name", None)
+        if lhs_name:
+            resource_type, value_key = NAMED_LHS_TYPES[obj]
+            entry["lhs"] = lookup((resource_type, None, value_key), lhs_name, obj)
+
+    # SCIM groups are scoped to their IdP, so they need the IdP IDs first.
+    scim_groups = defaultdict(set)
+    for obj, operand, entry in operands:
+        if entry.get("rhs_name") and entry.get("lhs"):
+            scim_groups[("scim_group", entry["lhs"], "id")].add(entry["rhs_name"])
+    indexes.update(
+        _name_indexes(client, scim_groups, cache, microtenant_id, concurrency)
+    )
+    for obj, operand, entry in operands:
+        rhs_name = entry.pop("rhs_name", None)
+        if rhs_name and entry.get("lhs"):
+            entry["rhs"] = lookup(("scim_group", entry["lhs"], "id"), rhs_name, obj)
+
+    return missing
+
+
+def resolve_rule_condition_names(module, client, conditions):
+    """Resolve operand names of a policy module's ``conditions``, failing the module on errors."""
+    try:
+        missing = resolve_condition_names(
+            client,
+            conditions,
+            name_index_cache(module.params),
+            microtenant_id=module.params.get("microtenant_id"),
+        )
+    except ValueError as e:
+        module.fail_json(msg=to_native(e))
+    if missing:
+        module.fail_json(
+            msg=f"Unable to resolve condition operand name(s): {', '.join(missing)}"
+        )
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import heapq
+import re
+from collections import Counter
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_resources import (
+    iter_resource_pages,
+)
+
+# Group fields of the enrollment types that share the controller layout.
+FLEET_GROUP_FIELDS = {
+    "app_connector": "app_connector_group_name",
+    "service_edge": "service_edge_group_name",
+}
+
+
+def version_key(version):
+    """Comparable form of a dotted version string such as ``24.103.2``."""
+    return tuple(int(part) for part in re.findall(r"\d+", str(version)))
+
+
+def epoch_seconds(value):
+    """Controller timestamps are epoch seconds, or milliseconds on some endpoints."""
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return value / 1000 if value > 1e11 else value
+
+
+def summarize_fleet(client, resource_type, microtenant_id=None, top=10):
+    """
+    Aggregate an App Connector or Service Edge listing in a single streaming pass.
+
+    Pages are listed raw and folded into counters as they arrive, so only one
+    page is held at a time and nothing per object outlives it except the
+    ``top`` entries that were seen the longest time ago.
+    Returns ``(summary, error)``.
+    """
+    group_field = FLEET_GROUP_FIELDS[resource_type]
+    by_status = Counter()
+    by_version = Counter()
+    by_group = Counter()
+    by_upgrade_status = Counter()
+    total = enabled = never_connected = 0
+    # Max-heap on last_seen (negated) keeping the ``top`` oldest entries.
+    oldest = []
+
+    pages = iter_resource_pages(client, resource_type, microtenant_id, raw=True)
+    for page, err in pages:
+        if err:
+            return None, err
+        for item in page:
+            total += 1
+            if item.get("enabled"):
+                enabled += 1
+            by_status[item.get("control_channel_status") or "UNKNOWN"] += 1
+            by_version[item.get("current_version") or "UNKNOWN"] += 1
+            by_group[item.get(group_field) or "UNKNOWN"] += 1
+            by_upgrade_status[item.get("upgrade_status") or "UNKNOWN"] += 1
+
+            last_seen = epoch_seconds(item.get("last_broker_connect_time"))
+            if not last_seen:
+                never_connected += 1
+                continue
+            if top <= 0:
+                continue
+            entry = (-last_seen, item.get("id") or "", item.get("name"))
+            if len(oldest) < top:
+                heapq.heappush(oldest, entry)
+            elif entry > oldest[0]:
+                heapq.heapreplace(oldest, entry)
+
+    return {
+        "total": total,
+        "enabled": enabled,
+        "never_connected": never_connected,
+        "by_status": dict(by_status),
+        "by_version": dict(
+            sorted(by_version.items(), key=lambda kv: version_key(kv[0]))
+        ),
+        "by_group": dict(by_group),
+        "by_upgrade_status": dict(by_upgrade_status),
+        "oldest_last_seen": [
+            {"id": obj_id, "name": name, "last_seen": int(-neg)}
+            for neg, obj_id, name in sorted(oldest, reverse=True)
+        ],
+    }, None
+
+
+# Enrollment types checked against version profiles: the group type, the
+# field linking an instance to its group, and the profile roles that apply.
+COMPLIANCE_COMPONENTS = {
+    "app_connector": ("app_connector_group", "app_connector_group_id", ("connector",)),
+    "service_edge": (
+        "service_edge_group",
+        "service_edge_group_id",
+        ("pse", "broker", "service_edge"),
+    ),
+}
+
+
+def profile_versions(profile, component):
+    """Versions a version profile allows for ``component``, as a set."""
+    roles = COMPLIANCE_COMPONENTS[component][2]
+    versions = set()
+    for detail in profile.get("version_details") or []:
+        role = str(detail.get("role") or "").lower()
+        if detail.get("version") and any(r in role for r in roles):
+            versions.add(detail["version"])
+    return versions
+
+
+def version_compliance(client, component, profiles, microtenant_id=None):
+    """
+    Join the groups and instances of ``component`` with their version profiles.
+
+    ``profiles`` maps profile IDs to profile dicts. Groups are indexed by ID
+    from one listing, then the instance listing is streamed and each instance
+    is checked against the versions allowed by its group's profile.
+    Returns ``(groups, out_of_profile, error)``.
+    """
+    group_type, group_field, _roles = COMPLIANCE_COMPONENTS[component]
+
+    groups = {}
+    for page, err in iter_resource_pages(client, group_type, microtenant_id, raw=True):
+        if err:
+            return None, None, err
+        for group in page:
+            profile_id = str(group.get("version_profile_id") or "0")
+            profile = profiles.get(profile_id)
+            groups[str(group.get("id"))] = {
+                "id": group.get("id"),
+                "name": group.get("name"),
+                "component": component,
+                "version_profile_id": profile_id,
+                "version_profile_name": (
+                    profile.get("name")
+                    if profile
+                    else group.get("version_profile_name")
+                ),
+                "allowed_versions": (
+                    sorted(profile_versions(profile, component), key=version_key)
+                    if profile
+                    else []
+                ),
+                "total": 0,
+                "compliant": 0,
+                "out_of_profile": 0,
+            }
+    allowed = {gid: set(g["allowed_versions"]) for gid, g in groups.items()}
+
+    out_of_profile = []
+    for page, err in iter_resource_pages(client, component, microtenant_id, raw=True):
+        if err:
+            return None, None, err
+        for item in page:
+            gid = str(item.get(group_field))
+            group = groups.get(gid)
+            if group is None:
+                continue
+            group["total"] += 1
+            versions = allowed[gid]
+            # A profile that pins no version for this role cannot be violated.
+            if not versions or item.get("current_version") in versions:
+                group["compliant"] += 1
+                continue
+            group["out_of_profile"] += 1
+            out_of_profile.append(
+                {
+                    "id": item.get("id"),
+                    "name": item.get("name"),
+                    "component": component,
+                    "group_id": group["id"],
+                    "group_name": group["name"],
+                    "current_version": item.get("current_version"),
+                    "allowed_versions": group["allowed_versions"],
+                }
+            )
+
+    for group in groups.values():
+        group["compliant_pct"] = (
+            round(100.0 * group["compliant"] / group["total"], 1)
+            if group["total"]
+            else 100.0
+        )
+    return list(groups.values()), out_of_profile, None
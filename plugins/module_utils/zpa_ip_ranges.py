@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import bisect
+import traceback
+
+try:
+    import netaddr
+
+    HAS_NETADDR = True
+    NETADDR_IMPORT_ERROR = None
+except ImportError:
+    HAS_NETADDR = False
+    NETADDR_IMPORT_ERROR = traceback.format_exc()
+
+
+def range_bounds(item):
+    """
+    The ``(version, first, last)`` integer bounds of a C2C IP range dict, taken
+    from ``subnet_cidr`` or from ``ip_range_begin``/``ip_range_end``.
+    Returns None when the item has no addresses, raises ValueError when they are invalid.
+    """
+    cidr = item.get("subnet_cidr")
+    begin = item.get("ip_range_begin")
+    end = item.get("ip_range_end") or begin
+    try:
+        if cidr:
+            network = netaddr.IPNetwork(cidr)
+            return network.version, network.first, network.last
+        if not begin:
+            return None
+        first, last = netaddr.IPAddress(begin), netaddr.IPAddress(end)
+    except (netaddr.AddrFormatError, TypeError) as e:
+        raise ValueError(f"Invalid address in C2C IP range '{item.get('name')}': {e}")
+    if first.version != last.version:
+        raise ValueError(
+            f"C2C IP range '{item.get('name')}' mixes IPv4 and IPv6 addresses"
+        )
+    if int(first) > int(last):
+        raise ValueError(
+            f"C2C IP range '{item.get('name')}' begins after it ends: {begin} > {end}"
+        )
+    return first.version, int(first), int(last)
+
+
+def describe_range(item):
+    if item.get("subnet_cidr"):
+        return item["subnet_cidr"]
+    begin = item.get("ip_range_begin")
+    return f"{begin}-{item.get('ip_range_end') or begin}"
+
+
+class RangeIndex:
+    """
+    Interval index over C2C IP ranges, per IP version.
+
+    Intervals are sorted by their first address, with a running maximum of the
+    last addresses, so a query only walks back over the intervals that start
+    before the queried range ends and stops as soon as none can reach it.
+    """
+
+    def __init__(self, items):
+        by_version = {}
+        for item in items:
+            bounds = range_bounds(item)
+            if bounds:
+                version, first, last = bounds
+                by_version.setdefault(version, []).append((first, last, item))
+        self._starts = {}
+        self._intervals = {}
+        self._reach = {}
+        for version, intervals in by_version.items():
+            intervals.sort(key=lambda i: (i[0], i[1]))
+            reach = []
+            for _first, last, _item in intervals:
+                reach.append(max(last, reach[-1]) if reach else last)
+            self._starts[version] = [i[0] for i in intervals]
+            self._intervals[version] = intervals
+            self._reach[version] = reach
+
+    def overlapping(self, item, exclude=()):
+        """The indexed ranges sharing at least one address with ``item``."""
+        bounds = range_bounds(item)
+        if not bounds:
+            return []
+        version, first, last = bounds
+        intervals = self._intervals.get(version, [])
+        reach = self._reach.get(version, [])
+        i = bisect.bisect_right(self._starts.get(version, []), last) - 1
+        found = []
+        while i >= 0 and reach[i] >= first:
+            other_last, other = intervals[i][1], intervals[i][2]
+            if other_last >= first and other.get("name") not in exclude:
+                found.append(other)
+            i -= 1
+        found.reverse()
+        return found
+
+
+def overlap_errors(index, items, exclude=()):
+    """
+    Describe every overlap between ``items`` and the ranges in ``index``,
+    ignoring a range overlapping itself and the names in ``exclude``.
+    """
+    errors = []
+    seen = set()
+    for item in items:
+        for other in index.overlapping(item, exclude):
+            pair = frozenset((item.get("name"), other.get("name")))
+            if other is item or len(pair) == 1 or pair in seen:
+                continue
+            seen.add(pair)
+            errors.append(
+                f"'{item.get('name')}' ({describe_range(item)}) overlaps "
+                f"'{other.get('name')}' ({describe_range(other)})"
+            )
+    return errors
@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import copy
+import gzip
+import json
+import os
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
+    convert_conditions_v1_to_v2,
+    map_conditions_v2,
+    normalize_app,
+    normalize_policy_v2,
+    normalize_port_processing,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_resources import (
+    get_resource_type,
+)
+
+
+def _ids_from_objects(obj, objects_key, ids_key):
+    """Replace a list of ``{"id": ...}`` objects with a sorted list of string IDs."""
+    if isinstance(obj.get(objects_key), list):
+        obj[ids_key] = sorted(str(o["id"]) for o in obj.pop(objects_key) if o.get("id"))
+    if isinstance(obj.get(ids_key), list):
+        obj[ids_key] = sorted(str(i) for i in obj[ids_key])
+    return obj
+
+
+def _normalize_application_segment(obj, desired):
+    return _ids_from_objects(
+        normalize_port_processing(obj), "server_groups", "server_group_ids"
+    )
+
+
+def _normalize_app(obj, desired):
+    return normalize_app(obj)
+
+
+def _normalize_server_group(obj, desired):
+    normalized = normalize_app(obj)
+    _ids_from_objects(normalized, "app_connector_groups", "app_connector_group_ids")
+    _ids_from_objects(normalized, "servers", "server_ids")
+    return normalized
+
+
+def _normalize_policy(obj, desired):
+    if desired:
+        return normalize_policy_v2(
+            {**obj, "conditions": map_conditions_v2(obj.get("conditions", []))}
+        )
+    return normalize_policy_v2(
+        {**obj, "conditions": convert_conditions_v1_to_v2(obj.get("conditions", []))}
+    )
+
+
+def _equal_default(desired_value, current_value):
+    if isinstance(desired_value, list) and isinstance(current_value, list):
+        if all(isinstance(v, (str, int)) for v in desired_value + current_value):
+            return sorted(map(str, desired_value)) == sorted(map(str, current_value))
+    if not desired_value and not current_value:
+        return True
+    return desired_value == current_value
+
+
+def _equal_policy(desired_value, current_value):
+    if isinstance(desired_value, list) and not desired_value:
+        desired_value = []
+    if isinstance(current_value, list) and not current_value:
+        current_value = []
+    return str(desired_value) == str(current_value)
+
+
+# resource type -> (normalizer, comparator, keys never compared)
+PLAN_HANDLERS = {
+    "application_segment": (_normalize_application_segment, _equal_default, ("id",)),
+    "application_segment_pra": (_normalize_app, _equal_default, ("id",)),
+    "application_segment_inspection": (_normalize_app, _equal_default, ("id",)),
+    "application_segment_ba_v2": (_normalize_app, _equal_default, ("id",)),
+    "segment_group": (_normalize_app, _equal_default, ("id",)),
+    "server_group": (_normalize_server_group, _equal_default, ("id",)),
+    "application_server": (_normalize_app, _equal_default, ("id",)),
+}
+for _policy_type in (
+    "policy_access_rule",
+    "policy_timeout_rule",
+    "policy_forwarding_rule",
+    "policy_isolation_rule",
+    "policy_inspection_rule",
+    "policy_redirection_rule",
+    "policy_credential_rule",
+    "policy_capabilities_rule",
+):
+    PLAN_HANDLERS[_policy_type] = (
+        _normalize_policy,
+        _equal_policy,
+        ("id", "policy_type", "rule_order"),
+    )
+
+
+class TenantSnapshot:
+    """
+    In-memory indexes over a tenant snapshot written by ``zpa_tenant_export``.
+
+    Objects are kept as plain dicts and indexed by ID and by name per resource
+    type, so lookups during planning are constant time and never touch the API.
+    """
+
+    def __init__(self):
+        self._items = {}
+        self._by_id = {}
+        self._by_name = {}
+
+    @classmethod
+    def load(cls, path, resource_types=None):
+        """Load ``resource_types`` (default: all in the manifest) from a snapshot directory."""
+        snapshot = cls()
+        files = {}
+        manifest_path = os.path.join(path, "manifest.json")
+        if os.path.exists(manifest_path):
+            with open(manifest_path, encoding="utf-8") as fh:
+                entries = json.load(fh).get("resource_types") or {}
+            files = {rt: entry.get("file") for rt, entry in entries.items()}
+
+        for resource_type in resource_types or sorted(files):
+            file_name = files.get(resource_type)
+            if not file_name:
+                for candidate in (
+                    f"{resource_type}.jsonl.gz",
+                    f"{resource_type}.jsonl",
+                ):
+                    if os.path.exists(os.path.join(path, candidate)):
+                        file_name = candidate
+                        break
+            if not file_name:
+                raise ValueError(
+                    f"Snapshot {path} does not contain resource type '{resource_type}'"
+                )
+            snapshot.load_file(resource_type, os.path.join(path, file_name))
+        return snapshot
+
+    def load_file(self, resource_type, file_path):
+        opener = gzip.open if file_path.endswith(".gz") else open
+        self._items.setdefault(resource_type, [])
+        with opener(file_path, "rt", encoding="utf-8") as fh:
+            for line in fh:
+                if line.strip():
+                    self.add(resource_type, json.loads(line))
+
+    def add(self, resource_type, item):
+        rtype = get_resource_type(resource_type)
+        self._items.setdefault(resource_type, []).append(item)
+        if item.get("id") is not None:
+            self._by_id.setdefault(resource_type, {})[str(item["id"])] = item
+        name = rtype.name_of(item)
+        if name is not None:
+            self._by_name.setdefault(resource_type, {}).setdefault(name, item)
+
+    def items(self, resource_type):
+        return self._items.get(resource_type, [])
+
+    def get_by_id(self, resource_type, obj_id):
+        return self._by_id.get(resource_type, {}).get(str(obj_id))
+
+    def get_by_name(self, resource_type, name):
+        return self._by_name.get(resource_type, {}).get(name)
+
+    def find(self, resource_type, obj):
+        """Return the snapshot object matching ``obj`` by ID, falling back to its name."""
+        if obj.get("id"):
+            return self.get_by_id(resource_type, obj["id"])
+        name = get_resource_type(resource_type).name_of(obj)
+        return self.get_by_name(resource_type, name) if name is not None else None
+
+
+def diff_object(resource_type, desired, current):
+    """
+    Compare a desired object against its snapshot counterpart.
+
+    Both sides go through the same normalizers the resource modules use, and
+    only keys set in ``desired`` are compared. Returns ``{key: {"current",
+    "desired"}}`` for every drifted key.
+    """
+    normalize, equal, ignored = PLAN_HANDLERS[resource_type]
+    desired_n = normalize(
+        copy.deepcopy({k: v for k, v in desired.items() if v is not None}), True
+    )
+    current_n = normalize(copy.deepcopy(current), False)
+
+    diff = {}
+    for key in desired_n:
+        if key in ignored:
+            continue
+        desired_value = desired_n.get(key)
+        current_value = current_n.get(key)
+        if not equal(desired_value, current_value):
+            diff[key] = {"current": current_value, "desired": desired_value}
+    return diff
+
+
+def build_plan(snapshot, desired_state, prune=False):
+    """
+    Evaluate ``{resource_type: [desired objects]}`` against a snapshot.
+
+    Returns a list of actions (``create``, ``update``, ``delete``, ``noop``).
+    Objects present in the snapshot but not in the desired state are planned
+    for deletion only when ``prune`` is set, and only for the resource types
+    given in ``desired_state``.
+    """
+    plan = []
+    for resource_type in sorted(desired_state):
+        if resource_type not in PLAN_HANDLERS:
+            raise ValueError(
+                f"Resource type '{resource_type}' is not supported by the planner. "
+                f"Supported types: {', '.join(sorted(PLAN_HANDLERS))}"
+            )
+        rtype = get_resource_type(resource_type)
+        matched = set()
+        for desired in desired_state[resource_type] or []:
+            state = desired.get("state") or "present"
+            obj = {k: v for k, v in desired.items() if k != "state"}
+            current = snapshot.find(resource_type, obj)
+            name = rtype.name_of(obj) or (current and rtype.name_of(current))
+            entry = {"resource_type": resource_type, "name": name}
+            if current is not None:
+                entry["id"] = str(current.get("id"))
+                matched.add(entry["id"])
+
+            if state == "absent":
+                entry["action"] = "delete" if current is not None else "noop"
+            elif current is None:
+                entry["action"] = "create"
+            else:
+                diff = diff_object(resource_type, obj, current)
+                entry["action"] = "update" if diff else "noop"
+                if diff:
+                    entry["diff"] = diff
+            plan.append(entry)
+
+        if prune:
+            for item in snapshot.items(resource_type):
+                if str(item.get("id")) not in matched:
+                    plan.append(
+                        {
+                            "resource_type": resource_type,
+                            "name": rtype.name_of(item),
+                            "id": str(item.get("id")),
+                            "action": "delete",
+                        }
+                    )
+    return plan
+
+
+def summarize_plan(plan):
+    summary = {"create": 0, "update": 0, "delete": 0, "noop": 0}
+    for entry in plan:
+        summary[entry["action"]] += 1
+    return summary
@@ -0,0 +1,796 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import time
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
+    collect_all_items,
+    iter_item_pages,
+)
+
+
+class ZPAResourceType:
+    """
+    Describes how to list and delete one ZPA resource type through the SDK.
+
+    The SDK services are not uniform (positional scope arguments, parent IDs,
+    non-paginated list calls, different ID argument names), so every entry
+    records the pieces needed to call them the same way from shared helpers.
+
+    ``endpoint`` is the REST path of the collection, relative to the customer,
+    for types that can also be listed and deleted through AsyncZPATransport.
+    ``base_path`` and ``api_version`` name the API it lives under, as the SDK
+    service of the type calls it.
+    """
+
+    def __init__(
+        self,
+        service,
+        list_method,
+        id_arg=None,
+        delete_method=None,
+        scope=None,
+        delete_kwargs=None,
+        parent=None,
+        name_key="name",
+        paginated=True,
+        microtenant=True,
+        endpoint=None,
+        base_path="mgmtconfig",
+        api_version="v1",
+    ):
+        self.service = service
+        self.list_method = list_method
+        self.id_arg = id_arg
+        self.delete_method = delete_method
+        self.scope = scope or {}
+        self.delete_kwargs = delete_kwargs or {}
+        self.parent = parent
+        self.name_key = name_key
+        self.paginated = paginated
+        self.microtenant = microtenant
+        self.endpoint = endpoint
+        self.base_path = base_path
+        self.api_version = api_version
+
+    def list_fn(self, client, parent_id=None, raw=False):
+        """
+        Return a ``list_fn(query_params)`` callable suitable for collect_all_items.
+
+        With ``raw``, types that have an ``endpoint`` are listed through
+        ZPAClientHelper.list_raw and yield plain snake_case dicts.
+        """
+        if raw and self.endpoint:
+            return lambda qp: client.list_raw(
+                self.endpoint,
+                qp,
+                api_version=self.api_version,
+                base_path=self.base_path,
+            )
+        method = getattr(getattr(client, self.service), self.list_method)
+        kwargs = dict(self.scope)
+        if self.parent:
+            kwargs[self.parent + "_id"] = parent_id
+
+        if not self.paginated:
+            return lambda qp: method(**kwargs)
+        return lambda qp: method(query_params=qp, **kwargs)
+
+    def delete(self, client, obj_id, microtenant_id=None, parent_id=None):
+        """Delete one object, returning the SDK ``(result, response, error)`` tuple."""
+        if not self.delete_method:
+            raise ValueError(f"Resource '{self.service}' does not support deletion")
+        method = getattr(getattr(client, self.service), self.delete_method)
+        kwargs = dict(self.scope)
+        kwargs.update(self.delete_kwargs)
+        kwargs[self.id_arg] = obj_id
+        if self.parent:
+            kwargs[self.parent + "_id"] = parent_id
+        if self.microtenant and microtenant_id:
+            kwargs["microtenant_id"] = microtenant_id
+        return method(**kwargs)
+
+    def delete_async(self, transport, obj_id, microtenant_id=None):
+        """Return a coroutine deleting one object through an AsyncZPATransport."""
+        if not self.endpoint or not self.delete_method:
+            raise ValueError(
+                f"Resource '{self.service}' does not support asynchronous deletion"
+            )
+        params = {k: v for k, v in self.delete_kwargs.items() if v}
+        if self.microtenant and microtenant_id:
+            params["microtenant_id"] = microtenant_id
+        return transport.delete(
+            f"{self.endpoint}/{obj_id}",
+            params=params,
+            api_version=self.api_version,
+            base_path=self.base_path,
+        )
+
+    def list_async(self, transport, microtenant_id=None):
+        """Return a coroutine listing every object through an AsyncZPATransport."""
+        if not self.endpoint or self.parent:
+            raise ValueError(
+                f"Resource '{self.service}' does not support asynchronous listing"
+            )
+        return transport.list_all(
+            self.endpoint,
+            params=_query_params(self, microtenant_id),
+            api_version=self.api_version,
+            base_path=self.base_path,
+        )
+
+    def name_of(self, item):
+        """Resolve the display name of an item, following dotted ``name_key`` paths."""
+        value = item
+        for part in self.name_key.split("."):
+            if not isinstance(value, dict):
+                return None
+            value = value.get(part)
+        return value
+
+
+RESOURCE_TYPES = {
+    "application_segment": ZPAResourceType(
+        "application_segment",
+        "list_segments",
+        id_arg="segment_id",
+        delete_method="delete_segment",
+        delete_kwargs={"force_delete": True},
+        endpoint="/application",
+    ),
+    "application_segment_ba_v2": ZPAResourceType(
+        "app_segments_ba_v2",
+        "list_segments_ba",
+        id_arg="segment_id",
+        delete_method="delete_segment_ba",
+        delete_kwargs={"force_delete": True},
+    ),
+    "application_segment_inspection": ZPAResourceType(
+        "app_segments_inspection",
+        "list_segment_inspection",
+        id_arg="segment_id",
+        delete_method="delete_segment_inspection",
+        delete_kwargs={"force_delete": True},
+        microtenant=False,
+    ),
+    "application_segment_pra": ZPAResourceType(
+        "app_segments_pra",
+        "list_segments_pra",
+        id_arg="segment_id",
+        delete_method="delete_segment_pra",
+        delete_kwargs={"force_delete": True},
+    ),
+    "segment_group": ZPAResourceType(
+        "segment_groups",
+        "list_groups",
+        id_arg="group_id",
+        delete_method="delete_group",
+        endpoint="/segmentGroup",
+    ),
+    "server_group": ZPAResourceType(
+        "server_groups",
+        "list_groups",
+        id_arg="group_id",
+        delete_method="delete_group",
+        endpoint="/serverGroup",
+    ),
+    "application_server": ZPAResourceType(
+        "servers",
+        "list_servers",
+        id_arg="server_id",
+        delete_method="delete_server",
+        endpoint="/server",
+    ),
+    "app_connector_group": ZPAResourceType(
+        "app_connector_groups",
+        "list_connector_groups",
+        id_arg="group_id",
+        delete_method="delete_connector_group",
+        endpoint="/appConnectorGroup",
+    ),
+    "app_connector": ZPAResourceType(
+        "app_connectors",
+        "list_connectors",
+        id_arg="connector_id",
+        delete_method="delete_connector",
+        endpoint="/connector",
+    ),
+    "service_edge_group": ZPAResourceType(
+        "service_edge_group",
+        "list_service_edge_groups",
+        id_arg="group_id",
+        delete_method="delete_service_edge_group",
+        endpoint="/serviceEdgeGroup",
+    ),
+    "service_edge": ZPAResourceType(
+        "service_edges",
+        "list_service_edges",
+        id_arg="service_edge_id",
+        delete_method="delete_service_edge",
+        endpoint="/serviceEdge",
+    ),
+    "connector_provisioning_key": ZPAResourceType(
+        "provisioning",
+        "list_provisioning_keys",
+        id_arg="key_id",
+        delete_method="delete_provisioning_key",
+        scope={"key_type": "connector"},
+    ),
+    "service_edge_provisioning_key": ZPAResourceType(
+        "provisioning",
+        "list_provisioning_keys",
+        id_arg="key_id",
+        delete_method="delete_provisioning_key",
+        scope={"key_type": "service_edge"},
+    ),
+    "private_cloud_group": ZPAResourceType(
+        "private_cloud_group",
+        "list_cloud_groups",
+        id_arg="group_id",
+        delete_method="delete_cloud_group",
+        endpoint="/privateCloudControllerGroup",
+    ),
+    "cloud_connector_group": ZPAResourceType(
+        "cloud_connector_groups", "list_cloud_connector_groups", microtenant=False
+    ),
+    "branch_connector_group": ZPAResourceType(
+        "branch_connector_group", "list_branch_connector_groups", microtenant=False
+    ),
+    "ba_certificate": ZPAResourceType(
+        "certificates",
+        "list_issued_certificates",
+        id_arg="certificate_id",
+        delete_method="delete_certificate",
+    ),
+    "enrollment_certificate": ZPAResourceType(
+        "enrollment_certificates", "list_enrolment", microtenant=False
+    ),
+    "idp": ZPAResourceType(
+        "idp", "list_idps", microtenant=False, endpoint="/idp", api_version="v2"
+    ),
+    "scim_group": ZPAResourceType(
+        "scim_groups", "list_scim_groups", parent="idp", microtenant=False
+    ),
+    "scim_attribute": ZPAResourceType(
+        "scim_attributes", "list_scim_attributes", parent="idp", microtenant=False
+    ),
+    "saml_attribute": ZPAResourceType(
+        "saml_attributes",
+        "list_saml_attributes",
+        microtenant=False,
+        endpoint="/samlAttribute",
+        api_version="v2",
+    ),
+    "posture_profile": ZPAResourceType(
+        "posture_profiles",
+        "list_posture_profiles",
+        microtenant=False,
+        endpoint="/posture",
+        api_version="v2",
+    ),
+    "trusted_network": ZPAResourceType(
+        "trusted_networks",
+        "list_trusted_networks",
+        microtenant=False,
+        endpoint="/network",
+        api_version="v2",
+    ),
+    "machine_group": ZPAResourceType(
+        "machine_groups", "list_machine_groups", endpoint="/machineGroup"
+    ),
+    "customer_version_profile": ZPAResourceType(
+        "customer_version_profile", "list_version_profiles", microtenant=False
+    ),
+    "lss_config": ZPAResourceType(
+        "lss",
+        "list_configs",
+        id_arg="lss_config_id",
+        delete_method="delete_lss_config",
+        name_key="config.name",
+        microtenant=False,
+    ),
+    "c2c_ip_range": ZPAResourceType(
+        "c2c_ip_ranges",
+        "list_ip_ranges",
+        id_arg="range_id",
+        delete_method="delete_ip_range",
+        paginated=False,
+        microtenant=False,
+    ),
+    "cbi_certificate": ZPAResourceType(
+        "cbi_certificate",
+        "list_cbi_certificates",
+        id_arg="certificate_id",
+        delete_method="delete_cbi_certificate",
+        paginated=False,
+        microtenant=False,
+    ),
+    "cbi_banner": ZPAResourceType(
+        "cbi_banner",
+        "list_cbi_banners",
+        id_arg="banner_id",
+        delete_method="delete_cbi_banner",
+        paginated=False,
+        microtenant=False,
+    ),
+    "pra_portal": ZPAResourceType(
+        "pra_portal",
+        "list_portals",
+        id_arg="portal_id",
+        delete_method="delete_portal",
+        endpoint="/praPortal",
+    ),
+    "pra_console": ZPAResourceType(
+        "pra_console",
+        "list_consoles",
+        id_arg="console_id",
+        delete_method="delete_console",
+        endpoint="/praConsole",
+    ),
+    "pra_credential": ZPAResourceType(
+        "pra_credential",
+        "list_credentials",
+        id_arg="credential_id",
+        delete_method="delete_credential",
+        endpoint="/credential",
+    ),
+    "pra_credential_pool": ZPAResourceType(
+        "pra_credential_pool",
+        "list_credential_pool",
+        id_arg="pool_id",
+        delete_method="delete_credential_pool",
+        endpoint="/credential-pool",
+        base_path="waap-pra-config",
+    ),
+    "user_portal": ZPAResourceType(
+        "user_portal_controller",
+        "list_user_portals",
+        id_arg="portal_id",
+        delete_method="delete_user_portal",
+        endpoint="/userPortal",
+    ),
+    "user_portal_link": ZPAResourceType(
+        "user_portal_link",
+        "list_portal_link",
+        id_arg="portal_link_id",
+        delete_method="delete_portal_link",
+        endpoint="/userPortalLink",
+    ),
+    "tag_namespace": ZPAResourceType(
+        "tag_namespace",
+        "list_namespaces",
+        id_arg="namespace_id",
+        delete_method="delete_namespace",
+        microtenant=False,
+    ),
+    "tag_key": ZPAResourceType(
+        "tag_key",
+        "list_tag_keys",
+        id_arg="tag_key_id",
+        delete_method="delete_tag_key",
+        parent="namespace",
+        microtenant=False,
+    ),
+    "tag_group": ZPAResourceType(
+        "tag_group",
+        "list_tag_groups",
+        id_arg="tag_group_id",
+        delete_method="delete_tag_group",
+        microtenant=False,
+    ),
+}
+
+# Policy rule sets share one SDK service and differ only by ``policy_type``.
+for _resource_name, _policy_type in (
+    ("policy_access_rule", "access"),
+    ("policy_timeout_rule", "timeout"),
+    ("policy_forwarding_rule", "client_forwarding"),
+    ("policy_isolation_rule", "isolation"),
+    ("policy_inspection_rule", "inspection"),
+    ("policy_redirection_rule", "redirection"),
+    ("policy_credential_rule", "credential"),
+    ("policy_capabilities_rule", "capabilities"),
+):
+    RESOURCE_TYPES[_resource_name] = ZPAResourceType(
+        "policies",
+        "list_rules",
+        id_arg="rule_id",
+        delete_method="delete_rule",
+        scope={"policy_type": _policy_type},
+    )
+
+
+# Resource type listed to enumerate the parents of scoped resource types.
+PARENT_RESOURCE_TYPES = {"idp": "idp", "namespace": "tag_namespace"}
+
+# Deletion order: objects in a tier may reference objects in later tiers,
+# never the other way round, so tiers are deleted first to last.
+DELETE_TIERS = (
+    tuple(rt for rt in RESOURCE_TYPES if rt.startswith("policy_")),
+    ("pra_console", "user_portal_link", "lss_config"),
+    (
+        "application_segment",
+        "application_segment_ba_v2",
+        "application_segment_inspection",
+        "application_segment_pra",
+    ),
+    (
+        "segment_group",
+        "server_group",
+        "pra_portal",
+        "user_portal",
+        "pra_credential_pool",
+        "tag_group",
+    ),
+    (
+        "application_server",
+        "app_connector",
+        "service_edge",
+        "connector_provisioning_key",
+        "service_edge_provisioning_key",
+        "pra_credential",
+        "tag_key",
+    ),
+    (
+        "app_connector_group",
+        "service_edge_group",
+        "private_cloud_group",
+        "ba_certificate",
+        "cbi_certificate",
+        "cbi_banner",
+        "c2c_ip_range",
+        "tag_namespace",
+    ),
+)
+
+
+def delete_tier(resource_type):
+    """Return the index of the DELETE_TIERS entry holding ``resource_type``."""
+    for index, tier in enumerate(DELETE_TIERS):
+        if resource_type in tier:
+            return index
+    raise KeyError(f"Resource type '{resource_type}' does not support deletion")
+
+
+def get_resource_type(resource_type):
+    """Return the registry entry for ``resource_type`` or raise ``KeyError`` with the valid choices."""
+    try:
+        return RESOURCE_TYPES[resource_type]
+    except KeyError:
+        raise KeyError(
+            f"Unsupported resource type '{resource_type}'. "
+            f"Supported types: {', '.join(sorted(RESOURCE_TYPES))}"
+        )
+
+
+def _as_dict(item):
+    return item.as_dict() if hasattr(item, "as_dict") else item
+
+
+def _query_params(rtype, microtenant_id):
+    query_params = {}
+    if rtype.microtenant and microtenant_id:
+        query_params["microtenant_id"] = microtenant_id
+    return query_params
+
+
+def list_resource(
+    client, resource_type, microtenant_id=None, parent_id=None, raw=False
+):
+    """
+    List every object of ``resource_type`` as plain dicts, skipping SDK
+    models when ``raw`` is set and the type supports it.
+
+    Returns a ``(items, error)`` tuple, like collect_all_items.
+    """
+    rtype = get_resource_type(resource_type)
+    items, err = collect_all_items(
+        rtype.list_fn(client, parent_id, raw), _query_params(rtype, microtenant_id)
+    )
+    if err:
+        return None, err
+    return [_as_dict(i) for i in items], None
+
+
+def iter_resource_pages(
+    client, resource_type, microtenant_id=None, parent_id=None, raw=False
+):
+    """Like list_resource, but yields ``(page, error)`` tuples one page at a time."""
+    rtype = get_resource_type(resource_type)
+    pages = iter_item_pages(
+        rtype.list_fn(client, parent_id, raw), _query_params(rtype, microtenant_id)
+    )
+    for page, err in pages:
+        if err:
+            yield None, err
+            return
+        yield [_as_dict(i) for i in page], None
+
+
+def iter_scoped_pages(client, resource_type, microtenant_id=None):
+    """
+    Like iter_resource_pages, but scoped types are listed under every parent
+    object and each item carries its parent ID in ``_parent_id``.
+    """
+    rtype = get_resource_type(resource_type)
+    if not rtype.parent:
+        yield from iter_resource_pages(client, resource_type, microtenant_id)
+        return
+
+    parent_type = PARENT_RESOURCE_TYPES[rtype.parent]
+    for parents, err in iter_resource_pages(client, parent_type, microtenant_id):
+        if err:
+            yield None, err
+            return
+        for parent in parents:
+            parent_id = parent.get("id")
+            for page, err in iter_resource_pages(
+                client, resource_type, microtenant_id, parent_id=parent_id
+            ):
+                if err:
+                    yield None, err
+                    return
+                for item in page:
+                    item["_parent_id"] = parent_id
+                yield page, None
+
+
+def build_name_index(rtype, items, value_key="id"):
+    """
+    Map each object name to its ID, or to another ``value_key`` field.
+    Duplicate names keep the first occurrence.
+    """
+    index = {}
+    for item in items:
+        name = rtype.name_of(item)
+        value = item.get(value_key)
+        if name is not None and value is not None and name not in index:
+            index[name] = str(value)
+    return index
+
+
+# Default certificate used for each provisioning key / component type.
+DEFAULT_ENROLLMENT_CERTS = {"connector": "Connector", "service_edge": "Service Edge"}
+
+
+def _resolve_by_search(list_method, name, cache, key):
+    """Resolve ``name`` to an ID with one ``search`` list call, remembering hits in ``cache``."""
+    obj_id = cache.get(key)
+    if obj_id is not None:
+        return obj_id, None
+
+    items, _unused, err = list_method(query_params={"search": name})
+    if err:
+        return None, err
+    for item in map(_as_dict, items or []):
+        if item.get("name") == name and item.get("id"):
+            obj_id = str(item["id"])
+            cache.set(key, obj_id)
+            return obj_id, None
+    return None, None
+
+
+def resolve_enrollment_cert_id(client, name, cache):
+    """
+    Resolve an enrollment certificate name to its ID through ``cache`` (a ZPACache).
+
+    A cache miss costs a single server-side search rather than a full listing.
+    Returns a ``(cert_id, error)`` tuple; ``cert_id`` is None when no certificate
+    has exactly that name.
+    """
+    return _resolve_by_search(
+        client.enrollment_certificates.list_enrolment, name, cache, f"name:{name}"
+    )
+
+
+def resolve_idp_id(client, name, cache):
+    """Like resolve_enrollment_cert_id, for identity providers."""
+    return _resolve_by_search(client.idp.list_idps, name, cache, f"idp:{name}")
+
+
+def cached_listing(cache, key, fetch):
+    """
+    Return the items of ``fetch()`` as dicts, serving repeat calls from ``cache``.
+
+    ``fetch`` takes no arguments and returns an ``(items, error)`` tuple like
+    collect_all_items. Errors are passed through and never cached, and a
+    ``cache`` of None only converts the items.
+    """
+    items = cache.get(key) if cache else None
+    if items is not None:
+        return items, None
+    items, err = fetch()
+    if err:
+        return None, err
+    items = [_as_dict(item) for item in items or []]
+    if cache:
+        cache.set(key, items)
+    return items, None
+
+
+def _sub_app_key(application_type, app_id, microtenant_id):
+    return f"{application_type}:{microtenant_id or ''}:{app_id}"
+
+
+def index_sub_apps(client, application_type, app_id, cache=None, microtenant_id=None):
+    """
+    Return ``({domain: sub_app}, error)`` for the sub-apps of ``application_type``
+    (C(BROWSER_ACCESS), C(INSPECT), ...) owned by the segment ``app_id``.
+
+    The by-type listing is filtered server-side by ``appId``, so the cost is the
+    segment's own sub-apps rather than every sub-app of that type in the tenant.
+    Ownership is checked again on the returned items, and repeat calls are
+    served from ``cache`` until forget_sub_apps drops the entry.
+    """
+    query_params = {"appId": app_id}
+    if microtenant_id:
+        query_params["microtenant_id"] = microtenant_id
+
+    items, err = cached_listing(
+        cache,
+        _sub_app_key(application_type, app_id, microtenant_id),
+        lambda: collect_all_items(
+            lambda qp: client.app_segment_by_type.get_segments_by_type(
+                application_type=application_type, expand_all=False, query_params=qp
+            ),
+            query_params,
+        ),
+    )
+    if err:
+        return None, err
+    return {
+        item["domain"]: item
+        for item in items
+        if item.get("domain") and str(item.get("app_id")) == str(app_id)
+    }, None
+
+
+def forget_sub_apps(cache, application_type, app_id, microtenant_id=None):
+    """Drop the cached sub-apps of ``app_id`` once the segment has been written."""
+    if cache:
+        cache.invalidate(_sub_app_key(application_type, app_id, microtenant_id))
+
+
+def _modified_time(item):
+    try:
+        return int(item.get("modified_time") or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _total_count(resp):
+    """Return ``totalCount`` from a ZPA list response, or None when unavailable."""
+    body = resp.get_body() if hasattr(resp, "get_body") else None
+    if isinstance(body, dict) and body.get("totalCount") is not None:
+        return int(body["totalCount"])
+    return None
+
+
+def list_resource_incremental(
+    client,
+    resource_type,
+    cache,
+    microtenant_id=None,
+    parent_id=None,
+    reconcile_interval=3600,
+    raw=False,
+):
+    """
+    Like list_resource, but refreshes a cached listing from its ``modified_time`` watermark.
+
+    The last listing is kept in ``cache`` (a ZPACache). Later calls request
+    objects sorted by modification time, newest first, and stop paging at the
+    first object older than the watermark. A full listing is done when there
+    is no cached state, every ``reconcile_interval`` seconds, when the API
+    does not honour the sort order, or when the merged count disagrees with the
+    ``totalCount`` reported by the API, which is how deletions are noticed.
+
+    Returns a ``(items, error)`` tuple.
+    """
+    rtype = get_resource_type(resource_type)
+    key = f"incremental:{resource_type}:{microtenant_id or ''}:{parent_id or ''}"
+    state = cache.get(key) if rtype.paginated else None
+    now = time.time()
+
+    def full_listing():
+        items, err = list_resource(
+            client, resource_type, microtenant_id, parent_id, raw
+        )
+        if err:
+            return None, err
+        cache.set(
+            key,
+            {
+                "items": items,
+                "watermark": max(map(_modified_time, items), default=0),
+                "reconciled": now,
+            },
+        )
+        return items, None
+
+    if state is None or now - state.get("reconciled", 0) >= reconcile_interval:
+        return full_listing()
+
+    watermark = state.get("watermark", 0)
+    meta = {}
+    list_fn = rtype.list_fn(client, parent_id, raw)
+
+    def sorted_list_fn(query_params):
+        result = list_fn(query_params)
+        if isinstance(result, tuple) and len(result) == 3:
+            meta["total"] = _total_count(result[1])
+        return result
+
+    query_params = _query_params(rtype, microtenant_id)
+    query_params.update(sort_by="modifiedTime", sort_order="DSC")
+
+    seen = []
+    previous = None
+    ordered = True
+    for page, err in iter_item_pages(sorted_list_fn, query_params):
+        if err:
+            return None, err
+        reached_watermark = False
+        for item in map(_as_dict, page):
+            modified = _modified_time(item)
+            if previous is not None and modified > previous:
+                ordered = False
+            previous = modified
+            # Objects modified in the watermark second itself are refetched,
+            # since a later change within that second would otherwise be lost.
+            if ordered and modified < watermark:
+                if not seen:
+                    # The newest object can never predate the watermark unless
+                    # the sort order was ignored or that object was deleted.
+                    return full_listing()
+                reached_watermark = True
+                break
+            seen.append(item)
+        if reached_watermark:
+            break
+
+    if not ordered:
+        # The endpoint ignored the sort order, so ``seen`` is a full listing.
+        items = seen
+    else:
+        merged = {str(i.get("id")): i for i in state.get("items", [])}
+        for item in seen:
+            merged[str(item.get("id"))] = item
+        items = list(merged.values())
+        if meta.get("total") is not None and meta["total"] != len(items):
+            return full_listing()
+
+    cache.set(
+        key,
+        {
+            "items": items,
+            "watermark": max(map(_modified_time, items), default=watermark),
+            "reconciled": now if not ordered else state.get("reconciled", 0),
+        },
+    )
+    return items, None
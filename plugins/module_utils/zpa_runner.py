@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+
+#                              MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import copy
+import importlib
+import json
+import threading
+from traceback import format_exc
+
+from ansible.module_utils._text import to_native
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.common.parameters import remove_values
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_cache import (
+    tenant_scope,
+)
+
+MODULE_PACKAGE = "ansible_collections.zscaler.zpacloud.plugins.modules"
+COLLECTION_PREFIX = "zscaler.zpacloud."
+
+_SPEC_LOCK = threading.Lock()
+_SPECS = {}
+
+
+class ModuleExit(BaseException):
+    """
+    Raised by InProcessModule instead of ``sys.exit``. Like SystemExit it is
+    a BaseException, so the ``except Exception`` blocks in module code do
+    not swallow it.
+    """
+
+    def __init__(self, result):
+        super().__init__(result.get("msg"))
+        self.result = result
+
+
+class _SpecCaptured(BaseException):
+    def __init__(self, kwargs):
+        super().__init__()
+        self.kwargs = kwargs
+
+
+class InProcessModule(AnsibleModule):
+    """
+    AnsibleModule that takes its parameters from the caller and raises
+    ModuleExit with the result instead of printing it and exiting.
+
+    Argument validation, defaults, check mode and no_log handling are the
+    ones of AnsibleModule. Warnings and deprecations are kept on the
+    instance, so modules can run concurrently in one process.
+    """
+
+    def __init__(self, params, **kwargs):
+        self._in_process_params = params
+        self._in_process_warnings = []
+        self._in_process_deprecations = []
+        super().__init__(**kwargs)
+
+    def _load_params(self):
+        self.params = copy.deepcopy(self._in_process_params)
+
+    def _log_invocation(self):
+        # Modules running on the controller do not write to the syslog.
+        pass
+
+    def warn(self, warning):
+        self._in_process_warnings.append(warning)
+
+    def deprecate(self, msg, version=None, date=None, collection_name=None):
+        self._in_process_deprecations.append(
+            {
+                "msg": msg,
+                "version": version,
+                "date": date,
+                "collection_name": collection_name,
+            }
+        )
+
+    def _in_process_result(self, kwargs):
+        kwargs.setdefault("invocation", {"module_args": self.params})
+        if self._in_process_warnings:
+            kwargs["warnings"] = list(self._in_process_warnings)
+        if self._in_process_deprecations:
+            kwargs["deprecations"] = list(self._in_process_deprecations)
+        preserved = {
+            k: v for k, v in kwargs.items() if v is None or isinstance(v, bool)
+        }
+        result = remove_values(kwargs, self.no_log_values)
+        result.update(preserved)
+        return result
+
+    def exit_json(self, **kwargs):
+        self.do_cleanup_files()
+        raise ModuleExit(self._in_process_result(kwargs))
+
+    def fail_json(self, msg, **kwargs):
+        kwargs["failed"] = True
+        kwargs["msg"] = msg
+        self.do_cleanup_files()
+        raise ModuleExit(self._in_process_result(kwargs))
+
+
+def module_short_name(name):
+    """Strip the collection prefix from ``zscaler.zpacloud.zpa_*`` names."""
+    if name.startswith(COLLECTION_PREFIX):
+        name = name[len(COLLECTION_PREFIX) :]
+    return name
+
+
+def import_module(name):
+    """Import a module of this collection by short or fully qualified name."""
+    short_name = module_short_name(name)
+    if "." in short_name or not short_name.startswith("zpa_"):
+        raise ImportError(
+            f"'{name}' is not a module of the zscaler.zpacloud collection"
+        )
+    mod = importlib.import_module(f"{MODULE_PACKAGE}.{short_name}")
+    if not callable(getattr(mod, "core", None)):
+        raise ImportError(f"Module '{short_name}' has no core() entry point")
+    return mod
+
+
+def module_spec(mod):
+    """
+    Return the keyword arguments the module's main() passes to AnsibleModule
+    (argument_spec, supports_check_mode, mutually_exclusive, ...).
+
+    main() is run once with AnsibleModule replaced by a recorder that stops
+    it right after the call, so the spec is taken from the module itself.
+    """
+    with _SPEC_LOCK:
+        if mod.__name__ in _SPECS:
+            return _SPECS[mod.__name__]
+
+        def recorder(*args, **kwargs):
+            if args:
+                kwargs["argument_spec"] = args[0]
+            raise _SpecCaptured(kwargs)
+
+        original = mod.AnsibleModule
+        mod.AnsibleModule = recorder
+        try:
+            mod.main()
+        except _SpecCaptured as captured:
+            spec = captured.kwargs
+        else:
+            raise ImportError(f"{mod.__name__}.main() did not create an AnsibleModule")
+        finally:
+            mod.AnsibleModule = original
+        _SPECS[mod.__name__] = spec
+        return spec
+
+
+def run_module(mod, params, check_mode=False, diff=False, no_log=False, verbosity=0):
+    """
+    Run ``mod.core()`` in-process with ``params`` and return its result dict,
+    exactly as the module would have printed it.
+    """
+    spec = module_spec(mod)
+    module_params = dict(params)
+    module_params.update(
+        _ansible_check_mode=check_mode,
+        _ansible_diff=diff,
+        _ansible_no_log=no_log,
+        _ansible_verbosity=verbosity,
+        _ansible_module_name=mod.__name__.rsplit(".", 1)[-1],
+    )
+    try:
+        module = InProcessModule(
+            module_params,
+            **dict(spec, argument_spec=copy.deepcopy(spec["argument_spec"])),
+        )
+        try:
+            mod.core(module)
+        except Exception as e:
+            module.fail_json(msg=to_native(e), exception=format_exc())
+        module.fail_json(msg=f"{mod.__name__} returned without a result")
+    except ModuleExit as result:
+        return result.result
+
+
+class SharedClients:
+    """
+    Stand-in for ZPAClientHelper that authenticates once per tenant and
+    hands the same client to every module run of a batch.
+    """
+
+    def __init__(self, helper_class):
+        self._helper_class = helper_class
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, module):
+        scope = tenant_scope(module.params)
+        with self._lock:
+            if scope not in self._clients:
+                self._clients[scope] = self._helper_class(module)
+            return self._clients[scope]
+
+    def __getattr__(self, name):
+        # zpa_argument_spec() and other static helpers
+        return getattr(self._helper_class, name)
+
+
+def _listing_key(list_fn, query_params):
+    """Identify a listing by the SDK method (or lambda and its closure) and query."""
+    func = getattr(list_fn, "__func__", None)
+    if func is not None:
+        # SDK service objects are created on every attribute access, but any
+        # two of the same class sharing a request executor are equivalent.
+        owner = list_fn.__self__
+        ident = (
+            type(owner).__qualname__,
+            func.__qualname__,
+            id(getattr(owner, "_request_executor", owner)),
+        )
+    elif getattr(list_fn, "__code__", None) is not None:
+        cells = []
+        for cell in list_fn.__closure__ or ():
+            value = cell.cell_contents
+            primitive = value is None or isinstance(value, (str, int, float, bool))
+            cells.append(value if primitive else id(value))
+        ident = (list_fn.__code__, tuple(cells))
+    else:
+        return None
+    return ident, json.dumps(query_params or {}, sort_keys=True, default=str)
+
+
+class ListingCache:
+    """
+    Memoizes collect_all_items for the duration of a batch. Any item that
+    reports a change clears it, so later items never see stale listings
+    of objects created, updated or deleted earlier in the batch. A listing
+    fetched while the cache was cleared is returned but not stored.
+    """
+
+    def __init__(self, collect_all_items):
+        self._collect_all_items = collect_all_items
+        self._items = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, list_fn, query_params=None):
+        key = _listing_key(list_fn, query_params)
+        if key is not None:
+            with self._lock:
+                if key in self._items:
+                    return list(self._items[key]), None
+                generation = self._generation
+        items, err = self._collect_all_items(
+            list_fn, dict(query_params) if query_params else query_params
+        )
+        if key is not None and not err:
+            with self._lock:
+                if generation == self._generation:
+                    self._items[key] = list(items)
+        return items, err
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._generation += 1
+
+
+class SharedModuleContext:
+    """
+    Context manager that points a module's ZPAClientHelper and
+    collect_all_items at shared instances while a batch runs.
+    """
+
+    def __init__(self, mod, cache_listings=True):
+        self.mod = mod
+        self.cache_listings = cache_listings
+        self.listings = None
+        self._originals = {}
+
+    def __enter__(self):
+        mod = self.mod
+        if hasattr(mod, "ZPAClientHelper"):
+            self._originals["ZPAClientHelper"] = mod.ZPAClientHelper
+            mod.ZPAClientHelper = SharedClients(mod.ZPAClientHelper)
+        if self.cache_listings and hasattr(mod, "collect_all_items"):
+            self._originals["collect_all_items"] = mod.collect_all_items
+            self.listings = ListingCache(mod.collect_all_items)
+            mod.collect_all_items = self.listings
+        return self
+
+    def __exit__(self, *exc_info):
+        for name, value in self._originals.items():
+            setattr(self.mod, name, value)
+        return False
+
+    def item_done(self, result):
+        if self.listings is not None and result.get("changed"):
+            self.listings.clear()
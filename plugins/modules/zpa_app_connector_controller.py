@@ -69,7 +69,60 @@ options:
   enabled:
     description:
       - Whether this App Connector is enabled or not.
+      - With O(selector) and O(state=present), the value every selected connector is set to.
     type: bool
+  microtenant_id:
+    description:
+      - The unique identifier of the Microtenant for the ZPA tenant.
+    required: false
+    type: str
+  selector:
+    description:
+      - Select the connectors to act on by their properties instead of by ID or name.
+      - The connectors are filtered page by page while they are listed. With O(state=absent)
+        the selected connectors are deleted, with O(state=present) their O(enabled) flag is set.
+      - A connector is selected when it matches every given criterion, and at least
+        one criterion is required.
+    required: false
+    type: dict
+    suboptions:
+      group_ids:
+        description: Only connectors of these App Connector Groups, by ID.
+        type: list
+        elements: str
+      group_names:
+        description: Only connectors of these App Connector Groups, by name.
+        type: list
+        elements: str
+      control_channel_status:
+        description:
+          - Only connectors whose control channel has one of these statuses,
+            for example C(ZPN_STATUS_DISCONNECTED) or C(ZPN_STATUS_AUTHENTICATED).
+        type: list
+        elements: str
+      last_connected_older_than:
+        description:
+          - Only connectors that last connected to a broker longer ago than this,
+            for example C(30 days) or C(12 hours). Connectors that never connected match.
+        type: str
+      version_below:
+        description:
+          - Only connectors running a version older than this one, for example C(24.103.2).
+            Connectors reporting no version do not match.
+        type: str
+      name_regex:
+        description: Only connectors whose name matches this regular expression.
+        type: str
+  chunk_size:
+    description:
+      - With O(selector) and O(state=absent), number of connectors per bulk delete request.
+    type: int
+    default: 100
+  concurrency:
+    description:
+      - With O(selector), number of bulk delete or update requests sent in parallel.
+    type: int
+    default: 4
 """
 
 EXAMPLES = """
@@ -85,6 +138,23 @@ EXAMPLES = """
   zscaler.zpacloud.zpa_app_connector_controller:
     ids: "{{ app_connector_ids }}"
 
+- name: Delete connectors of a group that have been offline for a month
+  zscaler.zpacloud.zpa_app_connector_controller:
+    provider: "{{ zpa_cloud }}"
+    state: absent
+    selector:
+      group_names: ["Datacenter West"]
+      control_channel_status: ["ZPN_STATUS_DISCONNECTED"]
+      last_connected_older_than: "30 days"
+
+- name: Disable connectors still running an old version
+  zscaler.zpacloud.zpa_app_connector_controller:
+    provider: "{{ zpa_cloud }}"
+    enabled: false
+    selector:
+      version_below: "24.103.2"
+      name_regex: "^branch-"
+
 - name: Update Service Edge Controller Description
   zscaler.zpacloud.zpa_app_connector_controller:
     name: 'AppConnectorController01'
@@ -93,19 +163,184 @@ EXAMPLES = """
 """
 
 RETURN = """
-# Default return values
+connectors:
+  description: The connectors matched by O(selector), with their ID and name.
+  returned: when O(selector) is set
+  type: list
+  elements: dict
+  sample: [{"id": "216199618143442000", "name": "branch-01"}]
 """
 
 
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from traceback import format_exc
 from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     collect_all_items,
+    parse_human_readable_timeout,
 )
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_fleet import (
+    epoch_seconds,
+    version_key,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_resources import (
+    iter_resource_pages,
+)
+
+
+def connector_matcher(selector, now=None):
+    """
+    Build a predicate over connector dicts from the ``selector`` option.
+    Returns ``(predicate, error)``.
+    """
+    checks = []
+    group_ids = selector.get("group_ids")
+    if group_ids:
+        wanted = set(map(str, group_ids))
+        checks.append(lambda c: str(c.get("app_connector_group_id")) in wanted)
+    group_names = selector.get("group_names")
+    if group_names:
+        checks.append(lambda c: c.get("app_connector_group_name") in group_names)
+    statuses = selector.get("control_channel_status")
+    if statuses:
+        checks.append(lambda c: c.get("control_channel_status") in statuses)
+    older_than = selector.get("last_connected_older_than")
+    if older_than:
+        parsed = parse_human_readable_timeout(older_than)
+        if not isinstance(parsed, tuple) or parsed[1]:
+            return None, (
+                f"Invalid last_connected_older_than '{older_than}', "
+                "expected for example '30 days' or '12 hours'"
+            )
+        cutoff = (now or time.time()) - parsed[0]
+
+        def stale(c):
+            last = epoch_seconds(c.get("last_broker_connect_time"))
+            return last is None or last < cutoff
+
+        checks.append(stale)
+    version_below = selector.get("version_below")
+    if version_below:
+        limit = version_key(version_below)
+        checks.append(
+            lambda c: bool(c.get("current_version"))
+            and version_key(c["current_version"]) < limit
+        )
+    name_regex = selector.get("name_regex")
+    if name_regex:
+        try:
+            pattern = re.compile(name_regex)
+        except re.error as e:
+            return None, f"Invalid name_regex: {to_native(e)}"
+        checks.append(lambda c: bool(pattern.search(c.get("name") or "")))
+
+    if not checks:
+        return None, "selector requires at least one criterion"
+    return lambda c: all(check(c) for check in checks), None
+
+
+def select_connectors(client, predicate, microtenant_id=None):
+    """
+    Return ``(connectors, error)``: the ID, name and enabled flag of the
+    connectors matching ``predicate``, evaluated one page at a time so only
+    the matches are kept in memory.
+    """
+    selected = []
+    for page, err in iter_resource_pages(
+        client, "app_connector", microtenant_id, raw=True
+    ):
+        if err:
+            return None, err
+        for connector in page:
+            if predicate(connector):
+                selected.append(
+                    {
+                        "id": str(connector.get("id")),
+                        "name": connector.get("name"),
+                        "enabled": connector.get("enabled"),
+                    }
+                )
+    return selected, None
+
+
+def _sdk_error(call, *args, **kwargs):
+    try:
+        result = call(*args, **kwargs)
+    except Exception as e:
+        return to_native(e)
+    err = result[-1] if isinstance(result, tuple) else None
+    return to_native(err) if err else None
+
+
+def apply_selector(module, client):
+    state = module.params.get("state")
+    enabled = module.params.get("enabled")
+    chunk_size = module.params.get("chunk_size")
+    concurrency = module.params.get("concurrency")
+    microtenant_id = module.params.get("microtenant_id")
+
+    if state == "present" and enabled is None:
+        module.fail_json(msg="selector with state=present requires enabled")
+    if chunk_size < 1 or concurrency < 1:
+        module.fail_json(msg="chunk_size and concurrency must be at least 1")
+    predicate, error = connector_matcher(module.params.get("selector"))
+    if error:
+        module.fail_json(msg=error)
+
+    selected, error = select_connectors(client, predicate, microtenant_id)
+    if error:
+        module.fail_json(msg=f"Error listing connectors: {to_native(error)}")
+    if state == "present":
+        selected = [c for c in selected if c.get("enabled") != enabled]
+    connectors = [{"id": c["id"], "name": c["name"]} for c in selected]
+    ids = [c["id"] for c in connectors]
+
+    if module.check_mode or not ids:
+        module.exit_json(changed=bool(ids), connectors=connectors)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        if state == "absent":
+            batches = [ids[i : i + chunk_size] for i in range(0, len(ids), chunk_size)]
+            futures = [
+                pool.submit(
+                    _sdk_error,
+                    client.app_connectors.bulk_delete_connectors,
+                    connector_ids=batch,
+                    microtenant_id=microtenant_id,
+                )
+                for batch in batches
+            ]
+        else:
+            batches = [[i] for i in ids]
+            futures = [
+                pool.submit(
+                    _sdk_error,
+                    client.app_connectors.update_connector,
+                    connector_id=connector_id,
+                    enabled=enabled,
+                    microtenant_id=microtenant_id,
+                )
+                for connector_id in ids
+            ]
+        errors = [f.result() for f in futures]
+
+    done = [i for batch, err in zip(batches, errors) if not err for i in batch]
+    key = "deleted_connectors" if state == "absent" else "updated_connectors"
+    failed = [err for err in errors if err]
+    if failed:
+        module.fail_json(
+            msg=f"{len(failed)} of {len(batches)} request(s) failed: {failed[0]}",
+            changed=bool(done),
+            connectors=connectors,
+            data={key: done},
+        )
+    module.exit_json(changed=True, connectors=connectors, data={key: done})
 
 
 def core(module):
@@ -120,6 +355,9 @@ def core(module):
     connector_name = connector.get("name")
     microtenant_id = connector.get("microtenant_id")
 
+    if module.params.get("selector"):
+        apply_selector(module, client)
+
     # Step 1: Handle bulk delete (skips state)
     if connector_ids:
         _unused, _unused, error = client.app_connectors.bulk_delete_connectors(
@@ -210,9 +448,31 @@ def main():
         enabled=dict(type="bool", required=False),
         microtenant_id=dict(type="str", required=False),
         state=dict(type="str", choices=["present", "absent"], default="present"),
+        selector=dict(
+            type="dict",
+            required=False,
+            options=dict(
+                group_ids=dict(type="list", elements="str"),
+                group_names=dict(type="list", elements="str"),
+                control_channel_status=dict(type="list", elements="str"),
+                last_connected_older_than=dict(type="str"),
+                version_below=dict(type="str"),
+                name_regex=dict(type="str"),
+            ),
+        ),
+        chunk_size=dict(type="int", default=100),
+        concurrency=dict(type="int", default=4),
     )
 
-    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        supports_check_mode=True,
+        mutually_exclusive=[
+            ("selector", "id"),
+            ("selector", "ids"),
+            ("selector", "name"),
+        ],
+    )
     try:
         core(module)
     except Exception as e:
@@ -42,6 +42,8 @@ notes:
 extends_documentation_fragment:
   - zscaler.zpacloud.fragments.provider
   - zscaler.zpacloud.fragments.documentation
+  - zscaler.zpacloud.fragments.info_projection
+  - zscaler.zpacloud.fragments.raw_listing
 
 options:
   name:
@@ -54,6 +56,19 @@ options:
       - ID of the App Connector Group.
     required: false
     type: str
+  summary:
+    description:
+      - Return only fleet aggregates in C(summary) instead of the App Connector objects.
+      - The listing is streamed one page at a time and folded into counters, so
+        memory use does not grow with the size of the fleet.
+    type: bool
+    default: false
+  summary_top:
+    description:
+      - With O(summary), how many of the App Connectors seen the longest time ago to
+        report in C(summary.oldest_last_seen).
+    type: int
+    default: 10
 """
 
 EXAMPLES = """
@@ -70,10 +85,38 @@ EXAMPLES = """
   zscaler.zpacloud.zpa_app_connector_controller_info:
     provider: "{{ zpa_cloud }}"
     name: '123456789'
+
+- name: Summarize the App Connector fleet health
+  zscaler.zpacloud.zpa_app_connector_controller_info:
+    provider: "{{ zpa_cloud }}"
+    summary: true
+    summary_top: 5
 """
 
 RETURN = """
 # Default return values
+summary:
+  description:
+    - Fleet aggregates, returned instead of the objects when O(summary=true).
+    - C(by_status) counts the control channel status, C(by_group) the App Connector Group name.
+    - C(oldest_last_seen) lists the entries whose last broker connection is the oldest,
+      oldest first, with C(last_seen) in epoch seconds.
+  returned: when O(summary=true)
+  type: dict
+  sample:
+    total: 3
+    enabled: 3
+    never_connected: 0
+    by_status: {"ZPN_STATUS_AUTHENTICATED": 2, "ZPN_STATUS_DISCONNECTED": 1}
+    by_version: {"24.90.5": 1, "24.103.2": 2}
+    by_group: {"Branches": 3}
+    by_upgrade_status: {"COMPLETE": 3}
+    oldest_last_seen: [{"id": "216199618143441990", "name": "branch-01", "last_seen": 1696544000}]
+count:
+  description: Number of matching objects, returned instead of the objects when O(count_only=true).
+  returned: when O(count_only=true)
+  type: int
+  sample: 42
 """
 
 from traceback import format_exc
@@ -83,8 +126,16 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_fleet import (
+    summarize_fleet,
+)
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     collect_all_items,
+    info_exit,
+    did_you_mean,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_resources import (
+    get_resource_type,
 )
 
 
@@ -99,6 +150,14 @@ def core(module):
     if microtenant_id:
         query_params["microtenant_id"] = microtenant_id
 
+    if module.params.get("summary"):
+        summary, err = summarize_fleet(
+            client, "app_connector", microtenant_id, module.params.get("summary_top")
+        )
+        if err:
+            module.fail_json(msg=f"Error summarizing App Connectors: {to_native(err)}")
+        module.exit_json(changed=False, summary=summary)
+
     if connector_id:
         result, _unused, error = client.app_connectors.get_connector(
             connector_id, query_params
@@ -107,16 +166,18 @@ def core(module):
             module.fail_json(
                 msg=f"Failed to retrieve App Connector ID '{connector_id}': {to_native(error)}"
             )
-        module.exit_json(changed=False, connectors=[result.as_dict()])
+        info_exit(module, "connectors", [result.as_dict()])
 
     # If no ID, we fetch all
-    connector_list, err = collect_all_items(
-        client.app_connectors.list_connectors, query_params
-    )
+    raw = module.params.get("raw")
+    list_fn = client.app_connectors.list_connectors
+    if raw:
+        list_fn = get_resource_type("app_connector").list_fn(client, raw=True)
+    connector_list, err = collect_all_items(list_fn, query_params)
     if err:
         module.fail_json(msg=f"Error retrieving App Connectors: {to_native(err)}")
 
-    result_list = [g.as_dict() for g in connector_list]
+    result_list = connector_list if raw else [g.as_dict() for g in connector_list]
 
     if connector_name:
         matched = next(
@@ -125,11 +186,11 @@ def core(module):
         if not matched:
             available = [g.get("name") for g in result_list]
             module.fail_json(
-                msg=f"App Connector '{connector_name}' not found. Available: {available}"
+                msg=f"App Connector '{connector_name}' not found.{did_you_mean(connector_name, available)}"
             )
         result_list = [matched]
 
-    module.exit_json(changed=False, connectors=result_list)
+    info_exit(module, "connectors", result_list)
 
 
 def main():
@@ -138,8 +199,17 @@ def main():
         name=dict(type="str", required=False),
         id=dict(type="str", required=False),
         microtenant_id=dict(type="str", required=False),
+        summary=dict(type="bool", default=False),
+        summary_top=dict(type="int", default=10),
+        fields=dict(type="list", elements="str", required=False),
+        count_only=dict(type="bool", default=False),
+        raw=dict(type="bool", default=False),
+    )
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        supports_check_mode=True,
+        mutually_exclusive=[("summary", "id"), ("summary", "name")],
     )
-    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
     try:
         core(module)
     except Exception as e:
@@ -227,9 +227,16 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     validate_iso3166_alpha2,
     collect_all_items,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_cache import (
+    enrollment_cert_cache,
+)
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_resources import (
+    DEFAULT_ENROLLMENT_CERTS,
+    resolve_enrollment_cert_id,
+)
 
 
 def resolve_connector_enrollment_cert_id(module, client):
@@ -237,41 +244,17 @@ def resolve_connector_enrollment_cert_id(module, client):
     Resolve the default Connector enrollment certificate ID when the user
     does not provide enrollment_cert_id explicitly.
     """
-    query_params = {"search": "Connector"}
-    certs, error = collect_all_items(
-        client.enrollment_certificates.list_enrolment, query_params
+    cert_id, error = resolve_enrollment_cert_id(
+        client,
+        DEFAULT_ENROLLMENT_CERTS["connector"],
+        enrollment_cert_cache(module.params),
     )
     if error:
         module.fail_json(
             msg=f"Error listing enrollment certificates for Connector lookup: {to_native(error)}"
         )
-
-    # Fallback for clients/mocks that do not paginate this endpoint.
-    if not certs:
-        certs, _unused, error = client.enrollment_certificates.list_enrolment(
-            query_params
-        )
-        if error:
-            module.fail_json(
-                msg=f"Error listing enrollment certificates for Connector lookup: {to_native(error)}"
-            )
-
-    for cert in certs or []:
-        cert_dict = cert.as_dict()
-        if cert_dict.get("name") == "Connector" and cert_dict.get("id"):
-            return cert_dict.get("id")
-
-    # If paginated helper returns an unexpected/mocked payload, retry directly.
-    certs, _unused, error = client.enrollment_certificates.list_enrolment(query_params)
-    if error:
-        module.fail_json(
-            msg=f"Error listing enrollment certificates for Connector lookup: {to_native(error)}"
-        )
-
-    for cert in certs or []:
-        cert_dict = cert.as_dict()
-        if cert_dict.get("name") == "Connector" and cert_dict.get("id"):
-            return cert_dict.get("id")
+    if cert_id:
+        return cert_id
 
     module.fail_json(
         msg="Unable to resolve enrollment certificate named 'Connector'. "
@@ -413,10 +396,7 @@ def core(module):
                         summary_group.get("id"),
                         query_params={"microtenant_id": microtenant_id},
                     )
-                    if (
-                        isinstance(details_result, tuple)
-                        and len(details_result) == 3
-                    ):
+                    if isinstance(details_result, tuple) and len(details_result) == 3:
                         details, _unused, error = details_result
                         if error:
                             module.fail_json(
@@ -84,6 +84,7 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import
 )
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     collect_all_items,
+    did_you_mean,
 )
 
 
@@ -119,7 +120,7 @@ def core(module):
         if not match:
             available = [getattr(c, "name", "") for c in controls]
             module.fail_json(
-                msg=f"Custom control '{control_name}' not found. Available: {available}"
+                msg=f"Custom control '{control_name}' not found.{did_you_mean(control_name, available)}"
             )
         controls = [match]
 
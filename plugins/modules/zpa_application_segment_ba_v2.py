@@ -423,6 +423,13 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_cache import (
+    sub_app_cache,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_resources import (
+    forget_sub_apps,
+    index_sub_apps,
+)
 
 
 def core(module):
@@ -590,34 +597,23 @@ def core(module):
 
     if "common_apps_dto" in desired_app:
         desired_configs = desired_app["common_apps_dto"].get("apps_config", [])
+        sub_apps = sub_app_cache(module.params)
 
-        segments_list, err = collect_all_items(
-            lambda qp: client.app_segment_by_type.get_segments_by_type(
-                application_type="BROWSER_ACCESS",
-                expand_all=False,
-                query_params={"appId": existing_app["id"]} if existing_app else {},
-            ),
-            query_params={},
-        )
-        if err:
-            module.fail_json(
-                msg=f"Failed to fetch Browser Access apps: {to_native(err)}"
-            )
-
-        # ------ extra debug so we know what came back ------
-        module.warn(f"[DEBUG] fetched {len(segments_list)} Browser Access segment(s)")
-
+        # Only the sub-apps owned by this segment can be reused or deleted; on
+        # create there are none yet, so no listing is needed at all.
+        pra_by_domain = {}
         if existing_app:
-            target_app_id = existing_app.get("id")
-            module.warn(f"[DEBUG] existing_app.id = {target_app_id}")
-            pra_by_domain = {
-                getattr(s, "domain"): s
-                for s in segments_list
-                if getattr(s, "app_id", None) == target_app_id
-            }
-        else:
-            module.warn("[DEBUG] existing_app is None (create flow)")
-            pra_by_domain = {getattr(s, "domain"): s for s in segments_list}
+            pra_by_domain, err = index_sub_apps(
+                client,
+                "BROWSER_ACCESS",
+                existing_app["id"],
+                cache=sub_apps,
+                microtenant_id=microtenant_id,
+            )
+            if err:
+                module.fail_json(
+                    msg=f"Failed to fetch Browser Access apps: {to_native(err)}"
+                )
 
         updated_configs = []
         deleted_ids = []
@@ -629,7 +625,7 @@ def core(module):
 
             config["app_id"] = existing_app["id"] if existing_app else ""
             if pra_app:
-                config["ba_app_id"] = pra_app.id
+                config["ba_app_id"] = pra_app["id"]
                 found_domains.add(domain)
             else:
                 config["ba_app_id"] = ""
@@ -638,7 +634,7 @@ def core(module):
 
         for domain, ba in pra_by_domain.items():
             if domain not in found_domains:
-                deleted_ids.append(ba.id)
+                deleted_ids.append(ba["id"])
 
         desired_app["common_apps_dto"]["apps_config"] = updated_configs
         if deleted_ids:
@@ -705,6 +701,10 @@ def core(module):
                     module.fail_json(
                         msg=f"Error updating ba application segment: {to_native(error)}"
                     )
+                if "common_apps_dto" in desired_app:
+                    forget_sub_apps(
+                        sub_apps, "BROWSER_ACCESS", existing_app["id"], microtenant_id
+                    )
 
                 refreshed, _unused, err = client.app_segments_ba_v2.get_segment_ba(
                     updated_segment.id,
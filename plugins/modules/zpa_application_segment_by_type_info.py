@@ -175,6 +175,7 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import
 )
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     collect_all_items,
+    did_you_mean,
 )
 
 
@@ -249,7 +250,7 @@ def core(module):
         if not matched:
             available = [getattr(a, "name", "") for a in segments]
             module.fail_json(
-                msg=f"Application Segment '{application_name}' not found. Available: {available}"
+                msg=f"Application Segment '{application_name}' not found.{did_you_mean(application_name, available)}"
             )
         segments = [matched]
 
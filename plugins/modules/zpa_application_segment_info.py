@@ -42,6 +42,8 @@ notes:
 extends_documentation_fragment:
   - zscaler.zpacloud.fragments.provider
   - zscaler.zpacloud.fragments.documentation
+  - zscaler.zpacloud.fragments.info_projection
+  - zscaler.zpacloud.fragments.raw_listing
 
 options:
   name:
@@ -57,6 +59,18 @@ options:
       - The unique identifier of the Microtenant for the ZPA tenant
     required: false
     type: str
+  incremental:
+    description:
+      - Keep the last listing across runs and only fetch segments modified since then.
+      - Deletions are detected by comparing the segment count with the total reported by
+        the API, and a full listing is done every O(reconcile_interval) seconds.
+    type: bool
+    default: false
+  reconcile_interval:
+    description:
+      - With O(incremental), seconds between full listings.
+    type: int
+    default: 3600
 """
 
 EXAMPLES = """
@@ -69,6 +83,29 @@ EXAMPLES = """
     provider: "{{ zpa_cloud }}"
     name: "Example Application Segment"
 
+- name: Retrieve All Application Segments, refreshing only what changed since the last run
+  zscaler.zpacloud.zpa_application_segment_info:
+    provider: "{{ zpa_cloud }}"
+    incremental: true
+
+- name: Retrieve only the IDs and names of all Application Segments
+  zscaler.zpacloud.zpa_application_segment_info:
+    provider: "{{ zpa_cloud }}"
+    fields:
+      - id
+      - name
+      - server_groups.id
+
+- name: Retrieve All Application Segments without building SDK models
+  zscaler.zpacloud.zpa_application_segment_info:
+    provider: "{{ zpa_cloud }}"
+    raw: true
+
+- name: Count Application Segments
+  zscaler.zpacloud.zpa_application_segment_info:
+    provider: "{{ zpa_cloud }}"
+    count_only: true
+
 - name: Retrieve Details of a Specific Application Segments by ID
   zscaler.zpacloud.zpa_application_segment_info:
     provider: "{{ zpa_cloud }}"
@@ -274,6 +311,11 @@ failed:
   returned: always
   type: bool
   sample: false
+count:
+  description: Number of matching objects, returned instead of the objects when O(count_only=true).
+  returned: when O(count_only=true)
+  type: int
+  sample: 42
 """
 
 from traceback import format_exc
@@ -285,6 +327,15 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import
 )
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     collect_all_items,
+    info_exit,
+    did_you_mean,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_cache import (
+    incremental_cache,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_resources import (
+    list_resource,
+    list_resource_incremental,
 )
 
 
@@ -307,27 +358,41 @@ def core(module):
             module.fail_json(
                 msg=f"Failed to retrieve Application Segment ID '{segment_id}': {to_native(error)}"
             )
-        module.exit_json(changed=False, groups=[result.as_dict()])
+        info_exit(module, "groups", [result.as_dict()])
 
     # If no ID, we fetch all
-    segment_list, err = collect_all_items(
-        client.application_segment.list_segments, query_params
-    )
+    raw = module.params.get("raw")
+    if module.params.get("incremental"):
+        result_list, err = list_resource_incremental(
+            client,
+            "application_segment",
+            incremental_cache(module.params),
+            microtenant_id=microtenant_id,
+            reconcile_interval=module.params.get("reconcile_interval"),
+            raw=raw,
+        )
+    elif raw:
+        result_list, err = list_resource(
+            client, "application_segment", microtenant_id, raw=True
+        )
+    else:
+        segment_list, err = collect_all_items(
+            client.application_segment.list_segments, query_params
+        )
+        result_list = [g.as_dict() for g in segment_list or []]
     if err:
         module.fail_json(msg=f"Error retrieving Application Segments: {to_native(err)}")
 
-    result_list = [g.as_dict() for g in segment_list]
-
     if segment_name:
         matched = next((g for g in result_list if g.get("name") == segment_name), None)
         if not matched:
             available = [g.get("name") for g in result_list]
             module.fail_json(
-                msg=f"Application Segment '{segment_name}' not found. Available: {available}"
+                msg=f"Application Segment '{segment_name}' not found.{did_you_mean(segment_name, available)}"
             )
         result_list = [matched]
 
-    module.exit_json(changed=False, app_segments=result_list)
+    info_exit(module, "app_segments", result_list)
 
 
 def main():
@@ -336,6 +401,11 @@ def main():
         name=dict(type="str", required=False),
         id=dict(type="str", required=False),
         microtenant_id=dict(type="str", required=False),
+        incremental=dict(type="bool", default=False),
+        reconcile_interval=dict(type="int", default=3600),
+        fields=dict(type="list", elements="str", required=False),
+        count_only=dict(type="bool", default=False),
+        raw=dict(type="bool", default=False),
     )
     module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
     try:
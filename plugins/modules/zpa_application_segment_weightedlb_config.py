@@ -122,6 +122,7 @@ from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     deleteNone,
+    did_you_mean,
 )
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
@@ -172,7 +173,7 @@ def core(module):
         if not matched_segment:
             available = [s.as_dict().get("name") for s in segment_list]
             module.fail_json(
-                msg=f"Application segment '{application_name}' not found. Available: {available}"
+                msg=f"Application segment '{application_name}' not found.{did_you_mean(application_name, available)}"
             )
 
         application_id = matched_segment.get("id")
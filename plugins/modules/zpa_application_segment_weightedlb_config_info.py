@@ -125,6 +125,7 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import
 )
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     collect_all_items,
+    did_you_mean,
 )
 
 
@@ -165,7 +166,7 @@ def core(module):
         if not matched_segment:
             available = [s.as_dict().get("name") for s in segment_list]
             module.fail_json(
-                msg=f"Application segment '{application_name}' not found. Available: {available}"
+                msg=f"Application segment '{application_name}' not found.{did_you_mean(application_name, available)}"
             )
 
         application_id = matched_segment.get("id")
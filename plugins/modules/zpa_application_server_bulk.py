@@ -0,0 +1,509 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+
+#                             MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+module: zpa_application_server_bulk
+short_description: Manage many application servers and their server group memberships
+description:
+  - Reconciles a list of application servers and the server membership of a list of
+    server groups in a single task.
+  - Servers and server groups are listed once each, App Connector Groups only when a group
+    references them by name. Memberships are compared as sets in memory, servers are
+    created or updated concurrently, and only the server groups whose membership or
+    settings changed are rewritten, also concurrently.
+author:
+  - William Guilherme (@willguibr)
+version_added: "2.3.0"
+requirements:
+    - Zscaler SDK Python can be obtained from PyPI U(https://pypi.org/project/zscaler-sdk-python/)
+notes:
+    - Check mode is supported.
+    - Servers and server groups are matched by name. Servers and groups that are not
+      listed are left untouched.
+    - Membership is managed on the server groups only. Server options left unset are not
+      compared.
+extends_documentation_fragment:
+  - zscaler.zpacloud.fragments.provider
+  - zscaler.zpacloud.fragments.documentation
+options:
+  servers:
+    description:
+      - The application servers to create or update.
+    type: list
+    elements: dict
+    default: []
+    suboptions:
+      name:
+        description: Name of the server.
+        type: str
+        required: true
+      address:
+        description: Domain or IP address of the server. Required to create the server.
+        type: str
+      description:
+        description: Description of the server.
+        type: str
+      enabled:
+        description: Whether the server is enabled.
+        type: bool
+        default: true
+  server_groups:
+    description:
+      - The server groups whose membership to manage. Missing groups are created.
+    type: list
+    elements: dict
+    default: []
+    suboptions:
+      name:
+        description: Name of the server group.
+        type: str
+        required: true
+      servers:
+        description:
+          - Names of the member servers, either listed in O(servers) or already present.
+          - Left unset, the server membership of the group is not managed.
+        type: list
+        elements: str
+      app_connector_groups:
+        description:
+          - Names of the App Connector Groups of the server group.
+          - Left unset, the App Connector Groups of the group are not managed.
+        type: list
+        elements: str
+      description:
+        description: Description of the server group.
+        type: str
+      enabled:
+        description: Whether the server group is enabled.
+        type: bool
+        default: true
+      dynamic_discovery:
+        description:
+          - Whether dynamic server discovery is enabled for the group.
+          - Defaults to C(false) on creation when O(server_groups[].servers) is set,
+            C(true) otherwise.
+        type: bool
+  membership:
+    description:
+      - C(exclusive) makes the group members exactly O(server_groups[].servers) and
+        O(server_groups[].app_connector_groups). C(additive) only adds the missing ones.
+    type: str
+    choices: ["exclusive", "additive"]
+    default: exclusive
+  concurrency:
+    description:
+      - Maximum number of write requests in flight at once.
+    type: int
+    default: 8
+  microtenant_id:
+    description:
+      - The unique identifier of the Microtenant for the ZPA tenant.
+    type: str
+"""
+
+EXAMPLES = r"""
+- name: Onboard the servers of a data center into their server groups
+  zscaler.zpacloud.zpa_application_server_bulk:
+    provider: "{{ zpa_cloud }}"
+    servers: "{{ dc_servers | map('combine', {'enabled': true}) | list }}"
+    server_groups:
+      - name: DC1-Web
+        servers: "{{ dc_servers | selectattr('role', 'eq', 'web') | map(attribute='name') | list }}"
+        app_connector_groups: ["DC1-Connectors"]
+      - name: DC1-DB
+        servers: ["db01.dc1.example.com", "db02.dc1.example.com"]
+        app_connector_groups: ["DC1-Connectors"]
+
+- name: Add one server to existing groups without removing other members
+  zscaler.zpacloud.zpa_application_server_bulk:
+    provider: "{{ zpa_cloud }}"
+    membership: additive
+    servers:
+      - name: web42.dc1.example.com
+        address: 10.1.0.42
+    server_groups:
+      - name: DC1-Web
+        servers: ["web42.dc1.example.com"]
+"""
+
+RETURN = r"""
+changes:
+  description: Names of the servers and server groups created and updated.
+  returned: always
+  type: dict
+  sample:
+    servers: {"created": ["web42.dc1.example.com"], "updated": []}
+    server_groups: {"created": [], "updated": ["DC1-Web"]}
+membership:
+  description: Servers added to and removed from each rewritten server group, by name.
+  returned: always
+  type: dict
+  sample:
+    DC1-Web:
+      added: ["web42.dc1.example.com"]
+      removed: []
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from traceback import format_exc
+
+from ansible.module_utils._text import to_native
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
+    deleteNone,
+    did_you_mean,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    ZPAClientHelper,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_resources import (
+    list_resource,
+)
+
+SERVER_FIELDS = ("address", "description", "enabled")
+
+
+def _sdk_call(call, **kwargs):
+    """Run an SDK call, returning ``(result_dict, error)``."""
+    try:
+        result, _unused, err = call(**kwargs)
+    except Exception as e:
+        return None, to_native(e)
+    if err:
+        return None, to_native(err)
+    if result is not None and hasattr(result, "as_dict"):
+        result = result.as_dict()
+    return result, None
+
+
+def run_writes(pool, writes):
+    """Run ``(name, call, kwargs)`` writes concurrently, returning ``(results, errors)``."""
+    futures = [
+        (name, pool.submit(_sdk_call, call, **kwargs)) for name, call, kwargs in writes
+    ]
+    results, errors = {}, {}
+    for name, future in futures:
+        result, err = future.result()
+        if err:
+            errors[name] = err
+        else:
+            results[name] = result or {}
+    return results, errors
+
+
+def member_ids(group, key):
+    return {str(m.get("id")) for m in group.get(key) or [] if m.get("id")}
+
+
+def server_drift(desired, current):
+    return [
+        k
+        for k in SERVER_FIELDS
+        if desired.get(k) is not None and desired[k] != current.get(k)
+    ]
+
+
+def _fail(module, msg, changes, membership):
+    module.fail_json(
+        msg=msg,
+        changed=any(v for level in changes.values() for v in level.values()),
+        changes=changes,
+        membership=membership,
+    )
+
+
+def core(module):
+    servers = module.params.get("servers") or []
+    groups = module.params.get("server_groups") or []
+    exclusive = module.params.get("membership") == "exclusive"
+    concurrency = module.params.get("concurrency")
+    microtenant_id = module.params.get("microtenant_id")
+    if concurrency < 1:
+        module.fail_json(msg="concurrency must be at least 1")
+    for label, items in (("server", servers), ("server group", groups)):
+        names = [i["name"] for i in items]
+        duplicates = sorted({n for n in names if names.count(n) > 1})
+        if duplicates:
+            module.fail_json(msg=f"Duplicate {label} name(s): {', '.join(duplicates)}")
+
+    client = ZPAClientHelper(module)
+    changes = {
+        "servers": {"created": [], "updated": []},
+        "server_groups": {"created": [], "updated": []},
+    }
+    membership = {}
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        listings = {
+            "application_server": pool.submit(
+                list_resource, client, "application_server", microtenant_id, raw=True
+            ),
+            "server_group": pool.submit(
+                list_resource, client, "server_group", microtenant_id, raw=True
+            ),
+        }
+        if any(g.get("app_connector_groups") is not None for g in groups):
+            listings["app_connector_group"] = pool.submit(
+                list_resource, client, "app_connector_group", microtenant_id, raw=True
+            )
+        listed = {}
+        for rtype, future in listings.items():
+            items, err = future.result()
+            if err:
+                module.fail_json(msg=f"Error listing {rtype}s: {to_native(err)}")
+            listed[rtype] = {i.get("name"): i for i in items}
+        existing_servers = listed["application_server"]
+        existing_groups = listed["server_group"]
+        connector_groups = listed.get("app_connector_group", {})
+
+        # Servers
+        writes = []
+        for server in servers:
+            current = existing_servers.get(server["name"])
+            payload = deleteNone(
+                {
+                    "name": server["name"],
+                    "address": server.get("address"),
+                    "description": server.get("description"),
+                    "enabled": server.get("enabled"),
+                    "microtenant_id": microtenant_id,
+                }
+            )
+            if current is None:
+                if not server.get("address"):
+                    module.fail_json(
+                        msg=f"Server '{server['name']}' does not exist and has no address"
+                    )
+                changes["servers"]["created"].append(server["name"])
+                writes.append((server["name"], client.servers.add_server, payload))
+            elif server_drift(server, current):
+                changes["servers"]["updated"].append(server["name"])
+                # The update replaces the server, so unset options keep their value.
+                kept = {k: current.get(k) for k in SERVER_FIELDS}
+                writes.append(
+                    (
+                        server["name"],
+                        client.servers.update_server,
+                        deleteNone({"server_id": current["id"], **kept, **payload}),
+                    )
+                )
+
+        if not module.check_mode and writes:
+            results, errors = run_writes(pool, writes)
+            for name, result in results.items():
+                existing_servers[name] = {
+                    **existing_servers.get(name, {}),
+                    **result,
+                    "name": name,
+                }
+            if errors:
+                for level in changes["servers"].values():
+                    level[:] = [n for n in level if n not in errors]
+                _fail(
+                    module,
+                    f"{len(errors)} of {len(writes)} server request(s) failed: "
+                    + "; ".join(f"{n}: {e}" for n, e in errors.items()),
+                    changes,
+                    membership,
+                )
+
+        # Server groups
+        server_names = {str(s.get("id")): name for name, s in existing_servers.items()}
+        planned = {s["name"] for s in servers}
+        writes = []
+        for group in groups:
+            current = existing_groups.get(group["name"])
+            current_servers = member_ids(current or {}, "servers")
+            current_connectors = member_ids(current or {}, "app_connector_groups")
+
+            target_servers = None
+            added = removed = []
+            if group.get("servers") is not None:
+                unknown = [
+                    n
+                    for n in group["servers"]
+                    if n not in existing_servers and n not in planned
+                ]
+                if unknown:
+                    _fail(
+                        module,
+                        f"Server group '{group['name']}' references unknown server(s) "
+                        f"{', '.join(unknown)}.{did_you_mean(unknown[0], existing_servers)}",
+                        changes,
+                        membership,
+                    )
+                wanted = {
+                    str(existing_servers[n]["id"])
+                    for n in group["servers"]
+                    if existing_servers.get(n, {}).get("id")
+                }
+                target_servers = wanted if exclusive else wanted | current_servers
+                # Servers only created in check mode have no ID yet.
+                pending = [
+                    n
+                    for n in group["servers"]
+                    if not existing_servers.get(n, {}).get("id")
+                ]
+                added = sorted(
+                    [server_names.get(i, i) for i in target_servers - current_servers]
+                    + pending
+                )
+                removed = sorted(
+                    server_names.get(i, i) for i in current_servers - target_servers
+                )
+
+            target_connectors = None
+            if group.get("app_connector_groups") is not None:
+                unknown = [
+                    n
+                    for n in group["app_connector_groups"]
+                    if n not in connector_groups
+                ]
+                if unknown:
+                    _fail(
+                        module,
+                        f"Server group '{group['name']}' references unknown App Connector "
+                        f"Group(s) {', '.join(unknown)}."
+                        f"{did_you_mean(unknown[0], connector_groups)}",
+                        changes,
+                        membership,
+                    )
+                wanted = {
+                    str(connector_groups[n]["id"])
+                    for n in group["app_connector_groups"]
+                }
+                target_connectors = wanted if exclusive else wanted | current_connectors
+
+            payload = deleteNone(
+                {
+                    "name": group["name"],
+                    "description": group.get("description"),
+                    "enabled": group.get("enabled"),
+                    "dynamic_discovery": group.get("dynamic_discovery"),
+                    "server_ids": (
+                        sorted(target_servers) if target_servers is not None else None
+                    ),
+                    "app_connector_group_ids": (
+                        sorted(target_connectors)
+                        if target_connectors is not None
+                        else None
+                    ),
+                    "microtenant_id": microtenant_id,
+                }
+            )
+            if current is None:
+                payload.setdefault("dynamic_discovery", group.get("servers") is None)
+                changes["server_groups"]["created"].append(group["name"])
+                writes.append((group["name"], client.server_groups.add_group, payload))
+            elif (
+                added
+                or removed
+                or (
+                    target_connectors is not None
+                    and target_connectors != current_connectors
+                )
+                or any(
+                    group.get(k) is not None and group[k] != current.get(k)
+                    for k in ("description", "enabled", "dynamic_discovery")
+                )
+            ):
+                changes["server_groups"]["updated"].append(group["name"])
+                writes.append(
+                    (
+                        group["name"],
+                        client.server_groups.update_group,
+                        {"group_id": current["id"], **payload},
+                    )
+                )
+            else:
+                continue
+            if added or removed:
+                membership[group["name"]] = {"added": added, "removed": removed}
+
+        if not module.check_mode and writes:
+            _unused, errors = run_writes(pool, writes)
+            if errors:
+                for level in changes["server_groups"].values():
+                    level[:] = [n for n in level if n not in errors]
+                for name in errors:
+                    membership.pop(name, None)
+                _fail(
+                    module,
+                    f"{len(errors)} of {len(writes)} server group request(s) failed: "
+                    + "; ".join(f"{n}: {e}" for n, e in errors.items()),
+                    changes,
+                    membership,
+                )
+
+    changed = any(v for level in changes.values() for v in level.values())
+    module.exit_json(changed=changed, changes=changes, membership=membership)
+
+
+def main():
+    argument_spec = ZPAClientHelper.zpa_argument_spec()
+    argument_spec.update(
+        servers=dict(
+            type="list",
+            elements="dict",
+            default=[],
+            options=dict(
+                name=dict(type="str", required=True),
+                address=dict(type="str", required=False),
+                description=dict(type="str", required=False),
+                enabled=dict(type="bool", default=True),
+            ),
+        ),
+        server_groups=dict(
+            type="list",
+            elements="dict",
+            default=[],
+            options=dict(
+                name=dict(type="str", required=True),
+                servers=dict(type="list", elements="str", required=False),
+                app_connector_groups=dict(type="list", elements="str", required=False),
+                description=dict(type="str", required=False),
+                enabled=dict(type="bool", default=True),
+                dynamic_discovery=dict(type="bool", required=False),
+            ),
+        ),
+        membership=dict(
+            type="str", choices=["exclusive", "additive"], default="exclusive"
+        ),
+        concurrency=dict(type="int", default=8),
+        microtenant_id=dict(type="str", required=False),
+    )
+    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+    try:
+        core(module)
+    except Exception as e:
+        module.fail_json(msg=to_native(e), exception=format_exc())
+
+
+if __name__ == "__main__":
+    main()
@@ -42,6 +42,8 @@ notes:
 extends_documentation_fragment:
   - zscaler.zpacloud.fragments.provider
   - zscaler.zpacloud.fragments.documentation
+  - zscaler.zpacloud.fragments.info_projection
+  - zscaler.zpacloud.fragments.raw_listing
 
 options:
   name:
@@ -133,6 +135,11 @@ failed:
   returned: always
   type: bool
   sample: false
+count:
+  description: Number of matching objects, returned instead of the objects when O(count_only=true).
+  returned: when O(count_only=true)
+  type: int
+  sample: 42
 """
 
 from traceback import format_exc
@@ -144,6 +151,11 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import
 )
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     collect_all_items,
+    info_exit,
+    did_you_mean,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_resources import (
+    get_resource_type,
 )
 
 
@@ -164,25 +176,29 @@ def core(module):
             module.fail_json(
                 msg=f"Failed to retrieve Application Server ID '{server_id}': {to_native(error)}"
             )
-        module.exit_json(changed=False, servers=[result.as_dict()])
+        info_exit(module, "servers", [result.as_dict()])
 
     # If no ID, we fetch all
-    server_list, err = collect_all_items(client.servers.list_servers, query_params)
+    raw = module.params.get("raw")
+    list_fn = client.servers.list_servers
+    if raw:
+        list_fn = get_resource_type("application_server").list_fn(client, raw=True)
+    server_list, err = collect_all_items(list_fn, query_params)
     if err:
         module.fail_json(msg=f"Error retrieving Application Servers: {to_native(err)}")
 
-    result_list = [g.as_dict() for g in server_list]
+    result_list = server_list if raw else [g.as_dict() for g in server_list]
 
     if server_name:
         matched = next((g for g in result_list if g.get("name") == server_name), None)
         if not matched:
             available = [g.get("name") for g in result_list]
             module.fail_json(
-                msg=f"Application Server '{server_name}' not found. Available: {available}"
+                msg=f"Application Server '{server_name}' not found.{did_you_mean(server_name, available)}"
             )
         result_list = [matched]
 
-    module.exit_json(changed=False, servers=result_list)
+    info_exit(module, "servers", result_list)
 
 
 def main():
@@ -191,6 +207,9 @@ def main():
         name=dict(type="str", required=False),
         id=dict(type="str", required=False),
         microtenant_id=dict(type="str", required=False),
+        fields=dict(type="list", elements="str", required=False),
+        count_only=dict(type="bool", default=False),
+        raw=dict(type="bool", default=False),
     )
     module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
     try:
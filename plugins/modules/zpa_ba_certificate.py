@@ -33,6 +33,8 @@ short_description: Create certificate in the ZPA Cloud.
 description:
     - This module creates/delete a certificate in the ZPA Cloud.
     - The Certificate API do not provide a Update Method.
+    - Certificates are matched by name from one listing shared between tasks, see
+      O(dedupe_content) to also match them by content.
 author:
   - William Guilherme (@willguibr)
 version_added: "1.0.0"
@@ -69,6 +71,15 @@ options:
         - The unique identifier of the Microtenant for the ZPA tenant
         required: false
         type: str
+    dedupe_content:
+        description:
+        - When no certificate has O(name) but one holds the same certificate, by the
+          SHA-256 fingerprint of its content, return that one instead of uploading a
+          duplicate under O(name).
+        - O(name) then does not exist, so later tasks must refer to the returned certificate.
+        required: false
+        type: bool
+        default: false
 """
 
 EXAMPLES = """
@@ -91,11 +102,19 @@ from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     deleteNone,
-    collect_all_items,
 )
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_cache import (
+    certificate_cache,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_certificates import (
+    certificate_fingerprint,
+    find_certificate,
+    forget_certificate,
+    remember_certificate,
+)
 
 
 def core(module):
@@ -110,6 +129,8 @@ def core(module):
     microtenant_id = certificate.get("microtenant_id")
 
     existing_cert = None
+    cache = certificate_cache(module.params)
+    fingerprint = certificate_fingerprint(certificate.get("cert_blob"))
 
     # Step 1: Try to get the certificate by ID
     if cert_id:
@@ -124,20 +145,19 @@ def core(module):
         if result:
             existing_cert = result.as_dict()
 
-    # Step 2: If no ID, try to match by name
+    # Step 2: If no ID, match by name or, with dedupe_content, by content
     elif cert_name:
-        query_params = {"microtenant_id": microtenant_id} if microtenant_id else {}
-        cert_list, error = collect_all_items(
-            client.certificates.list_issued_certificates,
-            query_params=query_params,
+        dedupe = state == "present" and module.params.get("dedupe_content")
+        existing_cert, error = find_certificate(
+            client,
+            "ba_certificate",
+            cache,
+            name=cert_name,
+            fingerprint=fingerprint if dedupe else None,
+            microtenant_id=microtenant_id,
         )
         if error:
             module.fail_json(msg=f"Error listing certificates: {to_native(error)}")
-        for cert in cert_list or []:
-            cert_dict = cert.as_dict()
-            if cert_dict.get("name") == cert_name:
-                existing_cert = cert_dict
-                break
 
     if module.check_mode:
         module.exit_json(
@@ -148,6 +168,24 @@ def core(module):
     # Step 3: Handle Present
     if state == "present":
         if existing_cert:
+            existing_fingerprint = certificate_fingerprint(
+                existing_cert.get("certificate")
+            )
+            if existing_cert.get("name") != cert_name and not cert_id:
+                module.warn(
+                    f"Certificate content is already uploaded as '{existing_cert.get('name')}', "
+                    "not uploading it again."
+                )
+            elif (
+                fingerprint
+                and existing_fingerprint
+                and fingerprint != existing_fingerprint
+            ):
+                module.warn(
+                    f"Certificate '{existing_cert.get('name')}' holds a different certificate "
+                    f"(SHA-256 {existing_fingerprint}, cert_blob has {fingerprint}). The API "
+                    "cannot update certificates; upload the new one under another name to rotate it."
+                )
             module.exit_json(changed=False, data=existing_cert)
         else:
             payload = deleteNone(
@@ -161,7 +199,11 @@ def core(module):
             created, _unused, error = client.certificates.add_certificate(**payload)
             if error:
                 module.fail_json(msg=f"Error creating certificate: {to_native(error)}")
-            module.exit_json(changed=True, data=created.as_dict())
+            created = created.as_dict()
+            remember_certificate(
+                cache, "ba_certificate", created, microtenant_id, fingerprint
+            )
+            module.exit_json(changed=True, data=created)
 
     # Step 4: Handle Absent
     if state == "absent" and existing_cert:
@@ -171,6 +213,9 @@ def core(module):
         )
         if error:
             module.fail_json(msg=f"Error deleting certificate: {to_native(error)}")
+        forget_certificate(
+            cache, "ba_certificate", existing_cert.get("id"), microtenant_id
+        )
         module.exit_json(changed=True, data=existing_cert)
 
     module.exit_json(changed=False, data={})
@@ -184,6 +229,7 @@ def main():
         description=dict(type="str", required=False),
         cert_blob=dict(type="str", required=True),
         microtenant_id=dict(type="str", required=False),
+        dedupe_content=dict(type="bool", default=False),
         state=dict(type="str", choices=["present", "absent"], default="present"),
     )
 
@@ -186,6 +186,7 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import
 )
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     collect_all_items,
+    did_you_mean,
 )
 
 
@@ -226,7 +227,7 @@ def core(module):
         if not matched:
             available = [g.get("name") for g in result_list]
             module.fail_json(
-                msg=f"BA Certificate '{certificate_name}' not found. Available: {available}"
+                msg=f"BA Certificate '{certificate_name}' not found.{did_you_mean(certificate_name, available)}"
             )
         result_list = [matched]
 
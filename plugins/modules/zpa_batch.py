@@ -0,0 +1,108 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+
+#                             MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+module: zpa_batch
+short_description: Run a ZPA module for many parameter sets in one task
+description:
+  - Runs another module of this collection once per entry of O(items), inside the
+    controller's worker process instead of one module process per loop item.
+  - All items share one authenticated client per tenant and, optionally, a listing cache,
+    and run on a bounded pool of worker threads.
+  - Results are returned per item in the same shape as a task C(loop), in C(results).
+author:
+  - William Guilherme (@willguibr)
+version_added: "2.3.0"
+requirements:
+    - Zscaler SDK Python can be obtained from PyPI U(https://pypi.org/project/zscaler-sdk-python/)
+notes:
+    - This module is implemented as an action plugin and always runs on the controller.
+    - Check mode and diff mode are passed on to the target module.
+    - Items run concurrently, so they should not depend on each other. Use separate
+      tasks when one object must exist before another one is configured.
+options:
+  module:
+    description:
+      - Name of the module to run, for example C(zpa_server_group) or
+        C(zscaler.zpacloud.zpa_server_group).
+    type: str
+    required: true
+  items:
+    description:
+      - One dictionary of module options per run.
+    type: list
+    elements: dict
+    required: true
+  provider:
+    description:
+      - Authentication options passed to every item that does not set its own C(provider).
+    type: dict
+    required: false
+  concurrency:
+    description:
+      - Number of items run in parallel.
+    type: int
+    default: 8
+  cache_listings:
+    description:
+      - Share object listings between items. The cache is cleared every time an item
+        reports a change, so later items never see stale listings.
+    type: bool
+    default: true
+"""
+
+EXAMPLES = r"""
+- name: Create many server groups in one task
+  zscaler.zpacloud.zpa_batch:
+    module: zpa_server_group
+    provider: "{{ zpa_cloud }}"
+    concurrency: 10
+    items: "{{ server_groups }}"
+  register: created
+
+- name: Show the IDs of the server groups
+  ansible.builtin.debug:
+    msg: "{{ created.results | map(attribute='data.id') | list }}"
+"""
+
+RETURN = r"""
+results:
+  description: The result of every item, in the order of O(items), like a task C(loop).
+  returned: always
+  type: list
+  elements: dict
+  sample:
+    - changed: true
+      failed: false
+      item:
+        name: web-servers
+      data:
+        id: "216196257331282583"
+        name: web-servers
+"""
@@ -259,6 +259,7 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import
 )
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     collect_all_items,
+    did_you_mean,
 )
 
 
@@ -403,7 +404,7 @@ def core(module):
                 for p in profiles
             ]
             module.fail_json(
-                msg=f"Couldn't find any browser protection profile with name '{profile_name}'. Available: {available}"
+                msg=f"Couldn't find any browser protection profile with name '{profile_name}'.{did_you_mean(profile_name, available)}"
             )
 
         result = flatten_profile(matched_profile)
@@ -0,0 +1,304 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+
+#                             MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+module: zpa_bulk_delete
+short_description: Delete many ZPA objects at once, in dependency order
+description:
+  - Lists each requested resource type once, selects objects by name or regular expression,
+    and deletes them in dependency order, for example policy rules before application
+    segments, segments before segment and server groups, servers before connector groups.
+  - Deletions within one dependency tier run concurrently.
+  - Intended for cleaning up test and sandbox tenants.
+author:
+  - William Guilherme (@willguibr)
+version_added: "2.3.0"
+requirements:
+    - Zscaler SDK Python can be obtained from PyPI U(https://pypi.org/project/zscaler-sdk-python/)
+notes:
+    - Check mode is supported. Objects are listed and reported but not deleted.
+    - At least one of O(names) or O(name_regex) is required. Use O(name_regex=.*) to
+      delete every object of the given resource types.
+extends_documentation_fragment:
+  - zscaler.zpacloud.fragments.provider
+  - zscaler.zpacloud.fragments.documentation
+
+options:
+  resource_types:
+    description:
+      - Resource types to clean up, for example C(policy_access_rule), C(application_segment),
+        C(segment_group), C(server_group), C(application_server) or C(app_connector_group).
+      - The order given here does not matter, deletions are always ordered by dependency.
+    type: list
+    elements: str
+    required: true
+  names:
+    description:
+      - Exact names of the objects to delete.
+    type: list
+    elements: str
+    required: false
+  name_regex:
+    description:
+      - Python regular expression searched in object names. Objects matching either
+        O(names) or O(name_regex) are deleted.
+    type: str
+    required: false
+  concurrency:
+    description:
+      - Number of deletions run in parallel within a dependency tier.
+    type: int
+    default: 8
+  transport:
+    description:
+      - How deletions are sent.
+      - C(sdk) runs SDK calls on a thread pool.
+      - C(async) sends them with asyncio over one shared connection pool, for resource
+        types that support it. The other types fall back to the SDK.
+      - C(async) requires the C(aiohttp) library.
+    type: str
+    default: sdk
+    choices: ["sdk", "async"]
+  microtenant_id:
+    description:
+      - The unique identifier of the Microtenant for the ZPA tenant
+    required: false
+    type: str
+"""
+
+EXAMPLES = r"""
+- name: Remove everything created by the integration tests
+  zscaler.zpacloud.zpa_bulk_delete:
+    provider: "{{ zpa_cloud }}"
+    resource_types:
+      - policy_access_rule
+      - application_segment
+      - segment_group
+      - server_group
+      - application_server
+      - app_connector_group
+    name_regex: "^tests-"
+    concurrency: 10
+    transport: async
+
+- name: Preview the objects that would be removed
+  zscaler.zpacloud.zpa_bulk_delete:
+    provider: "{{ zpa_cloud }}"
+    resource_types: [segment_group]
+    names: ["crm", "hr"]
+  check_mode: true
+"""
+
+RETURN = r"""
+deleted:
+  description: Deleted objects (or, in check mode, objects that would be deleted) by resource type.
+  returned: always
+  type: dict
+  sample:
+    segment_group:
+      - id: "216196257331282583"
+        name: "tests-crm"
+errors:
+  description: Objects whose deletion failed.
+  returned: always
+  type: list
+  elements: dict
+  sample:
+    - resource_type: server_group
+      id: "216196257331282590"
+      name: "tests-web"
+      msg: "Server group is referenced by an application segment"
+"""
+
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from traceback import format_exc
+
+from ansible.module_utils._text import to_native
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    ZPAClientHelper,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_resources import (
+    DELETE_TIERS,
+    RESOURCE_TYPES,
+    get_resource_type,
+    iter_scoped_pages,
+)
+
+
+def select_objects(client, resource_type, matches, microtenant_id):
+    """List a resource type once and return the objects whose name ``matches``."""
+    rtype = get_resource_type(resource_type)
+    selected = []
+    for page, err in iter_scoped_pages(client, resource_type, microtenant_id):
+        if err:
+            raise RuntimeError(f"Error listing {resource_type}: {to_native(err)}")
+        for item in page:
+            name = rtype.name_of(item)
+            if name is not None and matches(name):
+                selected.append(item)
+    return selected
+
+
+def delete_object(client, resource_type, item, microtenant_id):
+    """Delete one object and return an error message, or None on success."""
+    rtype = get_resource_type(resource_type)
+    try:
+        result = rtype.delete(
+            client,
+            item.get("id"),
+            microtenant_id=microtenant_id,
+            parent_id=item.get("_parent_id"),
+        )
+    except Exception as e:
+        return to_native(e)
+    err = result[-1] if isinstance(result, tuple) else None
+    return to_native(err) if err else None
+
+
+def core(module):
+    resource_types = module.params.get("resource_types")
+    names = set(module.params.get("names") or [])
+    name_regex = module.params.get("name_regex")
+    concurrency = module.params.get("concurrency")
+    use_async = module.params.get("transport") == "async"
+    microtenant_id = module.params.get("microtenant_id")
+
+    unsupported = [
+        r
+        for r in resource_types
+        if r not in RESOURCE_TYPES or not RESOURCE_TYPES[r].delete_method
+    ]
+    if unsupported:
+        deletable = sorted(rt for tier in DELETE_TIERS for rt in tier)
+        module.fail_json(
+            msg=f"Unsupported resource type(s): {', '.join(unsupported)}. "
+            f"Supported types: {', '.join(deletable)}"
+        )
+    if not names and not name_regex:
+        module.fail_json(msg="one of names or name_regex is required")
+    if concurrency < 1:
+        module.fail_json(msg="concurrency must be at least 1")
+    try:
+        pattern = re.compile(name_regex) if name_regex else None
+    except re.error as e:
+        module.fail_json(msg=f"Invalid name_regex: {to_native(e)}")
+
+    def matches(name):
+        return name in names or bool(pattern and pattern.search(name))
+
+    client = ZPAClientHelper(module)
+    transport = client.async_transport(concurrency) if use_async else None
+
+    requested = set(resource_types)
+    tiers = [[rt for rt in tier if rt in requested] for tier in DELETE_TIERS]
+    tiers = [tier for tier in tiers if tier]
+
+    deleted = {}
+    errors = []
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        # Every type is listed up front, concurrently, before anything is deleted.
+        listings = {
+            rt: pool.submit(select_objects, client, rt, matches, microtenant_id)
+            for rt in resource_types
+        }
+        selected = {rt: future.result() for rt, future in listings.items()}
+
+        for tier in tiers:
+            jobs = []
+            async_jobs = []
+            for rt in tier:
+                deleted.setdefault(rt, [])
+                rtype = get_resource_type(rt)
+                for item in selected[rt]:
+                    if module.check_mode:
+                        jobs.append((rt, item, None))
+                    elif transport and rtype.endpoint:
+                        async_jobs.append((rt, item))
+                    else:
+                        future = pool.submit(
+                            delete_object, client, rt, item, microtenant_id
+                        )
+                        jobs.append((rt, item, future))
+
+            if async_jobs:
+                results = transport.run(
+                    *[
+                        get_resource_type(rt).delete_async(
+                            transport, item.get("id"), microtenant_id
+                        )
+                        for rt, item in async_jobs
+                    ]
+                )
+                for (rt, item), (_, err) in zip(async_jobs, results):
+                    jobs.append((rt, item, to_native(err) if err else None))
+
+            for rt, item, error in jobs:
+                if isinstance(error, Future):
+                    error = error.result()
+                entry = {
+                    "id": str(item.get("id")),
+                    "name": get_resource_type(rt).name_of(item),
+                }
+                if error:
+                    errors.append(dict(entry, resource_type=rt, msg=error))
+                else:
+                    deleted[rt].append(entry)
+
+    changed = any(deleted.values())
+    if errors:
+        module.fail_json(
+            msg=f"Failed to delete {len(errors)} object(s)",
+            changed=changed,
+            deleted=deleted,
+            errors=errors,
+        )
+    module.exit_json(changed=changed, deleted=deleted, errors=errors)
+
+
+def main():
+    argument_spec = ZPAClientHelper.zpa_argument_spec()
+    argument_spec.update(
+        resource_types=dict(type="list", elements="str", required=True),
+        names=dict(type="list", elements="str", required=False),
+        name_regex=dict(type="str", required=False),
+        concurrency=dict(type="int", default=8),
+        transport=dict(type="str", default="sdk", choices=["sdk", "async"]),
+        microtenant_id=dict(type="str", required=False),
+    )
+    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+    try:
+        core(module)
+    except Exception as e:
+        module.fail_json(msg=to_native(e), exception=format_exc())
+
+
+if __name__ == "__main__":
+    main()
@@ -33,11 +33,16 @@ short_description: Create a C2C IP Range
 description:
     - This module will create/update/delete a C2C IP Range resource.
     - C2C IP Ranges define the IP address ranges for Client-to-Client connectivity.
+    - Before a range is created or its addresses change, it is checked against an interval
+      index of all C2C IP ranges built from one listing, see O(overlap_check).
+    - With O(ranges), a full list of ranges is reconciled in one pass from a single listing,
+      with the writes sent concurrently.
 author:
   - William Guilherme (@willguibr)
 version_added: "1.0.0"
 requirements:
     - Zscaler SDK Python can be obtained from PyPI U(https://pypi.org/project/zscaler-sdk-python/)
+    - netaddr, unless O(overlap_check=ignore)
 notes:
     - Check mode is supported.
 extends_documentation_fragment:
@@ -51,9 +56,11 @@ options:
     type: str
     required: false
   name:
-    description: "Name of the C2C IP Range"
+    description:
+      - Name of the C2C IP Range.
+      - Required unless O(ranges) is set.
     type: str
-    required: true
+    required: false
   description:
     description: "Description of the C2C IP Range"
     type: str
@@ -98,6 +105,73 @@ options:
     description: "Longitude coordinate stored in the database"
     type: str
     required: false
+  overlap_check:
+    description:
+      - What to do when a range that is created or whose addresses change would share
+        addresses with another C2C IP range, which makes C2C routing ambiguous.
+      - C(error) fails before anything is written, C(warn) writes and emits a warning,
+        C(ignore) skips the check and the listing it needs.
+      - Overlaps between ranges the task does not change are not reported.
+      - The check needs the C(netaddr) library.
+    type: str
+    choices: ["error", "warn", "ignore"]
+    default: warn
+  ranges:
+    description:
+      - Reconcile a list of C2C IP ranges, matched by name, instead of a single one.
+      - With O(state=present) missing ranges are created and drifted ones updated. With
+        O(state=absent) the listed ranges are deleted.
+      - Options left unset on a range are not compared.
+    type: list
+    elements: dict
+    suboptions:
+      name:
+        description: "Name of the C2C IP Range"
+        type: str
+        required: true
+      description:
+        description: "Description of the C2C IP Range"
+        type: str
+      enabled:
+        description: "Whether this C2C IP Range is enabled or not"
+        type: bool
+      ip_range_begin:
+        description: "Beginning IP address of the range"
+        type: str
+      ip_range_end:
+        description: "Ending IP address of the range"
+        type: str
+      location:
+        description: "Location description for the C2C IP Range"
+        type: str
+      location_hint:
+        description: "Location hint for the C2C IP Range"
+        type: str
+      sccm_flag:
+        description: "SCCM flag for the C2C IP Range"
+        type: bool
+      subnet_cidr:
+        description: "Subnet CIDR for the C2C IP Range"
+        type: str
+      country_code:
+        description: "Country code for the C2C IP Range location"
+        type: str
+      latitude_in_db:
+        description: "Latitude coordinate stored in the database"
+        type: str
+      longitude_in_db:
+        description: "Longitude coordinate stored in the database"
+        type: str
+  purge:
+    description:
+      - With O(ranges) and O(state=present), delete the C2C IP ranges that are not listed.
+    type: bool
+    default: false
+  concurrency:
+    description:
+      - With O(ranges), maximum number of write requests in flight at once.
+    type: int
+    default: 8
 """
 
 EXAMPLES = """
@@ -114,16 +188,38 @@ EXAMPLES = """
     country_code: "US"
     latitude_in_db: "37.33874"
     longitude_in_db: "-121.8852525"
+
+- name: Reconcile every C2C IP range of the tenant
+  zscaler.zpacloud.zpa_c2c_ip_ranges:
+    provider: "{{ zpa_cloud }}"
+    purge: true
+    ranges:
+      - name: HQ
+        subnet_cidr: "10.10.0.0/16"
+        enabled: true
+      - name: Branch_01
+        ip_range_begin: "10.20.0.1"
+        ip_range_end: "10.20.0.254"
+        enabled: true
 """
 
 RETURN = """
 # The newly created C2C IP Range resource record.
+changes:
+  description: With O(ranges), names of the ranges created, updated and deleted.
+  returned: when O(ranges) is set
+  type: dict
+  sample:
+    created: ["Branch_01"]
+    updated: ["HQ"]
+    deleted: []
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from traceback import format_exc
 
 from ansible.module_utils._text import to_native
-from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     deleteNone,
     normalize_app,
@@ -131,34 +227,206 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_ip_ranges import (
+    HAS_NETADDR,
+    NETADDR_IMPORT_ERROR,
+    RangeIndex,
+    overlap_errors,
+    range_bounds,
+)
+
+RANGE_FIELDS = [
+    "name",
+    "description",
+    "enabled",
+    "ip_range_begin",
+    "ip_range_end",
+    "location",
+    "location_hint",
+    "sccm_flag",
+    "subnet_cidr",
+    "country_code",
+    "latitude_in_db",
+    "longitude_in_db",
+]
+
+
+def list_ranges(module, client):
+    range_list, _unused, error = client.c2c_ip_ranges.list_ip_ranges()
+    if error:
+        module.fail_json(msg=f"Error listing C2C IP Ranges: {to_native(error)}")
+    return [item.as_dict() for item in range_list or []]
+
+
+def overlap_checking(module):
+    """Whether overlap_check is on, failing when netaddr is missing for it."""
+    if module.params.get("overlap_check") == "ignore":
+        return False
+    if not HAS_NETADDR:
+        module.fail_json(
+            msg=missing_required_lib("netaddr"), exception=NETADDR_IMPORT_ERROR
+        )
+    return True
+
+
+def bounds_changed(desired, current):
+    try:
+        desired_bounds = range_bounds(desired)
+        return desired_bounds is not None and desired_bounds != range_bounds(
+            current or {}
+        )
+    except ValueError:
+        # Invalid addresses are reported by the overlap check itself.
+        return True
+
+
+def check_overlaps(module, final_ranges, changed_ranges, exclude=()):
+    """Fail or warn, per overlap_check, when a changed range overlaps another one."""
+    mode = module.params.get("overlap_check")
+    if mode == "ignore" or not changed_ranges:
+        return
+    try:
+        errors = overlap_errors(RangeIndex(final_ranges), changed_ranges, exclude)
+    except ValueError as e:
+        module.fail_json(msg=to_native(e))
+    if not errors:
+        return
+    msg = "Overlapping C2C IP ranges: " + "; ".join(errors)
+    if mode == "error":
+        module.fail_json(msg=msg)
+    module.warn(msg)
+
+
+def _sdk_error(call, **kwargs):
+    try:
+        result = call(**kwargs)
+    except Exception as e:
+        return to_native(e)
+    err = result[-1] if isinstance(result, tuple) else None
+    return to_native(err) if err else None
+
+
+def range_drift(desired, current):
+    """Fields set on ``desired`` that differ from ``current``."""
+    return [
+        k
+        for k in RANGE_FIELDS
+        if desired.get(k) is not None and str(desired[k]) != str(current.get(k))
+    ]
+
+
+def reconcile_ranges(module, client):
+    state = module.params.get("state")
+    purge = module.params.get("purge")
+    concurrency = module.params.get("concurrency")
+    if concurrency < 1:
+        module.fail_json(msg="concurrency must be at least 1")
+
+    desired = {}
+    for item in module.params.get("ranges"):
+        if item["name"] in desired:
+            module.fail_json(msg=f"Duplicate C2C IP Range name '{item['name']}'")
+        desired[item["name"]] = {k: item.get(k) for k in RANGE_FIELDS}
+
+    existing = {r.get("name"): r for r in list_ranges(module, client)}
+    changes = {"created": [], "updated": [], "deleted": []}
+    writes = []
+
+    if state == "absent":
+        for name in desired:
+            if name in existing:
+                changes["deleted"].append(name)
+                writes.append(
+                    (
+                        name,
+                        client.c2c_ip_ranges.delete_ip_range,
+                        {"range_id": existing[name]["id"]},
+                    )
+                )
+    else:
+        checking = overlap_checking(module)
+        final = []
+        moved = []
+        for name, item in desired.items():
+            current = existing.get(name)
+            payload = deleteNone(dict(item))
+            if current is None:
+                changes["created"].append(name)
+                writes.append((name, client.c2c_ip_ranges.add_ip_range, payload))
+            elif range_drift(item, current):
+                changes["updated"].append(name)
+                writes.append(
+                    (
+                        name,
+                        client.c2c_ip_ranges.update_ip_range,
+                        {"range_id": current["id"], **payload},
+                    )
+                )
+            merged = {**(current or {}), **payload}
+            # One address form replaces the other, so drop the old one.
+            if payload.get("subnet_cidr"):
+                merged.pop("ip_range_begin", None)
+                merged.pop("ip_range_end", None)
+            elif payload.get("ip_range_begin") or payload.get("ip_range_end"):
+                merged.pop("subnet_cidr", None)
+            final.append(merged)
+            if checking and bounds_changed(item, current):
+                moved.append(merged)
+        for name, current in existing.items():
+            if name in desired:
+                continue
+            if purge:
+                changes["deleted"].append(name)
+                writes.append(
+                    (
+                        name,
+                        client.c2c_ip_ranges.delete_ip_range,
+                        {"range_id": current["id"]},
+                    )
+                )
+            else:
+                final.append(current)
+        check_overlaps(module, final, moved)
+
+    changed = any(changes.values())
+    if module.check_mode or not writes:
+        module.exit_json(changed=changed, changes=changes)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [
+            (name, pool.submit(_sdk_error, call, **kwargs))
+            for name, call, kwargs in writes
+        ]
+        failed = {name: f.result() for name, f in futures if f.result()}
+
+    if failed:
+        for names in changes.values():
+            names[:] = [n for n in names if n not in failed]
+        module.fail_json(
+            msg=f"{len(failed)} of {len(writes)} C2C IP Range request(s) failed: "
+            + "; ".join(f"{n}: {e}" for n, e in failed.items()),
+            changed=any(changes.values()),
+            changes=changes,
+        )
+    module.exit_json(changed=True, changes=changes)
 
 
 def core(module):
     state = module.params.get("state")
     client = ZPAClientHelper(module)
 
+    if module.params.get("ranges") is not None:
+        reconcile_ranges(module, client)
+
     # Collect parameters
-    params = [
-        "id",
-        "name",
-        "description",
-        "enabled",
-        "ip_range_begin",
-        "ip_range_end",
-        "location",
-        "location_hint",
-        "sccm_flag",
-        "subnet_cidr",
-        "country_code",
-        "latitude_in_db",
-        "longitude_in_db",
-    ]
+    params = ["id"] + RANGE_FIELDS
     range_data = {param: module.params.get(param) for param in params}
     range_id = range_data.get("id")
     range_name = range_data.get("name")
 
     # Step 1: Fetch existing range if possible
     existing_range = None
+    all_ranges = None
     if range_id:
         result, _unused, error = client.c2c_ip_ranges.get_ip_range(range_id)
         if error:
@@ -169,15 +437,11 @@ def core(module):
             existing_range = result.as_dict()
 
     elif range_name:
-        range_list, _unused, error = client.c2c_ip_ranges.list_ip_ranges()
-        if error:
-            module.fail_json(msg=f"Error listing C2C IP Ranges: {to_native(error)}")
-        for item in range_list or []:
-            item_dict = item.as_dict()
+        all_ranges = list_ranges(module, client)
+        for item_dict in all_ranges:
             if item_dict.get("name") == range_name:
                 existing_range = item_dict
                 break
-
     # Step 2: Normalize and compare
     desired_range = normalize_app(range_data)
     current_range = normalize_app(existing_range) if existing_range else {}
@@ -190,6 +454,16 @@ def core(module):
         if k not in fields_to_ignore
     )
 
+    if (
+        state == "present"
+        and overlap_checking(module)
+        and bounds_changed(range_data, existing_range)
+    ):
+        if all_ranges is None:
+            all_ranges = list_ranges(module, client)
+        own = {range_name, (existing_range or {}).get("name")}
+        check_overlaps(module, all_ranges, [range_data], exclude=own)
+
     if module.check_mode:
         module.exit_json(
             changed=(state == "present" and (drift or not existing_range))
@@ -264,7 +538,7 @@ def main():
     argument_spec = ZPAClientHelper.zpa_argument_spec()
     argument_spec.update(
         id=dict(type="str", required=False),
-        name=dict(type="str", required=True),
+        name=dict(type="str", required=False),
         description=dict(type="str", required=False),
         enabled=dict(type="bool", required=False),
         ip_range_begin=dict(type="str", required=False),
@@ -276,9 +550,38 @@ def main():
         country_code=dict(type="str", required=False),
         latitude_in_db=dict(type="str", required=False),
         longitude_in_db=dict(type="str", required=False),
+        overlap_check=dict(
+            type="str", choices=["error", "warn", "ignore"], default="warn"
+        ),
+        ranges=dict(
+            type="list",
+            elements="dict",
+            required=False,
+            options=dict(
+                name=dict(type="str", required=True),
+                description=dict(type="str", required=False),
+                enabled=dict(type="bool", required=False),
+                ip_range_begin=dict(type="str", required=False),
+                ip_range_end=dict(type="str", required=False),
+                location=dict(type="str", required=False),
+                location_hint=dict(type="str", required=False),
+                sccm_flag=dict(type="bool", required=False),
+                subnet_cidr=dict(type="str", required=False),
+                country_code=dict(type="str", required=False),
+                latitude_in_db=dict(type="str", required=False),
+                longitude_in_db=dict(type="str", required=False),
+            ),
+        ),
+        purge=dict(type="bool", default=False),
+        concurrency=dict(type="int", default=8),
         state=dict(type="str", choices=["present", "absent"], default="present"),
     )
-    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        supports_check_mode=True,
+        required_one_of=[("name", "ranges")],
+        mutually_exclusive=[("ranges", "name"), ("ranges", "id")],
+    )
     try:
         core(module)
     except Exception as e:
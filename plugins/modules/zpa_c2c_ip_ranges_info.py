@@ -174,6 +174,9 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
+    did_you_mean,
+)
 
 
 def core(module):
@@ -202,7 +205,7 @@ def core(module):
         if not matched:
             available = [r.get("name") for r in result_list]
             module.fail_json(
-                msg=f"C2C IP Range '{range_name}' not found. Available: {available}"
+                msg=f"C2C IP Range '{range_name}' not found.{did_you_mean(range_name, available)}"
             )
         result_list = [matched]
 
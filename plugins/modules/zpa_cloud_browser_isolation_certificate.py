@@ -32,6 +32,8 @@ module: zpa_cloud_browser_isolation_certificate
 short_description: Create a CBI Certificate
 description:
     - This module will create/update/delete a CBI Certificate resource.
+    - The certificate is compared by the SHA-256 fingerprint of its content, so a PEM
+      that only differs in formatting does not trigger an update.
 author:
   - William Guilherme (@willguibr)
 version_added: "2.0.0"
@@ -79,17 +81,15 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import dele
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
-
-
-def normalize_certificate(cbi_banner):
-    """
-    Remove computed attributes from a cbi certificate dict to make comparison easier.
-    """
-    normalized = cbi_banner.copy() if cbi_banner else {}
-    computed_values = ["id", "is_default", "private_key"]
-    for attr in computed_values:
-        normalized.pop(attr, None)
-    return normalized
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_cache import (
+    certificate_cache,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_certificates import (
+    certificate_fingerprint,
+    find_certificate,
+    forget_certificate,
+    remember_certificate,
+)
 
 
 def core(module):
@@ -108,6 +108,7 @@ def core(module):
 
     # Step 1: Fetch existing certificate if possible
     existing_certificate = None
+    cache = certificate_cache(module.params)
     if certificate_id:
         result, _unused, error = client.cbi_certificate.get_cbi_certificate(
             certificate_id
@@ -120,40 +121,25 @@ def core(module):
             existing_certificate = result.as_dict()
 
     elif certificate_name:
-        certificate_list, _unused, error = (
-            client.cbi_certificate.list_cbi_certificates()
+        existing_certificate, error = find_certificate(
+            client, "cbi_certificate", cache, name=certificate_name
         )
         if error:
             module.fail_json(msg=f"Error listing CBI certificates: {to_native(error)}")
-        for item in certificate_list or []:
-            item_dict = item.as_dict()
-            if item_dict.get("name") == certificate_name:
-                existing_certificate = item_dict
-                break
-
-    # Step 2: Normalize and compare
-    desired_certificate = normalize_certificate(certificate)
-    current_certificate = (
-        normalize_certificate(existing_certificate) if existing_certificate else {}
-    )
 
-    fields_to_ignore = ["id"]
+    # Step 2: Compare names and certificate fingerprints. The PEM text itself is
+    # only compared when either side cannot be decoded.
     drift = False
-
-    for k in desired_certificate:
-        if k in fields_to_ignore:
-            continue
-        if desired_certificate.get(k) != current_certificate.get(k):
-            module.warn(
-                f"[DRIFT] Key='{k}' => Desired={desired_certificate.get(k)!r}, Actual={current_certificate.get(k)!r}"
-            )
-            drift = True
-
-    drift = any(
-        desired_certificate.get(k) != current_certificate.get(k)
-        for k in desired_certificate
-        if k not in fields_to_ignore
-    )
+    if existing_certificate:
+        fingerprint = certificate_fingerprint(certificate.get("pem"))
+        existing_fingerprint = existing_certificate.get(
+            "fingerprint"
+        ) or certificate_fingerprint(existing_certificate.get("pem"))
+        if fingerprint and existing_fingerprint:
+            pem_drift = fingerprint != existing_fingerprint
+        else:
+            pem_drift = certificate.get("pem") != existing_certificate.get("pem")
+        drift = pem_drift or certificate_name != existing_certificate.get("name")
 
     if module.check_mode:
         module.exit_json(
@@ -168,8 +154,8 @@ def core(module):
                 update_banner = deleteNone(
                     {
                         "certificate_id": existing_certificate.get("id"),
-                        "name": desired_certificate.get("name"),
-                        "pem": desired_certificate.get("pem"),
+                        "name": certificate_name,
+                        "pem": certificate.get("pem"),
                     }
                 )
                 updated, _unused, error = client.cbi_certificate.update_cbi_certificate(
@@ -179,14 +165,18 @@ def core(module):
                     module.fail_json(
                         msg=f"Error updating CBI Certificate: {to_native(error)}"
                     )
-                module.exit_json(changed=True, data=updated.as_dict())
+                updated = updated.as_dict()
+                remember_certificate(
+                    cache, "cbi_certificate", updated, fingerprint=fingerprint
+                )
+                module.exit_json(changed=True, data=updated)
             else:
                 module.exit_json(changed=False, data=existing_certificate)
         else:
             create_banner = deleteNone(
                 {
-                    "name": desired_certificate.get("name"),
-                    "pem": desired_certificate.get("pem"),
+                    "name": certificate_name,
+                    "pem": certificate.get("pem"),
                 }
             )
             created, _unused, error = client.cbi_certificate.add_cbi_certificate(
@@ -196,7 +186,14 @@ def core(module):
                 module.fail_json(
                     msg=f"Error creating CBI Certificate: {to_native(error)}"
                 )
-            module.exit_json(changed=True, data=created.as_dict())
+            created = created.as_dict()
+            remember_certificate(
+                cache,
+                "cbi_certificate",
+                created,
+                fingerprint=certificate_fingerprint(certificate.get("pem")),
+            )
+            module.exit_json(changed=True, data=created)
 
     # Step 4: Delete
     elif state == "absent" and existing_certificate and existing_certificate.get("id"):
@@ -205,6 +202,7 @@ def core(module):
         )
         if error:
             module.fail_json(msg=f"Error deleting CBI Certificate: {to_native(error)}")
+        forget_certificate(cache, "cbi_certificate", existing_certificate.get("id"))
         module.exit_json(changed=True, data=existing_certificate)
 
     module.exit_json(changed=False, data={})
@@ -104,6 +104,7 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import
 )
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     collect_all_items,
+    did_you_mean,
 )
 
 
@@ -139,7 +140,7 @@ def core(module):
         if not matched:
             available = [p.get("name") for p in result_list]
             module.fail_json(
-                msg=f"Extranet Resource Partner '{partner_name}' not found. Available: {available}"
+                msg=f"Extranet Resource Partner '{partner_name}' not found.{did_you_mean(partner_name, available)}"
             )
         result_list = [matched]
 
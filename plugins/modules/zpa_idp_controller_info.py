@@ -224,6 +224,7 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import
 )
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     collect_all_items,
+    did_you_mean,
 )
 
 
@@ -268,7 +269,7 @@ def core(module):
         if not matched:
             available = [idp.get("name") for idp in result_list]
             module.fail_json(
-                msg=f"Identity Provider '{idp_name}' not found. Available: {available}"
+                msg=f"Identity Provider '{idp_name}' not found.{did_you_mean(idp_name, available)}"
             )
         result_list = [matched]
 
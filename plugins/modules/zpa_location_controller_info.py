@@ -96,6 +96,7 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import
 )
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     collect_all_items,
+    did_you_mean,
 )
 
 
@@ -155,7 +156,7 @@ def core(module):
     if not matched:
         available = [loc.get("name") for loc in result_list]
         module.fail_json(
-            msg=f"Location '{location_name}' not found for extranet resource '{zia_er_name}'. Available: {available}"
+            msg=f"Location '{location_name}' not found for extranet resource '{zia_er_name}'.{did_you_mean(location_name, available)}"
         )
 
     module.exit_json(changed=False, locations=[matched])
@@ -105,6 +105,7 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import
 )
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     collect_all_items,
+    did_you_mean,
 )
 
 
@@ -157,7 +158,7 @@ def core(module):
         if not matched:
             available = [loc.get("name") for loc in all_locations]
             module.fail_json(
-                msg=f"Location with name '{location_name}' not found. Available: {available}"
+                msg=f"Location with name '{location_name}' not found.{did_you_mean(location_name, available)}"
             )
         module.exit_json(changed=False, locations=[matched])
 
@@ -39,6 +39,9 @@ requirements:
     - Zscaler SDK Python can be obtained from PyPI U(https://pypi.org/project/zscaler-sdk-python/)
 notes:
     - Check mode is supported.
+    - Only the settings given in the task are compared with the configuration in place.
+      Policy rule operands are compared as a set of object type and value pairs, since
+      the API stores one operand per value.
 extends_documentation_fragment:
   - zscaler.zpacloud.fragments.provider
   - zscaler.zpacloud.fragments.documentation
@@ -239,7 +242,19 @@ EXAMPLES = r"""
 """
 
 RETURN = r"""
-# The newly created policy access rule resource record.
+data:
+  description: The LSS configuration after the task.
+  returned: always
+  type: dict
+drift:
+  description:
+    - The settings that differed from the LSS configuration in place, and were updated.
+    - The configuration is only written when at least one setting differs, since
+      every update restarts the log streaming session.
+  returned: when an existing configuration is updated
+  type: list
+  elements: str
+  sample: ["config.lss_port", "policy_rule_resource"]
 """
 
 from traceback import format_exc
@@ -247,18 +262,136 @@ from traceback import format_exc
 from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
+    collect_all_items,
     deleteNone,
 )
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
 
+# Source log types accepted by the module, keyed to the codes the API returns.
+LSS_SOURCE_LOG_TYPES = {
+    "app_connector_metrics": "zpn_ast_comprehensive_stats",
+    "app_connector_status": "zpn_ast_auth_log",
+    "audit_logs": "zpn_audit_log",
+    "browser_access": "zpn_http_trans_log",
+    "private_svc_edge_status": "zpn_sys_auth_log",
+    "user_activity": "zpn_trans_log",
+    "user_status": "zpn_auth_log",
+    "web_inspection": "zpn_waf_http_exchanges_log",
+}
 
-def get_lss_config(id, client):
-    confs = client.lss.list_configs().to_list()
-    for lssconf in confs:
-        if lssconf.get("config").get("id") == id:
-            return lssconf
+
+def find_lss_config(module, client, lss_config_id, lss_config_name):
+    """Return the existing LSS config as a dict, with at most one listing."""
+    if lss_config_id:
+        result, _unused, error = client.lss.get_config(lss_config_id=lss_config_id)
+        if error:
+            module.fail_json(
+                msg=f"Error retrieving LSS config {lss_config_id}: {to_native(error)}"
+            )
+        return result.as_dict() if result else None
+
+    if lss_config_name:
+        configs, error = collect_all_items(client.lss.list_configs, {})
+        if error:
+            module.fail_json(msg=f"Error listing LSS configs: {to_native(error)}")
+        for conf in configs:
+            conf = conf.as_dict() if hasattr(conf, "as_dict") else conf
+            if (conf.get("config") or {}).get("name") == lss_config_name:
+                return conf
+    return None
+
+
+def policy_operands(policy_rule_resource):
+    """Flatten the operands of a policy rule resource to ``(OBJECT_TYPE, [values])`` pairs."""
+    operands = []
+    for condition in (policy_rule_resource or {}).get("conditions") or []:
+        for operand in condition.get("operands") or []:
+            values = operand.get("values")
+            if values is None:
+                values = [operand["rhs"]] if operand.get("rhs") is not None else []
+            object_type = str(operand.get("object_type") or "").upper()
+            operands.append((object_type, [str(v) for v in values]))
+    return operands
+
+
+def normalize_policy_operands(operands, client_types):
+    """
+    Return a comparable set of ``(OBJECT_TYPE, value)`` pairs.
+
+    The API stores one operand per value, and the SDK writes one condition per
+    operand, so operators and grouping carry no meaning and are left out.
+    Client type names are mapped to the codes the API reports.
+    """
+    pairs = set()
+    for object_type, values in operands:
+        for value in values:
+            if object_type == "CLIENT_TYPE":
+                value = client_types.get(value, value)
+            pairs.add((object_type, value))
+    return pairs
+
+
+def lss_config_drift(desired, current, log_formats, client_types):
+    """Return the names of the fields that differ between the desired and current config."""
+    want = desired.get("config") or {}
+    have = current.get("config") or {}
+    drift = []
+
+    for key in ("name", "lss_host", "lss_port", "enabled", "use_tls"):
+        if want.get(key) is not None and str(want[key]) != str(have.get(key)):
+            drift.append(f"config.{key}")
+    if want.get("source_log_type") and LSS_SOURCE_LOG_TYPES.get(
+        want["source_log_type"]
+    ) != have.get("source_log_type"):
+        drift.append("config.source_log_type")
+    if want.get("filter") and sorted(want["filter"]) != sorted(
+        have.get("filter") or []
+    ):
+        drift.append("config.filter")
+    if log_formats is not None:
+        log_type = LSS_SOURCE_LOG_TYPES.get(want.get("source_log_type"))
+        wanted_format = (log_formats.get(log_type) or {}).get(
+            want.get("source_log_format")
+        )
+        if wanted_format is not None and wanted_format != have.get("format"):
+            drift.append("config.format")
+
+    if desired.get("app_connector_group_ids") is not None:
+        have_groups = [str(g.get("id")) for g in current.get("connector_groups") or []]
+        if sorted(map(str, desired["app_connector_group_ids"])) != sorted(have_groups):
+            drift.append("app_connector_group_ids")
+
+    if desired.get("policy_rule_resource") is not None:
+        want_policy = normalize_policy_operands(
+            policy_operands(desired["policy_rule_resource"]), client_types
+        )
+        have_policy = normalize_policy_operands(
+            policy_operands(current.get("policy_rule_resource")), client_types
+        )
+        if want_policy != have_policy:
+            drift.append("policy_rule_resource")
+    return drift
+
+
+def sdk_policy_rules(policy_rule_resource, client_types):
+    """Convert policy rule operands to the ``(object_type, values)`` tuples the SDK expects."""
+    names_by_code = {code: name for name, code in client_types.items()}
+    policy_rules = []
+    for object_type, values in policy_operands(policy_rule_resource):
+        if object_type == "CLIENT_TYPE":
+            values = [names_by_code.get(v, v) for v in values]
+        policy_rules.append((object_type.lower(), values))
+    return policy_rules
+
+
+def uses_client_types(*policy_rule_resources):
+    return any(
+        object_type == "CLIENT_TYPE"
+        for resource in policy_rule_resources
+        for object_type, _unused in policy_operands(resource)
+    )
 
 
 def core(module):
@@ -268,106 +401,103 @@ def core(module):
     params = ["id", "config", "app_connector_group_ids", "policy_rule_resource"]
     for param_name in params:
         lss_config[param_name] = module.params.get(param_name, None)
-    lss_config_name = lss_config.get("config", {}).get("name")
-    lss_config_id = lss_config.get("id")
-
-    existing_lss_config = None
-    if lss_config_id is not None:
-        existing_lss_config = client.lss.get_config(lss_id=lss_config_id)
-    elif lss_config_name is not None:
-        confs = client.lss.list_configs().to_list()
-        for lssconf in confs:
-            if lssconf.get("config").get("name") == lss_config_name:
-                existing_lss_config = lssconf
-                break
-
-    if existing_lss_config is not None:
-        id = existing_lss_config.get("id")
-        existing_lss_config.update(lss_config)
-        existing_lss_config["id"] = id
-
-    if state == "present":
-        if existing_lss_config is not None:
-            policy_rule_resource = existing_lss_config.get("policy_rule_resource", None)
-            policy_rules = []
-            if policy_rule_resource is not None:
-                policy_rules.append(policy_rule_resource)
-            """Update"""
-            existing_lss_config = deleteNone(
-                dict(
-                    lss_config_id=existing_lss_config.get("id", None),
-                    description=existing_lss_config.get("config", dict()).get(
-                        "description", None
-                    ),
-                    enabled=existing_lss_config.get("config", dict()).get(
-                        "enabled", None
-                    ),
-                    filter_status_codes=existing_lss_config.get("config", dict()).get(
-                        "filter_status_codes", None
-                    ),
-                    log_stream_content=existing_lss_config.get("config", dict()).get(
-                        "log_stream_content", None
-                    ),
-                    source_log_format=existing_lss_config.get("config", dict()).get(
-                        "source_log_format", None
-                    ),
-                    source_log_type=existing_lss_config.get("config", dict()).get(
-                        "source_log_type", None
-                    ),
-                    use_tls=existing_lss_config.get("config", dict()).get(
-                        "use_tls", None
-                    ),
-                    policy_rules=policy_rules,
-                )
-            )
-            lss_config = client.lss.update_lss_config(**existing_lss_config)
-            module.exit_json(
-                changed=True, data=get_lss_config(lss_config.get("id"), client)
-            )
-        else:
-            """Create"""
-            policy_rule_resource = lss_config.get("policy_rule_resource", None)
-            policy_rules = []
-            if policy_rule_resource is not None:
-                policy_rules.append(policy_rule_resource)
-            lss_config = deleteNone(
-                dict(
-                    app_connector_group_ids=lss_config.get(
-                        "app_connector_group_ids", None
-                    ),
-                    enabled=lss_config.get("config", dict()).get("enabled", None),
-                    lss_host=lss_config.get("config", dict()).get("lss_host", None),
-                    lss_port=lss_config.get("config", dict()).get("lss_port", None),
-                    name=lss_config.get("config", dict()).get("name", None),
-                    source_log_format=lss_config.get("config", dict()).get(
-                        "source_log_format", None
-                    ),
-                    source_log_type=lss_config.get("config", dict()).get(
-                        "source_log_type", None
-                    ),
-                    use_tls=lss_config.get("config", dict()).get("use_tls", None),
-                    description=lss_config.get("config", dict()).get(
-                        "description", None
-                    ),
-                    filter_status_codes=lss_config.get("config", dict()).get(
-                        "filter", None
-                    ),
-                    log_stream_content=lss_config.get("config", dict()).get(
-                        "log_stream_content", None
-                    ),
-                    policy_rules=policy_rules,
-                )
-            )
-            lss_config = client.lss.add_lss_config(**lss_config)
-            module.exit_json(
-                changed=True, data=get_lss_config(lss_config.get("id"), client)
+    config = lss_config.get("config") or {}
+    policy_rule_resource = lss_config.get("policy_rule_resource")
+
+    existing_lss_config = find_lss_config(
+        module, client, lss_config.get("id"), config.get("name")
+    )
+
+    if state == "absent":
+        if existing_lss_config is None:
+            module.exit_json(changed=False, data={})
+        if not module.check_mode:
+            _unused, _unused, error = client.lss.delete_lss_config(
+                lss_config_id=existing_lss_config.get("id")
             )
-    elif state == "absent" and existing_lss_config is not None:
-        code = client.lss.delete_lss_config(lss_id=existing_lss_config.get("id"))
-        if code > 299:
-            module.exit_json(changed=False, data=None)
+            if error:
+                module.fail_json(msg=f"Error deleting LSS config: {to_native(error)}")
         module.exit_json(changed=True, data=existing_lss_config)
-    module.exit_json(changed=False, data={})
+
+    # Client type names are only looked up when a policy rule refers to them.
+    client_types = {}
+    if uses_client_types(
+        policy_rule_resource, (existing_lss_config or {}).get("policy_rule_resource")
+    ):
+        client_types = client.lss.get_client_types() or {}
+    policy_rules = (
+        sdk_policy_rules(policy_rule_resource, client_types)
+        if policy_rule_resource
+        else None
+    )
+
+    if existing_lss_config is None:
+        """Create"""
+        if module.check_mode:
+            module.exit_json(changed=True, data={})
+        create_lss_config = deleteNone(
+            dict(
+                app_connector_group_ids=lss_config.get("app_connector_group_ids"),
+                enabled=config.get("enabled"),
+                lss_host=config.get("lss_host"),
+                lss_port=config.get("lss_port"),
+                name=config.get("name"),
+                source_log_format=config.get("source_log_format"),
+                source_log_type=config.get("source_log_type"),
+                use_tls=config.get("use_tls"),
+                filter_status_codes=config.get("filter"),
+                policy_rules=policy_rules,
+                policy_name=(policy_rule_resource or {}).get("name"),
+            )
+        )
+        result, _unused, error = client.lss.add_lss_config(**create_lss_config)
+        if error:
+            module.fail_json(msg=f"Error creating LSS config: {to_native(error)}")
+        module.exit_json(changed=True, data=result.as_dict())
+
+    # The canonical formats are only needed to compare an explicit source_log_format.
+    log_formats = None
+    if config.get("source_log_format") and config.get("source_log_type"):
+        log_formats = client.lss.get_all_log_formats() or {}
+
+    drift = lss_config_drift(lss_config, existing_lss_config, log_formats, client_types)
+    if not drift:
+        module.exit_json(changed=False, data=existing_lss_config)
+    if module.check_mode:
+        module.exit_json(changed=True, data=existing_lss_config, drift=drift)
+
+    """Update"""
+    update_lss_config = deleteNone(
+        dict(
+            lss_config_id=existing_lss_config.get("id"),
+            app_connector_group_ids=lss_config.get("app_connector_group_ids"),
+            enabled=config.get("enabled"),
+            lss_host=config.get("lss_host"),
+            lss_port=config.get("lss_port"),
+            name=config.get("name"),
+            source_log_type=config.get("source_log_type"),
+            use_tls=config.get("use_tls"),
+            filter_status_codes=config.get("filter"),
+            policy_rules=policy_rules,
+            policy_name=(policy_rule_resource or {}).get("name"),
+        )
+    )
+    existing_config = existing_lss_config.get("config") or {}
+    if config.get("source_log_format"):
+        update_lss_config["source_log_format"] = config["source_log_format"]
+    elif existing_config.get("format") and "config.source_log_type" not in drift:
+        # The SDK otherwise resets the format to the CSV template whenever
+        # source_log_type is sent, so keep the one already configured. A new
+        # log type gets the SDK's default template instead of the old type's.
+        update_lss_config["log_stream_content"] = existing_config["format"]
+    result, _unused, error = client.lss.update_lss_config(**update_lss_config)
+    if error:
+        module.fail_json(msg=f"Error updating LSS config: {to_native(error)}")
+    module.exit_json(
+        changed=True,
+        data=result.as_dict() if result else existing_lss_config,
+        drift=drift,
+    )
 
 
 def main():
@@ -85,6 +85,7 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import
 )
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     collect_all_items,
+    did_you_mean,
 )
 
 
@@ -121,7 +122,7 @@ def core(module):
         if not match:
             available = [getattr(c, "config", {}).get("name", "") for c in configs]
             module.fail_json(
-                msg=f"LSS Config with name '{lss_config_name}' not found. Available: {available}"
+                msg=f"LSS Config with name '{lss_config_name}' not found.{did_you_mean(lss_config_name, available)}"
             )
         configs = [match]
 
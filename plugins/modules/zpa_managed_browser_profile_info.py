@@ -166,6 +166,7 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import
 )
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     collect_all_items,
+    did_you_mean,
 )
 
 
@@ -204,7 +205,7 @@ def core(module):
         if not matched:
             available = [p.get("name") for p in result_list]
             module.fail_json(
-                msg=f"Managed Browser Profile '{profile_name}' not found. Available: {available}"
+                msg=f"Managed Browser Profile '{profile_name}' not found.{did_you_mean(profile_name, available)}"
             )
         result_list = [matched]
 
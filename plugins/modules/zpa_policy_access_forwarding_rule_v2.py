@@ -137,6 +137,16 @@ options:
             elements: str
             required: false
 
+          names:
+            description:
+              - Names of the objects to match, resolved to IDs and added to O(conditions[].operands[].values).
+              - Supported for C(APP), C(APP_GROUP), C(MACHINE_GRP), C(CONSOLE), C(EDGE_CONNECTOR_GROUP),
+                C(BRANCH_CONNECTOR_GROUP) and C(WORKLOAD_TAG_GROUP).
+              - All names of a rule are resolved together, with one cached listing per object type.
+            type: list
+            elements: str
+            required: false
+
           entry_values:
             description:
               - A dictionary of left-hand side (lhs) and right-hand side (rhs) values used for advanced condition matching.
@@ -153,6 +163,19 @@ options:
                   - Right-hand-side value used in operand evaluation.
                 type: str
                 required: false
+              lhs_name:
+                description:
+                  - Name of the object to set as O(conditions[].operands[].entry_values.lhs).
+                  - The IdP for C(SCIM_GROUP), the SAML attribute for C(SAML), the posture profile
+                    for C(POSTURE) and the trusted network for C(TRUSTED_NETWORK).
+                type: str
+                required: false
+              rhs_name:
+                description:
+                  - For C(SCIM_GROUP), name of the SCIM group to set as
+                    O(conditions[].operands[].entry_values.rhs).
+                type: str
+                required: false
 """
 
 EXAMPLES = """
@@ -241,6 +264,9 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_conditions import (
+    resolve_rule_condition_names,
+)
 import json
 
 
@@ -266,6 +292,8 @@ def core(module):
         "conditions": module.params.get("conditions"),
     }
 
+    resolve_rule_condition_names(module, client, rule.get("conditions"))
+
     # Validate operands
     for condition in rule.get("conditions") or []:
         for operand in condition.get("operands", []):
@@ -445,12 +473,15 @@ def main():
                     elements="dict",
                     options=dict(
                         values=dict(type="list", elements="str", required=False),
+                        names=dict(type="list", elements="str", required=False),
                         entry_values=dict(
                             type="dict",
                             required=False,
                             options=dict(
                                 lhs=dict(type="str", required=False),
                                 rhs=dict(type="str", required=False),
+                                lhs_name=dict(type="str", required=False),
+                                rhs_name=dict(type="str", required=False),
                             ),
                         ),
                         object_type=dict(
@@ -42,6 +42,7 @@ notes:
 extends_documentation_fragment:
   - zscaler.zpacloud.fragments.provider
   - zscaler.zpacloud.fragments.documentation
+  - zscaler.zpacloud.fragments.info_projection
 
 options:
   name:
@@ -89,10 +90,24 @@ EXAMPLES = """
   zscaler.zpacloud.zpa_policy_access_rule_facts:
     provider: "{{ zpa_cloud }}"
     id: "216196257331291979"
+
+- name: Get the names and actions of all Policy Access Rules
+  zscaler.zpacloud.zpa_policy_access_rule_info:
+    provider: "{{ zpa_cloud }}"
+    policy_type: access
+    fields:
+      - name
+      - action
+      - conditions.operands.object_type
 """
 
 RETURN = """
 # Returns information on a specified Policy Access Rule.
+count:
+  description: Number of matching objects, returned instead of the objects when O(count_only=true).
+  returned: when O(count_only=true)
+  type: int
+  sample: 42
 """
 
 from traceback import format_exc
@@ -104,6 +119,8 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import
 )
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     collect_all_items,
+    info_exit,
+    did_you_mean,
 )
 
 
@@ -128,9 +145,10 @@ def core(module):
             module.fail_json(
                 msg=f"Failed to retrieve policy rule ID '{policy_rule_id}' for type '{policy_type}'"
             )
-        module.exit_json(
-            changed=False,
-            policy_rules=[result.as_dict() if hasattr(result, "as_dict") else result],
+        info_exit(
+            module,
+            "policy_rules",
+            [result.as_dict() if hasattr(result, "as_dict") else result],
         )
 
     # Retrieve all rules using pagination
@@ -151,13 +169,14 @@ def core(module):
         if not match:
             available = [getattr(r, "name", "") for r in rules]
             module.fail_json(
-                msg=f"Policy rule '{policy_rule_name}' not found. Available: {available}"
+                msg=f"Policy rule '{policy_rule_name}' not found.{did_you_mean(policy_rule_name, available)}"
             )
         rules = [match]
 
-    module.exit_json(
-        changed=False,
-        policy_rules=[r.as_dict() if hasattr(r, "as_dict") else r for r in rules],
+    info_exit(
+        module,
+        "policy_rules",
+        [r.as_dict() if hasattr(r, "as_dict") else r for r in rules],
     )
 
 
@@ -181,6 +200,8 @@ def main():
                 "capabilities",
             ],
         ),
+        fields=dict(type="list", elements="str", required=False),
+        count_only=dict(type="bool", default=False),
     )
 
     module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
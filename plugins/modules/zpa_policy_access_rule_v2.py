@@ -163,6 +163,16 @@ options:
             elements: str
             required: false
 
+          names:
+            description:
+              - Names of the objects to match, resolved to IDs and added to O(conditions[].operands[].values).
+              - Supported for C(APP), C(APP_GROUP), C(MACHINE_GRP), C(CONSOLE), C(EDGE_CONNECTOR_GROUP),
+                C(BRANCH_CONNECTOR_GROUP) and C(WORKLOAD_TAG_GROUP).
+              - All names of a rule are resolved together, with one cached listing per object type.
+            type: list
+            elements: str
+            required: false
+
           entry_values:
             description:
               - A dictionary of left-hand side (lhs) and right-hand side (rhs) values used for advanced condition matching.
@@ -179,6 +189,19 @@ options:
                   - Right-hand-side value used in operand evaluation.
                 type: str
                 required: false
+              lhs_name:
+                description:
+                  - Name of the object to set as O(conditions[].operands[].entry_values.lhs).
+                  - The IdP for C(SCIM_GROUP), the SAML attribute for C(SAML), the posture profile
+                    for C(POSTURE) and the trusted network for C(TRUSTED_NETWORK).
+                type: str
+                required: false
+              rhs_name:
+                description:
+                  - For C(SCIM_GROUP), name of the SCIM group to set as
+                    O(conditions[].operands[].entry_values.rhs).
+                type: str
+                required: false
 """
 
 EXAMPLES = """
@@ -270,6 +293,29 @@ EXAMPLES = """
               - zpn_client_type_zapp_partner
               - zpn_client_type_exporter
               - zpn_client_type_zapp
+
+- name: "Policy Access Rule - Conditions by object name"
+  zscaler.zpacloud.zpa_policy_access_rule_v2:
+    provider: "{{ zpa_cloud }}"
+    name: "Allow_Engineering_CRM"
+    action: "ALLOW"
+    conditions:
+      - operator: "OR"
+        operands:
+          - object_type: "APP"
+            names:
+              - "crm"
+              - "crm-api"
+      - operator: "OR"
+        operands:
+          - object_type: "SCIM_GROUP"
+            entry_values:
+              lhs_name: "Okta_Users"
+              rhs_name: "Engineering"
+          - object_type: "POSTURE"
+            entry_values:
+              lhs_name: "CrowdStrike_ZPA_Pre-ZTA"
+              rhs: "true"
 """
 
 RETURN = """
@@ -291,6 +337,9 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_conditions import (
+    resolve_rule_condition_names,
+)
 import json
 
 
@@ -319,6 +368,8 @@ def core(module):
         "conditions": module.params.get("conditions"),
     }
 
+    resolve_rule_condition_names(module, client, rule.get("conditions"))
+
     # Validate operands
     for condition in rule.get("conditions") or []:
         for operand in condition.get("operands", []):
@@ -505,12 +556,15 @@ def main():
                     elements="dict",
                     options=dict(
                         values=dict(type="list", elements="str", required=False),
+                        names=dict(type="list", elements="str", required=False),
                         entry_values=dict(
                             type="dict",
                             required=False,
                             options=dict(
                                 lhs=dict(type="str", required=False),
                                 rhs=dict(type="str", required=False),
+                                lhs_name=dict(type="str", required=False),
+                                rhs_name=dict(type="str", required=False),
                             ),
                         ),
                         object_type=dict(
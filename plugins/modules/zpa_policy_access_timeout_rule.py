@@ -250,7 +250,39 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import
 )
 
 
+def validate_conditions(module):
+    """Check every condition operand has a valid object_type."""
+    conditions = module.params["conditions"]
+    if conditions:  # Add this check to handle when conditions is None
+        for condition in conditions:
+            operands = condition.get("operands", [])
+            for operand in operands:
+                object_type = operand.get("object_type")
+                valid_object_types = [
+                    "APP",
+                    "APP_GROUP",
+                    "CLIENT_TYPE",
+                    "IDP",
+                    "POSTURE",
+                    "PLATFORM",
+                    "SAML",
+                    "SCIM",
+                    "SCIM_GROUP",
+                ]
+                if (
+                    object_type is None or object_type == ""
+                ):  # Explicitly check for None or empty string
+                    module.fail_json(
+                        msg=f"object_type cannot be empty or None. Must be one of: {', '.join(valid_object_types)}"
+                    )
+                elif object_type not in valid_object_types:
+                    module.fail_json(
+                        msg=f"Invalid object_type: {object_type}. Must be one of: {', '.join(valid_object_types)}"
+                    )
+
+
 def core(module):
+    validate_conditions(module)
     state = module.params.get("state", "present")
     client = ZPAClientHelper(module)
 
@@ -498,35 +530,6 @@ def main():
         state=dict(type="str", choices=["present", "absent"], default="present"),
     )
     module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
-
-    # Custom validation for object_type
-    conditions = module.params["conditions"]
-    if conditions:  # Add this check to handle when conditions is None
-        for condition in conditions:
-            operands = condition.get("operands", [])
-            for operand in operands:
-                object_type = operand.get("object_type")
-                valid_object_types = [
-                    "APP",
-                    "APP_GROUP",
-                    "CLIENT_TYPE",
-                    "IDP",
-                    "POSTURE",
-                    "PLATFORM",
-                    "SAML",
-                    "SCIM",
-                    "SCIM_GROUP",
-                ]
-                if (
-                    object_type is None or object_type == ""
-                ):  # Explicitly check for None or empty string
-                    module.fail_json(
-                        msg=f"object_type cannot be empty or None. Must be one of: {', '.join(valid_object_types)}"
-                    )
-                elif object_type not in valid_object_types:
-                    module.fail_json(
-                        msg=f"Invalid object_type: {object_type}. Must be one of: {', '.join(valid_object_types)}"
-                    )
     try:
         core(module)
     except Exception as e:
@@ -139,6 +139,7 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     collect_all_items,
     remove_cloud_suffix,
+    did_you_mean,
 )
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
@@ -189,7 +190,7 @@ def core(module):
         if not matched:
             available = [remove_cloud_suffix(p.get("name", "")) for p in result_list]
             module.fail_json(
-                msg=f"Posture Profile '{profile_name}' not found. Available: {available}"
+                msg=f"Posture Profile '{profile_name}' not found.{did_you_mean(profile_name, available)}"
             )
         result_list = [matched]
 
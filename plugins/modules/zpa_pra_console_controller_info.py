@@ -88,6 +88,7 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import
 )
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     collect_all_items,
+    did_you_mean,
 )
 
 
@@ -126,7 +127,7 @@ def core(module):
         if not matched:
             available = [g.get("name") for g in result_list]
             module.fail_json(
-                msg=f"PRA Console '{console_name}' not found. Available: {available}"
+                msg=f"PRA Console '{console_name}' not found.{did_you_mean(console_name, available)}"
             )
         result_list = [matched]
 
@@ -107,6 +107,13 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     deleteNone,
     collect_all_items,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_cache import (
+    enrollment_cert_cache,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_resources import (
+    DEFAULT_ENROLLMENT_CERTS,
+    resolve_enrollment_cert_id,
+)
 
 
 def normalize_provisioning_key(prov_key):
@@ -153,24 +160,18 @@ def fetch_enrollment_cert_id(module, client, key_type):
     Fetch the enrollment certificate ID based on association type (connector vs service_edge).
     The returned ID is then used as 'enrollment_cert_id'.
     """
-    # We simply pass {"type": key_type} as query_params
-    query_params = {"type": key_type}
+    cert_name = DEFAULT_ENROLLMENT_CERTS.get(key_type)
+    if not cert_name:
+        return None
 
-    # This matches the same pattern as your info resource
-    cert_list, err = collect_all_items(
-        client.enrollment_certificates.list_enrolment, query_params
+    cert_id, err = resolve_enrollment_cert_id(
+        client, cert_name, enrollment_cert_cache(module.params)
     )
     if err:
         module.fail_json(
             msg=f"Error retrieving Enrollment Certificates: {to_native(err)}"
         )
-
-    result_list = [g.as_dict() for g in cert_list]
-    if not result_list:
-        return None
-
-    # For simplicity, just take the first certificate ID
-    return result_list[0].get("id")
+    return cert_id
 
 
 def core(module):
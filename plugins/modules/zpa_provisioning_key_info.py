@@ -167,6 +167,7 @@ from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     collect_all_items,
+    did_you_mean,
 )
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
@@ -227,7 +228,7 @@ def core(module):
         if not filtered:
             available = [getattr(k, "name", None) for k in keys]
             module.fail_json(
-                msg=f"Provisioning Key '{provisioning_key_name}' not found. Available: {available}"
+                msg=f"Provisioning Key '{provisioning_key_name}' not found.{did_you_mean(provisioning_key_name, available)}"
             )
         keys = filtered
 
@@ -42,6 +42,7 @@ notes:
 extends_documentation_fragment:
   - zscaler.zpacloud.fragments.provider
   - zscaler.zpacloud.fragments.documentation
+  - zscaler.zpacloud.fragments.idp_directory_cache
 
 options:
   name:
@@ -142,6 +143,13 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     collect_all_items,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_cache import (
+    idp_directory_cache,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_resources import (
+    cached_listing,
+    resolve_idp_id,
+)
 
 
 def core(module):
@@ -164,77 +172,60 @@ def core(module):
             saml_attributes=[result if isinstance(result, dict) else result.as_dict()],
         )
 
-    # Lookup by name
-    if saml_attr_name:
-        query_params = {"search": saml_attr_name}
-        attributes, err = collect_all_items(
-            lambda qp: client.saml_attributes.list_saml_attributes(query_params=qp),
-            query_params,
-        )
-        if err:
-            module.fail_json(msg=f"Error retrieving SAML attributes: {to_native(err)}")
-
-        matched = next(
-            (
-                a
-                for a in attributes
-                if a.name == saml_attr_name or a.get("name") == saml_attr_name
-            ),
-            None,
-        )
-        if not matched:
-            module.fail_json(
-                msg=f"SAML attribute with name '{saml_attr_name}' not found"
-            )
-        module.exit_json(
-            changed=False,
-            saml_attributes=[
-                matched.as_dict() if hasattr(matched, "as_dict") else matched
-            ],
-        )
-
-    # List by IDP name (optional)
+    cache = idp_directory_cache(module.params)
+    idp_id = None
     if idp_name:
-        idps, _unused, err = client.idp.list_idps(query_params={"search": idp_name})
+        idp_id, err = resolve_idp_id(client, idp_name, cache)
         if err:
             module.fail_json(
                 msg=f"Error searching for IdP '{idp_name}': {to_native(err)}"
             )
-        idp_id = next((idp.id for idp in idps if idp.name == idp_name), None)
         if not idp_id:
             module.fail_json(msg=f"IdP with name '{idp_name}' not found")
 
-        attributes, err = collect_all_items(
-            lambda qp: client.saml_attributes.list_saml_attributes_by_idp(
-                idp_id=idp_id, query_params=qp
+    # The attribute listing, of one IdP or of the whole tenant, is shared
+    # through the cache, so any number of lookups by name cost a single listing.
+    # Without the cache, a lookup by name lets the API filter instead.
+    search = saml_attr_name and not cache.enabled
+    query_params = {"search": saml_attr_name} if search else {}
+    listing_cache = None if search else cache
+    if idp_id:
+        attributes, err = cached_listing(
+            listing_cache,
+            f"saml_attribute:{idp_id}",
+            lambda: collect_all_items(
+                lambda qp: client.saml_attributes.list_saml_attributes_by_idp(
+                    idp_id=idp_id, query_params=qp
+                ),
+                query_params,
             ),
-            {},
         )
         if err:
             module.fail_json(
                 msg=f"Error listing SAML attributes for IdP '{idp_name}': {to_native(err)}"
             )
-
-        module.exit_json(
-            changed=False,
-            saml_attributes=[
-                a.as_dict() if hasattr(a, "as_dict") else a for a in attributes
-            ],
+    else:
+        attributes, err = cached_listing(
+            listing_cache,
+            "saml_attribute:",
+            lambda: collect_all_items(
+                lambda qp: client.saml_attributes.list_saml_attributes(query_params=qp),
+                query_params,
+            ),
         )
+        if err:
+            module.fail_json(msg=f"Error listing all SAML attributes: {to_native(err)}")
 
-    # Fallback: list all attributes
-    attributes, err = collect_all_items(
-        lambda qp: client.saml_attributes.list_saml_attributes(query_params=qp), {}
-    )
-    if err:
-        module.fail_json(msg=f"Error listing all SAML attributes: {to_native(err)}")
-
-    module.exit_json(
-        changed=False,
-        saml_attributes=[
-            a.as_dict() if hasattr(a, "as_dict") else a for a in attributes
-        ],
-    )
+    # Lookup by name
+    if saml_attr_name:
+        matched = next((a for a in attributes if a.get("name") == saml_attr_name), None)
+        if not matched:
+            module.fail_json(
+                msg=f"SAML attribute with name '{saml_attr_name}' not found"
+            )
+        module.exit_json(changed=False, saml_attributes=[matched])
+
+    module.exit_json(changed=False, saml_attributes=attributes)
 
 
 def main():
@@ -243,6 +234,7 @@ def main():
         name=dict(type="str", required=False),
         idp_name=dict(type="str", required=False),
         id=dict(type="str", required=False),
+        cache_ttl=dict(type="int", default=300),
     )
     module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
     try:
@@ -42,6 +42,7 @@ notes:
 extends_documentation_fragment:
   - zscaler.zpacloud.fragments.provider
   - zscaler.zpacloud.fragments.documentation
+  - zscaler.zpacloud.fragments.idp_directory_cache
 
 options:
   name:
@@ -170,6 +171,13 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     collect_all_items,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_cache import (
+    idp_directory_cache,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_resources import (
+    cached_listing,
+    resolve_idp_id,
+)
 
 
 def core(module):
@@ -179,10 +187,10 @@ def core(module):
     client = ZPAClientHelper(module)
 
     # Lookup IDP by name
-    idps, _unused, err = client.idp.list_idps(query_params={"search": idp_name})
+    cache = idp_directory_cache(module.params)
+    idp_id, err = resolve_idp_id(client, idp_name, cache)
     if err:
         module.fail_json(msg=f"Error retrieving IdP '{idp_name}': {to_native(err)}")
-    idp_id = next((idp.id for idp in idps if idp.name == idp_name), None)
     if not idp_id:
         module.fail_json(msg=f"IdP with name '{idp_name}' not found")
 
@@ -197,49 +205,33 @@ def core(module):
             )
         module.exit_json(changed=False, attributes=[result.as_dict()])
 
-    # Search SCIM Attribute by name
-    if scim_attr_name:
-        query_params = {"search": scim_attr_name}
-        attributes, err = collect_all_items(
+    # The attribute listing is shared through the cache, so any number of
+    # lookups by name against the same IdP cost a single listing. Without the
+    # cache, a lookup by name lets the API filter instead.
+    search = scim_attr_name and not cache.enabled
+    attributes, err = cached_listing(
+        None if search else cache,
+        f"scim_attribute:{idp_id}",
+        lambda: collect_all_items(
             lambda qp: client.scim_attributes.list_scim_attributes(
                 idp_id=idp_id, query_params=qp
             ),
-            query_params,
-        )
-        if err:
-            module.fail_json(msg=f"Error searching SCIM attributes: {to_native(err)}")
+            {"search": scim_attr_name} if search else {},
+        ),
+    )
+    if err:
+        module.fail_json(msg=f"Error listing SCIM attributes: {to_native(err)}")
 
-        matched = next(
-            (
-                a
-                for a in attributes
-                if a.name == scim_attr_name or a.get("name") == scim_attr_name
-            ),
-            None,
-        )
+    # Search SCIM Attribute by name
+    if scim_attr_name:
+        matched = next((a for a in attributes if a.get("name") == scim_attr_name), None)
         if not matched:
             module.fail_json(
                 msg=f"SCIM Attribute with name '{scim_attr_name}' not found"
             )
-        module.exit_json(
-            changed=False,
-            attributes=[matched.as_dict() if hasattr(matched, "as_dict") else matched],
-        )
-
-    # List all SCIM attributes
-    attributes, err = collect_all_items(
-        lambda qp: client.scim_attributes.list_scim_attributes(
-            idp_id=idp_id, query_params=qp
-        ),
-        {},
-    )
-    if err:
-        module.fail_json(msg=f"Error listing SCIM attributes: {to_native(err)}")
+        module.exit_json(changed=False, attributes=[matched])
 
-    module.exit_json(
-        changed=False,
-        attributes=[a.as_dict() if hasattr(a, "as_dict") else a for a in attributes],
-    )
+    module.exit_json(changed=False, attributes=attributes)
 
 
 def main():
@@ -248,6 +240,7 @@ def main():
         name=dict(type="str", required=False),
         id=dict(type="str", required=False),
         idp_name=dict(type="str", required=True),
+        cache_ttl=dict(type="int", default=300),
     )
     module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
     try:
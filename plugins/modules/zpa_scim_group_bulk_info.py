@@ -0,0 +1,263 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+
+#                             MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+module: zpa_scim_group_bulk_info
+short_description: Resolve many SCIM group names to IDs in one task
+description:
+  - Resolves a list of SCIM groups, each given by IdP name and group name, to their IDs.
+  - Groups are batched per IdP. Each IdP is resolved once and its groups are listed once,
+    and different IdPs are processed concurrently.
+  - Returns C(operands) ready to be used in the conditions of v2 policy rules, one
+    C(SCIM_GROUP) operand per group whose C(entry_values) C(lhs) is the IdP ID and
+    C(rhs) the SCIM group ID.
+author:
+  - William Guilherme (@willguibr)
+version_added: "2.3.0"
+requirements:
+    - Zscaler SDK Python can be obtained from PyPI U(https://pypi.org/project/zscaler-sdk-python/)
+notes:
+    - Check mode is supported.
+extends_documentation_fragment:
+  - zscaler.zpacloud.fragments.provider
+  - zscaler.zpacloud.fragments.documentation
+  - zscaler.zpacloud.fragments.idp_directory_cache
+
+options:
+  groups:
+    description:
+      - The SCIM groups to resolve.
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+      idp_name:
+        description:
+          - Name of the IdP the SCIM group belongs to.
+        type: str
+        required: true
+      name:
+        description:
+          - Name of the SCIM group.
+        type: str
+        required: true
+  errors:
+    description:
+      - What to do when an IdP or a group cannot be resolved.
+      - C(strict) fails the task, C(warn) emits a warning and leaves the group out of
+        C(operands), C(ignore) silently leaves it out.
+    type: str
+    default: strict
+    choices: ["strict", "warn", "ignore"]
+  concurrency:
+    description:
+      - Number of IdPs resolved in parallel.
+    type: int
+    default: 8
+"""
+
+EXAMPLES = r"""
+- name: Resolve the SCIM groups used by access policies
+  zscaler.zpacloud.zpa_scim_group_bulk_info:
+    provider: "{{ zpa_cloud }}"
+    groups:
+      - idp_name: "Okta_Users"
+        name: "Engineering"
+      - idp_name: "Okta_Users"
+        name: "Finance"
+      - idp_name: "AzureAD"
+        name: "Contractors"
+  register: scim_groups
+
+- name: Allow the resolved groups
+  zscaler.zpacloud.zpa_policy_access_rule_v2:
+    provider: "{{ zpa_cloud }}"
+    name: "Allow_Engineering"
+    action: "allow"
+    conditions:
+      - operator: "OR"
+        operands: "{{ scim_groups.operands }}"
+"""
+
+RETURN = r"""
+operands:
+  description:
+    - One C(SCIM_GROUP) condition operand per resolved group, in the order of O(groups).
+  returned: always
+  type: list
+  elements: dict
+  sample:
+    - object_type: "SCIM_GROUP"
+      entry_values:
+        lhs: "72058304855015574"
+        rhs: "490880"
+groups:
+  description:
+    - Every requested group with its resolved IdP and group IDs, in the order of O(groups).
+    - The IDs are C(null) when they could not be resolved.
+  returned: always
+  type: list
+  elements: dict
+  sample:
+    - idp_name: "Okta_Users"
+      name: "Engineering"
+      idp_id: "72058304855015574"
+      id: "490880"
+missing:
+  description: The requested groups that could not be resolved.
+  returned: always
+  type: list
+  elements: dict
+  sample:
+    - idp_name: "Okta_Users"
+      name: "Interns"
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from traceback import format_exc
+
+from ansible.module_utils._text import to_native
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_cache import (
+    idp_directory_cache,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    ZPAClientHelper,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_resources import (
+    build_name_index,
+    cached_listing,
+    get_resource_type,
+    list_resource,
+    resolve_idp_id,
+)
+
+
+def resolve_idp_groups(client, cache, idp_name):
+    """Return ``(idp_id, {group name: group id})`` for one IdP, listing its groups once."""
+    idp_id, err = resolve_idp_id(client, idp_name, cache)
+    if err:
+        raise RuntimeError(f"Error searching for IdP '{idp_name}': {to_native(err)}")
+    if not idp_id:
+        return None, {}
+
+    # Same cache entry as zpa_scim_group_info, so both modules share listings.
+    groups, err = cached_listing(
+        cache,
+        f"scim_group:{idp_id}",
+        lambda: list_resource(client, "scim_group", parent_id=idp_id),
+    )
+    if err:
+        raise RuntimeError(
+            f"Error listing SCIM groups for IdP '{idp_name}': {to_native(err)}"
+        )
+    return idp_id, build_name_index(get_resource_type("scim_group"), groups)
+
+
+def core(module):
+    requested = module.params.get("groups")
+    errors = module.params.get("errors")
+    concurrency = module.params.get("concurrency")
+    if concurrency < 1:
+        module.fail_json(msg="concurrency must be at least 1")
+
+    client = ZPAClientHelper(module)
+    cache = idp_directory_cache(module.params)
+
+    idp_names = list(dict.fromkeys(g["idp_name"] for g in requested))
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        resolved = dict(
+            zip(
+                idp_names,
+                pool.map(lambda n: resolve_idp_groups(client, cache, n), idp_names),
+            )
+        )
+
+    groups = []
+    operands = []
+    missing = []
+    for group in requested:
+        idp_id, index = resolved[group["idp_name"]]
+        group_id = index.get(group["name"])
+        groups.append(
+            {
+                "idp_name": group["idp_name"],
+                "name": group["name"],
+                "idp_id": idp_id,
+                "id": group_id,
+            }
+        )
+        if group_id is None:
+            missing.append({"idp_name": group["idp_name"], "name": group["name"]})
+        else:
+            operands.append(
+                {
+                    "object_type": "SCIM_GROUP",
+                    "entry_values": {"lhs": idp_id, "rhs": group_id},
+                }
+            )
+
+    if missing:
+        msg = "SCIM group(s) not found: " + ", ".join(
+            f"{m['idp_name']}/{m['name']}" for m in missing
+        )
+        if errors == "strict":
+            module.fail_json(msg=msg, missing=missing)
+        if errors == "warn":
+            module.warn(msg)
+
+    module.exit_json(changed=False, operands=operands, groups=groups, missing=missing)
+
+
+def main():
+    argument_spec = ZPAClientHelper.zpa_argument_spec()
+    argument_spec.update(
+        groups=dict(
+            type="list",
+            elements="dict",
+            required=True,
+            options=dict(
+                idp_name=dict(type="str", required=True),
+                name=dict(type="str", required=True),
+            ),
+        ),
+        errors=dict(type="str", default="strict", choices=["strict", "warn", "ignore"]),
+        concurrency=dict(type="int", default=8),
+        cache_ttl=dict(type="int", default=300),
+    )
+    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+    try:
+        core(module)
+    except Exception as e:
+        module.fail_json(msg=to_native(e), exception=format_exc())
+
+
+if __name__ == "__main__":
+    main()
@@ -42,6 +42,8 @@ notes:
 extends_documentation_fragment:
   - zscaler.zpacloud.fragments.provider
   - zscaler.zpacloud.fragments.documentation
+  - zscaler.zpacloud.fragments.idp_directory_cache
+  - zscaler.zpacloud.fragments.info_projection
 
 options:
   name:
@@ -170,6 +172,11 @@ groups:
       type: str
       returned: when available
       sample: null
+count:
+  description: Number of matching objects, returned instead of the objects when O(count_only=true).
+  returned: when O(count_only=true)
+  type: int
+  sample: 42
 """
 
 from traceback import format_exc
@@ -181,6 +188,15 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import
 )
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     collect_all_items,
+    info_exit,
+)
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_cache import (
+    idp_directory_cache,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_resources import (
+    cached_listing,
+    resolve_idp_id,
 )
 
 
@@ -208,13 +224,28 @@ def core(module):
             query_params[param] = val
 
     # Lookup IdP ID from provided idp_name
-    idps, _unused, err = client.idp.list_idps(query_params={"search": idp_name})
+    cache = idp_directory_cache(module.params)
+    idp_id, err = resolve_idp_id(client, idp_name, cache)
     if err:
         module.fail_json(msg=f"Error searching for IdP '{idp_name}': {to_native(err)}")
-    idp_id = next((idp.id for idp in idps if idp.name == idp_name), None)
     if not idp_id:
         module.fail_json(msg=f"IdP with name '{idp_name}' not found")
 
+    def list_groups(query_params):
+        def fetch():
+            return collect_all_items(
+                lambda qp: client.scim_groups.list_scim_groups(
+                    idp_id=idp_id, query_params=qp
+                ),
+                query_params,
+            )
+
+        # Only unfiltered listings are shared through the cache, so any number
+        # of lookups by name against the same IdP cost a single listing.
+        return cached_listing(
+            None if query_params else cache, f"scim_group:{idp_id}", fetch
+        )
+
     # Get SCIM group by ID
     if scim_group_id:
         result, _unused, err = client.scim_groups.get_scim_group(scim_group_id)
@@ -222,53 +253,30 @@ def core(module):
             module.fail_json(
                 msg=f"SCIM group with ID '{scim_group_id}' not found: {to_native(err)}"
             )
-        module.exit_json(changed=False, groups=[result.as_dict()])
+        info_exit(module, "groups", [result.as_dict()])
 
     # Warn log before pagination call
     # module.warn(f"[SCIM Groups] Fetching all portals with query_params: {query_params}")
 
     # Get SCIM group by name
     if scim_group_name:
-        query_params["search"] = scim_group_name
-        groups, err = collect_all_items(
-            lambda qp: client.scim_groups.list_scim_groups(
-                idp_id=idp_id, query_params=qp
-            ),
-            query_params,
-        )
+        # Without a shared listing to reuse, let the API filter by name.
+        if query_params or not cache.enabled:
+            query_params["search"] = scim_group_name
+        groups, err = list_groups(query_params)
         if err:
             module.fail_json(msg=f"Error searching SCIM groups: {to_native(err)}")
-        # matched = next(
-        #     (
-        #         g
-        #         for g in groups
-        #         if g.name == scim_group_name or g.get("name") == scim_group_name
-        #     ),
-        #     None,
-        # )
-        matched = next(
-            (g for g in groups if getattr(g, "name", None) == scim_group_name),
-            None,
-        )
+        matched = next((g for g in groups if g.get("name") == scim_group_name), None)
         if not matched:
             module.fail_json(msg=f"SCIM group with name '{scim_group_name}' not found")
-        module.exit_json(
-            changed=False,
-            groups=[matched.as_dict() if hasattr(matched, "as_dict") else matched],
-        )
+        info_exit(module, "groups", [matched])
 
     # List all SCIM groups for the given IdP
-    groups, err = collect_all_items(
-        lambda qp: client.scim_groups.list_scim_groups(idp_id=idp_id, query_params=qp),
-        query_params,
-    )
+    groups, err = list_groups(query_params)
     if err:
         module.fail_json(msg=f"Error listing SCIM groups: {to_native(err)}")
 
-    module.exit_json(
-        changed=False,
-        groups=[g.as_dict() if hasattr(g, "as_dict") else g for g in groups],
-    )
+    info_exit(module, "groups", groups)
 
 
 def main():
@@ -285,6 +293,9 @@ def main():
         sort_order=dict(type="str", required=False, choices=["ASC", "DSC"]),
         sort_by=dict(type="str", required=False),
         all_entries=dict(type="bool", required=False),
+        fields=dict(type="list", elements="str", required=False),
+        count_only=dict(type="bool", default=False),
+        cache_ttl=dict(type="int", default=300),
     )
     module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
     try:
@@ -42,6 +42,8 @@ notes:
 extends_documentation_fragment:
   - zscaler.zpacloud.fragments.provider
   - zscaler.zpacloud.fragments.documentation
+  - zscaler.zpacloud.fragments.info_projection
+  - zscaler.zpacloud.fragments.raw_listing
 
 options:
   name:
@@ -202,6 +204,11 @@ groups:
           description: Indicates if Web Application Firewall (WAF) is disabled.
           type: bool
           sample: false
+count:
+  description: Number of matching objects, returned instead of the objects when O(count_only=true).
+  returned: when O(count_only=true)
+  type: int
+  sample: 42
 """
 
 from traceback import format_exc
@@ -213,6 +220,11 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import
 )
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     collect_all_items,
+    info_exit,
+    did_you_mean,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_resources import (
+    get_resource_type,
 )
 
 
@@ -233,25 +245,29 @@ def core(module):
             module.fail_json(
                 msg=f"Failed to retrieve Server Group ID '{group_id}': {to_native(error)}"
             )
-        module.exit_json(changed=False, groups=[result.as_dict()])
+        info_exit(module, "groups", [result.as_dict()])
 
     # If no ID, we fetch all
-    group_list, err = collect_all_items(client.server_groups.list_groups, query_params)
+    raw = module.params.get("raw")
+    list_fn = client.server_groups.list_groups
+    if raw:
+        list_fn = get_resource_type("server_group").list_fn(client, raw=True)
+    group_list, err = collect_all_items(list_fn, query_params)
     if err:
         module.fail_json(msg=f"Error retrieving Server Groups: {to_native(err)}")
 
-    result_list = [g.as_dict() for g in group_list]
+    result_list = group_list if raw else [g.as_dict() for g in group_list]
 
     if group_name:
         matched = next((g for g in result_list if g.get("name") == group_name), None)
         if not matched:
             available = [g.get("name") for g in result_list]
             module.fail_json(
-                msg=f"Server Group '{group_name}' not found. Available: {available}"
+                msg=f"Server Group '{group_name}' not found.{did_you_mean(group_name, available)}"
             )
         result_list = [matched]
 
-    module.exit_json(changed=False, groups=result_list)
+    info_exit(module, "groups", result_list)
 
 
 def main():
@@ -260,6 +276,9 @@ def main():
         name=dict(type="str", required=False),
         id=dict(type="str", required=False),
         microtenant_id=dict(type="str", required=False),
+        fields=dict(type="list", elements="str", required=False),
+        count_only=dict(type="bool", default=False),
+        raw=dict(type="bool", default=False),
     )
     module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
     try:
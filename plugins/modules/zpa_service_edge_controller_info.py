@@ -59,6 +59,19 @@ options:
       - The unique identifier of the Microtenant for the ZPA tenant
       required: false
       type: str
+  summary:
+    description:
+      - Return only fleet aggregates in C(summary) instead of the Service Edge objects.
+      - The listing is streamed one page at a time and folded into counters, so
+        memory use does not grow with the size of the fleet.
+    type: bool
+    default: false
+  summary_top:
+    description:
+      - With O(summary), how many of the Service Edges seen the longest time ago to
+        report in C(summary.oldest_last_seen).
+    type: int
+    default: 10
 """
 
 EXAMPLES = """
@@ -75,10 +88,33 @@ EXAMPLES = """
   zscaler.zpacloud.zpa_service_edge_controller_info:
     provider: "{{ zpa_cloud }}"
     name: '123456789'
+
+- name: Summarize the Service Edge fleet health
+  zscaler.zpacloud.zpa_service_edge_controller_info:
+    provider: "{{ zpa_cloud }}"
+    summary: true
+    summary_top: 5
 """
 
 RETURN = """
 # Default return values
+summary:
+  description:
+    - Fleet aggregates, returned instead of the objects when O(summary=true).
+    - C(by_status) counts the control channel status, C(by_group) the Service Edge Group name.
+    - C(oldest_last_seen) lists the entries whose last broker connection is the oldest,
+      oldest first, with C(last_seen) in epoch seconds.
+  returned: when O(summary=true)
+  type: dict
+  sample:
+    total: 3
+    enabled: 3
+    never_connected: 0
+    by_status: {"ZPN_STATUS_AUTHENTICATED": 2, "ZPN_STATUS_DISCONNECTED": 1}
+    by_version: {"24.90.5": 1, "24.103.2": 2}
+    by_group: {"Branches": 3}
+    by_upgrade_status: {"COMPLETE": 3}
+    oldest_last_seen: [{"id": "216199618143441990", "name": "branch-01", "last_seen": 1696544000}]
 """
 
 from traceback import format_exc
@@ -88,8 +124,12 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_fleet import (
+    summarize_fleet,
+)
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     collect_all_items,
+    did_you_mean,
 )
 
 
@@ -104,6 +144,14 @@ def core(module):
     if microtenant_id:
         query_params["microtenant_id"] = microtenant_id
 
+    if module.params.get("summary"):
+        summary, err = summarize_fleet(
+            client, "service_edge", microtenant_id, module.params.get("summary_top")
+        )
+        if err:
+            module.fail_json(msg=f"Error summarizing Service Edges: {to_native(err)}")
+        module.exit_json(changed=False, summary=summary)
+
     if service_edge_id:
         result, _unused, error = client.service_edges.get_service_edge(
             service_edge_id, query_params
@@ -130,7 +178,7 @@ def core(module):
         if not matched:
             available = [g.get("name") for g in result_list]
             module.fail_json(
-                msg=f"Service Edge '{service_edge_name}' not found. Available: {available}"
+                msg=f"Service Edge '{service_edge_name}' not found.{did_you_mean(service_edge_name, available)}"
             )
         result_list = [matched]
 
@@ -143,8 +191,14 @@ def main():
         name=dict(type="str", required=False),
         id=dict(type="str", required=False),
         microtenant_id=dict(type="str", required=False),
+        summary=dict(type="bool", default=False),
+        summary_top=dict(type="int", default=10),
+    )
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        supports_check_mode=True,
+        mutually_exclusive=[("summary", "id"), ("summary", "name")],
     )
-    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
     try:
         core(module)
     except Exception as e:
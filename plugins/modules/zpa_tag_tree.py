@@ -0,0 +1,743 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+
+#                             MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+module: zpa_tag_tree
+short_description: Manage tag namespaces, keys, values and tag groups as one tree
+description:
+  - Reconciles a whole tree of tag namespaces, their tag keys and tag values, and
+    optionally the tag groups that reference them, in a single task.
+  - Namespaces and tag groups are listed once, the tag keys once per namespace, all
+    concurrently. The tree is diffed in memory and only the objects that changed are
+    created, updated or deleted, in parallel within each level.
+author:
+  - William Guilherme (@willguibr)
+version_added: "2.3.0"
+requirements:
+    - Zscaler SDK Python can be obtained from PyPI U(https://pypi.org/project/zscaler-sdk-python/)
+notes:
+    - Check mode is supported.
+    - Objects are matched by name, keys within their namespace.
+    - The tag key listing may omit tag values. Only the keys for which values are
+      declared and the listing returned none are fetched individually.
+extends_documentation_fragment:
+  - zscaler.zpacloud.fragments.provider
+  - zscaler.zpacloud.fragments.documentation
+  - zscaler.zpacloud.fragments.state
+options:
+  namespaces:
+    description:
+      - The tag namespaces to manage.
+      - With O(state=absent), a namespace that lists O(namespaces[].keys) only has those
+        keys deleted, otherwise the namespace is deleted along with all its keys.
+    type: list
+    elements: dict
+    default: []
+    suboptions:
+      name:
+        description: Name of the tag namespace.
+        type: str
+        required: true
+      description:
+        description: Description of the tag namespace.
+        type: str
+      enabled:
+        description: Whether the namespace is enabled.
+        type: bool
+        default: true
+      keys:
+        description: The tag keys of the namespace.
+        type: list
+        elements: dict
+        suboptions:
+          name:
+            description: Name of the tag key.
+            type: str
+            required: true
+          description:
+            description: Description of the tag key.
+            type: str
+          enabled:
+            description: Whether the tag key is enabled.
+            type: bool
+            default: true
+          values:
+            description:
+              - Names of the tag values of the key. When set, values not listed are removed.
+            type: list
+            elements: str
+  tag_groups:
+    description:
+      - The tag groups to manage. Tags reference namespaces, keys and values by name, and
+        may point at objects outside O(namespaces).
+    type: list
+    elements: dict
+    default: []
+    suboptions:
+      name:
+        description: Name of the tag group.
+        type: str
+        required: true
+      description:
+        description: Description of the tag group.
+        type: str
+      tags:
+        description: The tags of the group. When set, tags not listed are removed.
+        type: list
+        elements: dict
+        suboptions:
+          namespace:
+            description: Name of the tag namespace.
+            type: str
+            required: true
+          key:
+            description: Name of the tag key.
+            type: str
+            required: true
+          value:
+            description: Name of the tag value.
+            type: str
+            required: true
+  concurrency:
+    description:
+      - Maximum number of API requests in flight at once.
+    type: int
+    default: 8
+  microtenant_id:
+    description:
+      - The unique identifier of the microtenant for the ZPA tenant.
+    type: str
+"""
+
+EXAMPLES = r"""
+- name: Manage the environment and team tags with the groups built on them
+  zscaler.zpacloud.zpa_tag_tree:
+    provider: "{{ zpa_cloud }}"
+    namespaces:
+      - name: Platform
+        keys:
+          - name: Environment
+            values: ["dev", "staging", "prod"]
+          - name: Team
+            values: ["payments", "identity"]
+    tag_groups:
+      - name: Prod-Payments
+        tags:
+          - namespace: Platform
+            key: Environment
+            value: prod
+          - namespace: Platform
+            key: Team
+            value: payments
+
+- name: Remove a key from a namespace
+  zscaler.zpacloud.zpa_tag_tree:
+    provider: "{{ zpa_cloud }}"
+    state: absent
+    namespaces:
+      - name: Platform
+        keys:
+          - name: Team
+"""
+
+RETURN = r"""
+changes:
+  description: Names of the objects created, updated and deleted, per level. Keys are
+    reported as C(namespace/key).
+  returned: always
+  type: dict
+  sample:
+    namespaces: {"created": ["Platform"], "updated": [], "deleted": []}
+    tag_keys: {"created": ["Platform/Environment", "Platform/Team"], "updated": [], "deleted": []}
+    tag_groups: {"created": ["Prod-Payments"], "updated": [], "deleted": []}
+namespaces:
+  description:
+    - IDs of the managed namespaces, their keys and values, keyed by name.
+    - Objects that would be created in check mode have no ID.
+  returned: when O(state=present)
+  type: dict
+  sample:
+    Platform:
+      id: "216199618143442000"
+      keys:
+        Environment:
+          id: "216199618143442001"
+          values: {"dev": "216199618143442002", "prod": "216199618143442003"}
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from traceback import format_exc
+
+from ansible.module_utils._text import to_native
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
+    collect_all_items,
+    deleteNone,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    ZPAClientHelper,
+)
+
+LEVELS = ("namespaces", "tag_keys", "tag_groups")
+
+
+class RequestBodyObject:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def request_format(self):
+        return self.payload
+
+
+def _sdk_call(call, *args):
+    """Run an SDK call, returning ``(result_dict, error)``."""
+    try:
+        result, _unused, err = call(*args)
+    except Exception as e:
+        return None, to_native(e)
+    if err:
+        return None, to_native(err)
+    if result is not None and hasattr(result, "as_dict"):
+        result = result.as_dict()
+    return result, None
+
+
+def _description(desired, current):
+    """Keep the current description when none is declared, as updates replace it."""
+    if desired.get("description") is not None:
+        return desired["description"]
+    return (current or {}).get("description")
+
+
+def value_names(key):
+    return {v.get("name") for v in key.get("tag_values") or [] if v.get("name")}
+
+
+def key_differs(desired, current):
+    if desired.get("description") is not None and desired["description"] != current.get(
+        "description"
+    ):
+        return True
+    if bool(desired.get("enabled")) != bool(current.get("enabled")):
+        return True
+    values = desired.get("values")
+    return values is not None and set(values) != value_names(current)
+
+
+def namespace_differs(desired, current):
+    if desired.get("description") is not None and desired["description"] != current.get(
+        "description"
+    ):
+        return True
+    return bool(desired.get("enabled")) != bool(current.get("enabled"))
+
+
+def group_tags(group):
+    """The tags of an existing tag group as ``(namespace_id, key_id, value_name)``."""
+    tags = set()
+    for tag in group.get("tags") or []:
+        tags.add(
+            (
+                str((tag.get("namespace") or {}).get("id")),
+                str((tag.get("tag_key") or tag.get("tagKey") or {}).get("id")),
+                (tag.get("tag_value") or tag.get("tagValue") or {}).get("name"),
+            )
+        )
+    return tags
+
+
+def _list(list_fn, query_params):
+    """Every item of an SDK listing as plain dicts, in the task's microtenant."""
+    items, err = collect_all_items(list_fn, dict(query_params))
+    if err:
+        return None, err
+    return [i.as_dict() if hasattr(i, "as_dict") else i for i in items], None
+
+
+class TagTree:
+    """Indexes of the existing tree, filled level by level."""
+
+    def __init__(self, client, pool, query_params):
+        self.client = client
+        self.pool = pool
+        self.query_params = query_params
+        self.namespaces = {}
+        # namespace name -> {key name: key dict}
+        self.keys = {}
+        self.changes = {
+            level: {"created": [], "updated": [], "deleted": []} for level in LEVELS
+        }
+        self.errors = []
+
+    def run(self, calls):
+        """Run ``(label, call, args)`` tuples concurrently, returning ``[(label, result)]``."""
+        futures = [
+            (label, self.pool.submit(_sdk_call, call, *args))
+            for label, call, args in calls
+        ]
+        done = []
+        for label, future in futures:
+            result, err = future.result()
+            if err:
+                name = "/".join(label) if isinstance(label, tuple) else label
+                self.errors.append(f"{name}: {err}")
+            else:
+                done.append((label, result))
+        return done
+
+    def list_keys(self, namespace_names):
+        """List the keys of the given existing namespaces, once each, concurrently."""
+        names = [
+            n for n in namespace_names if n in self.namespaces and n not in self.keys
+        ]
+        futures = {
+            name: self.pool.submit(
+                _list,
+                lambda qp, ns_id=self.namespaces[name]["id"]: (
+                    self.client.tag_key.list_tag_keys(
+                        namespace_id=ns_id, query_params=qp
+                    )
+                ),
+                self.query_params,
+            )
+            for name in names
+        }
+        for name, future in futures.items():
+            items, err = future.result()
+            if err:
+                self.errors.append(f"listing tag keys of {name}: {to_native(err)}")
+                continue
+            self.keys[name] = {k.get("name"): k for k in items}
+
+    def fill_values(self, desired_namespaces):
+        """Fetch the keys whose listing omitted the tag values that are declared."""
+        calls = []
+        for ns in desired_namespaces:
+            for key in ns.get("keys") or []:
+                current = self.keys.get(ns["name"], {}).get(key["name"])
+                if current and key.get("values") and not current.get("tag_values"):
+                    calls.append(
+                        (
+                            (ns["name"], key["name"]),
+                            self.client.tag_key.get_tag_key,
+                            (
+                                self.namespaces[ns["name"]]["id"],
+                                current["id"],
+                                self.query_params,
+                            ),
+                        )
+                    )
+        for (ns_name, key_name), result in self.run(calls):
+            if result:
+                self.keys[ns_name][key_name] = result
+
+    def resolve(self, tag):
+        """IDs of a tag group tag as ``(namespace_id, key_id, value_id, value)``, or None."""
+        namespace = self.namespaces.get(tag["namespace"])
+        key = self.keys.get(tag["namespace"], {}).get(tag["key"])
+        if not namespace or not key or not namespace.get("id") or not key.get("id"):
+            return None
+        value_id = next(
+            (
+                v.get("id")
+                for v in key.get("tag_values") or []
+                if v.get("name") == tag["value"]
+            ),
+            None,
+        )
+        return str(namespace["id"]), str(key["id"]), value_id, tag["value"]
+
+    def export(self):
+        return {
+            name: {
+                "id": ns.get("id"),
+                "keys": {
+                    key_name: {
+                        "id": key.get("id"),
+                        "values": {
+                            v.get("name"): v.get("id")
+                            for v in key.get("tag_values") or []
+                        },
+                    }
+                    for key_name, key in self.keys.get(name, {}).items()
+                },
+            }
+            for name, ns in self.namespaces.items()
+        }
+
+
+def _fail_on_errors(module, tree):
+    if tree.errors:
+        module.fail_json(
+            msg=f"{len(tree.errors)} tag request(s) failed: " + "; ".join(tree.errors),
+            changed=any(v for level in tree.changes.values() for v in level.values()),
+            changes=tree.changes,
+        )
+
+
+def _key_payload(namespace_id, desired, current, microtenant_id):
+    existing = {
+        v.get("name"): v.get("id") for v in (current or {}).get("tag_values") or []
+    }
+    values = desired.get("values")
+    if values is None:
+        tag_values = (current or {}).get("tag_values")
+    else:
+        tag_values = [deleteNone({"id": existing.get(v), "name": v}) for v in values]
+    return RequestBodyObject(
+        deleteNone(
+            {
+                "name": desired["name"],
+                "description": _description(desired, current),
+                "enabled": desired.get("enabled"),
+                "namespaceId": namespace_id,
+                "tagValues": tag_values,
+                "microtenantId": microtenant_id,
+            }
+        )
+    )
+
+
+def apply_present(module, tree, namespaces, tag_groups, existing_groups):
+    client = tree.client
+    qp = tree.query_params
+    microtenant_id = module.params.get("microtenant_id")
+    check_mode = module.check_mode
+
+    # Existing keys of the declared namespaces and of those referenced by groups.
+    referenced = [ns["name"] for ns in namespaces]
+    referenced += [t["namespace"] for g in tag_groups for t in g.get("tags") or []]
+    tree.list_keys(dict.fromkeys(referenced))
+    tree.fill_values(namespaces)
+    _fail_on_errors(module, tree)
+
+    # Namespaces
+    calls = []
+    for ns in namespaces:
+        current = tree.namespaces.get(ns["name"])
+        payload = RequestBodyObject(
+            deleteNone(
+                {
+                    "name": ns["name"],
+                    "description": _description(ns, current),
+                    "enabled": ns.get("enabled"),
+                    "origin": (current or {}).get("origin") or "CUSTOM",
+                    "microtenantId": microtenant_id,
+                }
+            )
+        )
+        if current is None:
+            tree.changes["namespaces"]["created"].append(ns["name"])
+            calls.append(
+                (
+                    ns["name"],
+                    client.tag_namespace.create_namespace,
+                    (payload, qp),
+                )
+            )
+        elif namespace_differs(ns, current):
+            tree.changes["namespaces"]["updated"].append(ns["name"])
+            calls.append(
+                (
+                    ns["name"],
+                    client.tag_namespace.update_namespace,
+                    (current["id"], payload, qp),
+                )
+            )
+    if check_mode:
+        for name in [c[0] for c in calls]:
+            tree.namespaces.setdefault(name, {"name": name})
+    else:
+        for name, result in tree.run(calls):
+            if name not in tree.namespaces:
+                tree.namespaces[name] = result or {"name": name}
+                tree.keys[name] = {}
+        _fail_on_errors(module, tree)
+
+    # Tag keys
+    calls = []
+    for ns in namespaces:
+        namespace_id = tree.namespaces.get(ns["name"], {}).get("id")
+        current_keys = tree.keys.setdefault(ns["name"], {})
+        for key in ns.get("keys") or []:
+            current = current_keys.get(key["name"])
+            label = f"{ns['name']}/{key['name']}"
+            payload = _key_payload(namespace_id, key, current, microtenant_id)
+            if current is None:
+                tree.changes["tag_keys"]["created"].append(label)
+                calls.append(
+                    (
+                        (ns["name"], key["name"]),
+                        client.tag_key.create_tag_key,
+                        (namespace_id, payload, qp),
+                    )
+                )
+            elif key_differs(key, current):
+                tree.changes["tag_keys"]["updated"].append(label)
+                calls.append(
+                    (
+                        (ns["name"], key["name"]),
+                        client.tag_key.update_tag_key,
+                        (namespace_id, current["id"], payload, qp),
+                    )
+                )
+    if check_mode:
+        for (ns_name, key_name), _call, args in calls:
+            desired = args[-2].payload
+            tree.keys[ns_name][key_name] = {
+                **tree.keys[ns_name].get(key_name, {}),
+                "tag_values": desired.get("tagValues") or [],
+            }
+    else:
+        for (ns_name, key_name), result in tree.run(calls):
+            if result:
+                tree.keys[ns_name][key_name] = result
+        _fail_on_errors(module, tree)
+
+    # Tag groups
+    calls = []
+    for group in tag_groups:
+        current = existing_groups.get(group["name"])
+        resolved = []
+        unresolved = []
+        for tag in group.get("tags") or []:
+            ids = tree.resolve(tag)
+            if ids is None:
+                unresolved.append(f"{tag['namespace']}/{tag['key']}")
+            else:
+                resolved.append(ids)
+        if unresolved and not check_mode:
+            tree.errors.append(
+                f"tag group {group['name']}: unknown tag key(s) {', '.join(unresolved)}"
+            )
+            continue
+        desired_tags = {
+            (ns_id, key_id, value) for ns_id, key_id, _vid, value in resolved
+        }
+        differs = (
+            current is None
+            or bool(unresolved)
+            or (
+                group.get("description") is not None
+                and group["description"] != current.get("description")
+            )
+            or (group.get("tags") is not None and desired_tags != group_tags(current))
+        )
+        if not differs:
+            continue
+        payload = RequestBodyObject(
+            deleteNone(
+                {
+                    "name": group["name"],
+                    "description": _description(group, current),
+                    "tags": (
+                        [
+                            {
+                                "namespace": {"id": ns_id},
+                                "tagKey": {"id": key_id},
+                                "tagValue": deleteNone({"id": value_id, "name": value}),
+                            }
+                            for ns_id, key_id, value_id, value in resolved
+                        ]
+                        if group.get("tags") is not None
+                        else None
+                    ),
+                    "microtenantId": microtenant_id,
+                }
+            )
+        )
+        if current is None:
+            tree.changes["tag_groups"]["created"].append(group["name"])
+            calls.append(
+                (group["name"], client.tag_group.create_tag_group, (payload, qp))
+            )
+        else:
+            tree.changes["tag_groups"]["updated"].append(group["name"])
+            calls.append(
+                (
+                    group["name"],
+                    client.tag_group.update_tag_group,
+                    (current["id"], payload, qp),
+                )
+            )
+    if not check_mode:
+        tree.run(calls)
+    _fail_on_errors(module, tree)
+
+
+def apply_absent(module, tree, namespaces, tag_groups, existing_groups):
+    client = tree.client
+    qp = tree.query_params
+
+    tree.list_keys([ns["name"] for ns in namespaces])
+    _fail_on_errors(module, tree)
+
+    group_calls = [
+        (name, client.tag_group.delete_tag_group, (existing_groups[name]["id"], qp))
+        for name in dict.fromkeys(g["name"] for g in tag_groups)
+        if name in existing_groups
+    ]
+    key_calls = []
+    namespace_calls = []
+    for ns in namespaces:
+        current = tree.namespaces.get(ns["name"])
+        if current is None:
+            continue
+        current_keys = tree.keys.get(ns["name"], {})
+        wanted = (
+            [k["name"] for k in ns["keys"]] if ns.get("keys") else list(current_keys)
+        )
+        for key_name in wanted:
+            if key_name in current_keys:
+                key_calls.append(
+                    (
+                        f"{ns['name']}/{key_name}",
+                        client.tag_key.delete_tag_key,
+                        (current["id"], current_keys[key_name]["id"], qp),
+                    )
+                )
+        if not ns.get("keys"):
+            namespace_calls.append(
+                (ns["name"], client.tag_namespace.delete_namespace, (current["id"], qp))
+            )
+
+    # Groups reference keys, and keys live in namespaces, so delete top-down.
+    for level, calls in zip(LEVELS[::-1], (group_calls, key_calls, namespace_calls)):
+        if module.check_mode:
+            tree.changes[level]["deleted"] = [c[0] for c in calls]
+            continue
+        tree.changes[level]["deleted"] = [label for label, _unused in tree.run(calls)]
+        _fail_on_errors(module, tree)
+
+
+def core(module):
+    state = module.params.get("state")
+    namespaces = module.params.get("namespaces") or []
+    tag_groups = module.params.get("tag_groups") or []
+    concurrency = module.params.get("concurrency")
+    microtenant_id = module.params.get("microtenant_id")
+    if concurrency < 1:
+        module.fail_json(msg="concurrency must be at least 1")
+
+    client = ZPAClientHelper(module)
+    query_params = {"microtenant_id": microtenant_id} if microtenant_id else {}
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        tree = TagTree(client, pool, query_params)
+        # Listed in the same microtenant the writes are sent to.
+        namespace_listing = pool.submit(
+            _list, client.tag_namespace.list_namespaces, query_params
+        )
+        group_listing = (
+            pool.submit(_list, client.tag_group.list_tag_groups, query_params)
+            if tag_groups
+            else None
+        )
+
+        items, err = namespace_listing.result()
+        if err:
+            module.fail_json(msg=f"Error listing tag namespaces: {to_native(err)}")
+        tree.namespaces = {ns.get("name"): ns for ns in items}
+        existing_groups = {}
+        if group_listing:
+            items, err = group_listing.result()
+            if err:
+                module.fail_json(msg=f"Error listing tag groups: {to_native(err)}")
+            existing_groups = {g.get("name"): g for g in items}
+
+        if state == "absent":
+            apply_absent(module, tree, namespaces, tag_groups, existing_groups)
+        else:
+            apply_present(module, tree, namespaces, tag_groups, existing_groups)
+
+    changed = any(v for level in tree.changes.values() for v in level.values())
+    if state == "absent":
+        module.exit_json(changed=changed, changes=tree.changes)
+    declared = {ns["name"] for ns in namespaces}
+    exported = {k: v for k, v in tree.export().items() if k in declared}
+    module.exit_json(changed=changed, changes=tree.changes, namespaces=exported)
+
+
+def main():
+    argument_spec = ZPAClientHelper.zpa_argument_spec()
+    argument_spec.update(
+        namespaces=dict(
+            type="list",
+            elements="dict",
+            default=[],
+            options=dict(
+                name=dict(type="str", required=True),
+                description=dict(type="str", required=False),
+                enabled=dict(type="bool", default=True),
+                keys=dict(
+                    type="list",
+                    elements="dict",
+                    required=False,
+                    no_log=False,
+                    options=dict(
+                        name=dict(type="str", required=True),
+                        description=dict(type="str", required=False),
+                        enabled=dict(type="bool", default=True),
+                        values=dict(type="list", elements="str", required=False),
+                    ),
+                ),
+            ),
+        ),
+        tag_groups=dict(
+            type="list",
+            elements="dict",
+            default=[],
+            options=dict(
+                name=dict(type="str", required=True),
+                description=dict(type="str", required=False),
+                tags=dict(
+                    type="list",
+                    elements="dict",
+                    required=False,
+                    options=dict(
+                        namespace=dict(type="str", required=True),
+                        key=dict(type="str", required=True, no_log=False),
+                        value=dict(type="str", required=True),
+                    ),
+                ),
+            ),
+        ),
+        concurrency=dict(type="int", default=8),
+        microtenant_id=dict(type="str", required=False),
+        state=dict(type="str", choices=["present", "absent"], default="present"),
+    )
+    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+    try:
+        core(module)
+    except Exception as e:
+        module.fail_json(msg=to_native(e), exception=format_exc())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+
+#                             MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+module: zpa_tenant_export
+short_description: Export a ZPA tenant snapshot to compressed JSON Lines files
+description:
+  - Streams every requested resource type, page by page, into one JSON Lines file per type.
+  - Resource types are fetched concurrently. Only a manifest with counts, checksums and
+    durations is returned, so memory use stays bounded regardless of the tenant size.
+author:
+  - William Guilherme (@willguibr)
+version_added: "2.3.0"
+requirements:
+    - Zscaler SDK Python can be obtained from PyPI U(https://pypi.org/project/zscaler-sdk-python/)
+notes:
+    - Check mode is supported. No API calls are made and no files are written.
+    - Objects of scoped resource types (C(scim_group), C(scim_attribute), C(tag_key)) carry
+      their parent ID in a C(_parent_id) key.
+extends_documentation_fragment:
+  - zscaler.zpacloud.fragments.provider
+  - zscaler.zpacloud.fragments.documentation
+
+options:
+  dest:
+    description:
+      - Directory the snapshot is written to. It is created when missing.
+      - Existing files for the exported resource types are replaced atomically.
+    type: path
+    required: true
+  resource_types:
+    description:
+      - Resource types to export, for example C(application_segment), C(segment_group),
+        C(server_group), C(application_server) or C(policy_access_rule).
+      - Defaults to every supported resource type.
+    type: list
+    elements: str
+    required: false
+  compress:
+    description:
+      - Whether to gzip-compress the JSON Lines files.
+    type: bool
+    default: true
+  concurrency:
+    description:
+      - Number of resource types fetched in parallel.
+    type: int
+    default: 4
+  microtenant_id:
+    description:
+      - The unique identifier of the Microtenant for the ZPA tenant
+    required: false
+    type: str
+"""
+
+EXAMPLES = r"""
+- name: Export the full tenant for an audit
+  zscaler.zpacloud.zpa_tenant_export:
+    provider: "{{ zpa_cloud }}"
+    dest: "/var/backups/zpa/{{ ansible_date_time.date }}"
+
+- name: Export only segments and groups
+  zscaler.zpacloud.zpa_tenant_export:
+    provider: "{{ zpa_cloud }}"
+    dest: /tmp/zpa_snapshot
+    resource_types:
+      - application_segment
+      - segment_group
+      - server_group
+    concurrency: 3
+"""
+
+RETURN = r"""
+manifest:
+  description: Summary of the snapshot. Also written to C(manifest.json) in O(dest).
+  returned: always
+  type: dict
+  contains:
+    created:
+      description: UTC timestamp of the export.
+      type: str
+      sample: "2026-10-19T08:30:00Z"
+    duration_seconds:
+      description: Wall-clock duration of the whole export.
+      type: float
+      sample: 12.4
+    resource_types:
+      description: Per resource type entries keyed by resource type.
+      type: dict
+      sample:
+        server_group:
+          file: "server_group.jsonl.gz"
+          count: 120
+          bytes: 10240
+          sha256: "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08"
+          duration_seconds: 0.8
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from traceback import format_exc
+
+from ansible.module_utils._text import to_native
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    ZPAClientHelper,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_resources import (
+    RESOURCE_TYPES,
+    iter_scoped_pages,
+)
+
+
+def snapshot_file_name(resource_type, compress=True):
+    return f"{resource_type}.jsonl.gz" if compress else f"{resource_type}.jsonl"
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def export_resource_type(client, resource_type, dest, compress, microtenant_id):
+    """Stream one resource type to disk and return its manifest entry."""
+    started = time.time()
+    file_name = snapshot_file_name(resource_type, compress)
+    path = os.path.join(dest, file_name)
+
+    fd, tmp_path = tempfile.mkstemp(
+        dir=dest, prefix=f".{resource_type}.", suffix=".tmp"
+    )
+    count = 0
+    try:
+        with os.fdopen(fd, "wb") as raw:
+            # mtime=0 keeps the checksum stable for identical content
+            out = gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) if compress else raw
+            try:
+                for page, err in iter_scoped_pages(
+                    client, resource_type, microtenant_id
+                ):
+                    if err:
+                        raise RuntimeError(
+                            f"Error listing {resource_type}: {to_native(err)}"
+                        )
+                    for item in page:
+                        line = json.dumps(item, default=str, separators=(",", ":"))
+                        out.write(line.encode("utf-8") + b"\n")
+                        count += 1
+            finally:
+                if compress:
+                    out.close()
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    return {
+        "file": file_name,
+        "count": count,
+        "bytes": os.path.getsize(path),
+        "sha256": file_sha256(path),
+        "duration_seconds": round(time.time() - started, 3),
+    }
+
+
+def core(module):
+    dest = module.params.get("dest")
+    compress = module.params.get("compress")
+    concurrency = module.params.get("concurrency")
+    microtenant_id = module.params.get("microtenant_id")
+    resource_types = module.params.get("resource_types") or sorted(RESOURCE_TYPES)
+
+    unknown = [r for r in resource_types if r not in RESOURCE_TYPES]
+    if unknown:
+        module.fail_json(
+            msg=f"Unsupported resource type(s): {', '.join(unknown)}. "
+            f"Supported types: {', '.join(sorted(RESOURCE_TYPES))}"
+        )
+    if concurrency < 1:
+        module.fail_json(msg="concurrency must be at least 1")
+
+    if module.check_mode:
+        module.exit_json(changed=True, manifest={})
+
+    client = ZPAClientHelper(module)
+    os.makedirs(dest, exist_ok=True)
+
+    started = time.time()
+    entries = {}
+    errors = {}
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = {
+            rtype: pool.submit(
+                export_resource_type, client, rtype, dest, compress, microtenant_id
+            )
+            for rtype in resource_types
+        }
+        for rtype, future in futures.items():
+            try:
+                entries[rtype] = future.result()
+            except Exception as e:
+                errors[rtype] = to_native(e)
+
+    manifest = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(started)),
+        "duration_seconds": round(time.time() - started, 3),
+        "microtenant_id": microtenant_id,
+        "compressed": compress,
+        "resource_types": entries,
+    }
+    with open(os.path.join(dest, "manifest.json"), "w", encoding="utf-8") as fh:
+        json.dump(manifest, fh, indent=2, sort_keys=True)
+
+    if errors:
+        module.fail_json(
+            msg=f"Failed to export {len(errors)} resource type(s): "
+            + "; ".join(f"{k}: {v}" for k, v in sorted(errors.items())),
+            manifest=manifest,
+        )
+
+    module.exit_json(changed=True, manifest=manifest)
+
+
+def main():
+    argument_spec = ZPAClientHelper.zpa_argument_spec()
+    argument_spec.update(
+        dest=dict(type="path", required=True),
+        resource_types=dict(type="list", elements="str", required=False),
+        compress=dict(type="bool", default=True),
+        concurrency=dict(type="int", default=4),
+        microtenant_id=dict(type="str", required=False),
+    )
+    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+    try:
+        core(module)
+    except Exception as e:
+        module.fail_json(msg=to_native(e), exception=format_exc())
+
+
+if __name__ == "__main__":
+    main()
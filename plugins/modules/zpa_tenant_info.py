@@ -0,0 +1,293 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+
+#                             MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+module: zpa_tenant_info
+short_description: Retrieve several ZPA resource types in one task
+description:
+  - Lists every requested resource type concurrently over one authenticated client
+    and returns them in a single result, keyed by resource type.
+  - Replaces a series of C(*_info) tasks in inventory and audit playbooks. The task
+    takes about as long as the slowest listing instead of the sum of all of them.
+author:
+  - William Guilherme (@willguibr)
+version_added: "2.3.0"
+requirements:
+    - Zscaler SDK Python can be obtained from PyPI U(https://pypi.org/project/zscaler-sdk-python/)
+notes:
+    - Check mode is supported.
+    - Objects of scoped resource types (C(scim_group), C(scim_attribute), C(tag_key)) are
+      listed under every parent object and carry their parent ID in a C(_parent_id) key.
+      They are always listed through the SDK.
+extends_documentation_fragment:
+  - zscaler.zpacloud.fragments.provider
+  - zscaler.zpacloud.fragments.documentation
+  - zscaler.zpacloud.fragments.info_projection
+  - zscaler.zpacloud.fragments.raw_listing
+
+options:
+  resource_types:
+    description:
+      - Resource types to retrieve, for example C(application_segment), C(segment_group),
+        C(server_group), C(app_connector_group) or C(policy_access_rule).
+    type: list
+    elements: str
+    required: true
+  filters:
+    description:
+      - Per resource type, only return the objects whose keys have the given values.
+      - Keys are resource types, values map object keys to the expected value. Dotted
+        paths such as C(config.enabled) select nested keys, and a list of values
+        matches any of them.
+    type: dict
+    required: false
+  concurrency:
+    description:
+      - Number of listings run in parallel.
+    type: int
+    default: 8
+  transport:
+    description:
+      - How listings are sent.
+      - C(sdk) runs SDK calls on a thread pool sharing the client's HTTP session.
+      - C(async) sends them with asyncio over one shared connection pool and fetches
+        the pages of each listing in parallel, for resource types that support it.
+        The other types fall back to the SDK.
+      - C(async) requires the C(aiohttp) library and always returns API objects,
+        as with O(raw=true).
+    type: str
+    default: sdk
+    choices: ["sdk", "async"]
+  microtenant_id:
+    description:
+      - The unique identifier of the Microtenant for the ZPA tenant
+    required: false
+    type: str
+"""
+
+EXAMPLES = r"""
+- name: Collect the objects an access audit looks at
+  zscaler.zpacloud.zpa_tenant_info:
+    provider: "{{ zpa_cloud }}"
+    resource_types:
+      - application_segment
+      - segment_group
+      - server_group
+      - app_connector_group
+      - policy_access_rule
+    fields: ["id", "name", "enabled"]
+  register: tenant
+
+- name: Count disabled application segments and all connector groups
+  zscaler.zpacloud.zpa_tenant_info:
+    provider: "{{ zpa_cloud }}"
+    resource_types: [application_segment, app_connector_group]
+    filters:
+      application_segment:
+        enabled: false
+    count_only: true
+    transport: async
+"""
+
+RETURN = r"""
+resources:
+  description: The objects of each resource type, keyed by resource type.
+  returned: unless O(count_only=true)
+  type: dict
+  sample:
+    segment_group:
+      - id: "216196257331282583"
+        name: "crm"
+        enabled: true
+count:
+  description: Number of matching objects of each resource type.
+  returned: always
+  type: dict
+  sample:
+    segment_group: 12
+    server_group: 40
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from traceback import format_exc
+
+from ansible.module_utils._text import to_native
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
+    project_fields,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    ZPAClientHelper,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_resources import (
+    RESOURCE_TYPES,
+    get_resource_type,
+    iter_scoped_pages,
+    list_resource,
+)
+
+
+def _lookup(item, path):
+    value = item
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _value_matches(actual, expected):
+    if isinstance(expected, list):
+        return any(_value_matches(actual, e) for e in expected)
+    return actual == expected or str(actual) == str(expected)
+
+
+def filter_items(items, conditions):
+    """Keep the items whose values at every dotted path of ``conditions`` match."""
+    if not conditions:
+        return items
+    return [
+        item
+        for item in items
+        if all(
+            _value_matches(_lookup(item, path), expected)
+            for path, expected in conditions.items()
+        )
+    ]
+
+
+def list_scoped(client, resource_type, microtenant_id):
+    items = []
+    for page, err in iter_scoped_pages(client, resource_type, microtenant_id):
+        if err:
+            return None, err
+        items.extend(page)
+    return items, None
+
+
+def list_sdk(client, resource_type, microtenant_id, raw):
+    """List one resource type through the SDK, returning ``(items, error)``."""
+    try:
+        if get_resource_type(resource_type).parent:
+            return list_scoped(client, resource_type, microtenant_id)
+        return list_resource(client, resource_type, microtenant_id, raw=raw)
+    except Exception as e:
+        return None, e
+
+
+def core(module):
+    resource_types = list(dict.fromkeys(module.params.get("resource_types")))
+    filters = module.params.get("filters") or {}
+    fields = module.params.get("fields")
+    count_only = module.params.get("count_only")
+    raw = module.params.get("raw")
+    concurrency = module.params.get("concurrency")
+    use_async = module.params.get("transport") == "async"
+    microtenant_id = module.params.get("microtenant_id")
+
+    unknown = [r for r in resource_types if r not in RESOURCE_TYPES]
+    unknown += [r for r in filters if r not in resource_types and r not in unknown]
+    if unknown:
+        module.fail_json(
+            msg=f"Unsupported resource type(s): {', '.join(unknown)}. "
+            f"Supported types: {', '.join(sorted(RESOURCE_TYPES))}"
+        )
+    if concurrency < 1:
+        module.fail_json(msg="concurrency must be at least 1")
+
+    client = ZPAClientHelper(module)
+    transport = client.async_transport(concurrency) if use_async else None
+    async_types = [
+        rt
+        for rt in resource_types
+        if transport and RESOURCE_TYPES[rt].endpoint and not RESOURCE_TYPES[rt].parent
+    ]
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = {
+            rt: pool.submit(list_sdk, client, rt, microtenant_id, raw)
+            for rt in resource_types
+            if rt not in async_types
+        }
+        # The async listings run on this thread while the pool works through the rest.
+        if async_types:
+            listings = transport.run(
+                *[
+                    RESOURCE_TYPES[rt].list_async(transport, microtenant_id)
+                    for rt in async_types
+                ]
+            )
+            results.update(zip(async_types, listings))
+        for rt, future in futures.items():
+            results[rt] = future.result()
+
+    resources = {}
+    errors = {}
+    for rt in resource_types:
+        items, err = results[rt]
+        if err:
+            errors[rt] = to_native(err)
+            continue
+        resources[rt] = filter_items(items, filters.get(rt))
+
+    if errors:
+        module.fail_json(
+            msg=f"Failed to list {len(errors)} resource type(s): "
+            + "; ".join(f"{k}: {v}" for k, v in sorted(errors.items()))
+        )
+
+    count = {rt: len(items) for rt, items in resources.items()}
+    if count_only:
+        module.exit_json(changed=False, count=count)
+    resources = {rt: project_fields(items, fields) for rt, items in resources.items()}
+    module.exit_json(changed=False, resources=resources, count=count)
+
+
+def main():
+    argument_spec = ZPAClientHelper.zpa_argument_spec()
+    argument_spec.update(
+        resource_types=dict(type="list", elements="str", required=True),
+        filters=dict(type="dict", required=False),
+        fields=dict(type="list", elements="str", required=False),
+        count_only=dict(type="bool", default=False),
+        raw=dict(type="bool", default=False),
+        concurrency=dict(type="int", default=8),
+        transport=dict(type="str", default="sdk", choices=["sdk", "async"]),
+        microtenant_id=dict(type="str", required=False),
+    )
+    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+    try:
+        core(module)
+    except Exception as e:
+        module.fail_json(msg=to_native(e), exception=format_exc())
+
+
+if __name__ == "__main__":
+    main()
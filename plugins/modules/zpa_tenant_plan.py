@@ -0,0 +1,193 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+
+#                             MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+module: zpa_tenant_plan
+short_description: Plan changes against a ZPA tenant snapshot without calling the API
+description:
+  - Loads a snapshot written by M(zscaler.zpacloud.zpa_tenant_export) into memory and
+    evaluates desired-state objects against it.
+  - Desired and snapshot objects are normalized the same way the resource modules do it,
+    and the result is a create/update/delete plan with per-attribute differences.
+  - No API calls are made, so no provider credentials are required.
+author:
+  - William Guilherme (@willguibr)
+version_added: "2.3.0"
+notes:
+    - Check mode is supported. The module never changes anything.
+    - Objects are matched by C(id) when given, otherwise by C(name).
+    - Supported resource types are application segments (C(application_segment),
+      C(application_segment_pra), C(application_segment_inspection), C(application_segment_ba_v2)),
+      C(segment_group), C(server_group), C(application_server) and the C(policy_*_rule) types.
+
+options:
+  snapshot:
+    description:
+      - Directory containing the snapshot, as written by M(zscaler.zpacloud.zpa_tenant_export).
+    type: path
+    required: true
+  desired:
+    description:
+      - Desired objects keyed by resource type. Each object uses the same options as the
+        matching resource module, for example the options of M(zscaler.zpacloud.zpa_server_group)
+        for C(server_group). Policy rule conditions use the v2 module format.
+      - An object with O(desired.state=absent) is planned for deletion.
+    type: dict
+    required: true
+  prune:
+    description:
+      - Plan the deletion of snapshot objects that are not listed in O(desired),
+        for the resource types present in O(desired) only.
+    type: bool
+    default: false
+"""
+
+EXAMPLES = r"""
+- name: Export the objects the plan needs
+  zscaler.zpacloud.zpa_tenant_export:
+    provider: "{{ zpa_cloud }}"
+    dest: /tmp/zpa_snapshot
+    resource_types:
+      - segment_group
+      - server_group
+      - policy_access_rule
+
+- name: Review the plan offline
+  zscaler.zpacloud.zpa_tenant_plan:
+    snapshot: /tmp/zpa_snapshot
+    prune: true
+    desired:
+      segment_group:
+        - name: crm
+          enabled: true
+      server_group:
+        - name: crm-servers
+          dynamic_discovery: true
+          app_connector_group_ids: ["216196257331282583"]
+        - name: legacy-servers
+          state: absent
+      policy_access_rule:
+        - name: allow-crm
+          action: ALLOW
+          conditions:
+            - operator: OR
+              operands:
+                - object_type: APP_GROUP
+                  values: ["216196257331282584"]
+  register: plan
+
+- name: Show what would change
+  ansible.builtin.debug:
+    var: plan.summary
+"""
+
+RETURN = r"""
+plan:
+  description: One entry per evaluated object.
+  returned: always
+  type: list
+  elements: dict
+  sample:
+    - resource_type: server_group
+      name: crm-servers
+      id: "216196257331282590"
+      action: update
+      diff:
+        dynamic_discovery:
+          current: false
+          desired: true
+    - resource_type: segment_group
+      name: crm
+      action: create
+summary:
+  description: Number of planned actions by type.
+  returned: always
+  type: dict
+  sample:
+    create: 1
+    update: 1
+    delete: 0
+    noop: 12
+"""
+
+from traceback import format_exc
+
+from ansible.module_utils._text import to_native
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_plan import (
+    PLAN_HANDLERS,
+    TenantSnapshot,
+    build_plan,
+    summarize_plan,
+)
+
+
+def core(module):
+    desired = module.params.get("desired") or {}
+
+    unknown = [r for r in desired if r not in PLAN_HANDLERS]
+    if unknown:
+        module.fail_json(
+            msg=f"Unsupported resource type(s): {', '.join(unknown)}. "
+            f"Supported types: {', '.join(sorted(PLAN_HANDLERS))}"
+        )
+    for resource_type, objects in desired.items():
+        if not isinstance(objects, list) or not all(
+            isinstance(o, dict) for o in objects
+        ):
+            module.fail_json(
+                msg=f"desired.{resource_type} must be a list of dictionaries"
+            )
+
+    try:
+        snapshot = TenantSnapshot.load(
+            module.params.get("snapshot"), resource_types=sorted(desired)
+        )
+    except (OSError, ValueError) as e:
+        module.fail_json(msg=f"Error loading snapshot: {to_native(e)}")
+
+    plan = build_plan(snapshot, desired, prune=module.params.get("prune"))
+    module.exit_json(changed=False, plan=plan, summary=summarize_plan(plan))
+
+
+def main():
+    argument_spec = dict(
+        snapshot=dict(type="path", required=True),
+        desired=dict(type="dict", required=True),
+        prune=dict(type="bool", default=False),
+    )
+    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+    try:
+        core(module)
+    except Exception as e:
+        module.fail_json(msg=to_native(e), exception=format_exc())
+
+
+if __name__ == "__main__":
+    main()
@@ -130,6 +130,7 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     collect_all_items,
     remove_cloud_suffix,
+    did_you_mean,
 )
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
@@ -175,7 +176,7 @@ def core(module):
         if not match:
             available = [remove_cloud_suffix(getattr(n, "name", "")) for n in networks]
             module.fail_json(
-                msg=f"Trusted Network '{network_name}' not found. Available: {available}"
+                msg=f"Trusted Network '{network_name}' not found.{did_you_mean(network_name, available)}"
             )
         networks = [match]
 
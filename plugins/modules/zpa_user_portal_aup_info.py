@@ -145,6 +145,7 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import
 )
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     collect_all_items,
+    did_you_mean,
 )
 
 
@@ -183,7 +184,7 @@ def core(module):
         if not matched:
             available = [a.get("name") for a in result_list]
             module.fail_json(
-                msg=f"User Portal AUP '{aup_name}' not found. Available: {available}"
+                msg=f"User Portal AUP '{aup_name}' not found.{did_you_mean(aup_name, available)}"
             )
         result_list = [matched]
 
@@ -169,6 +169,7 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import
 )
 from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     collect_all_items,
+    did_you_mean,
 )
 
 
@@ -207,7 +208,7 @@ def core(module):
         if not matched:
             available = [l.get("name") for l in result_list]
             module.fail_json(
-                msg=f"User Portal Link '{link_name}' not found. Available: {available}"
+                msg=f"User Portal Link '{link_name}' not found.{did_you_mean(link_name, available)}"
             )
         result_list = [matched]
 
@@ -0,0 +1,203 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+
+#                             MIT License
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+module: zpa_version_compliance_info
+short_description: Report App Connectors and Service Edges running outside their version profile
+description:
+  - Joins App Connector and Service Edge groups with the customer version profile they
+    follow and checks the running version of every instance against the versions the
+    profile allows.
+  - Version profiles and groups are indexed by ID from one listing each, and the instance
+    listing is streamed page by page, so the check costs a handful of API pages even on
+    large fleets.
+author:
+  - William Guilherme (@willguibr)
+version_added: "2.3.0"
+requirements:
+    - Zscaler SDK Python can be obtained from PyPI U(https://pypi.org/project/zscaler-sdk-python/)
+notes:
+    - Check mode is supported.
+    - Groups without a version profile follow the C(Default) profile, ID C(0).
+    - A profile that pins no version for a component treats every instance of that
+      component as compliant.
+extends_documentation_fragment:
+  - zscaler.zpacloud.fragments.provider
+  - zscaler.zpacloud.fragments.documentation
+
+options:
+  components:
+    description:
+      - Which enrollment types to check, at least one.
+    type: list
+    elements: str
+    choices: ["app_connector", "service_edge"]
+    default: ["app_connector", "service_edge"]
+  microtenant_id:
+    description:
+      - The unique identifier of the Microtenant for the ZPA tenant.
+    type: str
+"""
+
+EXAMPLES = r"""
+- name: Check the whole fleet against its version profiles
+  zscaler.zpacloud.zpa_version_compliance_info:
+    provider: "{{ zpa_cloud }}"
+  register: compliance
+
+- name: Fail when any App Connector runs an unexpected version
+  ansible.builtin.assert:
+    that: compliance.out_of_profile | length == 0
+    fail_msg: "{{ compliance.out_of_profile | map(attribute='name') | list }}"
+
+- name: Only check App Connectors
+  zscaler.zpacloud.zpa_version_compliance_info:
+    provider: "{{ zpa_cloud }}"
+    components: [app_connector]
+"""
+
+RETURN = r"""
+groups:
+  description: Compliance of every group.
+  returned: always
+  type: list
+  elements: dict
+  sample:
+    - id: "216196257331291924"
+      name: "Branches"
+      component: app_connector
+      version_profile_id: "2"
+      version_profile_name: "New Release"
+      allowed_versions: ["24.103.2"]
+      total: 12
+      compliant: 11
+      out_of_profile: 1
+      compliant_pct: 91.7
+out_of_profile:
+  description: The instances whose running version is not allowed by their group's profile.
+  returned: always
+  type: list
+  elements: dict
+  sample:
+    - id: "216196257331291930"
+      name: "branch-07"
+      component: app_connector
+      group_id: "216196257331291924"
+      group_name: "Branches"
+      current_version: "24.90.5"
+      allowed_versions: ["24.103.2"]
+summary:
+  description: Instance counts over all checked groups.
+  returned: always
+  type: dict
+  sample:
+    total: 12
+    compliant: 11
+    out_of_profile: 1
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from traceback import format_exc
+
+from ansible.module_utils._text import to_native
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    ZPAClientHelper,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_fleet import (
+    version_compliance,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_resources import (
+    list_resource,
+)
+
+
+def core(module):
+    components = list(dict.fromkeys(module.params.get("components") or []))
+    if not components:
+        module.fail_json(
+            msg="components must list at least one of app_connector, service_edge"
+        )
+    microtenant_id = module.params.get("microtenant_id")
+    client = ZPAClientHelper(module)
+
+    profiles, err = list_resource(client, "customer_version_profile")
+    if err:
+        module.fail_json(msg=f"Error retrieving version profiles: {to_native(err)}")
+    profiles_by_id = {str(p.get("id")): p for p in profiles}
+
+    with ThreadPoolExecutor(max_workers=len(components)) as pool:
+        futures = [
+            pool.submit(
+                version_compliance, client, component, profiles_by_id, microtenant_id
+            )
+            for component in components
+        ]
+        results = [future.result() for future in futures]
+
+    groups = []
+    out_of_profile = []
+    for component, (component_groups, component_out, err) in zip(components, results):
+        if err:
+            module.fail_json(
+                msg=f"Error checking {component} versions: {to_native(err)}"
+            )
+        groups.extend(component_groups)
+        out_of_profile.extend(component_out)
+
+    summary = {
+        "total": sum(g["total"] for g in groups),
+        "compliant": sum(g["compliant"] for g in groups),
+        "out_of_profile": len(out_of_profile),
+    }
+    module.exit_json(
+        changed=False, groups=groups, out_of_profile=out_of_profile, summary=summary
+    )
+
+
+def main():
+    argument_spec = ZPAClientHelper.zpa_argument_spec()
+    argument_spec.update(
+        components=dict(
+            type="list",
+            elements="str",
+            choices=["app_connector", "service_edge"],
+            default=["app_connector", "service_edge"],
+        ),
+        microtenant_id=dict(type="str", required=False),
+    )
+    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+    try:
+        core(module)
+    except Exception as e:
+        module.fail_json(msg=to_native(e), exception=format_exc())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+# MIT License
+
+"""
+Compare the SDK model path and the raw path used by ``raw: true`` info modules.
+
+For every page of a synthetic application segment listing, the model path does
+what ``list_segments()`` followed by ``.as_dict()`` does: build an
+ApplicationSegments model and convert it back to a dict. The raw path only maps
+the keys to snake_case, like ZPAClientHelper.list_raw. Both start from the JSON
+text of the pages.
+
+Usage, with the collection on the Python path:
+
+    python tests/benchmarks/bench_raw_listing.py [--items 20000]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_async import (
+    snake_case_keys,
+)
+from zscaler.api_client import APIClient
+from zscaler.zpa.models.application_segment import ApplicationSegments
+
+PAGE_SIZE = 500
+
+
+def segment(i):
+    return {
+        "id": str(216196257331280000 + i),
+        "name": f"app-{i:05d}",
+        "description": "benchmark segment",
+        "enabled": True,
+        "domainNames": [f"app{i}.example.com", f"app{i}.internal.example.com"],
+        "tcpPortRanges": ["443", "443", "8080", "8081"],
+        "tcpPortRange": [{"from": "443", "to": "443"}, {"from": "8080", "to": "8081"}],
+        "segmentGroupId": "216196257331280001",
+        "segmentGroupName": "benchmark",
+        "serverGroups": [
+            {
+                "id": str(216196257331290000 + i % 50),
+                "name": f"servers-{i % 50}",
+                "enabled": True,
+                "dynamicDiscovery": True,
+                "configSpace": "DEFAULT",
+                "creationTime": "1724111999",
+                "modifiedTime": "1724111999",
+            }
+        ],
+        "bypassType": "NEVER",
+        "healthReporting": "ON_ACCESS",
+        "healthCheckType": "DEFAULT",
+        "icmpAccessType": "NONE",
+        "isCnameEnabled": True,
+        "ipAnchored": False,
+        "doubleEncrypt": False,
+        "passiveHealthEnabled": True,
+        "selectConnectorCloseToApp": False,
+        "useInDrMode": False,
+        "matchStyle": "EXCLUSIVE",
+        "configSpace": "DEFAULT",
+        "creationTime": "1724127537",
+        "modifiedTime": "1724127537",
+        "modifiedBy": "216199618143191041",
+        "microtenantName": "Default",
+    }
+
+
+def pages(count):
+    items = [segment(i) for i in range(count)]
+    return [
+        json.dumps(
+            {
+                "totalPages": str(-(-count // PAGE_SIZE)),
+                "list": items[i : i + PAGE_SIZE],
+            }
+        )
+        for i in range(0, count, PAGE_SIZE)
+    ]
+
+
+def model_path(bodies):
+    result = []
+    for body in bodies:
+        for item in json.loads(body)["list"]:
+            result.append(
+                ApplicationSegments(APIClient.form_response_body(item)).as_dict()
+            )
+    return result
+
+
+def raw_path(bodies):
+    result = []
+    for body in bodies:
+        result.extend(snake_case_keys(i) for i in json.loads(body)["list"])
+    return result
+
+
+def measure(fn, bodies):
+    gc.collect()
+    start = time.perf_counter()
+    result = fn(bodies)
+    elapsed = time.perf_counter() - start
+    del result
+    gc.collect()
+    tracemalloc.start()
+    result = fn(bodies)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=20000)
+    args = parser.parse_args()
+
+    bodies = pages(args.items)
+    model_time, model_peak, models = measure(model_path, bodies)
+    raw_time, raw_peak, raws = measure(raw_path, bodies)
+
+    assert len(models) == len(raws) == args.items
+    print(f"{args.items} application segments in {len(bodies)} pages")
+    print(f"model path: {model_time:7.3f}s  peak {model_peak / 2**20:7.1f} MiB")
+    print(f"raw path:   {raw_time:7.3f}s  peak {raw_peak / 2**20:7.1f} MiB")
+    print(f"speedup:    {model_time / raw_time:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
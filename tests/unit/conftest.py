@@ -80,3 +80,19 @@ def mock_zscaler_sdk(mocker):
     mock_sdk = mocker.MagicMock()
     mocker.patch.dict("sys.modules", {"zscaler": mock_sdk})
     return mock_sdk
+
+
+@pytest.fixture(autouse=True)
+def isolate_zpa_cache(tmp_path, monkeypatch):
+    """
+    Point the shared ZPA cache at a per-test directory and clear its
+    in-process memo, so cached listings never leak between tests.
+    """
+    from ansible_collections.zscaler.zpacloud.plugins.module_utils import zpa_cache
+
+    monkeypatch.setenv("ZPA_CACHE_DIR", str(tmp_path / "zpa_cache"))
+    monkeypatch.delenv("ZPA_CACHE_TTL", raising=False)
+    monkeypatch.delenv("ZPA_CACHE_DISABLED", raising=False)
+    zpa_cache._MEMORY.clear()
+    yield
+    zpa_cache._MEMORY.clear()
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+# MIT License
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from unittest.mock import MagicMock
+
+import pytest
+from ansible.errors import AnsibleActionFail
+from ansible.utils.unsafe_proxy import AnsibleUnsafe
+
+from ansible_collections.zscaler.zpacloud.plugins.action import zpa_batch
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    ZPAClientHelper,
+)
+from ansible_collections.zscaler.zpacloud.plugins.modules import (
+    zpa_policy_access_timeout_rule,
+    zpa_segment_group,
+)
+
+PROVIDER = {
+    "client_id": "test_client_id",
+    "client_secret": "test_client_secret",
+    "vanity_domain": "test_vanity",
+    "customer_id": "test_customer",
+    "cloud": "production",
+}
+
+
+class MockItem:
+    def __init__(self, data):
+        self._data = data
+
+    def as_dict(self):
+        return dict(self._data)
+
+    def __getattr__(self, name):
+        return self._data.get(name)
+
+
+@pytest.fixture
+def client(mocker):
+    helper = MagicMock()
+    helper.zpa_argument_spec.return_value = ZPAClientHelper.zpa_argument_spec()
+    client = MagicMock()
+    helper.return_value = client
+    mocker.patch.object(zpa_segment_group, "ZPAClientHelper", helper)
+    client.segment_groups.list_groups.return_value = (
+        [MockItem({"id": "1", "name": "crm", "enabled": True})],
+        None,
+    )
+    client.segment_groups.add_group.side_effect = lambda **kw: (
+        MockItem(dict(kw, id="2")),
+        None,
+        None,
+    )
+    return client
+
+
+def make_action(args, check_mode=False):
+    task = MagicMock()
+    task.args = args
+    task.async_val = 0
+    task.check_mode = check_mode
+    task.diff = False
+    task.no_log = False
+    play_context = MagicMock()
+    play_context.check_mode = check_mode
+    play_context.diff = False
+    return zpa_batch.ActionModule(
+        task=task,
+        connection=MagicMock(),
+        play_context=play_context,
+        loader=MagicMock(),
+        templar=MagicMock(),
+        shared_loader_obj=None,
+    )
+
+
+class TestZPABatchAction:
+    def test_runs_items_with_shared_client(self, client):
+        action = make_action(
+            {
+                "module": "zscaler.zpacloud.zpa_segment_group",
+                "provider": PROVIDER,
+                "items": [{"name": "crm"}, {"name": "hr"}, {"name": "fin"}],
+                "concurrency": 2,
+            }
+        )
+        result = action.run(task_vars={})
+
+        assert result["changed"] is True
+        assert [r["item"]["name"] for r in result["results"]] == ["crm", "hr", "fin"]
+        assert [r["changed"] for r in result["results"]] == [False, True, True]
+        assert result["results"][0]["ansible_loop_var"] == "item"
+        assert zpa_segment_group.ZPAClientHelper.call_count == 1
+
+    def test_failed_item_fails_task(self, client):
+        client.segment_groups.add_group.side_effect = None
+        client.segment_groups.add_group.return_value = (None, None, "denied")
+        action = make_action(
+            {
+                "module": "zpa_segment_group",
+                "provider": PROVIDER,
+                "items": [{"name": "crm"}, {"name": "hr"}],
+            }
+        )
+        result = action.run(task_vars={})
+
+        assert result["failed"] is True
+        assert result["results"][0]["failed"] is False
+        assert "denied" in result["results"][1]["msg"]
+
+    def test_api_strings_are_unsafe(self, client):
+        action = make_action(
+            {
+                "module": "zpa_segment_group",
+                "provider": PROVIDER,
+                "items": [{"name": "hr", "description": "{{ x }}"}],
+            }
+        )
+        result = action.run(task_vars={})
+        description = result["results"][0]["data"]["description"]
+        assert isinstance(description, AnsibleUnsafe)
+
+    def test_module_validation_runs_per_item(self, mocker):
+        helper = mocker.patch.object(zpa_policy_access_timeout_rule, "ZPAClientHelper")
+        helper.zpa_argument_spec.return_value = ZPAClientHelper.zpa_argument_spec()
+        action = make_action(
+            {
+                "module": "zpa_policy_access_timeout_rule",
+                "provider": PROVIDER,
+                "items": [
+                    {
+                        "name": "rule",
+                        "conditions": [{"operands": [{"lhs": "id", "rhs": "1"}]}],
+                    }
+                ],
+            }
+        )
+        result = action.run(task_vars={})
+        assert result["failed"] is True
+        assert "object_type cannot be empty" in result["results"][0]["msg"]
+        helper.return_value.policies.add_timeout_rule.assert_not_called()
+
+    def test_check_mode(self, client):
+        action = make_action(
+            {
+                "module": "zpa_segment_group",
+                "provider": PROVIDER,
+                "items": [{"name": "hr"}],
+            },
+            check_mode=True,
+        )
+        result = action.run(task_vars={})
+        assert result["changed"] is True
+        client.segment_groups.add_group.assert_not_called()
+
+    def test_unknown_module(self):
+        action = make_action({"module": "zpa_does_not_exist", "items": []})
+        with pytest.raises(AnsibleActionFail):
+            action.run(task_vars={})
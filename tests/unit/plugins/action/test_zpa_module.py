@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+# MIT License
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from ansible_collections.zscaler.zpacloud.plugins.action import zpa_module
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    ZPAClientHelper,
+)
+from ansible.utils.unsafe_proxy import AnsibleUnsafe
+from ansible_collections.zscaler.zpacloud.plugins.modules import (
+    zpa_policy_access_rule,
+    zpa_segment_group,
+)
+
+PROVIDER = {
+    "client_id": "test_client_id",
+    "client_secret": "test_client_secret",
+    "vanity_domain": "test_vanity",
+    "customer_id": "test_customer",
+    "cloud": "production",
+}
+
+
+class MockItem:
+    def __init__(self, data):
+        self._data = data
+
+    def as_dict(self):
+        return dict(self._data)
+
+    def __getattr__(self, name):
+        return self._data.get(name)
+
+
+@pytest.fixture
+def client(mocker):
+    helper = MagicMock()
+    helper.zpa_argument_spec.return_value = ZPAClientHelper.zpa_argument_spec()
+    client = MagicMock()
+    helper.return_value = client
+    mocker.patch.object(zpa_segment_group, "ZPAClientHelper", helper)
+    mocker.patch.object(zpa_module.zpa_client, "HAS_ZSCALER", True)
+    client.segment_groups.list_groups.return_value = ([], None)
+    client.segment_groups.add_group.side_effect = lambda **kw: (
+        MockItem(dict(kw, id="2")),
+        None,
+        None,
+    )
+    return client
+
+
+@pytest.fixture
+def normal_run(mocker):
+    return mocker.patch.object(
+        zpa_module.NormalActionModule, "run", return_value={"normal": True}
+    )
+
+
+def make_action(
+    args,
+    transport="local",
+    check_mode=False,
+    environment=None,
+    action="zscaler.zpacloud.zpa_segment_group",
+):
+    task = MagicMock()
+    task.action = action
+    task.args = args
+    task.async_val = 0
+    task.check_mode = check_mode
+    task.diff = False
+    task.no_log = False
+    task.environment = environment
+    connection = MagicMock()
+    connection.transport = transport
+    play_context = MagicMock()
+    play_context.check_mode = check_mode
+    play_context.diff = False
+    return zpa_module.ActionModule(
+        task=task,
+        connection=connection,
+        play_context=play_context,
+        loader=MagicMock(),
+        templar=MagicMock(),
+        shared_loader_obj=None,
+    )
+
+
+class TestZPAModuleAction:
+    def test_runs_in_process(self, client, normal_run):
+        action = make_action({"provider": PROVIDER, "name": "hr"})
+        result = action.run(task_vars={})
+        assert result["changed"] is True
+        assert result["data"]["id"] == "2"
+        normal_run.assert_not_called()
+
+    def test_api_strings_are_unsafe(self, client, normal_run):
+        action = make_action(
+            {"provider": PROVIDER, "name": "hr", "description": "{{ lookup('x') }}"}
+        )
+        result = action.run(task_vars={})
+        assert isinstance(result["data"]["description"], AnsibleUnsafe)
+
+    def test_module_validation_in_process(self, normal_run, mocker):
+        mocker.patch.object(zpa_module.zpa_client, "HAS_ZSCALER", True)
+        helper = mocker.patch.object(zpa_policy_access_rule, "ZPAClientHelper")
+        helper.zpa_argument_spec.return_value = ZPAClientHelper.zpa_argument_spec()
+        action = make_action(
+            {
+                "provider": PROVIDER,
+                "name": "rule",
+                "conditions": [{"operands": [{"lhs": "id", "rhs": "1"}]}],
+            },
+            action="zscaler.zpacloud.zpa_policy_access_rule",
+        )
+        result = action.run(task_vars={})
+        assert result["failed"] is True
+        assert "object_type cannot be empty" in result["msg"]
+        helper.return_value.policies.add_access_rule.assert_not_called()
+
+    def test_check_mode_in_process(self, client, normal_run):
+        action = make_action({"provider": PROVIDER, "name": "hr"}, check_mode=True)
+        result = action.run(task_vars={})
+        assert result["changed"] is True
+        client.segment_groups.add_group.assert_not_called()
+
+    def test_argument_errors_in_process(self, client, normal_run):
+        action = make_action({"provider": PROVIDER})
+        result = action.run(task_vars={})
+        assert result["failed"] is True
+        assert "name" in result["msg"]
+
+    @pytest.mark.parametrize(
+        "kwargs,task_vars",
+        [
+            ({"transport": "ssh"}, {}),
+            ({"environment": [{"ZSCALER_CLIENT_ID": "x"}]}, {}),
+            ({}, {"zpa_in_process": False}),
+        ],
+    )
+    def test_falls_back_to_normal_execution(
+        self, client, normal_run, kwargs, task_vars
+    ):
+        action = make_action({"provider": PROVIDER, "name": "hr"}, **kwargs)
+        assert action.run(task_vars=task_vars) == {"normal": True}
+        client.segment_groups.add_group.assert_not_called()
+
+    def test_falls_back_without_sdk(self, client, normal_run, mocker):
+        mocker.patch.object(zpa_module.zpa_client, "HAS_ZSCALER", False)
+        action = make_action({"provider": PROVIDER, "name": "hr"})
+        assert action.run(task_vars={}) == {"normal": True}
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+# MIT License
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from unittest.mock import MagicMock
+
+import pytest
+from ansible.errors import AnsibleLookupError
+
+from ansible_collections.zscaler.zpacloud.plugins.lookup import zpa_id
+
+# Option defaults as declared in the plugin DOCUMENTATION.
+DEFAULT_OPTIONS = {
+    "provider": None,
+    "microtenant_id": None,
+    "parent_id": None,
+    "parent_name": None,
+    "errors": "strict",
+    "cache_ttl": 300,
+    "incremental": False,
+    "reconcile_interval": 3600,
+}
+
+DEFAULT_PROVIDER = {
+    "client_id": "test_client_id",
+    "client_secret": "test_client_secret",
+    "vanity_domain": "test_domain",
+}
+
+
+class MockItem:
+    def __init__(self, data):
+        self._data = data
+
+    def as_dict(self):
+        return self._data
+
+
+class TestZPAIdLookup:
+    """Unit tests for the zpa_id lookup plugin."""
+
+    @pytest.fixture
+    def mock_client(self, mocker):
+        client = MagicMock()
+        mocker.patch.object(zpa_id, "ZPAClientHelper", return_value=client)
+        client.server_groups.list_groups.return_value = (
+            [
+                MockItem({"id": "1", "name": "web-servers"}),
+                MockItem({"id": "2", "name": "db-servers"}),
+            ],
+            None,
+        )
+        return client
+
+    @staticmethod
+    def _new_lookup():
+        """Instantiate the plugin without the collection loader's option parsing."""
+        plugin = zpa_id.LookupModule(loader=None, templar=None)
+
+        def set_options(var_options=None, direct=None):
+            plugin._options = dict(DEFAULT_OPTIONS, **(direct or {}))
+
+        plugin.set_options = set_options
+        return plugin
+
+    @pytest.fixture
+    def lookup(self):
+        return self._new_lookup()
+
+    def test_resolves_multiple_names(self, mock_client, lookup):
+        result = lookup.run(
+            ["server_group", "db-servers", ["web-servers"]], provider=DEFAULT_PROVIDER
+        )
+        assert result == ["2", "1"]
+
+    def test_listing_is_memoized(self, mock_client, lookup):
+        lookup.run(["server_group", "web-servers"], provider=DEFAULT_PROVIDER)
+        other = self._new_lookup()
+        assert other.run(["server_group", "db-servers"], provider=DEFAULT_PROVIDER) == [
+            "2"
+        ]
+        assert mock_client.server_groups.list_groups.call_count == 1
+
+    def test_cache_ttl_zero_relists(self, mock_client, lookup):
+        lookup.run(
+            ["server_group", "web-servers"], provider=DEFAULT_PROVIDER, cache_ttl=0
+        )
+        lookup.run(
+            ["server_group", "web-servers"], provider=DEFAULT_PROVIDER, cache_ttl=0
+        )
+        assert mock_client.server_groups.list_groups.call_count == 2
+
+    def test_missing_name_strict(self, mock_client, lookup):
+        with pytest.raises(AnsibleLookupError) as exc:
+            lookup.run(["server_group", "nope"], provider=DEFAULT_PROVIDER)
+        assert "nope" in str(exc.value)
+
+    def test_missing_name_ignore(self, mock_client, lookup):
+        result = lookup.run(
+            ["server_group", "nope", "web-servers"],
+            provider=DEFAULT_PROVIDER,
+            errors="ignore",
+        )
+        assert result == [None, "1"]
+
+    def test_unknown_resource_type(self, lookup):
+        with pytest.raises(AnsibleLookupError) as exc:
+            lookup.run(["widgets", "a"], provider=DEFAULT_PROVIDER)
+        assert "Unsupported resource type" in str(exc.value)
+
+    def test_parent_name_resolution(self, mock_client, lookup):
+        mock_client.idp.list_idps.return_value = (
+            [MockItem({"id": "77", "name": "Okta"})],
+            None,
+        )
+        mock_client.scim_groups.list_scim_groups.return_value = (
+            [MockItem({"id": "900", "name": "Engineering"})],
+            None,
+        )
+        result = lookup.run(
+            ["scim_group", "Engineering"],
+            provider=DEFAULT_PROVIDER,
+            parent_name="Okta",
+        )
+        assert result == ["900"]
+        call = mock_client.scim_groups.list_scim_groups.call_args
+        assert call.kwargs["idp_id"] == "77"
+
+    def test_parent_required(self, mock_client, lookup):
+        with pytest.raises(AnsibleLookupError) as exc:
+            lookup.run(["scim_group", "Engineering"], provider=DEFAULT_PROVIDER)
+        assert "parent" in str(exc.value)
+
+    def test_list_error(self, mock_client, lookup):
+        mock_client.server_groups.list_groups.return_value = (None, "boom")
+        with pytest.raises(AnsibleLookupError) as exc:
+            lookup.run(["server_group", "web-servers"], provider=DEFAULT_PROVIDER)
+        assert "boom" in str(exc.value)
+
+    def test_incremental_keeps_listing_across_runs(self, mock_client, lookup):
+        lookup.run(
+            ["server_group", "web-servers"],
+            provider=DEFAULT_PROVIDER,
+            incremental=True,
+            cache_ttl=0,
+        )
+        lookup.run(
+            ["server_group", "web-servers"],
+            provider=DEFAULT_PROVIDER,
+            incremental=True,
+            cache_ttl=0,
+        )
+        second_call = mock_client.server_groups.list_groups.call_args_list[1]
+        assert second_call.kwargs["query_params"]["sort_by"] == "modifiedTime"
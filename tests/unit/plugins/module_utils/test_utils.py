@@ -19,6 +19,9 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
     is_number,
     in_list,
     seconds_to_human_readable,
+    project_fields,
+    closest_names,
+    did_you_mean,
 )
 
 
@@ -859,3 +862,92 @@ class TestDeleteNoneAdvanced:
         input_dict = {"a": 1, None: "value"}
         result = deleteNone(input_dict)
         assert None not in result
+
+
+class TestIterItemPages:
+    """Tests for the page-by-page listing generator."""
+
+    def test_yields_each_page(self):
+        from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
+            iter_item_pages,
+        )
+
+        class MockResp:
+            def __init__(self, pages):
+                self._pages = pages
+
+            def has_next(self):
+                return bool(self._pages)
+
+            def next(self):
+                return (self._pages[0], MockResp(self._pages[1:]), None)
+
+        def mock_list_fn(query_params):
+            return (["item1"], MockResp([["item2"], ["item3"]]), None)
+
+        pages = list(iter_item_pages(mock_list_fn, {}))
+        assert pages == [(["item1"], None), (["item2"], None), (["item3"], None)]
+
+    def test_stops_on_error(self):
+        from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
+            iter_item_pages,
+        )
+
+        def mock_list_fn(query_params):
+            return (None, "API Error")
+
+        assert list(iter_item_pages(mock_list_fn, {})) == [(None, "API Error")]
+
+
+class TestProjectFields:
+    """Tests for project_fields"""
+
+    ITEM = {
+        "id": "1",
+        "name": "crm",
+        "config": {"name": "receiver", "enabled": True},
+        "server_groups": [{"id": "10", "name": "a"}, {"id": "11", "name": "b"}],
+    }
+
+    def test_no_fields_returns_items(self):
+        items = [self.ITEM]
+        assert project_fields(items, None) is items
+
+    def test_top_level_and_dotted(self):
+        result = project_fields([self.ITEM], ["id", "config.name", "missing"])
+        assert result == [{"id": "1", "config": {"name": "receiver"}}]
+
+    def test_dotted_path_through_list(self):
+        result = project_fields([self.ITEM], ["server_groups.id"])
+        assert result == [{"server_groups": [{"id": "10"}, {"id": "11"}]}]
+
+    def test_parent_and_child_path(self):
+        result = project_fields([self.ITEM], ["config", "config.name"])
+        assert result == [{"config": {"name": "receiver"}}]
+
+
+class TestClosestNames:
+    """Tests for the bounded "did you mean" suggestions."""
+
+    NAMES = [f"crm-app-{i}" for i in range(2000)] + ["CRM Portal", "finance", None]
+
+    def test_ranks_by_edit_distance(self):
+        assert closest_names("crm-ap-17", self.NAMES, limit=3) == [
+            "crm-app-17",
+            "crm-app-117",
+            "crm-app-170",
+        ]
+
+    def test_is_case_insensitive(self):
+        assert closest_names("crm portal", self.NAMES) == ["CRM Portal"]
+
+    def test_no_close_match(self):
+        assert closest_names("zzz", self.NAMES) == []
+        assert closest_names("payroll", self.NAMES) == []
+
+    def test_did_you_mean(self):
+        assert did_you_mean("Finanse", self.NAMES) == " Did you mean: 'finance'?"
+        assert did_you_mean("zzz", self.NAMES) == ""
+
+    def test_output_is_bounded(self):
+        assert len(closest_names("crm-app-1", self.NAMES)) == 5
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+# MIT License
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import asyncio
+import threading
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_async import (  # noqa: E402
+    AsyncZPATransport,
+)
+
+BASE = "/zpa/mgmtconfig/v1/admin/customers/123"
+
+
+class FakeExecutor:
+    """The parts of the SDK RequestExecutor used by the transport."""
+
+    customer_id = "123"
+    _max_retries = 2
+    _request_timeout = 30
+
+    def __init__(self, base_url):
+        self.base_url = base_url
+        self.token = 0
+        self._oauth = self
+
+    def clear_access_token(self):
+        self.token += 1
+
+    def create_request(self, method, endpoint, body=None, params=None):
+        request = {
+            "url": self.base_url + endpoint,
+            "params": params,
+            "headers": {"Authorization": f"Bearer t{self.token}"},
+            "json": body,
+        }
+        return request, None
+
+    def get_retry_after(self, headers, logger):
+        return 0 if "Retry-After" in headers else None
+
+
+@pytest.fixture
+def server():
+    """A local aiohttp server standing in for the ZPA API."""
+    state = {"in_flight": 0, "max_in_flight": 0, "deleted": [], "fail": {}}
+    groups = [{"id": str(i), "modifiedTime": str(i)} for i in range(7)]
+
+    async def tracked(handler, request):
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        try:
+            await asyncio.sleep(0.01)
+            failure = state["fail"].pop(request.path, None)
+            if failure:
+                return failure
+            if request.headers.get("Authorization") == "Bearer t0":
+                return web.json_response({"id": "expired"}, status=401)
+            return await handler(request)
+        finally:
+            state["in_flight"] -= 1
+
+    async def list_groups(request):
+        page = int(request.query["page"])
+        size = int(request.query["page_size"])
+        state.setdefault("pages", []).append(page)
+        return web.json_response(
+            {
+                "totalPages": str(-(-len(groups) // size)),
+                "list": groups[(page - 1) * size : page * size],
+            }
+        )
+
+    async def delete_group(request):
+        state["deleted"].append((request.match_info["id"], dict(request.query)))
+        return web.Response(status=204)
+
+    app = web.Application()
+    app.router.add_get(BASE + "/segmentGroup", lambda r: tracked(list_groups, r))
+    app.router.add_delete(
+        BASE + "/segmentGroup/{id}", lambda r: tracked(delete_group, r)
+    )
+
+    loop = asyncio.new_event_loop()
+    runner = web.AppRunner(app)
+    loop.run_until_complete(runner.setup())
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    loop.run_until_complete(site.start())
+    port = site._server.sockets[0].getsockname()[1]
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{port}", state
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.run_until_complete(runner.cleanup())
+    loop.close()
+
+
+@pytest.fixture
+def transport(server):
+    base_url, _ = server
+    executor = FakeExecutor(base_url)
+    executor.token = 1
+    return AsyncZPATransport(executor, concurrency=2)
+
+
+class TestAsyncZPATransport:
+    def test_list_all_fetches_remaining_pages(self, server, transport, monkeypatch):
+        monkeypatch.setattr(
+            "ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_async.PAGE_SIZE",
+            3,
+        )
+        [(items, err)] = transport.run(transport.list_all("/segmentGroup"))
+        assert err is None
+        assert [i["id"] for i in items] == [str(i) for i in range(7)]
+        assert items[0] == {"id": "0", "modified_time": "0"}
+        assert sorted(server[1]["pages"]) == [1, 2, 3]
+
+    def test_concurrency_is_bounded(self, server, transport):
+        results = transport.run(
+            *[
+                transport.delete(f"/segmentGroup/{i}", params={"force_delete": True})
+                for i in range(6)
+            ]
+        )
+        state = server[1]
+        assert results == [({}, None)] * 6
+        assert sorted(state["deleted"]) == [
+            (str(i), {"force_delete": "true"}) for i in range(6)
+        ]
+        assert state["max_in_flight"] == 2
+
+    def test_expired_token_is_refreshed_once(self, server):
+        executor = FakeExecutor(server[0])
+        transport = AsyncZPATransport(executor, concurrency=4)
+        results = transport.run(
+            *[transport.delete(f"/segmentGroup/{i}") for i in range(4)]
+        )
+        assert results == [({}, None)] * 4
+        assert executor.token == 1
+
+    def test_rate_limited_requests_are_retried(self, server, transport):
+        server[1]["fail"][BASE + "/segmentGroup/1"] = web.json_response(
+            {"id": "too.many.requests"}, status=429, headers={"Retry-After": "0s"}
+        )
+        [(result, err)] = transport.run(transport.delete("/segmentGroup/1"))
+        assert err is None
+        assert server[1]["deleted"] == [("1", {})]
+
+    def test_errors_are_returned(self, server, transport):
+        server[1]["fail"][BASE + "/segmentGroup/1"] = web.json_response(
+            {"id": "resource.in.use", "reason": "Segment group is in use"},
+            status=400,
+        )
+        [(result, err)] = transport.run(transport.delete("/segmentGroup/1"))
+        assert result is None
+        assert "400" in err and "Segment group is in use" in err
+
+    def test_requests_need_a_session(self, transport):
+        coroutine = transport.delete("/segmentGroup/1")
+        with pytest.raises(RuntimeError):
+            asyncio.run(coroutine)
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+# MIT License
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils import zpa_cache
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_cache import (
+    ZPACache,
+    name_index_cache,
+    run_cache,
+    tenant_scope,
+)
+
+
+class TestZPACache:
+    """Tests for the shared TTL cache."""
+
+    def test_set_and_get(self):
+        cache = ZPACache("test", scope="tenant-a")
+        cache.set("server_group", {"web": "1"})
+        assert cache.get("server_group") == {"web": "1"}
+
+    def test_value_survives_memory_reset(self):
+        cache = ZPACache("test", scope="tenant-a")
+        cache.set("server_group", {"web": "1"})
+        zpa_cache._MEMORY.clear()
+        assert ZPACache("test", scope="tenant-a").get("server_group") == {"web": "1"}
+
+    def test_scopes_are_isolated(self):
+        ZPACache("test", scope="tenant-a").set("key", "a")
+        assert ZPACache("test", scope="tenant-b").get("key") is None
+
+    def test_expired_entry(self, mocker):
+        cache = ZPACache("test", scope="tenant-a", ttl=10)
+        cache.set("key", "value")
+        mocker.patch.object(zpa_cache.time, "time", return_value=10**12)
+        assert cache.get("key") is None
+
+    def test_zero_ttl_disables_cache(self):
+        cache = ZPACache("test", scope="tenant-a", ttl=0)
+        cache.set("key", "value")
+        assert cache.get("key") is None
+
+    def test_disabled_by_environment(self, monkeypatch):
+        monkeypatch.setenv("ZPA_CACHE_DISABLED", "true")
+        cache = ZPACache("test", scope="tenant-a")
+        cache.set("key", "value")
+        assert cache.get("key") is None
+
+    def test_invalidate(self):
+        cache = ZPACache("test", scope="tenant-a")
+        cache.set("key", "value")
+        cache.invalidate("key")
+        assert cache.get("key") is None
+
+
+class TestTenantScope:
+    """Tests for tenant_scope."""
+
+    def test_same_params_same_scope(self):
+        params = {"provider": {"client_id": "abc", "vanity_domain": "acme"}}
+        assert tenant_scope(params) == tenant_scope(dict(params))
+
+    def test_different_tenants(self):
+        a = tenant_scope({"provider": {"vanity_domain": "acme"}})
+        b = tenant_scope({"provider": {"vanity_domain": "other"}})
+        assert a != b
+
+    def test_secret_not_part_of_scope(self):
+        a = tenant_scope({"provider": {"client_id": "abc", "client_secret": "x"}})
+        b = tenant_scope({"provider": {"client_id": "abc", "client_secret": "y"}})
+        assert a == b
+
+    def test_run_cache_changes_with_run_id(self, monkeypatch):
+        params = {"provider": {"vanity_domain": "acme"}}
+        monkeypatch.setenv("ZPA_CACHE_RUN_ID", "run-1")
+        first = run_cache("test", params, 300)
+        first.set("key", "value")
+        monkeypatch.setenv("ZPA_CACHE_RUN_ID", "run-2")
+        second = run_cache("test", params, 300)
+
+        assert first.scope.startswith(tenant_scope(params))
+        assert first.persist and second.persist
+        assert second.get("key") is None
+        assert name_index_cache(params).scope == second.scope
+
+    def test_run_cache_without_run_id_stays_in_memory(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("ZPA_CACHE_RUN_ID", raising=False)
+        params = {"provider": {"vanity_domain": "acme"}}
+        cache = name_index_cache(params)
+        cache.set("key", "value")
+
+        assert cache.persist is False
+        assert cache.get("key") == "value"
+        assert not (tmp_path / "zpa_cache" / "name_index").exists()
+        zpa_cache._MEMORY.clear()
+        assert cache.get("key") is None
+
+    def test_controller_run_cache_uses_the_parent_process(self, monkeypatch):
+        monkeypatch.delenv("ZPA_CACHE_RUN_ID", raising=False)
+        monkeypatch.setattr(zpa_cache.os, "getppid", lambda: 4242)
+        cache = run_cache("test", {}, 300, controller=True)
+        assert cache.persist is True
+        assert cache.scope.endswith(":4242")
@@ -805,3 +805,121 @@ class TestZPAClientHelper:
         ZPAClientHelper(mock_module)
         call_args = mock_oneapi.call_args[0][0]
         assert "cloud" not in call_args
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch(
+        "ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client.HAS_ZSCALER",
+        True,
+    )
+    @patch(
+        "ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client.HAS_VERSION",
+        True,
+    )
+    @patch(
+        "ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client.OneAPIClient"
+    )
+    def test_async_transport_shares_request_executor(self, mock_oneapi):
+        """The async transport builds its requests with the client's executor."""
+        from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+            ZPAClientHelper,
+        )
+
+        executor = MagicMock(spec=["create_request", "customer_id", "_max_retries"])
+        executor.customer_id = "123"
+        executor._max_retries = 3
+        mock_oneapi.return_value = MagicMock(_request_executor=executor)
+
+        mock_module = create_mock_module(
+            {
+                "provider": {
+                    "client_id": "cid",
+                    "client_secret": "csecret",
+                    "vanity_domain": "test.zscaler.com",
+                },
+                "use_legacy_client": False,
+            }
+        )
+
+        transport = ZPAClientHelper(mock_module).async_transport(concurrency=4)
+        assert transport._executor is executor
+        assert transport._concurrency == 4
+        assert transport._max_retries == 3
+        assert transport.endpoint("/segmentGroup") == (
+            "/zpa/mgmtconfig/v1/admin/customers/123/segmentGroup"
+        )
+        assert transport.endpoint("/credential-pool", "v1", "waap-pra-config") == (
+            "/zpa/waap-pra-config/v1/admin/customers/123/credential-pool"
+        )
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch(
+        "ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client.HAS_ZSCALER",
+        True,
+    )
+    @patch(
+        "ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client.HAS_VERSION",
+        True,
+    )
+    @patch(
+        "ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client.OneAPIClient"
+    )
+    def test_list_raw_skips_models(self, mock_oneapi):
+        """list_raw returns the JSON objects with snake_case keys, page by page."""
+        import json
+
+        from ansible_collections.zscaler.zpacloud.plugins.module_utils.utils import (
+            collect_all_items,
+        )
+        from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+            ZPAClientHelper,
+        )
+
+        pages = [
+            {
+                "totalPages": "2",
+                "list": [{"id": "1", "segmentGroupId": "7", "serverGroups": []}],
+            },
+            {"totalPages": "2", "list": [{"id": "2", "tcpPortRange": [{"from": "1"}]}]},
+        ]
+
+        def fire_request(request):
+            page = int(request["params"].get("page", 1))
+            response = MagicMock(
+                status_code=200, headers={"Content-Type": "application/json"}
+            )
+            return request, response, json.dumps(pages[page - 1]), None
+
+        executor = MagicMock(
+            spec=["create_request", "fire_request", "execute", "customer_id"]
+        )
+        executor.customer_id = "123"
+        executor.create_request.side_effect = lambda method, url, params: (
+            {"method": method, "url": url, "params": params, "headers": {}},
+            None,
+        )
+        executor.fire_request.side_effect = fire_request
+        mock_oneapi.return_value = MagicMock(_request_executor=executor)
+
+        mock_module = create_mock_module(
+            {
+                "provider": {
+                    "client_id": "cid",
+                    "client_secret": "csecret",
+                    "vanity_domain": "test.zscaler.com",
+                },
+                "use_legacy_client": False,
+            }
+        )
+        client = ZPAClientHelper(mock_module)
+
+        items, err = collect_all_items(lambda qp: client.list_raw("/application", qp))
+        assert err is None
+        assert items == [
+            {"id": "1", "segment_group_id": "7", "server_groups": []},
+            {"id": "2", "tcp_port_range": [{"from": "1"}]},
+        ]
+        call = executor.create_request.call_args
+        url, params = call.args[1], call.kwargs["params"]
+        assert url == "/zpa/mgmtconfig/v1/admin/customers/123/application"
+        assert params["page_size"] == "500"
+        executor.execute.assert_not_called()
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+# MIT License
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_conditions import (
+    resolve_condition_names,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_cache import (
+    ZPACache,
+)
+
+
+@pytest.fixture
+def cache():
+    return ZPACache("name_index", scope="test", ttl=300)
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.application_segment.list_segments.return_value = (
+        [{"id": "11", "name": "crm"}, {"id": "12", "name": "hr"}],
+        None,
+    )
+    client.idp.list_idps.return_value = ([{"id": "100", "name": "Okta"}], None)
+    client.scim_groups.list_scim_groups.return_value = (
+        [{"id": "7", "name": "Engineering"}],
+        None,
+    )
+    client.posture_profiles.list_posture_profiles.return_value = (
+        [{"id": "5", "name": "CrowdStrike", "posture_udid": "udid-5"}],
+        None,
+    )
+    return client
+
+
+def test_resolves_names_in_place(client, cache):
+    conditions = [
+        {
+            "operator": "OR",
+            "operands": [
+                {"object_type": "APP", "values": ["9"], "names": ["crm", "hr"]},
+                {"object_type": "APP", "names": ["crm"], "entry_values": None},
+            ],
+        },
+        {
+            "operator": "AND",
+            "operands": [
+                {
+                    "object_type": "SCIM_GROUP",
+                    "entry_values": {"lhs_name": "Okta", "rhs_name": "Engineering"},
+                },
+                {
+                    "object_type": "POSTURE",
+                    "entry_values": {"lhs_name": "CrowdStrike", "rhs": "true"},
+                },
+            ],
+        },
+    ]
+    assert resolve_condition_names(client, conditions, cache) == []
+
+    app, app2 = conditions[0]["operands"]
+    scim, posture = conditions[1]["operands"]
+    assert app == {"object_type": "APP", "values": ["9", "11", "12"]}
+    assert app2["values"] == ["11"]
+    assert scim["entry_values"] == {"lhs": "100", "rhs": "7"}
+    assert posture["entry_values"] == {"lhs": "udid-5", "rhs": "true"}
+    client.application_segment.list_segments.assert_called_once()
+    client.scim_groups.list_scim_groups.assert_called_once()
+    assert client.scim_groups.list_scim_groups.call_args.kwargs["idp_id"] == "100"
+
+
+def test_indexes_are_shared_and_refreshed_on_miss(client, cache):
+    resolve_condition_names(
+        client, [{"operands": [{"object_type": "APP", "names": ["crm"]}]}], cache
+    )
+    resolve_condition_names(
+        client, [{"operands": [{"object_type": "APP", "names": ["hr"]}]}], cache
+    )
+    assert client.application_segment.list_segments.call_count == 1
+
+    client.application_segment.list_segments.return_value = (
+        [{"id": "13", "name": "new"}],
+        None,
+    )
+    conditions = [{"operands": [{"object_type": "APP", "names": ["new"]}]}]
+    assert resolve_condition_names(client, conditions, cache) == []
+    assert conditions[0]["operands"][0]["values"] == ["13"]
+    assert client.application_segment.list_segments.call_count == 2
+
+
+def test_reports_missing_names(client, cache):
+    conditions = [
+        {
+            "operands": [
+                {"object_type": "APP", "names": ["crm", "gone"]},
+                {
+                    "object_type": "SCIM_GROUP",
+                    "entry_values": {"lhs_name": "Okta", "rhs_name": "Interns"},
+                },
+            ]
+        }
+    ]
+    assert resolve_condition_names(client, conditions, cache) == [
+        "APP: gone",
+        "SCIM_GROUP: Interns",
+    ]
+
+
+def test_names_on_unsupported_type(client, cache):
+    conditions = [{"operands": [{"object_type": "PLATFORM", "names": ["linux"]}]}]
+    with pytest.raises(ValueError, match="not supported for PLATFORM"):
+        resolve_condition_names(client, conditions, cache)
+
+
+def test_list_error(client, cache):
+    client.application_segment.list_segments.return_value = (None, None, "boom")
+    conditions = [{"operands": [{"object_type": "APP", "names": ["crm"]}]}]
+    with pytest.raises(RuntimeError, match="boom"):
+        resolve_condition_names(client, conditions, cache)
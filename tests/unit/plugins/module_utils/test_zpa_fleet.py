@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+# MIT License
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from unittest.mock import MagicMock
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_fleet import (
+    epoch_seconds,
+    profile_versions,
+    summarize_fleet,
+    version_compliance,
+    version_key,
+)
+
+
+def connector(idx, status, version, group, last_seen, upgrade="COMPLETE"):
+    return {
+        "id": str(idx),
+        "name": f"connector-{idx}",
+        "enabled": idx % 2 == 0,
+        "control_channel_status": status,
+        "current_version": version,
+        "app_connector_group_name": group,
+        "upgrade_status": upgrade,
+        "last_broker_connect_time": last_seen,
+    }
+
+
+def paged_client(*pages):
+    """Client whose raw listing returns ``pages`` through response.next()."""
+    client = MagicMock()
+    resp = MagicMock()
+    rest = list(pages[1:])
+    resp.has_next.side_effect = lambda: bool(rest)
+    resp.next.side_effect = lambda: (rest.pop(0), resp, None)
+    client.list_raw.return_value = (pages[0], resp, None)
+    return client
+
+
+class TestHelpers:
+    def test_version_key(self):
+        assert version_key("24.103.2") > version_key("24.90.5")
+        assert version_key("v23.5") == (23, 5)
+
+    def test_epoch_seconds(self):
+        assert epoch_seconds("1700000000") == 1700000000
+        assert epoch_seconds(1700000000123) == 1700000000.123
+        assert epoch_seconds("") is None
+        assert epoch_seconds(None) is None
+
+
+class TestSummarizeFleet:
+    def test_aggregates_across_pages(self):
+        client = paged_client(
+            [
+                connector(1, "ZPN_STATUS_AUTHENTICATED", "24.103.2", "A", "1700000500"),
+                connector(2, "ZPN_STATUS_DISCONNECTED", "24.90.5", "A", "1700000100"),
+            ],
+            [
+                connector(
+                    3, "ZPN_STATUS_AUTHENTICATED", "24.103.2", "B", "1700000900000"
+                ),
+                connector(4, None, None, None, "", upgrade=None),
+                connector(5, "ZPN_STATUS_DISCONNECTED", "9.1", "B", "1700000300"),
+            ],
+        )
+
+        summary, err = summarize_fleet(client, "app_connector", top=2)
+
+        assert err is None
+        assert client.list_raw.call_args[0][0] == "/connector"
+        assert summary == {
+            "total": 5,
+            "enabled": 2,
+            "never_connected": 1,
+            "by_status": {
+                "ZPN_STATUS_AUTHENTICATED": 2,
+                "ZPN_STATUS_DISCONNECTED": 2,
+                "UNKNOWN": 1,
+            },
+            "by_version": {"UNKNOWN": 1, "9.1": 1, "24.90.5": 1, "24.103.2": 2},
+            "by_group": {"A": 2, "B": 2, "UNKNOWN": 1},
+            "by_upgrade_status": {"COMPLETE": 4, "UNKNOWN": 1},
+            "oldest_last_seen": [
+                {"id": "2", "name": "connector-2", "last_seen": 1700000100},
+                {"id": "5", "name": "connector-5", "last_seen": 1700000300},
+            ],
+        }
+        assert list(summary["by_version"]) == ["UNKNOWN", "9.1", "24.90.5", "24.103.2"]
+
+    def test_service_edge_groups(self):
+        edge = {
+            "id": "1",
+            "name": "pse-1",
+            "service_edge_group_name": "PSE",
+            "last_broker_connect_time": "1700000000",
+        }
+        client = paged_client([edge])
+
+        summary, err = summarize_fleet(client, "service_edge", top=0)
+
+        assert err is None
+        assert client.list_raw.call_args[0][0] == "/serviceEdge"
+        assert summary["by_group"] == {"PSE": 1}
+        assert summary["oldest_last_seen"] == []
+
+    def test_error(self):
+        client = MagicMock()
+        client.list_raw.return_value = (None, None, "boom")
+
+        assert summarize_fleet(client, "app_connector") == (None, "boom")
+
+
+PROFILES = {
+    "0": {"id": "0", "name": "Default", "version_details": []},
+    "2": {
+        "id": "2",
+        "name": "New Release",
+        "version_details": [
+            {"role": "zpa-connector", "version": "24.103.2"},
+            {"role": "zpa-connector", "version": "24.103.3"},
+            {"role": "zpa-pse", "version": "24.50.1"},
+        ],
+    },
+}
+
+
+def raw_client(listings):
+    """Client whose raw listing returns ``listings[endpoint]`` as one page."""
+    client = MagicMock()
+    client.list_raw.side_effect = lambda path, qp, **kw: (listings[path], None, None)
+    return client
+
+
+class TestVersionCompliance:
+    def test_profile_versions(self):
+        assert profile_versions(PROFILES["2"], "app_connector") == {
+            "24.103.2",
+            "24.103.3",
+        }
+        assert profile_versions(PROFILES["2"], "service_edge") == {"24.50.1"}
+
+    def test_joins_groups_profiles_and_instances(self):
+        client = raw_client(
+            {
+                "/appConnectorGroup": [
+                    {"id": "10", "name": "Branches", "version_profile_id": "2"},
+                    {"id": "20", "name": "Lab"},
+                ],
+                "/connector": [
+                    {
+                        "id": "1",
+                        "name": "c1",
+                        "app_connector_group_id": "10",
+                        "current_version": "24.103.3",
+                    },
+                    {
+                        "id": "2",
+                        "name": "c2",
+                        "app_connector_group_id": "10",
+                        "current_version": "24.90.5",
+                    },
+                    {
+                        "id": "3",
+                        "name": "c3",
+                        "app_connector_group_id": "20",
+                        "current_version": "1.0",
+                    },
+                    {"id": "4", "name": "orphan", "app_connector_group_id": "99"},
+                ],
+            }
+        )
+
+        groups, out, err = version_compliance(client, "app_connector", PROFILES)
+
+        assert err is None
+        assert groups == [
+            {
+                "id": "10",
+                "name": "Branches",
+                "component": "app_connector",
+                "version_profile_id": "2",
+                "version_profile_name": "New Release",
+                "allowed_versions": ["24.103.2", "24.103.3"],
+                "total": 2,
+                "compliant": 1,
+                "out_of_profile": 1,
+                "compliant_pct": 50.0,
+            },
+            {
+                "id": "20",
+                "name": "Lab",
+                "component": "app_connector",
+                "version_profile_id": "0",
+                "version_profile_name": "Default",
+                "allowed_versions": [],
+                "total": 1,
+                "compliant": 1,
+                "out_of_profile": 0,
+                "compliant_pct": 100.0,
+            },
+        ]
+        assert out == [
+            {
+                "id": "2",
+                "name": "c2",
+                "component": "app_connector",
+                "group_id": "10",
+                "group_name": "Branches",
+                "current_version": "24.90.5",
+                "allowed_versions": ["24.103.2", "24.103.3"],
+            }
+        ]
+
+    def test_service_edges(self):
+        client = raw_client(
+            {
+                "/serviceEdgeGroup": [
+                    {"id": "30", "name": "PSE", "version_profile_id": "2"}
+                ],
+                "/serviceEdge": [
+                    {
+                        "id": "5",
+                        "name": "pse-1",
+                        "service_edge_group_id": "30",
+                        "current_version": "24.50.1",
+                    }
+                ],
+            }
+        )
+
+        groups, out, err = version_compliance(client, "service_edge", PROFILES)
+
+        assert err is None
+        assert groups[0]["allowed_versions"] == ["24.50.1"]
+        assert groups[0]["compliant"] == 1
+        assert out == []
+
+    def test_error(self):
+        client = MagicMock()
+        client.list_raw.return_value = (None, None, "boom")
+
+        assert version_compliance(client, "app_connector", PROFILES) == (
+            None,
+            None,
+            "boom",
+        )
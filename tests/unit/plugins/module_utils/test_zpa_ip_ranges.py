@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+# MIT License
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_ip_ranges import (
+    RangeIndex,
+    overlap_errors,
+    range_bounds,
+)
+
+
+def cidr(name, value):
+    return {"name": name, "subnet_cidr": value}
+
+
+def span(name, begin, end=None):
+    return {"name": name, "ip_range_begin": begin, "ip_range_end": end}
+
+
+class TestRangeBounds:
+    def test_cidr(self):
+        assert range_bounds(cidr("a", "10.0.0.0/30")) == (4, 167772160, 167772163)
+
+    def test_begin_end(self):
+        assert range_bounds(span("a", "10.0.0.1", "10.0.0.2")) == (
+            4,
+            167772161,
+            167772162,
+        )
+
+    def test_single_address(self):
+        assert range_bounds(span("a", "::1")) == (6, 1, 1)
+
+    def test_no_addresses(self):
+        assert range_bounds({"name": "a"}) is None
+
+    @pytest.mark.parametrize(
+        "item, msg",
+        [
+            (span("a", "10.0.0.9", "10.0.0.1"), "begins after it ends"),
+            (span("a", "10.0.0.1", "::1"), "mixes IPv4 and IPv6"),
+            (span("a", "not-an-ip"), "Invalid address"),
+        ],
+    )
+    def test_invalid(self, item, msg):
+        with pytest.raises(ValueError, match=msg):
+            range_bounds(item)
+
+
+class TestRangeIndex:
+    RANGES = [
+        cidr("wide", "10.0.0.0/8"),
+        span("branch", "192.168.1.1", "192.168.1.254"),
+        cidr("lab", "192.168.2.0/24"),
+        cidr("v6", "2001:db8::/32"),
+        {"name": "empty"},
+    ]
+
+    def test_overlapping(self):
+        index = RangeIndex(self.RANGES)
+
+        assert [r["name"] for r in index.overlapping(cidr("q", "10.1.0.0/16"))] == [
+            "wide"
+        ]
+        assert [
+            r["name"]
+            for r in index.overlapping(span("q", "192.168.1.200", "192.168.2.5"))
+        ] == ["branch", "lab"]
+        assert index.overlapping(cidr("q", "192.168.3.0/24")) == []
+        assert [r["name"] for r in index.overlapping(cidr("q", "2001:db8:1::/48"))] == [
+            "v6"
+        ]
+
+    def test_long_range_found_behind_short_ones(self):
+        # The query starts after several short ranges that all start later than
+        # the wide one, so the index must walk past them.
+        ranges = [cidr("wide", "10.0.0.0/8")] + [
+            cidr(f"s{i}", f"10.{i}.0.0/24") for i in range(1, 6)
+        ]
+        index = RangeIndex(ranges)
+
+        assert [r["name"] for r in index.overlapping(cidr("q", "10.200.0.0/24"))] == [
+            "wide"
+        ]
+
+    def test_exclude(self):
+        index = RangeIndex(self.RANGES)
+
+        assert index.overlapping(cidr("q", "10.1.0.0/16"), exclude={"wide"}) == []
+
+    def test_overlap_errors_reports_each_pair_once(self):
+        a = cidr("a", "10.0.0.0/24")
+        b = span("b", "10.0.0.128", "10.0.1.10")
+        index = RangeIndex([a, b, cidr("c", "10.9.0.0/24")])
+
+        assert overlap_errors(index, [a, b]) == [
+            "'a' (10.0.0.0/24) overlaps 'b' (10.0.0.128-10.0.1.10)"
+        ]
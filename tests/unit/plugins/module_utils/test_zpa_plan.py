@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+# MIT License
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import gzip
+import json
+
+import pytest
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_plan import (
+    TenantSnapshot,
+    build_plan,
+    diff_object,
+    summarize_plan,
+)
+
+
+def write_snapshot(path, resource_type, items, compress=True):
+    name = f"{resource_type}.jsonl.gz" if compress else f"{resource_type}.jsonl"
+    opener = gzip.open if compress else open
+    with opener(path / name, "wt", encoding="utf-8") as fh:
+        for item in items:
+            fh.write(json.dumps(item) + "\n")
+    return name
+
+
+ACCESS_RULE = {
+    "id": "9",
+    "name": "allow-crm",
+    "action": "ALLOW",
+    "policy_type": "1",
+    "rule_order": "3",
+    "modified_time": "1700000000",
+    "conditions": [
+        {
+            "operator": "OR",
+            "operands": [{"object_type": "APP_GROUP", "lhs": "id", "rhs": "55"}],
+        }
+    ],
+}
+
+
+class TestTenantSnapshot:
+    def test_load_from_manifest(self, tmp_path):
+        name = write_snapshot(tmp_path, "server_group", [{"id": "1", "name": "web"}])
+        (tmp_path / "manifest.json").write_text(
+            json.dumps({"resource_types": {"server_group": {"file": name}}})
+        )
+        snapshot = TenantSnapshot.load(str(tmp_path))
+        assert snapshot.get_by_name("server_group", "web")["id"] == "1"
+        assert snapshot.get_by_id("server_group", 1)["name"] == "web"
+
+    def test_load_without_manifest(self, tmp_path):
+        write_snapshot(tmp_path, "segment_group", [{"id": "2", "name": "crm"}], False)
+        snapshot = TenantSnapshot.load(str(tmp_path), ["segment_group"])
+        assert snapshot.find("segment_group", {"name": "crm"})["id"] == "2"
+        assert snapshot.find("segment_group", {"id": "2", "name": "other"})
+
+    def test_missing_resource_type(self, tmp_path):
+        with pytest.raises(ValueError):
+            TenantSnapshot.load(str(tmp_path), ["server_group"])
+
+
+class TestDiffObject:
+    def test_server_group_ignores_order_and_computed_fields(self):
+        current = {
+            "id": "1",
+            "name": "web",
+            "enabled": True,
+            "creation_time": "1",
+            "app_connector_groups": [{"id": "b"}, {"id": "a"}],
+        }
+        desired = {
+            "name": "web",
+            "enabled": True,
+            "app_connector_group_ids": ["a", "b"],
+        }
+        assert diff_object("server_group", desired, current) == {}
+
+    def test_application_segment_server_groups(self):
+        current = {
+            "name": "crm",
+            "server_groups": [{"id": "1"}, {"id": "2"}],
+            "tcp_port_range": [{"from": "443", "to": "443"}],
+        }
+        desired = {
+            "name": "crm",
+            "server_group_ids": ["2", "1"],
+            "tcp_port_range": [{"from": "443", "to": "443"}],
+            "description": None,
+        }
+        assert diff_object("application_segment", desired, current) == {}
+        desired["server_group_ids"] = ["1"]
+        assert set(diff_object("application_segment", desired, current)) == {
+            "server_group_ids"
+        }
+
+    def test_policy_conditions(self):
+        desired = {
+            "name": "allow-crm",
+            "action": "ALLOW",
+            "rule_order": "1",
+            "conditions": [
+                {
+                    "operator": "OR",
+                    "operands": [{"object_type": "APP_GROUP", "values": ["55"]}],
+                }
+            ],
+        }
+        assert diff_object("policy_access_rule", desired, ACCESS_RULE) == {}
+        desired["conditions"][0]["operands"][0]["values"] = ["56"]
+        assert "conditions" in diff_object("policy_access_rule", desired, ACCESS_RULE)
+        # the snapshot object itself is never mutated by normalization
+        assert ACCESS_RULE["conditions"][0]["operands"][0]["rhs"] == "55"
+
+
+class TestBuildPlan:
+    def _snapshot(self):
+        snapshot = TenantSnapshot()
+        snapshot.add("segment_group", {"id": "1", "name": "crm", "enabled": True})
+        snapshot.add("segment_group", {"id": "2", "name": "hr", "enabled": True})
+        snapshot.add("segment_group", {"id": "3", "name": "old", "enabled": False})
+        return snapshot
+
+    def test_actions(self):
+        desired = {
+            "segment_group": [
+                {"name": "crm", "enabled": True},
+                {"name": "hr", "enabled": False},
+                {"name": "new", "enabled": True},
+                {"name": "old", "state": "absent"},
+                {"name": "gone", "state": "absent"},
+            ]
+        }
+        plan = build_plan(self._snapshot(), desired)
+        actions = {(e["name"], e["action"]) for e in plan}
+        assert actions == {
+            ("crm", "noop"),
+            ("hr", "update"),
+            ("new", "create"),
+            ("old", "delete"),
+            ("gone", "noop"),
+        }
+        update = [e for e in plan if e["action"] == "update"][0]
+        assert update["diff"] == {"enabled": {"current": True, "desired": False}}
+        assert summarize_plan(plan) == {
+            "create": 1,
+            "update": 1,
+            "delete": 1,
+            "noop": 2,
+        }
+
+    def test_prune(self):
+        plan = build_plan(
+            self._snapshot(), {"segment_group": [{"name": "crm"}]}, prune=True
+        )
+        deletes = sorted(e["id"] for e in plan if e["action"] == "delete")
+        assert deletes == ["2", "3"]
+
+    def test_unsupported_type(self):
+        with pytest.raises(ValueError):
+            build_plan(TenantSnapshot(), {"lss_config": []})
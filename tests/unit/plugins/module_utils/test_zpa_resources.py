@@ -0,0 +1,382 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+# MIT License
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_resources import (
+    DELETE_TIERS,
+    RESOURCE_TYPES,
+    delete_tier,
+    build_name_index,
+    get_resource_type,
+    list_resource,
+    cached_listing,
+    forget_sub_apps,
+    index_sub_apps,
+    list_resource_incremental,
+    resolve_enrollment_cert_id,
+    resolve_idp_id,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_cache import (
+    ZPACache,
+)
+
+
+class MockItem:
+    def __init__(self, data):
+        self._data = data
+
+    def as_dict(self):
+        return self._data
+
+
+class TestResourceRegistry:
+    """Tests for the resource type registry."""
+
+    def test_unknown_type(self):
+        with pytest.raises(KeyError) as exc:
+            get_resource_type("nope")
+        assert "server_group" in str(exc.value)
+
+    def test_list_server_groups(self):
+        client = MagicMock()
+        client.server_groups.list_groups.return_value = (
+            [MockItem({"id": "1", "name": "web"})],
+            None,
+        )
+        items, err = list_resource(client, "server_group", microtenant_id="42")
+        assert err is None
+        assert items == [{"id": "1", "name": "web"}]
+        qp = client.server_groups.list_groups.call_args.kwargs["query_params"]
+        assert qp["microtenant_id"] == "42"
+
+    def test_list_policy_rules_passes_policy_type(self):
+        client = MagicMock()
+        client.policies.list_rules.return_value = ([], None)
+        list_resource(client, "policy_timeout_rule")
+        assert client.policies.list_rules.call_args.kwargs["policy_type"] == "timeout"
+
+    def test_list_scoped_to_parent(self):
+        client = MagicMock()
+        client.scim_groups.list_scim_groups.return_value = ([], None)
+        list_resource(client, "scim_group", parent_id="idp-1")
+        call = client.scim_groups.list_scim_groups.call_args
+        assert call.kwargs["idp_id"] == "idp-1"
+
+    def test_list_non_paginated(self):
+        client = MagicMock()
+        client.c2c_ip_ranges.list_ip_ranges.return_value = ([], None)
+        items, err = list_resource(client, "c2c_ip_range", microtenant_id="42")
+        assert items == [] and err is None
+        client.c2c_ip_ranges.list_ip_ranges.assert_called_once_with()
+
+    def test_list_error(self):
+        client = MagicMock()
+        client.server_groups.list_groups.return_value = (None, "boom")
+        items, err = list_resource(client, "server_group")
+        assert items is None
+        assert err == "boom"
+
+    def test_raw_listing_uses_endpoint(self):
+        client = MagicMock()
+        client.list_raw.return_value = ([{"id": "1", "name": "web"}], None, None)
+        items, err = list_resource(
+            client, "server_group", microtenant_id="42", raw=True
+        )
+        assert items == [{"id": "1", "name": "web"}] and err is None
+        path, qp = client.list_raw.call_args.args
+        assert path == "/serverGroup"
+        assert qp["microtenant_id"] == "42"
+        client.server_groups.list_groups.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "resource_type,api_version,base_path",
+        [
+            ("server_group", "v1", "mgmtconfig"),
+            ("idp", "v2", "mgmtconfig"),
+            ("trusted_network", "v2", "mgmtconfig"),
+            ("pra_credential_pool", "v1", "waap-pra-config"),
+        ],
+    )
+    def test_raw_listing_uses_api_of_the_type(
+        self, resource_type, api_version, base_path
+    ):
+        client = MagicMock()
+        client.list_raw.return_value = ([], None, None)
+        list_resource(client, resource_type, raw=True)
+        assert client.list_raw.call_args.kwargs == {
+            "api_version": api_version,
+            "base_path": base_path,
+        }
+
+    def test_raw_listing_falls_back_without_endpoint(self):
+        client = MagicMock()
+        client.policies.list_rules.return_value = ([MockItem({"id": "1"})], None)
+        items, err = list_resource(client, "policy_access_rule", raw=True)
+        assert items == [{"id": "1"}]
+        client.list_raw.assert_not_called()
+
+    def test_delete_uses_id_arg_and_microtenant(self):
+        client = MagicMock()
+        RESOURCE_TYPES["application_segment"].delete(client, "7", microtenant_id="42")
+        client.application_segment.delete_segment.assert_called_once_with(
+            segment_id="7", force_delete=True, microtenant_id="42"
+        )
+
+    def test_delete_policy_rule(self):
+        client = MagicMock()
+        RESOURCE_TYPES["policy_access_rule"].delete(client, "9")
+        client.policies.delete_rule.assert_called_once_with(
+            policy_type="access", rule_id="9"
+        )
+
+    def test_delete_unsupported(self):
+        with pytest.raises(ValueError):
+            RESOURCE_TYPES["idp"].delete(MagicMock(), "1")
+
+    def test_every_deletable_type_has_a_tier(self):
+        deletable = {rt for rt, t in RESOURCE_TYPES.items() if t.delete_method}
+        assert deletable == {rt for tier in DELETE_TIERS for rt in tier}
+        assert delete_tier("policy_access_rule") < delete_tier("application_segment")
+        assert delete_tier("application_segment") < delete_tier("server_group")
+        assert delete_tier("application_server") < delete_tier("app_connector_group")
+        with pytest.raises(KeyError):
+            delete_tier("idp")
+
+    def test_name_index_with_dotted_key(self):
+        rtype = RESOURCE_TYPES["lss_config"]
+        items = [
+            {"id": "1", "config": {"name": "receiver-a"}},
+            {"id": "2", "config": {"name": "receiver-b"}},
+        ]
+        assert build_name_index(rtype, items) == {"receiver-a": "1", "receiver-b": "2"}
+
+    def test_name_index_keeps_first_duplicate(self):
+        rtype = RESOURCE_TYPES["server_group"]
+        items = [{"id": "1", "name": "dup"}, {"id": "2", "name": "dup"}]
+        assert build_name_index(rtype, items) == {"dup": "1"}
+
+
+class MockResp:
+    """Paginated SDK response reporting a total count."""
+
+    def __init__(self, pages, total=None):
+        self._pages = pages
+        self._total = total
+
+    def has_next(self):
+        return bool(self._pages)
+
+    def next(self):
+        return (self._pages[0], MockResp(self._pages[1:]), None)
+
+    def get_body(self):
+        return {"totalCount": self._total}
+
+
+def segment(obj_id, modified):
+    return MockItem({"id": obj_id, "name": f"s{obj_id}", "modified_time": modified})
+
+
+class TestListResourceIncremental:
+    """Tests for the modified_time based incremental listing."""
+
+    @pytest.fixture
+    def cache(self):
+        return ZPACache("incremental", scope="test", ttl=3600)
+
+    @pytest.fixture
+    def client(self, cache):
+        client = MagicMock()
+        client.server_groups.list_groups.return_value = (
+            [segment("1", "100"), segment("2", "200")],
+            None,
+        )
+        items, err = list_resource_incremental(client, "server_group", cache)
+        assert err is None and len(items) == 2
+        return client
+
+    def test_delta_stops_at_watermark(self, client, cache):
+        older = [segment("1", "100")]
+        client.server_groups.list_groups.return_value = (
+            [segment("2", "300"), segment("3", "250")],
+            MockResp([older], total=3),
+            None,
+        )
+        items, err = list_resource_incremental(client, "server_group", cache)
+        assert err is None
+        assert {i["id"]: i["modified_time"] for i in items} == {
+            "1": "100",
+            "2": "300",
+            "3": "250",
+        }
+        qp = client.server_groups.list_groups.call_args.kwargs["query_params"]
+        assert qp["sort_by"] == "modifiedTime" and qp["sort_order"] == "DSC"
+
+    def test_count_mismatch_triggers_full_listing(self, client, cache):
+        first = ([segment("2", "200")], MockResp([], total=1), None)
+        full = ([segment("2", "200")], None)
+        client.server_groups.list_groups.side_effect = [first, full]
+        items, err = list_resource_incremental(client, "server_group", cache)
+        assert [i["id"] for i in items] == ["2"]
+        assert client.server_groups.list_groups.call_count == 3
+
+    def test_unsorted_response_is_used_as_full_listing(self, client, cache):
+        client.server_groups.list_groups.return_value = (
+            [segment("2", "200"), segment("4", "400"), segment("1", "100")],
+            MockResp([]),
+            None,
+        )
+        items, err = list_resource_incremental(client, "server_group", cache)
+        assert sorted(i["id"] for i in items) == ["1", "2", "4"]
+        assert client.server_groups.list_groups.call_count == 2
+
+    def test_stale_first_object_triggers_full_listing(self, client, cache):
+        client.server_groups.list_groups.return_value = (
+            [segment("1", "100"), segment("4", "400")],
+            MockResp([]),
+            None,
+        )
+        items, err = list_resource_incremental(client, "server_group", cache)
+        assert sorted(i["id"] for i in items) == ["1", "4"]
+        assert client.server_groups.list_groups.call_count == 3
+
+    def test_reconcile_interval(self, client, cache):
+        client.server_groups.list_groups.return_value = ([segment("5", "50")], None)
+        items, err = list_resource_incremental(
+            client, "server_group", cache, reconcile_interval=0
+        )
+        assert [i["id"] for i in items] == ["5"]
+        assert (
+            "sort_by"
+            not in client.server_groups.list_groups.call_args.kwargs["query_params"]
+        )
+
+
+class TestResolveEnrollmentCertId:
+    """Tests for the cached enrollment certificate lookup."""
+
+    @pytest.fixture
+    def cache(self):
+        return ZPACache("enrollment_cert", scope="test", ttl=3600)
+
+    def test_single_search_then_cached(self, cache):
+        client = MagicMock()
+        client.enrollment_certificates.list_enrolment.return_value = (
+            [
+                MockItem({"id": 7, "name": "Connector-Old"}),
+                MockItem({"id": 8, "name": "Connector"}),
+            ],
+            None,
+            None,
+        )
+        assert resolve_enrollment_cert_id(client, "Connector", cache) == ("8", None)
+        assert resolve_enrollment_cert_id(client, "Connector", cache) == ("8", None)
+        client.enrollment_certificates.list_enrolment.assert_called_once_with(
+            query_params={"search": "Connector"}
+        )
+
+    def test_not_found_is_not_cached(self, cache):
+        client = MagicMock()
+        client.enrollment_certificates.list_enrolment.return_value = ([], None, None)
+        assert resolve_enrollment_cert_id(client, "Service Edge", cache) == (None, None)
+        assert resolve_enrollment_cert_id(client, "Service Edge", cache) == (None, None)
+        assert client.enrollment_certificates.list_enrolment.call_count == 2
+
+    def test_error(self, cache):
+        client = MagicMock()
+        client.enrollment_certificates.list_enrolment.return_value = (
+            None,
+            None,
+            "boom",
+        )
+        assert resolve_enrollment_cert_id(client, "Connector", cache) == (None, "boom")
+
+
+class TestIdpDirectory:
+    """Tests for the IdP ID and per-IdP listing cache helpers."""
+
+    @pytest.fixture
+    def cache(self):
+        return ZPACache("idp_directory", scope="test", ttl=300)
+
+    def test_resolve_idp_id_is_cached(self, cache):
+        client = MagicMock()
+        client.idp.list_idps.return_value = (
+            [MockItem({"id": "11", "name": "Okta"})],
+            None,
+            None,
+        )
+        assert resolve_idp_id(client, "Okta", cache) == ("11", None)
+        assert resolve_idp_id(client, "Okta", cache) == ("11", None)
+        client.idp.list_idps.assert_called_once_with(query_params={"search": "Okta"})
+
+    def test_cached_listing(self, cache):
+        fetch = MagicMock(return_value=([MockItem({"id": "1", "name": "a"})], None))
+        assert cached_listing(cache, "k", fetch) == ([{"id": "1", "name": "a"}], None)
+        assert cached_listing(cache, "k", fetch) == ([{"id": "1", "name": "a"}], None)
+        fetch.assert_called_once_with()
+
+    def test_cached_listing_without_cache_or_on_error(self, cache):
+        fetch = MagicMock(return_value=(None, "boom"))
+        assert cached_listing(cache, "k", fetch) == (None, "boom")
+        fetch.return_value = ([{"id": "1"}], None)
+        assert cached_listing(None, "k", fetch) == ([{"id": "1"}], None)
+        assert cache.get("k") is None
+        assert fetch.call_count == 2
+
+
+class TestSubApps:
+    """Tests for the per-segment Browser Access / inspection sub-app index."""
+
+    @pytest.fixture
+    def cache(self):
+        return ZPACache("sub_apps", scope="test", ttl=60)
+
+    @pytest.fixture
+    def client(self):
+        client = MagicMock()
+        client.app_segment_by_type.get_segments_by_type.return_value = (
+            [
+                MockItem({"id": "b1", "app_id": "123", "domain": "a.example.com"}),
+                MockItem({"id": "b2", "app_id": "555", "domain": "b.example.com"}),
+            ],
+            None,
+            None,
+        )
+        return client
+
+    def test_index_is_scoped_to_the_segment(self, client, cache):
+        index, err = index_sub_apps(
+            client, "BROWSER_ACCESS", "123", cache=cache, microtenant_id="9"
+        )
+        assert err is None
+        assert list(index) == ["a.example.com"]
+        kwargs = client.app_segment_by_type.get_segments_by_type.call_args.kwargs
+        assert kwargs["application_type"] == "BROWSER_ACCESS"
+        assert kwargs["query_params"]["appId"] == "123"
+        assert kwargs["query_params"]["microtenant_id"] == "9"
+
+    def test_index_is_cached_until_forgotten(self, client, cache):
+        index_sub_apps(client, "INSPECT", "123", cache=cache)
+        index_sub_apps(client, "INSPECT", "123", cache=cache)
+        assert client.app_segment_by_type.get_segments_by_type.call_count == 1
+
+        forget_sub_apps(cache, "INSPECT", "123")
+        index_sub_apps(client, "INSPECT", "123", cache=cache)
+        assert client.app_segment_by_type.get_segments_by_type.call_count == 2
+
+    def test_index_error(self, client, cache):
+        client.app_segment_by_type.get_segments_by_type.return_value = (
+            None,
+            None,
+            "boom",
+        )
+        assert index_sub_apps(client, "INSPECT", "123", cache=cache) == (None, "boom")
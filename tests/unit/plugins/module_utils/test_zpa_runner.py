@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+# MIT License
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    ZPAClientHelper,
+)
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_runner import (
+    ListingCache,
+    SharedModuleContext,
+    import_module,
+    module_spec,
+    run_module,
+)
+from ansible_collections.zscaler.zpacloud.plugins.modules import zpa_segment_group
+
+PROVIDER = {
+    "client_id": "test_client_id",
+    "client_secret": "test_client_secret",
+    "vanity_domain": "test_vanity",
+    "customer_id": "test_customer",
+    "cloud": "production",
+}
+
+
+class MockItem:
+    def __init__(self, data):
+        self._data = data
+
+    def as_dict(self):
+        return dict(self._data)
+
+    def __getattr__(self, name):
+        return self._data.get(name)
+
+
+@pytest.fixture
+def client(mocker):
+    helper = MagicMock()
+    helper.zpa_argument_spec.return_value = ZPAClientHelper.zpa_argument_spec()
+    client = MagicMock()
+    helper.return_value = client
+    mocker.patch.object(zpa_segment_group, "ZPAClientHelper", helper)
+    client.segment_groups.list_groups.return_value = (
+        [MockItem({"id": "1", "name": "crm", "enabled": True})],
+        None,
+    )
+    client.segment_groups.add_group.side_effect = lambda **kw: (
+        MockItem(dict(kw, id="2")),
+        None,
+        None,
+    )
+    return client
+
+
+class TestRunModule:
+    def test_import_module(self):
+        assert import_module("zscaler.zpacloud.zpa_segment_group") is zpa_segment_group
+        with pytest.raises(ImportError):
+            import_module("ansible.builtin.copy")
+
+    def test_module_spec(self, client):
+        spec = module_spec(zpa_segment_group)
+        assert spec["supports_check_mode"] is True
+        assert "name" in spec["argument_spec"]
+
+    def test_create(self, client):
+        result = run_module(zpa_segment_group, {"provider": PROVIDER, "name": "hr"})
+        assert result["changed"] is True
+        assert result["data"]["id"] == "2"
+        # provider secrets are scrubbed from the invocation, like a regular run
+        invocation = result["invocation"]["module_args"]["provider"]
+        assert invocation["client_secret"] == "VALUE_SPECIFIED_IN_NO_LOG_PARAMETER"
+
+    def test_check_mode(self, client):
+        result = run_module(
+            zpa_segment_group, {"provider": PROVIDER, "name": "hr"}, check_mode=True
+        )
+        assert result["changed"] is True
+        client.segment_groups.add_group.assert_not_called()
+
+    def test_argument_validation(self, client):
+        result = run_module(zpa_segment_group, {"provider": PROVIDER, "bogus": 1})
+        assert result["failed"] is True
+        assert "name" in result["msg"]
+
+    def test_exception_becomes_failure(self, client):
+        client.segment_groups.list_groups.side_effect = RuntimeError("boom")
+        result = run_module(zpa_segment_group, {"provider": PROVIDER, "name": "hr"})
+        assert result["failed"] is True
+        assert result["msg"] == "boom"
+
+
+class FakeSegmentGroups:
+    """SDK-like service, so listings are keyed by a real bound method."""
+
+    def __init__(self, request_executor, calls):
+        self._request_executor = request_executor
+        self.calls = calls
+
+    def list_groups(self, query_params=None):
+        self.calls.append(query_params)
+        return [MockItem({"id": "1", "name": "crm", "enabled": True})], None
+
+
+class TestSharedModuleContext:
+    def test_one_client_and_listing_per_batch(self, client):
+        calls = []
+        executor = object()
+        type(client).segment_groups = property(
+            lambda self: FakeSegmentGroups(executor, calls)
+        )
+        helper = zpa_segment_group.ZPAClientHelper
+        with SharedModuleContext(zpa_segment_group) as ctx:
+            for name in ("crm", "crm"):
+                result = run_module(
+                    zpa_segment_group, {"provider": PROVIDER, "name": name}
+                )
+                ctx.item_done(result)
+                assert result["changed"] is False
+        assert helper.call_count == 1
+        assert len(calls) == 1
+        assert zpa_segment_group.ZPAClientHelper is helper
+
+    def test_change_clears_listing_cache(self, client):
+        with SharedModuleContext(zpa_segment_group) as ctx:
+            for name in ("hr", "crm"):
+                ctx.item_done(
+                    run_module(zpa_segment_group, {"provider": PROVIDER, "name": name})
+                )
+        assert client.segment_groups.list_groups.call_count == 2
+
+
+class TestListingCache:
+    def test_bound_methods_and_lambdas(self):
+        collect = MagicMock(return_value=(["a"], None))
+        cache = ListingCache(collect)
+        sdk = MagicMock()
+
+        def make(policy_type):
+            return lambda qp: sdk.list_rules(policy_type, query_params=qp)
+
+        cache(make("access"), {})
+        cache(make("access"), {})
+        cache(make("timeout"), {})
+        assert collect.call_count == 2
+
+    def test_errors_are_not_cached(self):
+        collect = MagicMock(return_value=(None, "boom"))
+        cache = ListingCache(collect)
+
+        def list_fn(qp):
+            return None
+
+        assert cache(list_fn) == (None, "boom")
+        cache(list_fn)
+        assert collect.call_count == 2
+
+    def test_listing_fetched_across_a_clear_is_not_stored(self):
+        def collect(list_fn, query_params):
+            # Another batch item reports a change while this listing is in flight.
+            if collect.calls == 0:
+                cache.clear()
+            collect.calls += 1
+            return [collect.calls], None
+
+        collect.calls = 0
+        cache = ListingCache(collect)
+
+        def list_fn(qp):
+            return None
+
+        assert cache(list_fn) == ([1], None)
+        assert cache(list_fn) == ([2], None)
+        assert cache(list_fn) == ([2], None)
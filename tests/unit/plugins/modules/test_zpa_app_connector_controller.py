@@ -12,6 +12,7 @@ from unittest.mock import MagicMock, patch
 from tests.unit.plugins.modules.common.utils import (
     set_module_args,
     AnsibleExitJson,
+    AnsibleFailJson,
     ModuleTestCase,
     DEFAULT_PROVIDER,
 )
@@ -320,3 +321,174 @@ class TestZPAAppConnectorControllerModule(ModuleTestCase):
             zpa_app_connector_controller.main()
 
         assert "error" in result.value.result["msg"].lower()
+
+
+class TestAppConnectorSelector(ModuleTestCase):
+    """Unit tests for the selector mode of zpa_app_connector_controller."""
+
+    NOW = 1_700_000_000
+    DAY = 86400
+
+    FLEET = [
+        {
+            "id": "1",
+            "name": "branch-01",
+            "enabled": True,
+            "app_connector_group_id": "10",
+            "app_connector_group_name": "Branches",
+            "control_channel_status": "ZPN_STATUS_DISCONNECTED",
+            "last_broker_connect_time": str(NOW - 40 * DAY),
+            "current_version": "24.90.5",
+        },
+        {
+            "id": "2",
+            "name": "branch-02",
+            "enabled": True,
+            "app_connector_group_id": "10",
+            "app_connector_group_name": "Branches",
+            "control_channel_status": "ZPN_STATUS_AUTHENTICATED",
+            "last_broker_connect_time": str((NOW - 60) * 1000),
+            "current_version": "24.103.2",
+        },
+        {
+            "id": "3",
+            "name": "dc-01",
+            "enabled": False,
+            "app_connector_group_id": "20",
+            "app_connector_group_name": "Datacenter",
+            "control_channel_status": "ZPN_STATUS_DISCONNECTED",
+            "current_version": "23.5.1",
+        },
+    ]
+
+    @pytest.fixture
+    def mock_client(self, mocker):
+        mocker.patch(
+            "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_app_connector_controller.time.time",
+            return_value=self.NOW,
+        )
+        with patch(
+            "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_app_connector_controller.ZPAClientHelper"
+        ) as mock_class:
+            mock_class.zpa_argument_spec.return_value = REAL_ARGUMENT_SPEC.copy()
+            client_instance = MagicMock()
+            client_instance.list_raw.return_value = (list(self.FLEET), None, None)
+            client_instance.app_connectors.bulk_delete_connectors.return_value = (
+                None,
+                None,
+                None,
+            )
+            client_instance.app_connectors.update_connector.return_value = (
+                MockBox({}),
+                None,
+                None,
+            )
+            mock_class.return_value = client_instance
+            yield client_instance
+
+    def _run(self, **args):
+        set_module_args(provider=DEFAULT_PROVIDER, **args)
+        from ansible_collections.zscaler.zpacloud.plugins.modules import (
+            zpa_app_connector_controller,
+        )
+
+        zpa_app_connector_controller.main()
+
+    def test_prunes_stale_disconnected_connectors(self, mock_client):
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(
+                state="absent",
+                selector={
+                    "control_channel_status": ["ZPN_STATUS_DISCONNECTED"],
+                    "last_connected_older_than": "30 days",
+                },
+            )
+
+        assert result.value.result["changed"] is True
+        assert result.value.result["data"] == {"deleted_connectors": ["1", "3"]}
+        mock_client.list_raw.assert_called_once()
+        mock_client.app_connectors.bulk_delete_connectors.assert_called_once_with(
+            connector_ids=["1", "3"], microtenant_id=None
+        )
+
+    def test_deletes_in_chunks(self, mock_client):
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(
+                state="absent",
+                selector={"name_regex": "."},
+                chunk_size=2,
+            )
+
+        assert result.value.result["data"] == {"deleted_connectors": ["1", "2", "3"]}
+        calls = mock_client.app_connectors.bulk_delete_connectors.call_args_list
+        assert sorted(c.kwargs["connector_ids"] for c in calls) == [["1", "2"], ["3"]]
+
+    def test_disables_old_versions_by_group(self, mock_client):
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(
+                enabled=False,
+                selector={
+                    "group_names": ["Branches", "Datacenter"],
+                    "version_below": "24.100",
+                },
+            )
+
+        # dc-01 is already disabled, so only branch-01 is updated.
+        assert result.value.result["connectors"] == [{"id": "1", "name": "branch-01"}]
+        mock_client.app_connectors.update_connector.assert_called_once_with(
+            connector_id="1", enabled=False, microtenant_id=None
+        )
+
+    def test_check_mode(self, mock_client):
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(
+                state="absent",
+                selector={"group_ids": ["10"]},
+                _ansible_check_mode=True,
+            )
+
+        assert result.value.result["changed"] is True
+        assert [c["id"] for c in result.value.result["connectors"]] == ["1", "2"]
+        mock_client.app_connectors.bulk_delete_connectors.assert_not_called()
+
+    def test_no_match(self, mock_client):
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(state="absent", selector={"name_regex": "^nope"})
+
+        assert result.value.result["changed"] is False
+        mock_client.app_connectors.bulk_delete_connectors.assert_not_called()
+
+    def test_partial_failure(self, mock_client):
+        mock_client.app_connectors.bulk_delete_connectors.side_effect = [
+            (None, None, None),
+            (None, None, "in use"),
+        ]
+        with pytest.raises(AnsibleFailJson) as result:
+            self._run(
+                state="absent",
+                selector={"name_regex": "."},
+                chunk_size=2,
+                concurrency=1,
+            )
+
+        assert result.value.result["changed"] is True
+        assert result.value.result["data"] == {"deleted_connectors": ["1", "2"]}
+        assert "1 of 2 request(s) failed: in use" in result.value.result["msg"]
+
+    @pytest.mark.parametrize(
+        "args, msg",
+        [
+            ({"state": "absent", "selector": {}}, "at least one criterion"),
+            ({"selector": {"name_regex": "x"}}, "requires enabled"),
+            (
+                {"state": "absent", "selector": {"last_connected_older_than": "soon"}},
+                "Invalid last_connected_older_than",
+            ),
+        ],
+    )
+    def test_invalid_selector(self, mock_client, args, msg):
+        with pytest.raises(AnsibleFailJson) as result:
+            self._run(**args)
+
+        assert msg in result.value.result["msg"]
+        mock_client.list_raw.assert_not_called()
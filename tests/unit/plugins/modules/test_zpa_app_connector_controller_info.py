@@ -186,3 +186,62 @@ class TestZPAAppConnectorControllerInfoModule(ModuleTestCase):
             zpa_app_connector_controller_info.main()
 
         assert "Error" in result.value.result["msg"]
+
+    def test_fields_by_id(self, mock_client):
+        mock_client.app_connectors.get_connector.return_value = (
+            MockBox(self.SAMPLE_CONNECTOR),
+            None,
+            None,
+        )
+
+        set_module_args(
+            provider=DEFAULT_PROVIDER, id=self.SAMPLE_CONNECTOR["id"], fields=["name"]
+        )
+
+        from ansible_collections.zscaler.zpacloud.plugins.modules import (
+            zpa_app_connector_controller_info,
+        )
+
+        with pytest.raises(AnsibleExitJson) as result:
+            zpa_app_connector_controller_info.main()
+
+        assert result.value.result["connectors"] == [
+            {"name": self.SAMPLE_CONNECTOR["name"]}
+        ]
+
+    def test_summary(self, mock_client):
+        mock_client.list_raw.return_value = (
+            [self.SAMPLE_CONNECTOR, self.SAMPLE_CONNECTOR_2],
+            None,
+            None,
+        )
+
+        set_module_args(provider=DEFAULT_PROVIDER, summary=True, summary_top=1)
+
+        from ansible_collections.zscaler.zpacloud.plugins.modules import (
+            zpa_app_connector_controller_info,
+        )
+
+        with pytest.raises(AnsibleExitJson) as result:
+            zpa_app_connector_controller_info.main()
+
+        summary = result.value.result["summary"]
+        assert "connectors" not in result.value.result
+        assert summary["total"] == 2
+        assert summary["by_version"] == {"22.4.1": 2}
+        assert len(summary["oldest_last_seen"]) == 1
+        mock_client.app_connectors.list_connectors.assert_not_called()
+
+    def test_summary_error(self, mock_client):
+        mock_client.list_raw.return_value = (None, None, "denied")
+
+        set_module_args(provider=DEFAULT_PROVIDER, summary=True)
+
+        from ansible_collections.zscaler.zpacloud.plugins.modules import (
+            zpa_app_connector_controller_info,
+        )
+
+        with pytest.raises(AnsibleFailJson) as result:
+            zpa_app_connector_controller_info.main()
+
+        assert "Error summarizing App Connectors: denied" in result.value.result["msg"]
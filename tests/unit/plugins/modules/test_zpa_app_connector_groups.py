@@ -655,13 +655,7 @@ class TestZPAAppConnectorGroupsModule(ModuleTestCase):
         """Test enrollment cert ID auto-resolution when omitted."""
         mocker.patch(
             "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_app_connector_groups.collect_all_items",
-            side_effect=[
-                ([], None),  # list connector groups
-                (
-                    [MockBox({"id": "cert-123", "name": "Connector"})],
-                    None,
-                ),  # list certs
-            ],
+            return_value=([], None),
         )
         mock_client.app_connector_groups.add_connector_group.return_value = (
             MockBox(self.SAMPLE_GROUP),
@@ -694,17 +688,43 @@ class TestZPAAppConnectorGroupsModule(ModuleTestCase):
         )
         assert create_kwargs["enrollment_cert_id"] == "cert-123"
 
+    def test_enrollment_cert_id_is_cached_between_runs(self, mock_client, mocker):
+        """Test the Connector certificate is searched for once across tasks."""
+        mocker.patch(
+            "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_app_connector_groups.collect_all_items",
+            return_value=([], None),
+        )
+        mock_client.app_connector_groups.add_connector_group.return_value = (
+            MockBox(self.SAMPLE_GROUP),
+            None,
+            None,
+        )
+
+        from ansible_collections.zscaler.zpacloud.plugins.modules import (
+            zpa_app_connector_groups,
+        )
+
+        for name in ("Group_A", "Group_B"):
+            set_module_args(
+                provider=DEFAULT_PROVIDER,
+                name=name,
+                enabled=True,
+                state="present",
+            )
+            with pytest.raises(AnsibleExitJson):
+                zpa_app_connector_groups.main()
+
+        mock_client.enrollment_certificates.list_enrolment.assert_called_once_with(
+            query_params={"search": "Connector"}
+        )
+        for call in mock_client.app_connector_groups.add_connector_group.call_args_list:
+            assert call.kwargs["enrollment_cert_id"] == "cert-123"
+
     def test_verifies_user_codes_after_create(self, mock_client, mocker):
         """Test OAuth user code verification after create."""
         mocker.patch(
             "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_app_connector_groups.collect_all_items",
-            side_effect=[
-                ([], None),  # list connector groups
-                (
-                    [MockBox({"id": "cert-123", "name": "Connector"})],
-                    None,
-                ),  # list certs
-            ],
+            return_value=([], None),
         )
         created_group = dict(self.SAMPLE_GROUP)
         created_group["id"] = "216199618143441990"
@@ -140,3 +140,108 @@ class TestZPAApplicationSegmentBAV2Module(ModuleTestCase):
         assert apps_config[0]["ext_label"] == "app1label"
         # A Zscaler-managed certificate app should not carry a certificate_id.
         assert apps_config[0].get("certificate_id") is None
+
+    def test_create_does_not_list_browser_access_apps(self, mock_client, mocker):
+        """Creating a segment never scans the tenant's Browser Access apps."""
+        mocker.patch(
+            "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_application_segment_ba_v2.collect_all_items",
+            return_value=([], None),
+        )
+        mock_client.app_segments_ba_v2.add_segment_ba.return_value = (
+            MockBox({"id": "999"}),
+            None,
+            None,
+        )
+        mock_client.app_segments_ba_v2.get_segment_ba.return_value = (
+            MockBox({"id": "999"}),
+            None,
+            None,
+        )
+
+        set_module_args(
+            provider=DEFAULT_PROVIDER,
+            state="present",
+            name="BA_App_Segment",
+            segment_group_id="456",
+            server_group_ids=["789"],
+            common_apps_dto={
+                "apps_config": [
+                    {
+                        "domain": "app1.example.com",
+                        "application_port": "443",
+                        "application_protocol": "HTTPS",
+                    }
+                ]
+            },
+        )
+        from ansible_collections.zscaler.zpacloud.plugins.modules import (
+            zpa_application_segment_ba_v2,
+        )
+
+        with pytest.raises(AnsibleExitJson):
+            zpa_application_segment_ba_v2.main()
+
+        mock_client.app_segment_by_type.get_segments_by_type.assert_not_called()
+        _args, kwargs = mock_client.app_segments_ba_v2.add_segment_ba.call_args
+        assert kwargs["common_apps_dto"]["apps_config"][0]["ba_app_id"] == ""
+        assert "deleted_ba_apps" not in kwargs["common_apps_dto"]
+
+    def test_update_only_lists_the_segments_own_apps(self, mock_client):
+        """Sub-app IDs and deletions come from the segment's own BA apps."""
+        existing = MockBox(
+            {
+                "id": "123",
+                "name": "BA_App_Segment",
+                "segment_group_id": "456",
+                "clientless_apps": [],
+            }
+        )
+        mock_client.app_segments_ba_v2.get_segment_ba.return_value = (
+            existing,
+            None,
+            None,
+        )
+        mock_client.app_segments_ba_v2.update_segment_ba.return_value = (
+            existing,
+            None,
+            None,
+        )
+        mock_client.app_segment_by_type.get_segments_by_type.return_value = (
+            [
+                MockBox({"id": "b1", "app_id": "123", "domain": "app1.example.com"}),
+                MockBox({"id": "b2", "app_id": "123", "domain": "old.example.com"}),
+                MockBox({"id": "b3", "app_id": "777", "domain": "app1.example.com"}),
+            ],
+            None,
+            None,
+        )
+
+        set_module_args(
+            provider=DEFAULT_PROVIDER,
+            state="present",
+            id="123",
+            name="BA_App_Segment",
+            segment_group_id="456",
+            common_apps_dto={
+                "apps_config": [
+                    {
+                        "domain": "app1.example.com",
+                        "application_port": "443",
+                        "application_protocol": "HTTPS",
+                    }
+                ]
+            },
+        )
+        from ansible_collections.zscaler.zpacloud.plugins.modules import (
+            zpa_application_segment_ba_v2,
+        )
+
+        with pytest.raises(AnsibleExitJson) as result:
+            zpa_application_segment_ba_v2.main()
+
+        assert result.value.result["changed"] is True
+        lookup = mock_client.app_segment_by_type.get_segments_by_type.call_args.kwargs
+        assert lookup["query_params"]["appId"] == "123"
+        _args, kwargs = mock_client.app_segments_ba_v2.update_segment_ba.call_args
+        assert kwargs["common_apps_dto"]["apps_config"][0]["ba_app_id"] == "b1"
+        assert kwargs["common_apps_dto"]["deleted_ba_apps"] == ["b2"]
@@ -187,3 +187,19 @@ class TestZPAApplicationSegmentInfoModule(ModuleTestCase):
             zpa_application_segment_info.main()
 
         assert "Error retrieving Application Segments" in result.value.result["msg"]
+
+    def test_incremental_listing(self, mock_client):
+        mock_client.application_segment.list_segments.return_value = (
+            [MockBox(self.SAMPLE_SEGMENT), MockBox(self.SAMPLE_SEGMENT_2)],
+            None,
+        )
+        set_module_args(provider=DEFAULT_PROVIDER, incremental=True)
+
+        from ansible_collections.zscaler.zpacloud.plugins.modules import (
+            zpa_application_segment_info,
+        )
+
+        with pytest.raises(AnsibleExitJson) as result:
+            zpa_application_segment_info.main()
+
+        assert len(result.value.result["app_segments"]) == 2
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+# MIT License
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from tests.unit.plugins.modules.common.utils import (
+    set_module_args,
+    AnsibleExitJson,
+    AnsibleFailJson,
+    ModuleTestCase,
+    DEFAULT_PROVIDER,
+)
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    ZPAClientHelper,
+)
+
+REAL_ARGUMENT_SPEC = ZPAClientHelper.zpa_argument_spec()
+
+
+class MockBox:
+    def __init__(self, data):
+        self._data = data
+
+    def as_dict(self):
+        return self._data
+
+
+class TestZPAApplicationServerBulkModule(ModuleTestCase):
+    """Unit tests for zpa_application_server_bulk module."""
+
+    @pytest.fixture
+    def mock_client(self):
+        with patch(
+            "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_application_server_bulk.ZPAClientHelper"
+        ) as mock_class:
+            mock_class.zpa_argument_spec.return_value = REAL_ARGUMENT_SPEC.copy()
+            client = MagicMock()
+            self.listings = {
+                "/server": [
+                    {
+                        "id": "s1",
+                        "name": "web01",
+                        "address": "10.0.0.1",
+                        "enabled": True,
+                    },
+                    {
+                        "id": "s2",
+                        "name": "web02",
+                        "address": "10.0.0.2",
+                        "enabled": True,
+                    },
+                    {
+                        "id": "s3",
+                        "name": "old01",
+                        "address": "10.0.0.3",
+                        "enabled": True,
+                    },
+                ],
+                "/serverGroup": [
+                    {
+                        "id": "g1",
+                        "name": "Web",
+                        "enabled": True,
+                        "dynamic_discovery": False,
+                        "servers": [{"id": "s1"}, {"id": "s3"}],
+                        "app_connector_groups": [{"id": "c1"}],
+                    }
+                ],
+                "/appConnectorGroup": [
+                    {"id": "c1", "name": "DC1"},
+                    {"id": "c2", "name": "DC2"},
+                ],
+            }
+            client.list_raw.side_effect = lambda path, qp, **kw: (
+                self.listings[path],
+                None,
+                None,
+            )
+            client.servers.add_server.side_effect = lambda **kw: (
+                MockBox({"id": f"new-{kw['name']}", **kw}),
+                None,
+                None,
+            )
+            client.servers.update_server.return_value = (MockBox({}), None, None)
+            client.server_groups.update_group.return_value = (MockBox({}), None, None)
+            client.server_groups.add_group.return_value = (MockBox({}), None, None)
+            mock_class.return_value = client
+            yield client
+
+    def _run(self, **args):
+        set_module_args(provider=DEFAULT_PROVIDER, **args)
+        from ansible_collections.zscaler.zpacloud.plugins.modules import (
+            zpa_application_server_bulk,
+        )
+
+        zpa_application_server_bulk.main()
+
+    def test_no_changes(self, mock_client):
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(
+                servers=[{"name": "web01", "address": "10.0.0.1"}],
+                server_groups=[
+                    {
+                        "name": "Web",
+                        "servers": ["old01", "web01"],
+                        "app_connector_groups": ["DC1"],
+                    }
+                ],
+            )
+
+        assert result.value.result["changed"] is False
+        paths = sorted(c.args[0] for c in mock_client.list_raw.call_args_list)
+        assert paths == ["/appConnectorGroup", "/server", "/serverGroup"]
+        mock_client.servers.update_server.assert_not_called()
+        mock_client.server_groups.update_group.assert_not_called()
+
+    def test_skips_connector_group_listing_when_unused(self, mock_client):
+        with pytest.raises(AnsibleExitJson):
+            self._run(server_groups=[{"name": "Web", "servers": ["web01", "old01"]}])
+
+        paths = sorted(c.args[0] for c in mock_client.list_raw.call_args_list)
+        assert paths == ["/server", "/serverGroup"]
+
+    def test_creates_servers_and_rewrites_changed_groups(self, mock_client):
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(
+                servers=[
+                    {"name": "web03", "address": "10.0.0.4"},
+                    {"name": "web02", "address": "10.0.0.22"},
+                ],
+                server_groups=[
+                    {"name": "Web", "servers": ["web01", "web02", "web03"]},
+                    {
+                        "name": "Api",
+                        "servers": ["web03"],
+                        "app_connector_groups": ["DC2"],
+                    },
+                ],
+            )
+
+        res = result.value.result
+        assert res["changes"] == {
+            "servers": {"created": ["web03"], "updated": ["web02"]},
+            "server_groups": {"created": ["Api"], "updated": ["Web"]},
+        }
+        assert res["membership"] == {
+            "Web": {"added": ["web02", "web03"], "removed": ["old01"]},
+            "Api": {"added": ["web03"], "removed": []},
+        }
+        mock_client.servers.update_server.assert_called_once_with(
+            server_id="s2", name="web02", address="10.0.0.22", enabled=True
+        )
+        mock_client.server_groups.update_group.assert_called_once_with(
+            group_id="g1",
+            name="Web",
+            enabled=True,
+            server_ids=["new-web03", "s1", "s2"],
+        )
+        mock_client.server_groups.add_group.assert_called_once_with(
+            name="Api",
+            enabled=True,
+            dynamic_discovery=False,
+            server_ids=["new-web03"],
+            app_connector_group_ids=["c2"],
+        )
+
+    def test_additive_membership(self, mock_client):
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(
+                membership="additive",
+                server_groups=[{"name": "Web", "servers": ["web02"]}],
+            )
+
+        assert result.value.result["membership"] == {
+            "Web": {"added": ["web02"], "removed": []}
+        }
+        kwargs = mock_client.server_groups.update_group.call_args.kwargs
+        assert kwargs["server_ids"] == ["s1", "s2", "s3"]
+
+    def test_check_mode(self, mock_client):
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(
+                servers=[{"name": "web03", "address": "10.0.0.4"}],
+                server_groups=[{"name": "Web", "servers": ["web01", "web03"]}],
+                _ansible_check_mode=True,
+            )
+
+        assert result.value.result["changed"] is True
+        assert result.value.result["membership"] == {
+            "Web": {"added": ["web03"], "removed": ["old01"]}
+        }
+        mock_client.servers.add_server.assert_not_called()
+        mock_client.server_groups.update_group.assert_not_called()
+
+    def test_unknown_server(self, mock_client):
+        with pytest.raises(AnsibleFailJson) as result:
+            self._run(server_groups=[{"name": "Web", "servers": ["web1"]}])
+
+        assert "unknown server(s) web1" in result.value.result["msg"]
+        assert "Did you mean" in result.value.result["msg"]
+
+    def test_new_server_requires_address(self, mock_client):
+        with pytest.raises(AnsibleFailJson) as result:
+            self._run(servers=[{"name": "web09"}])
+
+        assert "has no address" in result.value.result["msg"]
+
+    def test_server_failure_stops_before_groups(self, mock_client):
+        mock_client.servers.add_server.side_effect = lambda **kw: (None, None, "dup")
+
+        with pytest.raises(AnsibleFailJson) as result:
+            self._run(
+                servers=[{"name": "web03", "address": "10.0.0.4"}],
+                server_groups=[{"name": "Web", "servers": ["web03"]}],
+            )
+
+        assert "1 of 1 server request(s) failed: web03: dup" in (
+            result.value.result["msg"]
+        )
+        mock_client.server_groups.update_group.assert_not_called()
+
+    def test_group_failure(self, mock_client):
+        mock_client.server_groups.update_group.return_value = (None, None, "busy")
+
+        with pytest.raises(AnsibleFailJson) as result:
+            self._run(server_groups=[{"name": "Web", "servers": ["web01"]}])
+
+        assert "Web: busy" in result.value.result["msg"]
+        assert result.value.result["membership"] == {}
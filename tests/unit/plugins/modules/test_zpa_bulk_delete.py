@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+# MIT License
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import asyncio
+import os
+import sys
+
+# Add the collection root to path for imports
+COLLECTION_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "..", "..")
+)
+if COLLECTION_ROOT not in sys.path:
+    sys.path.insert(0, COLLECTION_ROOT)
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from tests.unit.plugins.modules.common.utils import (
+    set_module_args,
+    AnsibleExitJson,
+    AnsibleFailJson,
+    ModuleTestCase,
+    DEFAULT_PROVIDER,
+)
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    ZPAClientHelper,
+)
+
+REAL_ARGUMENT_SPEC = ZPAClientHelper.zpa_argument_spec()
+
+
+class MockBox:
+    """Mock Box object to simulate SDK responses"""
+
+    def __init__(self, data):
+        self._data = data
+
+    def as_dict(self):
+        return dict(self._data)
+
+
+class FakeTransport:
+    """Stands in for AsyncZPATransport, recording the deleted paths."""
+
+    def __init__(self, errors=None):
+        self.deleted = []
+        self.errors = errors or {}
+
+    async def delete(self, path, params=None, **kwargs):
+        self.deleted.append((path, params))
+        return None, self.errors.get(path)
+
+    def run(self, *coroutines):
+        async def gather():
+            return await asyncio.gather(*coroutines)
+
+        return asyncio.run(gather())
+
+
+class TestZPABulkDeleteModule(ModuleTestCase):
+    """Unit tests for zpa_bulk_delete module."""
+
+    @pytest.fixture
+    def mock_client(self, mocker):
+        """Create a mock ZPA client that preserves argument_spec"""
+        with patch(
+            "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_bulk_delete.ZPAClientHelper"
+        ) as mock_class:
+            mock_class.zpa_argument_spec.return_value = REAL_ARGUMENT_SPEC.copy()
+            client_instance = MagicMock()
+            mock_class.return_value = client_instance
+
+            client_instance.segment_groups.list_groups.return_value = (
+                [
+                    MockBox({"id": "1", "name": "test_crm"}),
+                    MockBox({"id": "2", "name": "prod"}),
+                ],
+                None,
+            )
+            client_instance.application_segment.list_segments.return_value = (
+                [MockBox({"id": "10", "name": "test_app"})],
+                None,
+            )
+            client_instance.policies.list_rules.return_value = (
+                [MockBox({"id": "20", "name": "keep"})],
+                None,
+            )
+            for method in (
+                client_instance.segment_groups.delete_group,
+                client_instance.application_segment.delete_segment,
+                client_instance.policies.delete_rule,
+            ):
+                method.return_value = (None, None, None)
+            yield client_instance
+
+    def _run(self, **args):
+        set_module_args(provider=DEFAULT_PROVIDER, **args)
+        from ansible_collections.zscaler.zpacloud.plugins.modules import (
+            zpa_bulk_delete,
+        )
+
+        zpa_bulk_delete.main()
+
+    def test_deletes_in_dependency_order(self, mock_client):
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(
+                resource_types=["segment_group", "application_segment"],
+                name_regex="^test_",
+            )
+
+        assert result.value.result["changed"] is True
+        assert result.value.result["deleted"] == {
+            "application_segment": [{"id": "10", "name": "test_app"}],
+            "segment_group": [{"id": "1", "name": "test_crm"}],
+        }
+        calls = [c[0] for c in mock_client.method_calls if "delete" in c[0]]
+        assert calls == [
+            "application_segment.delete_segment",
+            "segment_groups.delete_group",
+        ]
+        mock_client.application_segment.delete_segment.assert_called_once_with(
+            segment_id="10", force_delete=True
+        )
+        mock_client.segment_groups.delete_group.assert_called_once_with(group_id="1")
+
+    def test_exact_names(self, mock_client):
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(resource_types=["segment_group"], names=["prod"])
+        assert result.value.result["deleted"]["segment_group"] == [
+            {"id": "2", "name": "prod"}
+        ]
+
+    def test_nothing_matches(self, mock_client):
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(resource_types=["policy_access_rule"], name_regex="^test_")
+        assert result.value.result["changed"] is False
+        mock_client.policies.delete_rule.assert_not_called()
+
+    def test_check_mode(self, mock_client):
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(
+                resource_types=["segment_group"],
+                name_regex="test_",
+                _ansible_check_mode=True,
+            )
+        assert result.value.result["changed"] is True
+        mock_client.segment_groups.delete_group.assert_not_called()
+
+    def test_delete_errors_are_reported(self, mock_client):
+        mock_client.segment_groups.delete_group.return_value = (None, None, "in use")
+        with pytest.raises(AnsibleFailJson) as result:
+            self._run(
+                resource_types=["segment_group", "application_segment"],
+                name_regex="test_",
+            )
+        assert result.value.result["errors"] == [
+            {
+                "id": "1",
+                "name": "test_crm",
+                "resource_type": "segment_group",
+                "msg": "in use",
+            }
+        ]
+        assert result.value.result["deleted"]["application_segment"]
+
+    def test_filter_required(self, mock_client):
+        with pytest.raises(AnsibleFailJson) as result:
+            self._run(resource_types=["segment_group"])
+        assert "names or name_regex" in result.value.result["msg"]
+
+    def test_unsupported_resource_type(self, mock_client):
+        with pytest.raises(AnsibleFailJson) as result:
+            self._run(resource_types=["idp"], name_regex=".*")
+        assert "Unsupported resource type" in result.value.result["msg"]
+
+    def test_async_transport(self, mock_client):
+        transport = FakeTransport(errors={"/segmentGroup/1": "in use"})
+        mock_client.async_transport.return_value = transport
+        with pytest.raises(AnsibleFailJson) as result:
+            self._run(
+                resource_types=["segment_group", "application_segment"],
+                name_regex="^test_",
+                transport="async",
+                concurrency=4,
+            )
+
+        mock_client.async_transport.assert_called_once_with(4)
+        assert transport.deleted == [
+            ("/application/10", {"force_delete": True}),
+            ("/segmentGroup/1", {}),
+        ]
+        mock_client.segment_groups.delete_group.assert_not_called()
+        assert result.value.result["deleted"]["application_segment"] == [
+            {"id": "10", "name": "test_app"}
+        ]
+        assert result.value.result["errors"][0]["msg"] == "in use"
+
+    def test_async_transport_falls_back_to_sdk(self, mock_client):
+        mock_client.async_transport.return_value = FakeTransport()
+        with pytest.raises(AnsibleExitJson):
+            self._run(
+                resource_types=["policy_access_rule"],
+                names=["keep"],
+                transport="async",
+            )
+        mock_client.policies.delete_rule.assert_called_once()
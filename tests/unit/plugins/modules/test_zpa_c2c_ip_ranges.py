@@ -12,6 +12,7 @@ from unittest.mock import MagicMock, patch
 from tests.unit.plugins.modules.common.utils import (
     set_module_args,
     AnsibleExitJson,
+    AnsibleFailJson,
     ModuleTestCase,
     DEFAULT_PROVIDER,
 )
@@ -373,3 +374,240 @@ class TestZPAC2CIPRangesModule(ModuleTestCase):
             zpa_c2c_ip_ranges.main()
 
         assert result.value.result["changed"] is True
+
+    def _run(self, **args):
+        set_module_args(provider=DEFAULT_PROVIDER, **args)
+        from ansible_collections.zscaler.zpacloud.plugins.modules import (
+            zpa_c2c_ip_ranges,
+        )
+
+        zpa_c2c_ip_ranges.main()
+
+    def test_create_overlapping_range_fails(self, mock_client):
+        mock_client.c2c_ip_ranges.list_ip_ranges.return_value = (
+            [MockBox(self.SAMPLE_IP_RANGE)],
+            None,
+            None,
+        )
+
+        with pytest.raises(AnsibleFailJson) as result:
+            self._run(name="Overlap", subnet_cidr="10.0.0.0/28", overlap_check="error")
+
+        assert (
+            "'Overlap' (10.0.0.0/28) overlaps 'Test_C2C_IP_Range' (10.0.0.1-10.0.0.254)"
+            in result.value.result["msg"]
+        )
+        mock_client.c2c_ip_ranges.add_ip_range.assert_not_called()
+
+    def test_create_overlapping_range_warns(self, mock_client):
+        from ansible_collections.zscaler.zpacloud.plugins.modules import (
+            zpa_c2c_ip_ranges,
+        )
+
+        mock_client.c2c_ip_ranges.list_ip_ranges.return_value = (
+            [MockBox(self.SAMPLE_IP_RANGE)],
+            None,
+            None,
+        )
+        mock_client.c2c_ip_ranges.add_ip_range.return_value = (
+            MockBox({"id": "1", "name": "Overlap"}),
+            None,
+            None,
+        )
+
+        with patch.object(zpa_c2c_ip_ranges.AnsibleModule, "warn", MagicMock()) as warn:
+            with pytest.raises(AnsibleExitJson):
+                self._run(name="Overlap", subnet_cidr="10.0.0.0/28")
+
+        assert "Overlapping C2C IP ranges" in warn.call_args[0][0]
+        mock_client.c2c_ip_ranges.add_ip_range.assert_called_once()
+
+    def test_netaddr_only_needed_for_the_check(self, mock_client):
+        from ansible_collections.zscaler.zpacloud.plugins.modules import (
+            zpa_c2c_ip_ranges,
+        )
+
+        mock_client.c2c_ip_ranges.list_ip_ranges.return_value = ([], None, None)
+        mock_client.c2c_ip_ranges.add_ip_range.return_value = (
+            MockBox({"id": "1", "name": "New"}),
+            None,
+            None,
+        )
+
+        with patch.object(zpa_c2c_ip_ranges, "HAS_NETADDR", False):
+            with pytest.raises(AnsibleExitJson) as result:
+                self._run(name="New", subnet_cidr="10.9.0.0/24", overlap_check="ignore")
+            assert result.value.result["changed"] is True
+
+            with pytest.raises(AnsibleFailJson) as result:
+                self._run(name="New", subnet_cidr="10.9.0.0/24")
+            assert "netaddr" in result.value.result["msg"]
+
+    def test_update_by_id_does_not_overlap_itself(self, mock_client):
+        mock_client.c2c_ip_ranges.get_ip_range.return_value = (
+            MockBox(self.SAMPLE_IP_RANGE),
+            None,
+            None,
+        )
+        mock_client.c2c_ip_ranges.list_ip_ranges.return_value = (
+            [MockBox(self.SAMPLE_IP_RANGE)],
+            None,
+            None,
+        )
+        mock_client.c2c_ip_ranges.update_ip_range.return_value = (
+            MockBox(self.SAMPLE_IP_RANGE),
+            None,
+            None,
+        )
+
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(
+                id=self.SAMPLE_IP_RANGE["id"],
+                name="Renamed",
+                ip_range_begin="10.0.0.1",
+                ip_range_end="10.0.0.100",
+            )
+
+        assert result.value.result["changed"] is True
+        mock_client.c2c_ip_ranges.list_ip_ranges.assert_called_once()
+
+    def test_unchanged_addresses_skip_listing(self, mock_client):
+        mock_client.c2c_ip_ranges.get_ip_range.return_value = (
+            MockBox(self.SAMPLE_IP_RANGE),
+            None,
+            None,
+        )
+        mock_client.c2c_ip_ranges.update_ip_range.return_value = (
+            MockBox(self.SAMPLE_IP_RANGE),
+            None,
+            None,
+        )
+
+        with pytest.raises(AnsibleExitJson):
+            self._run(
+                id=self.SAMPLE_IP_RANGE["id"],
+                name="Test_C2C_IP_Range",
+                description="New description",
+                ip_range_begin="10.0.0.1",
+                ip_range_end="10.0.0.254",
+            )
+
+        mock_client.c2c_ip_ranges.list_ip_ranges.assert_not_called()
+
+    def test_bulk_reconcile(self, mock_client):
+        stale = {"id": "2", "name": "Stale", "subnet_cidr": "172.16.0.0/24"}
+        mock_client.c2c_ip_ranges.list_ip_ranges.return_value = (
+            [MockBox(self.SAMPLE_IP_RANGE), MockBox(stale)],
+            None,
+            None,
+        )
+        for call in ("add_ip_range", "update_ip_range", "delete_ip_range"):
+            getattr(mock_client.c2c_ip_ranges, call).return_value = (
+                MockBox({}),
+                None,
+                None,
+            )
+
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(
+                purge=True,
+                ranges=[
+                    {"name": "Test_C2C_IP_Range", "description": "Updated"},
+                    {"name": "Stale2", "subnet_cidr": "172.16.0.0/24"},
+                ],
+            )
+
+        # Stale is purged, so its addresses are free for Stale2.
+        assert result.value.result["changes"] == {
+            "created": ["Stale2"],
+            "updated": ["Test_C2C_IP_Range"],
+            "deleted": ["Stale"],
+        }
+        mock_client.c2c_ip_ranges.list_ip_ranges.assert_called_once()
+        mock_client.c2c_ip_ranges.add_ip_range.assert_called_once_with(
+            name="Stale2", subnet_cidr="172.16.0.0/24"
+        )
+        mock_client.c2c_ip_ranges.update_ip_range.assert_called_once_with(
+            range_id=self.SAMPLE_IP_RANGE["id"],
+            name="Test_C2C_IP_Range",
+            description="Updated",
+        )
+        mock_client.c2c_ip_ranges.delete_ip_range.assert_called_once_with(range_id="2")
+
+    def test_bulk_overlap_between_listed_ranges(self, mock_client):
+        mock_client.c2c_ip_ranges.list_ip_ranges.return_value = ([], None, None)
+
+        with pytest.raises(AnsibleFailJson) as result:
+            self._run(
+                ranges=[
+                    {"name": "A", "subnet_cidr": "10.1.0.0/16"},
+                    {"name": "B", "ip_range_begin": "10.1.2.3"},
+                ],
+                overlap_check="error",
+            )
+
+        assert "'A' (10.1.0.0/16) overlaps 'B'" in result.value.result["msg"]
+        mock_client.c2c_ip_ranges.add_ip_range.assert_not_called()
+
+    def test_bulk_switch_from_cidr_checks_new_addresses(self, mock_client):
+        mock_client.c2c_ip_ranges.list_ip_ranges.return_value = (
+            [
+                MockBox({"id": "1", "name": "Net", "subnet_cidr": "10.0.0.0/24"}),
+                MockBox({"id": "2", "name": "Other", "subnet_cidr": "10.5.0.0/24"}),
+            ],
+            None,
+            None,
+        )
+
+        with pytest.raises(AnsibleFailJson) as result:
+            self._run(
+                ranges=[
+                    {
+                        "name": "Net",
+                        "ip_range_begin": "10.5.0.1",
+                        "ip_range_end": "10.5.0.10",
+                    }
+                ],
+                overlap_check="error",
+            )
+
+        assert "'Net' (10.5.0.1-10.5.0.10) overlaps 'Other'" in (
+            result.value.result["msg"]
+        )
+        mock_client.c2c_ip_ranges.update_ip_range.assert_not_called()
+
+    def test_bulk_check_mode_and_absent(self, mock_client):
+        mock_client.c2c_ip_ranges.list_ip_ranges.return_value = (
+            [MockBox(self.SAMPLE_IP_RANGE)],
+            None,
+            None,
+        )
+
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(
+                state="absent",
+                ranges=[{"name": "Test_C2C_IP_Range"}, {"name": "Missing"}],
+                _ansible_check_mode=True,
+            )
+
+        assert result.value.result["changes"]["deleted"] == ["Test_C2C_IP_Range"]
+        mock_client.c2c_ip_ranges.delete_ip_range.assert_not_called()
+
+    def test_bulk_partial_failure(self, mock_client):
+        mock_client.c2c_ip_ranges.list_ip_ranges.return_value = ([], None, None)
+        mock_client.c2c_ip_ranges.add_ip_range.side_effect = lambda **kw: (
+            (None, None, "rejected") if kw["name"] == "B" else (MockBox({}), None, None)
+        )
+
+        with pytest.raises(AnsibleFailJson) as result:
+            self._run(
+                ranges=[
+                    {"name": "A", "subnet_cidr": "10.1.0.0/16"},
+                    {"name": "B", "subnet_cidr": "10.2.0.0/16"},
+                ]
+            )
+
+        assert "1 of 2 C2C IP Range request(s) failed: B: rejected" in (
+            result.value.result["msg"]
+        )
+        assert result.value.result["changes"]["created"] == ["A"]
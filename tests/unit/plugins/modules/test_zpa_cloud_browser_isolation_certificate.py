@@ -63,6 +63,21 @@ class TestZPACBICertificateModule(ModuleTestCase):
             mock_class.return_value = client_instance
             yield client_instance
 
+    @staticmethod
+    def _listed(client, *certs):
+        """List ``certs`` and serve each of them in full by ID."""
+        by_id = {cert["id"]: cert for cert in certs}
+        client.cbi_certificate.list_cbi_certificates.return_value = (
+            [MockBox(cert) for cert in certs],
+            None,
+            None,
+        )
+        client.cbi_certificate.get_cbi_certificate.side_effect = lambda cert_id: (
+            (MockBox(by_id[cert_id]), None, None)
+            if cert_id in by_id
+            else (None, None, "404 Not Found")
+        )
+
     def test_create_certificate(self, mock_client):
         """Test creating a new CBI Certificate."""
         mock_client.cbi_certificate.list_cbi_certificates.return_value = (
@@ -101,12 +116,7 @@ class TestZPACBICertificateModule(ModuleTestCase):
         existing_cert["pem"] = (
             "-----BEGIN CERTIFICATE-----\nOLDCERT...\n-----END CERTIFICATE-----"
         )
-        mock_existing = MockBox(existing_cert)
-        mock_client.cbi_certificate.list_cbi_certificates.return_value = (
-            [mock_existing],
-            None,
-            None,
-        )
+        self._listed(mock_client, existing_cert)
 
         mock_updated = MockBox(self.SAMPLE_CERT)
         mock_client.cbi_certificate.update_cbi_certificate.return_value = (
@@ -134,12 +144,7 @@ class TestZPACBICertificateModule(ModuleTestCase):
 
     def test_delete_certificate(self, mock_client):
         """Test deleting a CBI Certificate."""
-        mock_existing = MockBox(self.SAMPLE_CERT)
-        mock_client.cbi_certificate.list_cbi_certificates.return_value = (
-            [mock_existing],
-            None,
-            None,
-        )
+        self._listed(mock_client, self.SAMPLE_CERT)
         mock_client.cbi_certificate.delete_cbi_certificate.return_value = (
             None,
             None,
@@ -165,12 +170,7 @@ class TestZPACBICertificateModule(ModuleTestCase):
 
     def test_no_change_when_identical(self, mock_client):
         """Test no change when certificate already matches desired state."""
-        mock_existing = MockBox(self.SAMPLE_CERT)
-        mock_client.cbi_certificate.list_cbi_certificates.return_value = (
-            [mock_existing],
-            None,
-            None,
-        )
+        self._listed(mock_client, self.SAMPLE_CERT)
 
         set_module_args(
             provider=DEFAULT_PROVIDER,
@@ -335,11 +335,7 @@ class TestZPACBICertificateModule(ModuleTestCase):
         from tests.unit.plugins.modules.common.utils import AnsibleFailJson
 
         existing = {**self.SAMPLE_CERT, "pem": "OLD_PEM"}
-        mock_client.cbi_certificate.list_cbi_certificates.return_value = (
-            [MockBox(existing)],
-            None,
-            None,
-        )
+        self._listed(mock_client, existing)
         mock_client.cbi_certificate.update_cbi_certificate.return_value = (
             None,
             None,
@@ -366,11 +362,7 @@ class TestZPACBICertificateModule(ModuleTestCase):
         """Test error handling when deleting certificate"""
         from tests.unit.plugins.modules.common.utils import AnsibleFailJson
 
-        mock_client.cbi_certificate.list_cbi_certificates.return_value = (
-            [MockBox(self.SAMPLE_CERT)],
-            None,
-            None,
-        )
+        self._listed(mock_client, self.SAMPLE_CERT)
         mock_client.cbi_certificate.delete_cbi_certificate.return_value = (
             None,
             None,
@@ -392,3 +384,30 @@ class TestZPACBICertificateModule(ModuleTestCase):
             zpa_cloud_browser_isolation_certificate.main()
 
         assert "error" in result.value.result["msg"].lower()
+
+    def test_no_change_when_only_pem_formatting_differs(self, mock_client):
+        """PEMs holding the same certificate are compared by fingerprint."""
+        body = "bGVhZiBjZXJ0aWZpY2F0ZSBkZXI="
+        existing_cert = dict(
+            self.SAMPLE_CERT,
+            pem=f"-----BEGIN CERTIFICATE-----\n{body}\n-----END CERTIFICATE-----",
+        )
+        self._listed(mock_client, existing_cert)
+
+        set_module_args(
+            provider=DEFAULT_PROVIDER,
+            name="cbi_profile01.acme.com",
+            pem=f"-----BEGIN CERTIFICATE-----\r\n{body[:12]}\r\n{body[12:]}\r\n"
+            "-----END CERTIFICATE-----\r\n",
+            state="present",
+        )
+
+        from ansible_collections.zscaler.zpacloud.plugins.modules import (
+            zpa_cloud_browser_isolation_certificate,
+        )
+
+        with pytest.raises(AnsibleExitJson) as result:
+            zpa_cloud_browser_isolation_certificate.main()
+
+        mock_client.cbi_certificate.update_cbi_certificate.assert_not_called()
+        assert result.value.result["changed"] is False
@@ -6,12 +6,15 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import copy
+
 import pytest
 from unittest.mock import MagicMock, patch
 
 from tests.unit.plugins.modules.common.utils import (
     set_module_args,
     AnsibleExitJson,
+    AnsibleFailJson,
     ModuleTestCase,
     DEFAULT_PROVIDER,
 )
@@ -23,12 +26,12 @@ from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import
 REAL_ARGUMENT_SPEC = ZPAClientHelper.zpa_argument_spec()
 
 
-class MockListResult:
-    def __init__(self, items):
-        self._items = items
+class MockBox:
+    def __init__(self, data):
+        self._data = data
 
-    def to_list(self):
-        return self._items
+    def as_dict(self):
+        return self._data
 
 
 class TestZPALSSConfigControllerModule(ModuleTestCase):
@@ -43,11 +46,56 @@ class TestZPALSSConfigControllerModule(ModuleTestCase):
             "enabled": True,
             "lss_host": "10.1.1.1",
             "lss_port": "20000",
-            "source_log_type": "user_activity",
-            "source_log_format": "json",
+            "source_log_type": "zpn_trans_log",
+            "format": "CUSTOM_FORMAT",
+            "filter": [],
             "use_tls": True,
         },
-        "app_connector_group_ids": ["111111"],
+        "connector_groups": [{"id": "111111", "name": "Group"}],
+        "policy_rule_resource": {
+            "name": "SIEM_POLICY",
+            "conditions": [
+                {
+                    "operator": "OR",
+                    "operands": [
+                        {"object_type": "APP", "lhs": "id", "rhs": "77"},
+                        {"object_type": "APP", "lhs": "id", "rhs": "78"},
+                    ],
+                },
+                {
+                    "operator": "OR",
+                    "operands": [
+                        {
+                            "object_type": "CLIENT_TYPE",
+                            "lhs": "id",
+                            "rhs": "zpn_client_type_exporter",
+                        }
+                    ],
+                },
+            ],
+        },
+    }
+
+    DESIRED_CONFIG = {
+        "name": "Test_LSS_Config",
+        "enabled": True,
+        "lss_host": "10.1.1.1",
+        "lss_port": "20000",
+        "source_log_type": "user_activity",
+        "use_tls": True,
+    }
+
+    DESIRED_POLICY = {
+        "name": "SIEM_POLICY",
+        "conditions": [
+            {
+                "operator": "OR",
+                "operands": [
+                    {"object_type": "CLIENT_TYPE", "values": ["web_browser"]},
+                    {"object_type": "APP", "values": ["78", "77"]},
+                ],
+            }
+        ],
     }
 
     @pytest.fixture
@@ -57,195 +105,226 @@ class TestZPALSSConfigControllerModule(ModuleTestCase):
         ) as mock_class:
             mock_class.zpa_argument_spec.return_value = REAL_ARGUMENT_SPEC.copy()
             client_instance = MagicMock()
+            client_instance.lss.list_configs.return_value = (
+                [MockBox(copy.deepcopy(self.SAMPLE_CONFIG))],
+                None,
+                None,
+            )
+            client_instance.lss.get_config.return_value = (
+                MockBox(copy.deepcopy(self.SAMPLE_CONFIG)),
+                None,
+                None,
+            )
+            client_instance.lss.get_client_types.return_value = {
+                "web_browser": "zpn_client_type_exporter",
+                "client_connector": "zpn_client_type_zapp",
+            }
+            client_instance.lss.update_lss_config.return_value = (
+                MockBox({"id": "123456"}),
+                None,
+                None,
+            )
             mock_class.return_value = client_instance
             yield client_instance
 
-    def test_create_lss_config(self, mock_client):
-        """Test creating a new LSS config"""
-        mock_client.lss.list_configs.return_value = MockListResult([])
-        mock_client.lss.add_lss_config.return_value = {"id": "123456"}
-
-        set_module_args(
-            provider=DEFAULT_PROVIDER,
-            state="present",
-            config={
-                "name": "Test_LSS_Config",
-                "description": "Test LSS Configuration",
-                "enabled": True,
-                "lss_host": "10.1.1.1",
-                "lss_port": "20000",
-                "source_log_type": "user_activity",
-            },
-            app_connector_group_ids=["111111"],
-        )
-
+    def run_module(self, **kwargs):
         from ansible_collections.zscaler.zpacloud.plugins.modules import (
             zpa_lss_config_controller,
         )
 
+        set_module_args(provider=DEFAULT_PROVIDER, **kwargs)
+        zpa_lss_config_controller.main()
+
+    def test_create_lss_config(self, mock_client):
+        """Test creating a new LSS config"""
+        mock_client.lss.list_configs.return_value = ([], None, None)
+        mock_client.lss.add_lss_config.return_value = (
+            MockBox({"id": "123456"}),
+            None,
+            None,
+        )
+
         with pytest.raises(AnsibleExitJson) as result:
-            zpa_lss_config_controller.main()
+            self.run_module(
+                state="present",
+                config=self.DESIRED_CONFIG,
+                app_connector_group_ids=["111111"],
+            )
 
         assert result.value.result["changed"] is True
+        kwargs = mock_client.lss.add_lss_config.call_args.kwargs
+        assert kwargs["source_log_type"] == "user_activity"
+        assert kwargs["app_connector_group_ids"] == ["111111"]
 
-    def test_update_lss_config_by_id(self, mock_client):
-        """Test updating an existing LSS config by ID"""
-        mock_client.lss.get_config.return_value = self.SAMPLE_CONFIG.copy()
-        mock_client.lss.list_configs.return_value = MockListResult([self.SAMPLE_CONFIG])
-        mock_client.lss.update_lss_config.return_value = {"id": "123456"}
-
-        set_module_args(
-            provider=DEFAULT_PROVIDER,
-            state="present",
-            id="123456",
-            config={
-                "name": "Test_LSS_Config",
-                "description": "Updated description",
-                "enabled": True,
-                "lss_host": "10.1.1.1",
-                "lss_port": "20000",
-                "source_log_type": "user_activity",
-            },
-        )
-
-        from ansible_collections.zscaler.zpacloud.plugins.modules import (
-            zpa_lss_config_controller,
+    def test_create_with_policy_rule_resource(self, mock_client):
+        """Test creating LSS config with policy rule resource"""
+        mock_client.lss.list_configs.return_value = ([], None, None)
+        mock_client.lss.add_lss_config.return_value = (
+            MockBox({"id": "123456"}),
+            None,
+            None,
         )
 
         with pytest.raises(AnsibleExitJson) as result:
-            zpa_lss_config_controller.main()
+            self.run_module(
+                state="present",
+                config=self.DESIRED_CONFIG,
+                policy_rule_resource=self.DESIRED_POLICY,
+            )
 
         assert result.value.result["changed"] is True
+        kwargs = mock_client.lss.add_lss_config.call_args.kwargs
+        assert kwargs["policy_rules"] == [
+            ("client_type", ["web_browser"]),
+            ("app", ["78", "77"]),
+        ]
+        assert kwargs["policy_name"] == "SIEM_POLICY"
+
+    def test_no_drift_skips_update(self, mock_client):
+        """Test an unchanged config is neither written nor re-read"""
+        with pytest.raises(AnsibleExitJson) as result:
+            self.run_module(
+                state="present",
+                config=self.DESIRED_CONFIG,
+                app_connector_group_ids=["111111"],
+                policy_rule_resource=self.DESIRED_POLICY,
+            )
+
+        assert result.value.result["changed"] is False
+        mock_client.lss.update_lss_config.assert_not_called()
+        mock_client.lss.list_configs.assert_called_once()
+        mock_client.lss.get_config.assert_not_called()
 
     def test_update_lss_config_by_name(self, mock_client):
         """Test updating an existing LSS config by name"""
-        mock_client.lss.list_configs.return_value = MockListResult([self.SAMPLE_CONFIG])
-        mock_client.lss.update_lss_config.return_value = {"id": "123456"}
-
-        set_module_args(
-            provider=DEFAULT_PROVIDER,
-            state="present",
-            config={
-                "name": "Test_LSS_Config",
-                "description": "Updated description",
-                "enabled": True,
-                "lss_host": "10.1.1.1",
-                "lss_port": "20000",
-                "source_log_type": "user_activity",
-            },
-        )
-
-        from ansible_collections.zscaler.zpacloud.plugins.modules import (
-            zpa_lss_config_controller,
-        )
+        desired = dict(self.DESIRED_CONFIG, lss_port="20001")
 
         with pytest.raises(AnsibleExitJson) as result:
-            zpa_lss_config_controller.main()
+            self.run_module(state="present", config=desired)
 
         assert result.value.result["changed"] is True
+        assert result.value.result["drift"] == ["config.lss_port"]
+        kwargs = mock_client.lss.update_lss_config.call_args.kwargs
+        assert kwargs["lss_config_id"] == "123456"
+        assert kwargs["lss_port"] == "20001"
+        # The configured log format is kept when source_log_format is not set.
+        assert kwargs["log_stream_content"] == "CUSTOM_FORMAT"
+        mock_client.lss.get_config.assert_not_called()
 
-    def test_delete_lss_config(self, mock_client):
-        """Test deleting an LSS config"""
-        mock_client.lss.get_config.return_value = self.SAMPLE_CONFIG.copy()
-        mock_client.lss.delete_lss_config.return_value = 204
-
-        set_module_args(
-            provider=DEFAULT_PROVIDER,
-            state="absent",
-            id="123456",
-            config={
-                "name": "Test_LSS_Config",
-                "lss_host": "10.1.1.1",
-                "lss_port": "20000",
-                "source_log_type": "user_activity",
-            },
-        )
+    def test_update_lss_config_by_id(self, mock_client):
+        """Test updating an existing LSS config by ID"""
+        with pytest.raises(AnsibleExitJson) as result:
+            self.run_module(
+                state="present",
+                id="123456",
+                config=self.DESIRED_CONFIG,
+                app_connector_group_ids=["111111", "222222"],
+            )
+
+        assert result.value.result["drift"] == ["app_connector_group_ids"]
+        mock_client.lss.update_lss_config.assert_called_once()
+        mock_client.lss.list_configs.assert_not_called()
+
+    def test_policy_drift(self, mock_client):
+        """Test a changed policy rule operand triggers an update"""
+        policy = copy.deepcopy(self.DESIRED_POLICY)
+        policy["conditions"][0]["operands"][1]["values"] = ["77"]
 
-        from ansible_collections.zscaler.zpacloud.plugins.modules import (
-            zpa_lss_config_controller,
-        )
+        with pytest.raises(AnsibleExitJson) as result:
+            self.run_module(
+                state="present", config=self.DESIRED_CONFIG, policy_rule_resource=policy
+            )
+
+        assert result.value.result["drift"] == ["policy_rule_resource"]
+        kwargs = mock_client.lss.update_lss_config.call_args.kwargs
+        assert kwargs["policy_rules"] == [
+            ("client_type", ["web_browser"]),
+            ("app", ["77"]),
+        ]
+
+    def test_new_log_type_does_not_keep_old_format(self, mock_client):
+        """Test the configured format is not carried over to another log type"""
+        desired = dict(self.DESIRED_CONFIG, source_log_type="audit_logs")
 
         with pytest.raises(AnsibleExitJson) as result:
-            zpa_lss_config_controller.main()
+            self.run_module(state="present", config=desired)
+
+        assert result.value.result["drift"] == ["config.source_log_type"]
+        kwargs = mock_client.lss.update_lss_config.call_args.kwargs
+        assert kwargs["source_log_type"] == "audit_logs"
+        assert "log_stream_content" not in kwargs
+
+    def test_source_log_format_drift(self, mock_client):
+        """Test an explicit source_log_format is compared with the canonical format"""
+        mock_client.lss.get_all_log_formats.return_value = {
+            "zpn_trans_log": {"json": "JSON_FORMAT", "csv": "CSV_FORMAT"}
+        }
+
+        with pytest.raises(AnsibleExitJson) as result:
+            self.run_module(
+                state="present",
+                config=dict(self.DESIRED_CONFIG, source_log_format="json"),
+            )
+
+        assert result.value.result["drift"] == ["config.format"]
+        kwargs = mock_client.lss.update_lss_config.call_args.kwargs
+        assert kwargs["source_log_format"] == "json"
+        assert "log_stream_content" not in kwargs
+
+    def test_check_mode_update(self, mock_client):
+        """Test check mode reports drift without writing"""
+        with pytest.raises(AnsibleExitJson) as result:
+            self.run_module(
+                state="present",
+                config=dict(self.DESIRED_CONFIG, enabled=False),
+                _ansible_check_mode=True,
+            )
 
         assert result.value.result["changed"] is True
+        assert result.value.result["drift"] == ["config.enabled"]
+        mock_client.lss.update_lss_config.assert_not_called()
 
-    def test_delete_nonexistent_config(self, mock_client):
-        """Test deleting a nonexistent config"""
-        mock_client.lss.get_config.return_value = None
-        mock_client.lss.list_configs.return_value = MockListResult([])
-
-        set_module_args(
-            provider=DEFAULT_PROVIDER,
-            state="absent",
-            config={
-                "name": "NonExistent_Config",
-                "lss_host": "10.1.1.1",
-                "lss_port": "20000",
-                "source_log_type": "user_activity",
-            },
-        )
+    def test_update_error(self, mock_client):
+        """Test an update error fails the task"""
+        mock_client.lss.update_lss_config.return_value = (None, None, "boom")
 
-        from ansible_collections.zscaler.zpacloud.plugins.modules import (
-            zpa_lss_config_controller,
-        )
+        with pytest.raises(AnsibleFailJson) as result:
+            self.run_module(
+                state="present", config=dict(self.DESIRED_CONFIG, lss_port="1")
+            )
 
-        with pytest.raises(AnsibleExitJson) as result:
-            zpa_lss_config_controller.main()
+        assert "boom" in result.value.result["msg"]
 
-        assert result.value.result["changed"] is False
+    def test_delete_lss_config(self, mock_client):
+        """Test deleting an LSS config"""
+        mock_client.lss.delete_lss_config.return_value = (None, None, None)
 
-    def test_delete_with_error_code(self, mock_client):
-        """Test delete returning error code"""
-        mock_client.lss.get_config.return_value = self.SAMPLE_CONFIG.copy()
-        mock_client.lss.delete_lss_config.return_value = 400
-
-        set_module_args(
-            provider=DEFAULT_PROVIDER,
-            state="absent",
-            id="123456",
-            config={
-                "name": "Test_LSS_Config",
-                "lss_host": "10.1.1.1",
-                "lss_port": "20000",
-                "source_log_type": "user_activity",
-            },
-        )
+        with pytest.raises(AnsibleExitJson) as result:
+            self.run_module(state="absent", id="123456", config=self.DESIRED_CONFIG)
 
-        from ansible_collections.zscaler.zpacloud.plugins.modules import (
-            zpa_lss_config_controller,
+        assert result.value.result["changed"] is True
+        mock_client.lss.delete_lss_config.assert_called_once_with(
+            lss_config_id="123456"
         )
 
+    def test_delete_nonexistent_config(self, mock_client):
+        """Test deleting a nonexistent config"""
+        mock_client.lss.list_configs.return_value = ([], None, None)
+
         with pytest.raises(AnsibleExitJson) as result:
-            zpa_lss_config_controller.main()
+            self.run_module(
+                state="absent",
+                config=dict(self.DESIRED_CONFIG, name="NonExistent_Config"),
+            )
 
         assert result.value.result["changed"] is False
+        mock_client.lss.delete_lss_config.assert_not_called()
 
-    def test_create_with_policy_rule_resource(self, mock_client):
-        """Test creating LSS config with policy rule resource"""
-        mock_client.lss.list_configs.return_value = MockListResult([])
-        mock_client.lss.add_lss_config.return_value = {"id": "123456"}
-
-        set_module_args(
-            provider=DEFAULT_PROVIDER,
-            state="present",
-            config={
-                "name": "Test_LSS_Config",
-                "lss_host": "10.1.1.1",
-                "lss_port": "20000",
-                "source_log_type": "user_activity",
-            },
-            policy_rule_resource={
-                "name": "Test_Policy_Rule",
-                "action": "LOG",
-            },
-        )
+    def test_delete_with_error(self, mock_client):
+        """Test a delete error fails the task"""
+        mock_client.lss.delete_lss_config.return_value = (None, None, "in use")
 
-        from ansible_collections.zscaler.zpacloud.plugins.modules import (
-            zpa_lss_config_controller,
-        )
-
-        with pytest.raises(AnsibleExitJson) as result:
-            zpa_lss_config_controller.main()
+        with pytest.raises(AnsibleFailJson) as result:
+            self.run_module(state="absent", id="123456", config=self.DESIRED_CONFIG)
 
-        assert result.value.result["changed"] is True
+        assert "in use" in result.value.result["msg"]
@@ -217,3 +217,31 @@ class TestZPAPolicyAccessRuleInfoModule(ModuleTestCase):
 
         assert result.value.result["changed"] is False
         assert len(result.value.result["policy_rules"]) == 1
+
+    def test_fields_projection(self, mock_client, mocker):
+        """Test restricting the returned keys with fields."""
+        mocker.patch(
+            "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_policy_access_rule_info.collect_all_items",
+            return_value=(
+                [MockBox(self.SAMPLE_RULE), MockBox(self.SAMPLE_RULE_2)],
+                None,
+            ),
+        )
+
+        set_module_args(
+            provider=DEFAULT_PROVIDER,
+            policy_type="access",
+            fields=["id", "name"],
+        )
+
+        from ansible_collections.zscaler.zpacloud.plugins.modules import (
+            zpa_policy_access_rule_info,
+        )
+
+        with pytest.raises(AnsibleExitJson) as result:
+            zpa_policy_access_rule_info.main()
+
+        assert result.value.result["policy_rules"] == [
+            {"id": self.SAMPLE_RULE["id"], "name": self.SAMPLE_RULE["name"]},
+            {"id": self.SAMPLE_RULE_2["id"], "name": self.SAMPLE_RULE_2["name"]},
+        ]
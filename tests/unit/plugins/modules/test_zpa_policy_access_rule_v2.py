@@ -22,6 +22,7 @@ from unittest.mock import MagicMock, patch
 from tests.unit.plugins.modules.common.utils import (
     set_module_args,
     AnsibleExitJson,
+    AnsibleFailJson,
     ModuleTestCase,
     DEFAULT_PROVIDER,
 )
@@ -297,3 +298,89 @@ class TestZPAPolicyAccessRuleV2Module(ModuleTestCase):
 
         mock_client.policies.add_access_rule_v2.assert_called_once()
         assert result.value.result["changed"] is True
+
+    def test_rule_with_named_operands(self, mock_client, mocker):
+        """Test operands given by name are resolved to IDs before the create."""
+        mocker.patch(
+            "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_policy_access_rule_v2.collect_all_items",
+            return_value=([], None),
+        )
+        mock_client.application_segment.list_segments.return_value = (
+            [MockBox({"id": "11", "name": "crm"})],
+            None,
+        )
+        mock_client.idp.list_idps.return_value = (
+            [MockBox({"id": "100", "name": "Okta"})],
+            None,
+        )
+        mock_client.scim_groups.list_scim_groups.return_value = (
+            [MockBox({"id": "7", "name": "Engineering"})],
+            None,
+        )
+        mock_client.policies.add_access_rule_v2.return_value = (
+            MockBox(self.SAMPLE_RULE),
+            None,
+            None,
+        )
+
+        set_module_args(
+            provider=DEFAULT_PROVIDER,
+            name="Policy Access Rule V2 - Example",
+            action="ALLOW",
+            conditions=[
+                {
+                    "operator": "OR",
+                    "operands": [{"object_type": "APP", "names": ["crm"]}],
+                },
+                {
+                    "operator": "OR",
+                    "operands": [
+                        {
+                            "object_type": "SCIM_GROUP",
+                            "entry_values": {
+                                "lhs_name": "Okta",
+                                "rhs_name": "Engineering",
+                            },
+                        }
+                    ],
+                },
+            ],
+            state="present",
+        )
+
+        from ansible_collections.zscaler.zpacloud.plugins.modules import (
+            zpa_policy_access_rule_v2,
+        )
+
+        with pytest.raises(AnsibleExitJson):
+            zpa_policy_access_rule_v2.main()
+
+        conditions = mock_client.policies.add_access_rule_v2.call_args.kwargs[
+            "conditions"
+        ]
+        assert conditions == [
+            ("OR", ("app", ["11"])),
+            ("OR", ("scim_group", "100", "7")),
+        ]
+
+    def test_rule_with_unresolved_operand_name(self, mock_client, mocker):
+        """Test unresolved operand names fail the task before any change."""
+        mock_client.application_segment.list_segments.return_value = ([], None)
+
+        set_module_args(
+            provider=DEFAULT_PROVIDER,
+            name="Policy Access Rule V2 - Example",
+            action="ALLOW",
+            conditions=[{"operands": [{"object_type": "APP", "names": ["gone"]}]}],
+            state="present",
+        )
+
+        from ansible_collections.zscaler.zpacloud.plugins.modules import (
+            zpa_policy_access_rule_v2,
+        )
+
+        with pytest.raises(AnsibleFailJson) as result:
+            zpa_policy_access_rule_v2.main()
+
+        assert "APP: gone" in result.value.result["msg"]
+        mock_client.policies.add_access_rule_v2.assert_not_called()
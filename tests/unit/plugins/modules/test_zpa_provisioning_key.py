@@ -70,17 +70,20 @@ class TestZPAProvisioningKeyModule(ModuleTestCase):
         ) as mock_class:
             mock_class.zpa_argument_spec.return_value = REAL_ARGUMENT_SPEC.copy()
             client_instance = MagicMock()
+            client_instance.enrollment_certificates.list_enrolment.return_value = (
+                [MockBox(self.SAMPLE_ENROLLMENT_CERT)],
+                None,
+                None,
+            )
             mock_class.return_value = client_instance
             yield client_instance
 
     def test_create_provisioning_key(self, mock_client, mocker):
         """Test creating a new Provisioning Key."""
-        mock_cert = MockBox(self.SAMPLE_ENROLLMENT_CERT)
         mocker.patch(
             "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_provisioning_key.collect_all_items",
             side_effect=[
-                ([mock_cert], None),  # First call for enrollment cert
-                ([], None),  # Second call for list provisioning keys
+                ([], None),
             ],
         )
 
@@ -112,7 +115,6 @@ class TestZPAProvisioningKeyModule(ModuleTestCase):
 
     def test_update_provisioning_key(self, mock_client, mocker):
         """Test updating an existing Provisioning Key."""
-        mock_cert = MockBox(self.SAMPLE_ENROLLMENT_CERT)
         existing_key = dict(self.SAMPLE_KEY)
         existing_key["max_usage"] = 5
         mock_existing = MockBox(existing_key)
@@ -120,8 +122,7 @@ class TestZPAProvisioningKeyModule(ModuleTestCase):
         mocker.patch(
             "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_provisioning_key.collect_all_items",
             side_effect=[
-                ([mock_cert], None),  # First call for enrollment cert
-                ([mock_existing], None),  # Second call for list provisioning keys
+                ([mock_existing], None),
             ],
         )
 
@@ -155,14 +156,12 @@ class TestZPAProvisioningKeyModule(ModuleTestCase):
 
     def test_delete_provisioning_key(self, mock_client, mocker):
         """Test deleting a Provisioning Key."""
-        mock_cert = MockBox(self.SAMPLE_ENROLLMENT_CERT)
         mock_existing = MockBox(self.SAMPLE_KEY)
 
         mocker.patch(
             "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_provisioning_key.collect_all_items",
             side_effect=[
-                ([mock_cert], None),  # First call for enrollment cert
-                ([mock_existing], None),  # Second call for list provisioning keys
+                ([mock_existing], None),
             ],
         )
 
@@ -191,14 +190,12 @@ class TestZPAProvisioningKeyModule(ModuleTestCase):
 
     def test_no_change_when_identical(self, mock_client, mocker):
         """Test no change when key already matches desired state."""
-        mock_cert = MockBox(self.SAMPLE_ENROLLMENT_CERT)
         mock_existing = MockBox(self.SAMPLE_KEY)
 
         mocker.patch(
             "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_provisioning_key.collect_all_items",
             side_effect=[
-                ([mock_cert], None),  # First call for enrollment cert
-                ([mock_existing], None),  # Second call for list provisioning keys
+                ([mock_existing], None),
             ],
         )
 
@@ -224,13 +221,11 @@ class TestZPAProvisioningKeyModule(ModuleTestCase):
 
     def test_check_mode_create(self, mock_client, mocker):
         """Test check mode for create operation."""
-        mock_cert = MockBox(self.SAMPLE_ENROLLMENT_CERT)
 
         mocker.patch(
             "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_provisioning_key.collect_all_items",
             side_effect=[
-                ([mock_cert], None),  # First call for enrollment cert
-                ([], None),  # Second call for list provisioning keys
+                ([], None),
             ],
         )
 
@@ -256,9 +251,10 @@ class TestZPAProvisioningKeyModule(ModuleTestCase):
 
     def test_enrollment_cert_not_found(self, mock_client, mocker):
         """Test when enrollment certificate is not found."""
-        mocker.patch(
-            "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_provisioning_key.collect_all_items",
-            return_value=([], None),
+        mock_client.enrollment_certificates.list_enrolment.return_value = (
+            [],
+            None,
+            None,
         )
 
         set_module_args(
@@ -281,11 +277,6 @@ class TestZPAProvisioningKeyModule(ModuleTestCase):
 
     def test_get_key_by_id(self, mock_client, mocker):
         """Test retrieving provisioning key by ID"""
-        mock_cert = MockBox(self.SAMPLE_ENROLLMENT_CERT)
-        mocker.patch(
-            "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_provisioning_key.collect_all_items",
-            return_value=([mock_cert], None),
-        )
         mock_client.provisioning.get_provisioning_key.return_value = (
             MockBox(self.SAMPLE_KEY),
             None,
@@ -316,11 +307,6 @@ class TestZPAProvisioningKeyModule(ModuleTestCase):
 
     def test_get_key_by_id_error(self, mock_client, mocker):
         """Test error when retrieving provisioning key by ID"""
-        mock_cert = MockBox(self.SAMPLE_ENROLLMENT_CERT)
-        mocker.patch(
-            "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_provisioning_key.collect_all_items",
-            return_value=([mock_cert], None),
-        )
         mock_client.provisioning.get_provisioning_key.return_value = (
             None,
             None,
@@ -346,11 +332,9 @@ class TestZPAProvisioningKeyModule(ModuleTestCase):
 
     def test_create_key_error(self, mock_client, mocker):
         """Test error handling when creating provisioning key"""
-        mock_cert = MockBox(self.SAMPLE_ENROLLMENT_CERT)
         mocker.patch(
             "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_provisioning_key.collect_all_items",
             side_effect=[
-                ([mock_cert], None),
                 ([], None),
             ],
         )
@@ -380,12 +364,10 @@ class TestZPAProvisioningKeyModule(ModuleTestCase):
 
     def test_update_key_error(self, mock_client, mocker):
         """Test error handling when updating provisioning key"""
-        mock_cert = MockBox(self.SAMPLE_ENROLLMENT_CERT)
         existing_key = {**self.SAMPLE_KEY, "max_usage": 5}
         mocker.patch(
             "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_provisioning_key.collect_all_items",
             side_effect=[
-                ([mock_cert], None),
                 ([MockBox(existing_key)], None),
             ],
         )
@@ -415,11 +397,9 @@ class TestZPAProvisioningKeyModule(ModuleTestCase):
 
     def test_delete_key_error(self, mock_client, mocker):
         """Test error handling when deleting provisioning key"""
-        mock_cert = MockBox(self.SAMPLE_ENROLLMENT_CERT)
         mocker.patch(
             "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_provisioning_key.collect_all_items",
             side_effect=[
-                ([mock_cert], None),
                 ([MockBox(self.SAMPLE_KEY)], None),
             ],
         )
@@ -447,11 +427,9 @@ class TestZPAProvisioningKeyModule(ModuleTestCase):
 
     def test_list_keys_error(self, mock_client, mocker):
         """Test error handling when listing provisioning keys"""
-        mock_cert = MockBox(self.SAMPLE_ENROLLMENT_CERT)
         mocker.patch(
             "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_provisioning_key.collect_all_items",
             side_effect=[
-                ([mock_cert], None),
                 (None, "List error"),
             ],
         )
@@ -134,6 +134,29 @@ class TestZPASAMLAttributeInfoModule(ModuleTestCase):
         assert result.value.result["changed"] is False
         assert len(result.value.result["saml_attributes"]) == 1
 
+    def test_lookup_without_cache_searches_by_name(self, mock_client, mocker):
+        """Test a lookup by name with cache_ttl=0 lets the API filter by name."""
+        collect = mocker.patch(
+            "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_saml_attribute_info.collect_all_items",
+            return_value=([MockBox(self.SAMPLE_ATTR)], None),
+        )
+
+        set_module_args(
+            provider=DEFAULT_PROVIDER,
+            name="DepartmentName_Okta_Users",
+            cache_ttl=0,
+        )
+
+        from ansible_collections.zscaler.zpacloud.plugins.modules import (
+            zpa_saml_attribute_info,
+        )
+
+        with pytest.raises(AnsibleExitJson) as result:
+            zpa_saml_attribute_info.main()
+
+        assert len(result.value.result["saml_attributes"]) == 1
+        assert collect.call_args.args[1] == {"search": "DepartmentName_Okta_Users"}
+
     def test_get_all_attributes(self, mock_client, mocker):
         """Test fetching all SAML Attributes."""
         mock_attrs = [MockBox(self.SAMPLE_ATTR), MockBox(self.SAMPLE_ATTR_2)]
@@ -144,6 +144,35 @@ class TestZPASCIMAttributeHeaderInfoModule(ModuleTestCase):
         assert len(result.value.result["attributes"]) == 1
         assert result.value.result["attributes"][0]["name"] == "costCenter"
 
+    def test_lookup_without_cache_searches_by_name(self, mock_client, mocker):
+        """Test a lookup by name with cache_ttl=0 lets the API filter by name."""
+        mock_client.idp.list_idps.return_value = (
+            [MockBox(self.SAMPLE_IDP)],
+            None,
+            None,
+        )
+        collect = mocker.patch(
+            "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_scim_attribute_header_info.collect_all_items",
+            return_value=([MockBox(self.SAMPLE_ATTR)], None),
+        )
+
+        set_module_args(
+            provider=DEFAULT_PROVIDER,
+            name="costCenter",
+            idp_name="Okta_Users",
+            cache_ttl=0,
+        )
+
+        from ansible_collections.zscaler.zpacloud.plugins.modules import (
+            zpa_scim_attribute_header_info,
+        )
+
+        with pytest.raises(AnsibleExitJson) as result:
+            zpa_scim_attribute_header_info.main()
+
+        assert result.value.result["attributes"][0]["name"] == "costCenter"
+        assert collect.call_args.args[1] == {"search": "costCenter"}
+
     def test_get_all_attributes(self, mock_client, mocker):
         """Test fetching all SCIM Attributes for an IdP."""
         mock_idp = MockBox(self.SAMPLE_IDP)
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+# MIT License
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import sys
+import os
+
+COLLECTION_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "..", "..")
+)
+if COLLECTION_ROOT not in sys.path:
+    sys.path.insert(0, COLLECTION_ROOT)
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from tests.unit.plugins.modules.common.utils import (
+    set_module_args,
+    AnsibleExitJson,
+    AnsibleFailJson,
+    ModuleTestCase,
+    DEFAULT_PROVIDER,
+)
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    ZPAClientHelper,
+)
+
+REAL_ARGUMENT_SPEC = ZPAClientHelper.zpa_argument_spec()
+
+
+class MockBox:
+    def __init__(self, data):
+        self._data = data
+
+    def as_dict(self):
+        return self._data
+
+
+IDPS = {"Okta_Users": "100", "AzureAD": "200"}
+GROUPS = {
+    "100": [{"id": "1", "name": "Engineering"}, {"id": "2", "name": "Finance"}],
+    "200": [{"id": "3", "name": "Contractors"}],
+}
+
+
+class TestZPASCIMGroupBulkInfoModule(ModuleTestCase):
+    """Unit tests for zpa_scim_group_bulk_info module."""
+
+    @pytest.fixture
+    def mock_client(self, mocker):
+        with patch(
+            "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_scim_group_bulk_info.ZPAClientHelper"
+        ) as mock_class:
+            mock_class.zpa_argument_spec.return_value = REAL_ARGUMENT_SPEC.copy()
+            client_instance = MagicMock()
+
+            def list_idps(query_params):
+                name = query_params["search"]
+                found = [{"id": IDPS[name], "name": name}] if name in IDPS else []
+                return [MockBox(i) for i in found], None, None
+
+            def list_scim_groups(idp_id, query_params):
+                return [MockBox(g) for g in GROUPS[idp_id]], None, None
+
+            client_instance.idp.list_idps.side_effect = list_idps
+            client_instance.scim_groups.list_scim_groups.side_effect = list_scim_groups
+            mock_class.return_value = client_instance
+            yield client_instance
+
+    def run_module(self, **kwargs):
+        from ansible_collections.zscaler.zpacloud.plugins.modules import (
+            zpa_scim_group_bulk_info,
+        )
+
+        set_module_args(provider=DEFAULT_PROVIDER, **kwargs)
+        zpa_scim_group_bulk_info.main()
+
+    def test_resolves_groups_batched_per_idp(self, mock_client):
+        groups = [
+            {"idp_name": "Okta_Users", "name": "Finance"},
+            {"idp_name": "AzureAD", "name": "Contractors"},
+            {"idp_name": "Okta_Users", "name": "Engineering"},
+        ]
+        with pytest.raises(AnsibleExitJson) as result:
+            self.run_module(groups=groups)
+
+        assert result.value.result["changed"] is False
+        assert result.value.result["operands"] == [
+            {"object_type": "SCIM_GROUP", "entry_values": {"lhs": "100", "rhs": "2"}},
+            {"object_type": "SCIM_GROUP", "entry_values": {"lhs": "200", "rhs": "3"}},
+            {"object_type": "SCIM_GROUP", "entry_values": {"lhs": "100", "rhs": "1"}},
+        ]
+        assert result.value.result["missing"] == []
+        assert mock_client.idp.list_idps.call_count == 2
+        assert mock_client.scim_groups.list_scim_groups.call_count == 2
+
+    def test_listing_is_reused_by_later_tasks(self, mock_client):
+        for name in ("Finance", "Engineering"):
+            with pytest.raises(AnsibleExitJson):
+                self.run_module(groups=[{"idp_name": "Okta_Users", "name": name}])
+
+        mock_client.idp.list_idps.assert_called_once()
+        mock_client.scim_groups.list_scim_groups.assert_called_once()
+
+    def test_missing_group_fails_in_strict_mode(self, mock_client):
+        groups = [
+            {"idp_name": "Okta_Users", "name": "Interns"},
+            {"idp_name": "Unknown", "name": "Engineering"},
+        ]
+        with pytest.raises(AnsibleFailJson) as result:
+            self.run_module(groups=groups)
+
+        assert "Okta_Users/Interns" in result.value.result["msg"]
+        assert "Unknown/Engineering" in result.value.result["msg"]
+
+    def test_missing_group_is_skipped_when_ignored(self, mock_client):
+        groups = [
+            {"idp_name": "Okta_Users", "name": "Interns"},
+            {"idp_name": "Okta_Users", "name": "Finance"},
+        ]
+        with pytest.raises(AnsibleExitJson) as result:
+            self.run_module(groups=groups, errors="ignore")
+
+        assert len(result.value.result["operands"]) == 1
+        assert result.value.result["missing"] == [
+            {"idp_name": "Okta_Users", "name": "Interns"}
+        ]
+        assert result.value.result["groups"][0] == {
+            "idp_name": "Okta_Users",
+            "name": "Interns",
+            "idp_id": "100",
+            "id": None,
+        }
+
+    def test_list_error(self, mock_client):
+        mock_client.scim_groups.list_scim_groups.side_effect = None
+        mock_client.scim_groups.list_scim_groups.return_value = (None, None, "boom")
+        with pytest.raises(AnsibleFailJson) as result:
+            self.run_module(groups=[{"idp_name": "Okta_Users", "name": "Finance"}])
+
+        assert "boom" in result.value.result["msg"]
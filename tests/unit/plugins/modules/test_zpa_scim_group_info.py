@@ -271,3 +271,114 @@ class TestZPASCIMGroupInfoModule(ModuleTestCase):
             zpa_scim_group_info.main()
 
         assert "error" in result.value.result["msg"].lower()
+
+    def test_count_only(self, mock_client, mocker):
+        """Test returning only the number of SCIM Groups."""
+        mock_client.idp.list_idps.return_value = (
+            [MockBox(self.SAMPLE_IDP)],
+            None,
+            None,
+        )
+        mocker.patch(
+            "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_scim_group_info.collect_all_items",
+            return_value=(
+                [MockBox(self.SAMPLE_SCIM_GROUP), MockBox(self.SAMPLE_SCIM_GROUP_2)],
+                None,
+            ),
+        )
+
+        set_module_args(
+            provider=DEFAULT_PROVIDER, idp_name="Okta_Users", count_only=True
+        )
+
+        from ansible_collections.zscaler.zpacloud.plugins.modules import (
+            zpa_scim_group_info,
+        )
+
+        with pytest.raises(AnsibleExitJson) as result:
+            zpa_scim_group_info.main()
+
+        assert result.value.result["count"] == 2
+        assert "groups" not in result.value.result
+
+    def test_lookups_share_idp_and_group_listing(self, mock_client, mocker):
+        """Test many lookups by name cost one IdP search and one listing."""
+        mock_client.idp.list_idps.return_value = (
+            [MockBox(self.SAMPLE_IDP)],
+            None,
+            None,
+        )
+        collect = mocker.patch(
+            "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_scim_group_info.collect_all_items",
+            return_value=(
+                [MockBox(self.SAMPLE_SCIM_GROUP), MockBox(self.SAMPLE_SCIM_GROUP_2)],
+                None,
+            ),
+        )
+
+        from ansible_collections.zscaler.zpacloud.plugins.modules import (
+            zpa_scim_group_info,
+        )
+
+        for name in ("Engineering", "Finance", "Engineering"):
+            set_module_args(provider=DEFAULT_PROVIDER, name=name, idp_name="Okta_Users")
+            with pytest.raises(AnsibleExitJson) as result:
+                zpa_scim_group_info.main()
+            assert result.value.result["groups"][0]["name"] == name
+
+        mock_client.idp.list_idps.assert_called_once()
+        collect.assert_called_once()
+
+    def test_filtered_listing_bypasses_cache(self, mock_client, mocker):
+        """Test listings narrowed by query parameters are never cached."""
+        mock_client.idp.list_idps.return_value = (
+            [MockBox(self.SAMPLE_IDP)],
+            None,
+            None,
+        )
+        collect = mocker.patch(
+            "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_scim_group_info.collect_all_items",
+            return_value=([MockBox(self.SAMPLE_SCIM_GROUP)], None),
+        )
+
+        from ansible_collections.zscaler.zpacloud.plugins.modules import (
+            zpa_scim_group_info,
+        )
+
+        for _unused in range(2):
+            set_module_args(
+                provider=DEFAULT_PROVIDER, idp_name="Okta_Users", sort_order="ASC"
+            )
+            with pytest.raises(AnsibleExitJson):
+                zpa_scim_group_info.main()
+
+        assert collect.call_count == 2
+        assert collect.call_args.args[1] == {"sort_order": "ASC"}
+
+    def test_lookup_without_cache_searches_by_name(self, mock_client, mocker):
+        """Test a lookup by name with cache_ttl=0 lets the API filter by name."""
+        mock_client.idp.list_idps.return_value = (
+            [MockBox(self.SAMPLE_IDP)],
+            None,
+            None,
+        )
+        collect = mocker.patch(
+            "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_scim_group_info.collect_all_items",
+            return_value=([MockBox(self.SAMPLE_SCIM_GROUP)], None),
+        )
+        set_module_args(
+            provider=DEFAULT_PROVIDER,
+            name="Engineering",
+            idp_name="Okta_Users",
+            cache_ttl=0,
+        )
+
+        from ansible_collections.zscaler.zpacloud.plugins.modules import (
+            zpa_scim_group_info,
+        )
+
+        with pytest.raises(AnsibleExitJson) as result:
+            zpa_scim_group_info.main()
+
+        assert result.value.result["groups"][0]["name"] == "Engineering"
+        assert collect.call_args.args[1] == {"search": "Engineering"}
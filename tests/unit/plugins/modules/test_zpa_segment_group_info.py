@@ -101,6 +101,31 @@ class TestZpaSegmentGroupInfo(ModuleTestCase):
         assert result.value.result["changed"] is False
         assert len(result.value.result["groups"]) == 3
 
+    def test_fetch_all_raw(self, mock_client):
+        """Test raw listing skips the SDK models"""
+        mock_client.list_raw.return_value = (
+            [{"id": "1", "name": "Group1", "config_space": "DEFAULT"}],
+            None,
+            None,
+        )
+
+        set_module_args(provider=DEFAULT_PROVIDER, raw=True, microtenant_id="42")
+
+        with pytest.raises(AnsibleExitJson) as result:
+            from ansible_collections.zscaler.zpacloud.plugins.modules import (
+                zpa_segment_group_info,
+            )
+
+            zpa_segment_group_info.main()
+
+        assert result.value.result["groups"] == [
+            {"id": "1", "name": "Group1", "config_space": "DEFAULT"}
+        ]
+        path, query_params = mock_client.list_raw.call_args.args
+        assert path == "/segmentGroup"
+        assert query_params["microtenant_id"] == "42"
+        mock_client.segment_groups.list_groups.assert_not_called()
+
     def test_fetch_all_returns_empty(self, mock_client):
         """Test fetching when no segment groups exist"""
         # Mock: return empty list
@@ -217,7 +242,7 @@ class TestZpaSegmentGroupInfo(ModuleTestCase):
         )
 
         # Run module with non-existent name
-        set_module_args(provider=DEFAULT_PROVIDER, name="NonExistent_Group")
+        set_module_args(provider=DEFAULT_PROVIDER, name="Group_1")
 
         with pytest.raises(AnsibleFailJson) as result:
             from ansible_collections.zscaler.zpacloud.plugins.modules import (
@@ -228,6 +253,9 @@ class TestZpaSegmentGroupInfo(ModuleTestCase):
 
         # Should fail with appropriate message
         assert result.value.result["failed"] is True
+        assert result.value.result["msg"] == (
+            "Segment Group 'Group_1' not found. Did you mean: 'Group1', 'Group2'?"
+        )
         assert "not found" in result.value.result["msg"].lower()
 
     # ==================== ERROR HANDLING TESTS ====================
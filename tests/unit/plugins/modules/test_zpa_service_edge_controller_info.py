@@ -207,3 +207,19 @@ class TestZPAServiceEdgeControllerInfoModule(ModuleTestCase):
             zpa_service_edge_controller_info.main()
 
         assert result.value.result["changed"] is False
+
+    def test_summary(self, mock_client):
+        mock_client.list_raw.return_value = ([self.SAMPLE_SERVICE_EDGE], None, None)
+
+        set_module_args(provider=DEFAULT_PROVIDER, summary=True)
+
+        from ansible_collections.zscaler.zpacloud.plugins.modules import (
+            zpa_service_edge_controller_info,
+        )
+
+        with pytest.raises(AnsibleExitJson) as result:
+            zpa_service_edge_controller_info.main()
+
+        assert result.value.result["summary"]["total"] == 1
+        assert mock_client.list_raw.call_args[0][0] == "/serviceEdge"
+        mock_client.service_edges.list_service_edges.assert_not_called()
@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+# MIT License
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from tests.unit.plugins.modules.common.utils import (
+    set_module_args,
+    AnsibleExitJson,
+    AnsibleFailJson,
+    ModuleTestCase,
+    DEFAULT_PROVIDER,
+)
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    ZPAClientHelper,
+)
+
+REAL_ARGUMENT_SPEC = ZPAClientHelper.zpa_argument_spec()
+
+
+class MockBox:
+    def __init__(self, data):
+        self._data = data
+
+    def as_dict(self):
+        return self._data
+
+
+PLATFORM = {"id": "ns-1", "name": "Platform", "enabled": True, "origin": "CUSTOM"}
+ENVIRONMENT = {
+    "id": "key-1",
+    "name": "Environment",
+    "enabled": True,
+    "tag_values": [{"id": "val-1", "name": "dev"}, {"id": "val-2", "name": "prod"}],
+}
+PROD_GROUP = {
+    "id": "grp-1",
+    "name": "Prod",
+    "tags": [
+        {
+            "namespace": {"id": "ns-1"},
+            "tag_key": {"id": "key-1"},
+            "tag_value": {"id": "val-2", "name": "prod"},
+        }
+    ],
+}
+TREE = [
+    {
+        "name": "Platform",
+        "keys": [{"name": "Environment", "values": ["dev", "prod"]}],
+    }
+]
+GROUPS = [
+    {
+        "name": "Prod",
+        "tags": [{"namespace": "Platform", "key": "Environment", "value": "prod"}],
+    }
+]
+
+
+class TestZpaTagTree(ModuleTestCase):
+    @pytest.fixture
+    def mock_client(self):
+        with patch(
+            "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_tag_tree.ZPAClientHelper"
+        ) as mock_class:
+            mock_class.zpa_argument_spec.return_value = REAL_ARGUMENT_SPEC.copy()
+            client = MagicMock()
+            self.keys = {"ns-1": [ENVIRONMENT]}
+            client.tag_namespace.list_namespaces.return_value = (
+                [MockBox(PLATFORM)],
+                None,
+                None,
+            )
+            client.tag_group.list_tag_groups.return_value = (
+                [MockBox(PROD_GROUP)],
+                None,
+                None,
+            )
+            client.tag_key.list_tag_keys.side_effect = (
+                lambda query_params=None, namespace_id=None: (
+                    [MockBox(k) for k in self.keys.get(namespace_id, [])],
+                    None,
+                    None,
+                )
+            )
+            mock_class.return_value = client
+            yield client
+
+    def _run(self, **args):
+        set_module_args(provider=DEFAULT_PROVIDER, **args)
+        from ansible_collections.zscaler.zpacloud.plugins.modules import zpa_tag_tree
+
+        zpa_tag_tree.main()
+
+    def test_unchanged_tree_makes_no_writes(self, mock_client):
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(namespaces=TREE, tag_groups=GROUPS)
+
+        assert result.value.result["changed"] is False
+        assert result.value.result["namespaces"] == {
+            "Platform": {
+                "id": "ns-1",
+                "keys": {
+                    "Environment": {
+                        "id": "key-1",
+                        "values": {"dev": "val-1", "prod": "val-2"},
+                    }
+                },
+            }
+        }
+        mock_client.tag_namespace.list_namespaces.assert_called_once()
+        mock_client.tag_key.list_tag_keys.assert_called_once()
+        mock_client.tag_key.get_tag_key.assert_not_called()
+        mock_client.tag_key.update_tag_key.assert_not_called()
+        mock_client.tag_group.update_tag_group.assert_not_called()
+
+    def test_lists_in_the_microtenant(self, mock_client):
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(namespaces=TREE, tag_groups=GROUPS, microtenant_id="mt-1")
+
+        assert result.value.result["changed"] is False
+        for listing in (
+            mock_client.tag_namespace.list_namespaces,
+            mock_client.tag_group.list_tag_groups,
+        ):
+            assert listing.call_args.args[0]["microtenant_id"] == "mt-1"
+        key_listing = mock_client.tag_key.list_tag_keys.call_args.kwargs
+        assert key_listing["namespace_id"] == "ns-1"
+        assert key_listing["query_params"]["microtenant_id"] == "mt-1"
+
+    def test_creates_whole_tree(self, mock_client):
+        mock_client.tag_namespace.list_namespaces.return_value = ([], None, None)
+        mock_client.tag_group.list_tag_groups.return_value = ([], None, None)
+        mock_client.tag_namespace.create_namespace.return_value = (
+            MockBox({"id": "ns-9", "name": "Platform"}),
+            None,
+            None,
+        )
+        mock_client.tag_key.create_tag_key.return_value = (
+            MockBox({**ENVIRONMENT, "id": "key-9"}),
+            None,
+            None,
+        )
+        mock_client.tag_group.create_tag_group.return_value = (
+            MockBox({"id": "grp-9"}),
+            None,
+            None,
+        )
+
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(namespaces=TREE, tag_groups=GROUPS)
+
+        assert result.value.result["changed"] is True
+        assert result.value.result["changes"] == {
+            "namespaces": {"created": ["Platform"], "updated": [], "deleted": []},
+            "tag_keys": {
+                "created": ["Platform/Environment"],
+                "updated": [],
+                "deleted": [],
+            },
+            "tag_groups": {"created": ["Prod"], "updated": [], "deleted": []},
+        }
+        # A namespace that did not exist has no keys to list.
+        mock_client.tag_key.list_tag_keys.assert_not_called()
+        key_args = mock_client.tag_key.create_tag_key.call_args[0]
+        assert key_args[0] == "ns-9"
+        assert key_args[1].request_format()["tagValues"] == [
+            {"name": "dev"},
+            {"name": "prod"},
+        ]
+        group = mock_client.tag_group.create_tag_group.call_args[0][0]
+        assert group.request_format()["tags"] == [
+            {
+                "namespace": {"id": "ns-9"},
+                "tagKey": {"id": "key-9"},
+                "tagValue": {"id": "val-2", "name": "prod"},
+            }
+        ]
+
+    def test_updates_changed_values_only(self, mock_client):
+        mock_client.tag_key.update_tag_key.return_value = (MockBox({}), None, None)
+        tree = [
+            {
+                "name": "Platform",
+                "keys": [{"name": "Environment", "values": ["prod", "qa"]}],
+            }
+        ]
+
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(namespaces=tree)
+
+        assert result.value.result["changes"]["tag_keys"]["updated"] == [
+            "Platform/Environment"
+        ]
+        args = mock_client.tag_key.update_tag_key.call_args[0]
+        assert args[:2] == ("ns-1", "key-1")
+        assert args[2].request_format()["tagValues"] == [
+            {"id": "val-2", "name": "prod"},
+            {"name": "qa"},
+        ]
+        mock_client.tag_namespace.update_namespace.assert_not_called()
+        mock_client.tag_group.list_tag_groups.assert_not_called()
+
+    def test_fetches_keys_whose_listing_omits_values(self, mock_client):
+        self.keys["ns-1"] = [
+            {"id": "key-1", "name": "Environment", "enabled": True},
+            {"id": "key-2", "name": "Team", "enabled": True},
+        ]
+        mock_client.tag_key.get_tag_key.return_value = (
+            MockBox(ENVIRONMENT),
+            None,
+            None,
+        )
+
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(namespaces=TREE)
+
+        assert result.value.result["changed"] is False
+        mock_client.tag_key.get_tag_key.assert_called_once_with("ns-1", "key-1", {})
+
+    def test_check_mode(self, mock_client):
+        mock_client.tag_group.list_tag_groups.return_value = ([], None, None)
+        tree = TREE + [
+            {"name": "Security", "keys": [{"name": "Tier", "values": ["1"]}]}
+        ]
+
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(namespaces=tree, tag_groups=GROUPS, _ansible_check_mode=True)
+
+        changes = result.value.result["changes"]
+        assert result.value.result["changed"] is True
+        assert changes["namespaces"]["created"] == ["Security"]
+        assert changes["tag_keys"]["created"] == ["Security/Tier"]
+        assert changes["tag_groups"]["created"] == ["Prod"]
+        mock_client.tag_namespace.create_namespace.assert_not_called()
+        mock_client.tag_key.create_tag_key.assert_not_called()
+        mock_client.tag_group.create_tag_group.assert_not_called()
+
+    def test_absent_deletes_groups_keys_then_namespaces(self, mock_client):
+        for call in (
+            mock_client.tag_group.delete_tag_group,
+            mock_client.tag_key.delete_tag_key,
+            mock_client.tag_namespace.delete_namespace,
+        ):
+            call.return_value = (None, None, None)
+
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(
+                state="absent", namespaces=[{"name": "Platform"}], tag_groups=GROUPS
+            )
+
+        assert result.value.result["changes"] == {
+            "namespaces": {"created": [], "updated": [], "deleted": ["Platform"]},
+            "tag_keys": {
+                "created": [],
+                "updated": [],
+                "deleted": ["Platform/Environment"],
+            },
+            "tag_groups": {"created": [], "updated": [], "deleted": ["Prod"]},
+        }
+        mock_client.tag_group.delete_tag_group.assert_called_once_with("grp-1", {})
+        mock_client.tag_key.delete_tag_key.assert_called_once_with("ns-1", "key-1", {})
+        mock_client.tag_namespace.delete_namespace.assert_called_once_with("ns-1", {})
+
+    def test_absent_only_listed_keys(self, mock_client):
+        mock_client.tag_key.delete_tag_key.return_value = (None, None, None)
+
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(
+                state="absent",
+                namespaces=[{"name": "Platform", "keys": [{"name": "Environment"}]}],
+            )
+
+        assert result.value.result["changed"] is True
+        mock_client.tag_namespace.delete_namespace.assert_not_called()
+
+    def test_partial_failure(self, mock_client):
+        mock_client.tag_key.create_tag_key.return_value = (None, None, "quota")
+        tree = [{"name": "Platform", "keys": [{"name": "Team", "values": ["a"]}]}]
+
+        with pytest.raises(AnsibleFailJson) as result:
+            self._run(namespaces=tree, tag_groups=GROUPS)
+
+        assert "Platform/Team: quota" in result.value.result["msg"]
+        mock_client.tag_group.update_tag_group.assert_not_called()
+
+    def test_unknown_tag_key(self, mock_client):
+        groups = [
+            {
+                "name": "Prod",
+                "tags": [{"namespace": "Platform", "key": "Owner", "value": "x"}],
+            }
+        ]
+        with pytest.raises(AnsibleFailJson) as result:
+            self._run(tag_groups=groups)
+
+        assert "unknown tag key(s) Platform/Owner" in result.value.result["msg"]
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+# MIT License
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import gzip
+import hashlib
+import json
+import os
+import sys
+
+# Add the collection root to path for imports
+COLLECTION_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "..", "..")
+)
+if COLLECTION_ROOT not in sys.path:
+    sys.path.insert(0, COLLECTION_ROOT)
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from tests.unit.plugins.modules.common.utils import (
+    set_module_args,
+    AnsibleExitJson,
+    AnsibleFailJson,
+    ModuleTestCase,
+    DEFAULT_PROVIDER,
+)
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    ZPAClientHelper,
+)
+
+REAL_ARGUMENT_SPEC = ZPAClientHelper.zpa_argument_spec()
+
+
+class MockBox:
+    """Mock Box object to simulate SDK responses"""
+
+    def __init__(self, data):
+        self._data = data
+
+    def as_dict(self):
+        return dict(self._data)
+
+
+class MockResp:
+    """Mock paginated SDK response returning the remaining pages."""
+
+    def __init__(self, pages):
+        self._pages = pages
+
+    def has_next(self):
+        return bool(self._pages)
+
+    def next(self):
+        return (self._pages[0], MockResp(self._pages[1:]), None)
+
+
+def read_jsonl(path):
+    with gzip.open(path, "rt", encoding="utf-8") as fh:
+        return [json.loads(line) for line in fh]
+
+
+class TestZPATenantExportModule(ModuleTestCase):
+    """Unit tests for zpa_tenant_export module."""
+
+    @pytest.fixture
+    def mock_client(self, mocker):
+        """Create a mock ZPA client that preserves argument_spec"""
+        with patch(
+            "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_tenant_export.ZPAClientHelper"
+        ) as mock_class:
+            mock_class.zpa_argument_spec.return_value = REAL_ARGUMENT_SPEC.copy()
+            client_instance = MagicMock()
+            mock_class.return_value = client_instance
+            yield client_instance
+
+    def _run(self, **args):
+        set_module_args(provider=DEFAULT_PROVIDER, **args)
+        from ansible_collections.zscaler.zpacloud.plugins.modules import (
+            zpa_tenant_export,
+        )
+
+        zpa_tenant_export.main()
+
+    def test_export_streams_all_pages(self, mock_client, tmp_path):
+        """Every page of a paginated listing ends up in the JSONL file."""
+        page1 = [MockBox({"id": "1", "name": "a"}), MockBox({"id": "2", "name": "b"})]
+        page2 = [MockBox({"id": "3", "name": "c"})]
+        mock_client.server_groups.list_groups.return_value = (
+            page1,
+            MockResp([page2]),
+            None,
+        )
+        mock_client.segment_groups.list_groups.return_value = ([], None)
+
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(
+                dest=str(tmp_path),
+                resource_types=["server_group", "segment_group"],
+                concurrency=2,
+            )
+
+        manifest = result.value.result["manifest"]
+        assert result.value.result["changed"] is True
+        entry = manifest["resource_types"]["server_group"]
+        assert entry["count"] == 3
+        assert entry["file"] == "server_group.jsonl.gz"
+        path = tmp_path / "server_group.jsonl.gz"
+        assert [i["id"] for i in read_jsonl(path)] == ["1", "2", "3"]
+        assert entry["sha256"] == hashlib.sha256(path.read_bytes()).hexdigest()
+        assert manifest["resource_types"]["segment_group"]["count"] == 0
+        assert (tmp_path / "manifest.json").exists()
+
+    def test_export_uncompressed(self, mock_client, tmp_path):
+        mock_client.server_groups.list_groups.return_value = (
+            [MockBox({"id": "1", "name": "a"})],
+            None,
+        )
+        with pytest.raises(AnsibleExitJson):
+            self._run(
+                dest=str(tmp_path), resource_types=["server_group"], compress=False
+            )
+        lines = (tmp_path / "server_group.jsonl").read_text().splitlines()
+        assert json.loads(lines[0])["name"] == "a"
+
+    def test_export_scoped_type_over_parents(self, mock_client, tmp_path):
+        mock_client.idp.list_idps.return_value = (
+            [MockBox({"id": "idp1", "name": "Okta"})],
+            None,
+        )
+        mock_client.scim_groups.list_scim_groups.return_value = (
+            [MockBox({"id": "g1", "name": "Engineering"})],
+            None,
+        )
+        with pytest.raises(AnsibleExitJson):
+            self._run(dest=str(tmp_path), resource_types=["scim_group"])
+        items = read_jsonl(tmp_path / "scim_group.jsonl.gz")
+        assert items == [{"id": "g1", "name": "Engineering", "_parent_id": "idp1"}]
+
+    def test_export_error_fails_and_keeps_no_partial_file(self, mock_client, tmp_path):
+        mock_client.server_groups.list_groups.return_value = (None, None, "API Error")
+        with pytest.raises(AnsibleFailJson) as result:
+            self._run(dest=str(tmp_path), resource_types=["server_group"])
+        assert "server_group" in result.value.result["msg"]
+        assert not [p for p in os.listdir(tmp_path) if p.endswith(".tmp")]
+        assert not (tmp_path / "server_group.jsonl.gz").exists()
+
+    def test_unknown_resource_type(self, mock_client, tmp_path):
+        with pytest.raises(AnsibleFailJson) as result:
+            self._run(dest=str(tmp_path), resource_types=["widgets"])
+        assert "Unsupported resource type" in result.value.result["msg"]
+
+    def test_check_mode(self, mock_client, tmp_path):
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(
+                dest=str(tmp_path / "out"),
+                resource_types=["server_group"],
+                _ansible_check_mode=True,
+            )
+        assert result.value.result["changed"] is True
+        assert not (tmp_path / "out").exists()
+        mock_client.server_groups.list_groups.assert_not_called()
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+# MIT License
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import asyncio
+import os
+import sys
+
+# Add the collection root to path for imports
+COLLECTION_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "..", "..")
+)
+if COLLECTION_ROOT not in sys.path:
+    sys.path.insert(0, COLLECTION_ROOT)
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from tests.unit.plugins.modules.common.utils import (
+    set_module_args,
+    AnsibleExitJson,
+    AnsibleFailJson,
+    ModuleTestCase,
+    DEFAULT_PROVIDER,
+)
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    ZPAClientHelper,
+)
+
+REAL_ARGUMENT_SPEC = ZPAClientHelper.zpa_argument_spec()
+
+
+class MockBox:
+    """Mock Box object to simulate SDK responses"""
+
+    def __init__(self, data):
+        self._data = data
+
+    def as_dict(self):
+        return dict(self._data)
+
+
+class FakeTransport:
+    """Stands in for AsyncZPATransport, serving listings by path."""
+
+    def __init__(self, listings):
+        self.listings = listings
+        self.listed = []
+
+    async def list_all(self, path, params=None, **kwargs):
+        self.listed.append((path, params))
+        return self.listings.get(path, (None, f"no listing for {path}"))
+
+    def run(self, *coroutines):
+        async def gather():
+            return await asyncio.gather(*coroutines)
+
+        return asyncio.run(gather())
+
+
+class TestZPATenantInfoModule(ModuleTestCase):
+    """Unit tests for zpa_tenant_info module."""
+
+    @pytest.fixture
+    def mock_client(self, mocker):
+        with patch(
+            "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_tenant_info.ZPAClientHelper"
+        ) as mock_class:
+            mock_class.zpa_argument_spec.return_value = REAL_ARGUMENT_SPEC.copy()
+            client_instance = MagicMock()
+            mock_class.return_value = client_instance
+
+            client_instance.segment_groups.list_groups.return_value = (
+                [
+                    MockBox({"id": "1", "name": "crm", "enabled": True}),
+                    MockBox({"id": "2", "name": "hr", "enabled": False}),
+                ],
+                None,
+            )
+            client_instance.server_groups.list_groups.return_value = (
+                [MockBox({"id": "10", "name": "web", "enabled": True})],
+                None,
+            )
+            client_instance.idp.list_idps.return_value = (
+                [MockBox({"id": "100", "name": "Okta"})],
+                None,
+            )
+            client_instance.scim_groups.list_scim_groups.return_value = (
+                [MockBox({"id": "200", "name": "Engineering"})],
+                None,
+            )
+            yield client_instance
+
+    def _run(self, **args):
+        set_module_args(provider=DEFAULT_PROVIDER, **args)
+        from ansible_collections.zscaler.zpacloud.plugins.modules import (
+            zpa_tenant_info,
+        )
+
+        zpa_tenant_info.main()
+
+    def test_lists_every_type(self, mock_client):
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(resource_types=["segment_group", "server_group"])
+
+        assert result.value.result["changed"] is False
+        assert result.value.result["count"] == {"segment_group": 2, "server_group": 1}
+        resources = result.value.result["resources"]
+        assert [g["name"] for g in resources["segment_group"]] == ["crm", "hr"]
+        assert resources["server_group"][0]["id"] == "10"
+
+    def test_filters_and_fields(self, mock_client):
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(
+                resource_types=["segment_group", "server_group"],
+                filters={"segment_group": {"enabled": False}},
+                fields=["name"],
+            )
+
+        assert result.value.result["resources"] == {
+            "segment_group": [{"name": "hr"}],
+            "server_group": [{"name": "web"}],
+        }
+
+    def test_filter_value_list_matches_any(self, mock_client):
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(
+                resource_types=["segment_group"],
+                filters={"segment_group": {"id": [1, "3"]}},
+                count_only=True,
+            )
+
+        assert result.value.result["count"] == {"segment_group": 1}
+        assert "resources" not in result.value.result
+
+    def test_scoped_type_is_listed_per_parent(self, mock_client):
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(resource_types=["scim_group"])
+
+        assert result.value.result["resources"]["scim_group"] == [
+            {"id": "200", "name": "Engineering", "_parent_id": "100"}
+        ]
+
+    def test_listing_error(self, mock_client):
+        mock_client.server_groups.list_groups.return_value = (None, "boom")
+
+        with pytest.raises(AnsibleFailJson) as result:
+            self._run(resource_types=["segment_group", "server_group"])
+
+        assert "server_group: boom" in result.value.result["msg"]
+
+    def test_unknown_type(self, mock_client):
+        with pytest.raises(AnsibleFailJson) as result:
+            self._run(
+                resource_types=["segment_group"],
+                filters={"nope": {"name": "x"}},
+            )
+
+        assert "Unsupported resource type(s): nope" in result.value.result["msg"]
+
+    def test_async_transport(self, mock_client):
+        transport = FakeTransport(
+            {"/segmentGroup": ([{"id": "1", "name": "crm"}], None)}
+        )
+        mock_client.async_transport.return_value = transport
+
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(
+                resource_types=["segment_group", "scim_group"],
+                transport="async",
+                concurrency=4,
+                microtenant_id="55",
+            )
+
+        mock_client.async_transport.assert_called_once_with(4)
+        assert transport.listed == [("/segmentGroup", {"microtenant_id": "55"})]
+        mock_client.segment_groups.list_groups.assert_not_called()
+        assert result.value.result["count"] == {"segment_group": 1, "scim_group": 1}
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+# MIT License
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import gzip
+import json
+import os
+import sys
+
+# Add the collection root to path for imports
+COLLECTION_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "..", "..")
+)
+if COLLECTION_ROOT not in sys.path:
+    sys.path.insert(0, COLLECTION_ROOT)
+
+import pytest
+
+from tests.unit.plugins.modules.common.utils import (
+    set_module_args,
+    AnsibleExitJson,
+    AnsibleFailJson,
+    ModuleTestCase,
+)
+
+
+class TestZPATenantPlanModule(ModuleTestCase):
+    """Unit tests for zpa_tenant_plan module."""
+
+    @pytest.fixture
+    def snapshot(self, tmp_path):
+        with gzip.open(tmp_path / "server_group.jsonl.gz", "wt") as fh:
+            for item in (
+                {"id": "1", "name": "web", "enabled": True},
+                {"id": "2", "name": "db", "enabled": True},
+            ):
+                fh.write(json.dumps(item) + "\n")
+        (tmp_path / "manifest.json").write_text(
+            json.dumps(
+                {"resource_types": {"server_group": {"file": "server_group.jsonl.gz"}}}
+            )
+        )
+        return str(tmp_path)
+
+    def _run(self, **args):
+        set_module_args(**args)
+        from ansible_collections.zscaler.zpacloud.plugins.modules import (
+            zpa_tenant_plan,
+        )
+
+        zpa_tenant_plan.main()
+
+    def test_plan(self, snapshot):
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(
+                snapshot=snapshot,
+                desired={
+                    "server_group": [
+                        {"name": "web", "enabled": False},
+                        {"name": "app", "enabled": True},
+                    ]
+                },
+                prune=True,
+            )
+        assert result.value.result["changed"] is False
+        assert result.value.result["summary"] == {
+            "create": 1,
+            "update": 1,
+            "delete": 1,
+            "noop": 0,
+        }
+
+    def test_unsupported_type(self, snapshot):
+        with pytest.raises(AnsibleFailJson) as result:
+            self._run(snapshot=snapshot, desired={"widgets": []})
+        assert "Unsupported resource type" in result.value.result["msg"]
+
+    def test_missing_snapshot_file(self, snapshot):
+        with pytest.raises(AnsibleFailJson) as result:
+            self._run(snapshot=snapshot, desired={"segment_group": [{"name": "x"}]})
+        assert "Error loading snapshot" in result.value.result["msg"]
+
+    def test_desired_must_be_list(self, snapshot):
+        with pytest.raises(AnsibleFailJson) as result:
+            self._run(snapshot=snapshot, desired={"server_group": {"name": "web"}})
+        assert "must be a list" in result.value.result["msg"]
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Zscaler Inc, <devrel@zscaler.com>
+# MIT License
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from tests.unit.plugins.modules.common.utils import (
+    set_module_args,
+    AnsibleExitJson,
+    AnsibleFailJson,
+    ModuleTestCase,
+    DEFAULT_PROVIDER,
+)
+
+from ansible_collections.zscaler.zpacloud.plugins.module_utils.zpa_client import (
+    ZPAClientHelper,
+)
+
+REAL_ARGUMENT_SPEC = ZPAClientHelper.zpa_argument_spec()
+
+
+class MockBox:
+    def __init__(self, data):
+        self._data = data
+
+    def as_dict(self):
+        return self._data
+
+
+class TestZPAVersionComplianceInfoModule(ModuleTestCase):
+    """Unit tests for zpa_version_compliance_info module."""
+
+    PROFILES = [
+        {
+            "id": "2",
+            "name": "New Release",
+            "version_details": [
+                {"role": "zpa-connector", "version": "24.103.2"},
+                {"role": "zpa-pse", "version": "24.50.1"},
+            ],
+        }
+    ]
+
+    LISTINGS = {
+        "/appConnectorGroup": [
+            {"id": "10", "name": "Branches", "version_profile_id": "2"}
+        ],
+        "/connector": [
+            {
+                "id": "1",
+                "name": "c1",
+                "app_connector_group_id": "10",
+                "current_version": "24.103.2",
+            },
+            {
+                "id": "2",
+                "name": "c2",
+                "app_connector_group_id": "10",
+                "current_version": "24.90.5",
+            },
+        ],
+        "/serviceEdgeGroup": [{"id": "30", "name": "PSE", "version_profile_id": "2"}],
+        "/serviceEdge": [
+            {
+                "id": "5",
+                "name": "pse-1",
+                "service_edge_group_id": "30",
+                "current_version": "24.50.1",
+            }
+        ],
+    }
+
+    @pytest.fixture
+    def mock_client(self, mocker):
+        with patch(
+            "ansible_collections.zscaler.zpacloud.plugins.modules.zpa_version_compliance_info.ZPAClientHelper"
+        ) as mock_class:
+            mock_class.zpa_argument_spec.return_value = REAL_ARGUMENT_SPEC.copy()
+            client_instance = MagicMock()
+            client_instance.customer_version_profile.list_version_profiles.return_value = (
+                [MockBox(p) for p in self.PROFILES],
+                None,
+                None,
+            )
+            client_instance.list_raw.side_effect = lambda path, qp, **kw: (
+                self.LISTINGS[path],
+                None,
+                None,
+            )
+            mock_class.return_value = client_instance
+            yield client_instance
+
+    def _run(self, **args):
+        set_module_args(provider=DEFAULT_PROVIDER, **args)
+        from ansible_collections.zscaler.zpacloud.plugins.modules import (
+            zpa_version_compliance_info,
+        )
+
+        zpa_version_compliance_info.main()
+
+    def test_reports_out_of_profile_instances(self, mock_client):
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run()
+
+        res = result.value.result
+        assert res["changed"] is False
+        assert res["summary"] == {"total": 3, "compliant": 2, "out_of_profile": 1}
+        assert [(g["name"], g["out_of_profile"]) for g in res["groups"]] == [
+            ("Branches", 1),
+            ("PSE", 0),
+        ]
+        assert [i["name"] for i in res["out_of_profile"]] == ["c2"]
+        mock_client.customer_version_profile.list_version_profiles.assert_called_once()
+
+    def test_single_component(self, mock_client):
+        with pytest.raises(AnsibleExitJson) as result:
+            self._run(components=["service_edge"])
+
+        assert result.value.result["summary"]["total"] == 1
+        paths = {c.args[0] for c in mock_client.list_raw.call_args_list}
+        assert paths == {"/serviceEdgeGroup", "/serviceEdge"}
+
+    def test_empty_components(self, mock_client):
+        with pytest.raises(AnsibleFailJson) as result:
+            self._run(components=[])
+
+        assert "components must list at least one" in result.value.result["msg"]
+        mock_client.list_raw.assert_not_called()
+
+    def test_profile_error(self, mock_client):
+        mock_client.customer_version_profile.list_version_profiles.return_value = (
+            None,
+            None,
+            "denied",
+        )
+        with pytest.raises(AnsibleFailJson) as result:
+            self._run()
+
+        assert "Error retrieving version profiles: denied" in result.value.result["msg"]
+
+    def test_listing_error(self, mock_client):
+        mock_client.list_raw.side_effect = lambda path, qp, **kw: (None, None, "boom")
+        with pytest.raises(AnsibleFailJson) as result:
+            self._run(components=["app_connector"])
+
+        assert (
+            "Error checking app_connector versions: boom" in result.value.result["msg"]
+        )